@@ -18,6 +18,7 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
+import re
 from pathlib import Path
 
 from ra2ce.analysis.adaptation.adaptation_option import AdaptationOption
@@ -86,11 +87,20 @@ class Adaptation(AnalysisBase, AnalysisDamagesProtocol):
         """
         _reference_impact = self.reference_option.get_impact()
 
+        # Only the columns needed to calculate the cost of the options are read.
+        _cost_columns = [
+            _column
+            for _column in self.graph_file_hazard.get_columns()
+            if _column in ["rfid", "length", "geometry"]
+            or re.search("EV.*_fr", _column)
+        ]
+        _gdf_hazard = self.graph_file_hazard.get_graph(columns=_cost_columns)
+
         _result_gdf = _reference_impact.data_frame.copy()
         for _option in self.adaptation_options:
             _option_result = _option.get_bc_ratio(
                 _reference_impact,
-                self.graph_file_hazard.get_graph(),
+                _gdf_hazard,
                 self.analysis.hazard_fraction_cost,
             )
             # Copy the option result columns.
@@ -24,6 +24,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 from ra2ce.analysis.adaptation.adaptation import Adaptation
+from ra2ce.analysis.analysis_config_data.analysis_config_data import ProjectSection
 from ra2ce.analysis.analysis_config_data.enums.analysis_damages_enum import (
     AnalysisDamagesEnum,
 )
@@ -43,6 +44,8 @@ class AnalysisCollection:
     damages_analyses: list[AnalysisDamagesProtocol] = field(default_factory=list)
     losses_analyses: list[AnalysisLossesProtocol] = field(default_factory=list)
     adaptation_analysis: Adaptation = None
+    # General settings of the analyses, e.g. of the export of their results.
+    project: ProjectSection = field(default_factory=ProjectSection)
 
     @property
     def analyses(self) -> list[AnalysisProtocol]:
@@ -84,6 +87,7 @@ class AnalysisCollection:
             adaptation_analysis=AnalysisFactory.get_adaptation_analysis(
                 analysis_config.config_data.adaptation, analysis_config
             ),
+            project=analysis_config.config_data.project,
         )
 
     def get_analysis(
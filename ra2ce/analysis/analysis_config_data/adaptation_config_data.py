@@ -43,6 +43,7 @@ class AdaptationConfigData(AnalysisConfigDataProtocol):
 
     name: str
     save_csv: bool = False  # Save results as CSV
+    save_parquet: bool = False  # Save results as GeoParquet
     save_gpkg: bool = False  # Save results as GPKG
 
     losses_analysis: AnalysisLossesEnum = AnalysisLossesEnum.SINGLE_LINK_LOSSES
@@ -70,6 +70,7 @@ class AnalysisSectionBase:
     name: str = ""
     save_gpkg: bool = False
     save_csv: bool = False
+    save_parquet: bool = False
     analysis: AnalysisEnum | AnalysisDamagesEnum | AnalysisLossesEnum = field(
         default_factory=lambda: AnalysisEnum.INVALID
     )
@@ -215,6 +216,11 @@ class AnalysisSectionDamages(AnalysisSectionBase):
 
     file_name : Path or None
 
+    chunk_size : int, optional
+        Maximum number of segments to calculate the damages (and risk) for at once.
+        When set, the hazard network is streamed and processed in chunks of this size
+        to bound the memory usage. Defaults to None (whole network at once).
+
 
     Notes
     -----
@@ -237,6 +243,7 @@ class AnalysisSectionDamages(AnalysisSectionBase):
     risk_calculation_year: Optional[int] = 0
     create_table: Optional[bool] = False
     file_name: Optional[Path] = None
+    chunk_size: Optional[int] = None
 
 
 @dataclass
@@ -279,9 +286,24 @@ class AnalysisSectionAdaptationOption:
 class ProjectSection:
     """
     Reflects all possible settings that a project section might contain.
+
+    Attributes
+    ----------
+    name
+        Name of the project.
+
+    export_max_workers
+        Number of threads exporting the results of the analyses in the background,
+        while the next analysis runs.
+
+    export_max_in_flight_bytes
+        Maximum (approximate) size in bytes of the results being exported at once.
+        When exceeded, the next analysis waits for earlier exports to finish.
     """
 
     name: str = ""
+    export_max_workers: int = 2
+    export_max_in_flight_bytes: int = 2 * 1024**3
 
 
 @dataclass
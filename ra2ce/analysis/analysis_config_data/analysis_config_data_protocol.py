@@ -33,6 +33,7 @@ class AnalysisConfigDataProtocol(Protocol):
     name: str
     save_gpkg: bool
     save_csv: bool
+    save_parquet: bool
 
     def validate_integrity(self) -> ValidationReport:
         """
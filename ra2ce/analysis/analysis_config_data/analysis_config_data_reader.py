@@ -130,7 +130,17 @@ class AnalysisConfigDataReader(ConfigDataReaderProtocol):
         }
 
     def get_project_section(self) -> ProjectSection:
-        return ProjectSection(**self._parser["project"])
+        _section = ProjectSection()
+        _section.name = self._parser.get("project", "name", fallback=_section.name)
+        _section.export_max_workers = self._parser.getint(
+            "project", "export_max_workers", fallback=_section.export_max_workers
+        )
+        _section.export_max_in_flight_bytes = self._parser.getint(
+            "project",
+            "export_max_in_flight_bytes",
+            fallback=_section.export_max_in_flight_bytes,
+        )
+        return _section
 
     def _set_section_common_properties(
         self, section: AnalysisConfigDataProtocol, section_name: str
@@ -142,6 +152,9 @@ class AnalysisConfigDataReader(ConfigDataReaderProtocol):
         section.save_csv = self._parser.getboolean(
             section_name, "save_csv", fallback=section.save_csv
         )
+        section.save_parquet = self._parser.getboolean(
+            section_name, "save_parquet", fallback=section.save_parquet
+        )
 
     def _get_single_link_redundancy_config_data(
         self, section_name: str
@@ -210,6 +223,11 @@ class AnalysisConfigDataReader(ConfigDataReaderProtocol):
             "create_table",
             fallback=_section.create_table,
         )
+        _section.chunk_size = self._parser.getint(
+            section_name,
+            "chunk_size",
+            fallback=_section.chunk_size,
+        )
         return _section
 
     def _get_base_link_losses_config_data(
@@ -329,6 +347,9 @@ class AnalysisConfigDataReader(ConfigDataReaderProtocol):
         _section.save_csv = self._parser.getboolean(
             section_name, "save_csv", fallback=_section.save_csv
         )
+        _section.save_parquet = self._parser.getboolean(
+            section_name, "save_parquet", fallback=_section.save_parquet
+        )
         _section.hazard_fraction_cost = self._parser.getboolean(
             section_name,
             "hazard_fraction_costs",
@@ -405,6 +426,9 @@ class AnalysisConfigDataReader(ConfigDataReaderProtocol):
         _section.save_csv = self._parser.getboolean(
             section_name, "save_csv", fallback=_section.save_csv
         )
+        _section.save_parquet = self._parser.getboolean(
+            section_name, "save_parquet", fallback=_section.save_parquet
+        )
         _weighing = self._parser.get(section_name, "weighing", fallback=None)
         # Map distance -> length
         if _weighing == "distance":
@@ -484,6 +508,9 @@ class AnalysisConfigDataReader(ConfigDataReaderProtocol):
         _section.save_csv = self._parser.getboolean(
             section_name, "save_csv", fallback=_section.save_csv
         )
+        _section.save_parquet = self._parser.getboolean(
+            section_name, "save_parquet", fallback=_section.save_parquet
+        )
 
         # road damage
         _section.event_type = EventTypeEnum.get_enum(
@@ -505,6 +532,11 @@ class AnalysisConfigDataReader(ConfigDataReaderProtocol):
             "create_table",
             fallback=_section.create_table,
         )
+        _section.chunk_size = self._parser.getint(
+            section_name,
+            "chunk_size",
+            fallback=_section.chunk_size,
+        )
         return _section
 
     def _get_analysis_section_adaptation(
@@ -528,6 +560,9 @@ class AnalysisConfigDataReader(ConfigDataReaderProtocol):
         _section.save_csv = self._parser.getboolean(
             section_name, "save_csv", fallback=_section.save_csv
         )
+        _section.save_parquet = self._parser.getboolean(
+            section_name, "save_parquet", fallback=_section.save_parquet
+        )
         _section.hazard_fraction_cost = self._parser.getboolean(
             section_name,
             "hazard_fraction_costs",
@@ -142,11 +142,24 @@ class AnalysisConfigDataValidator(Ra2ceIoValidator):
                 )
         return _report
 
+    def _validate_project_integrity(self) -> ValidationReport:
+        _report = ValidationReport()
+        if not self._config.project:
+            return _report
+        if self._config.project.export_max_workers < 1:
+            _report.error("'export_max_workers' should be a positive integer.")
+        if self._config.project.export_max_in_flight_bytes < 0:
+            _report.error(
+                "'export_max_in_flight_bytes' should be a non-negative integer."
+            )
+        return _report
+
     def validate(self) -> ValidationReport:
         _report = ValidationReport()
         _required_headers = ["project", "analyses"]
 
         _report.merge(self._validate_headers(_required_headers))
+        _report.merge(self._validate_project_integrity())
         _report.merge(self._validate_analysis_config_integrity())
         _report.merge(self._validate_analysis_network_compatibility())
 
@@ -52,6 +52,7 @@ class BaseLinkLossesConfigData(AnalysisConfigDataProtocol, ABC):
     name: str
     save_gpkg: bool = False
     save_csv: bool = False
+    save_parquet: bool = False
 
     # Concrete properties
     event_type: EventTypeEnum = field(default_factory=lambda: EventTypeEnum.NONE)
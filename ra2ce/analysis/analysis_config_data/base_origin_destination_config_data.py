@@ -19,6 +19,7 @@ class BaseOriginDestinationConfigData(AnalysisConfigDataProtocol, ABC):
     name: str
     save_gpkg: bool = False
     save_csv: bool = False
+    save_parquet: bool = False
 
     # Concrete properties
     weighing: WeighingEnum = field(default_factory=lambda: WeighingEnum.NONE)
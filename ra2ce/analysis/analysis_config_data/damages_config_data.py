@@ -46,6 +46,7 @@ class DamagesConfigData(AnalysisConfigDataProtocol):
     name: str
     save_gpkg: bool = False  # Save results as GPKG
     save_csv: bool = False  # Save results as CSV
+    save_parquet: bool = False  # Save results as GeoParquet
 
     # Concrete properties
     event_type: EventTypeEnum = field(default_factory=lambda: EventTypeEnum.NONE)
@@ -63,6 +64,9 @@ class DamagesConfigData(AnalysisConfigDataProtocol):
     create_table: bool = False
     file_name: Optional[Path] = None
     representative_damage_percentage: float = 100
+    # Maximum number of segments to process at once, None to process the whole network at once.
+    # When set, the segment based result is streamed to its GeoParquet output (.parquet).
+    chunk_size: Optional[int] = None
 
     def validate_integrity(self) -> ValidationReport:
         _report = ValidationReport()
@@ -86,6 +90,11 @@ class DamagesConfigData(AnalysisConfigDataProtocol):
                 f"For damage analysis '{self.name}': 'damage_curve' must be a valid DamageCurveEnum value."
             )
 
+        if self.chunk_size is not None and self.chunk_size < 1:
+            _report.error(
+                f"For damage analysis '{self.name}': 'chunk_size' should be a positive integer."
+            )
+
         if self.risk_calculation_mode == RiskCalculationModeEnum.TRIANGLE_TO_NULL_YEAR:
             if self.risk_calculation_year is None or self.risk_calculation_year <= 0:
                 _report.error(
@@ -37,6 +37,7 @@ class MultiLinkRedundancyConfigData(AnalysisConfigDataProtocol):
     name: str
     save_gpkg: bool = False
     save_csv: bool = False
+    save_parquet: bool = False
 
     # Concrete properties
     weighing: WeighingEnum = field(default_factory=lambda: WeighingEnum.NONE)
@@ -31,11 +31,16 @@ from ra2ce.analysis.analysis_config_data.analysis_config_data import AnalysisCon
 class AnalysisResult:
     """
     Dataclass to represent an analysis result (`GeoDataFrame`) and its related configuration.
+    When the complete result is stored in a (GeoParquet) `analysis_result_file`, the
+    `analysis_result` only holds the columns needed to derive other results, and the
+    result is exported from the file. Unless it is the `.parquet` export of the
+    result, the file is intermediate and removed once the result is exported.
     """
 
     analysis_result: GeoDataFrame
     analysis_config: AnalysisConfigData.ANALYSIS_SECTION
     output_path: Path
+    analysis_result_file: Path | None = None
 
     _custom_name: str = ""
 
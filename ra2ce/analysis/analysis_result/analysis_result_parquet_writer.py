@@ -0,0 +1,113 @@
+"""
+                    GNU GENERAL PUBLIC LICENSE
+                      Version 3, 29 June 2007
+
+    Risk Assessment and Adaptation for Critical Infrastructure (RA2CE).
+    Copyright (C) 2023-2026 Stichting Deltares
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from geopandas import GeoDataFrame
+
+from ra2ce.network.networks_utils import cast_object_columns_to_str
+
+
+@dataclass(kw_only=True)
+class AnalysisResultParquetWriter:
+    """
+    Writes an analysis result part by part (e.g. per chunk of the network) into one
+    GeoParquet file, so the complete result never needs to be held in memory.
+
+    The parts are prepared as for any other export (CRS and object columns as string)
+    and should have the same columns. Columns of which the type differs between the
+    parts are cast to the type of the first part.
+    """
+
+    export_path: Path
+
+    _writer: pq.ParquetWriter | None = field(default=None, init=False, repr=False)
+
+    def __enter__(self) -> AnalysisResultParquetWriter:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def write(self, gdf: GeoDataFrame) -> None:
+        """
+        Appends the given part of the result to the file.
+
+        Args:
+            gdf (GeoDataFrame): Part of the result (changed in place to prepare its export).
+        """
+        gdf.crs = "epsg:4326"
+        cast_object_columns_to_str(gdf)
+
+        _geometry_column = gdf.geometry.name
+        _df = pd.DataFrame(gdf, copy=False)
+        _df[_geometry_column] = gdf.geometry.to_wkb()
+        if self._writer:
+            # Columns stored as string, which are not (only) strings in this part.
+            _string_columns = [
+                _field.name
+                for _field in self._writer.schema
+                if pa.types.is_string(_field.type)
+                and _field.name != _geometry_column
+                and _df[_field.name].dtype != object
+            ]
+            if _string_columns:
+                _df[_string_columns] = _df[_string_columns].astype(str)
+        _table = pa.Table.from_pandas(_df, preserve_index=False)
+
+        if not self._writer:
+            # GeoParquet metadata, so the file is read as any other GeoParquet file.
+            _geo_metadata = dict(
+                version="1.0.0",
+                primary_column=_geometry_column,
+                columns={
+                    _geometry_column: dict(
+                        encoding="WKB",
+                        geometry_types=[],
+                        crs=gdf.crs.to_json_dict(),
+                    )
+                },
+            )
+            _schema = _table.schema.with_metadata(
+                (_table.schema.metadata or {})
+                | {b"geo": json.dumps(_geo_metadata).encode()}
+            )
+            if self.export_path.exists():
+                self.export_path.unlink()
+            self.export_path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(self.export_path, _schema)
+
+        self._writer.write_table(_table.cast(self._writer.schema))
+
+    def close(self) -> None:
+        """
+        Closes the file, completing the result.
+        """
+        if self._writer:
+            self._writer.close()
+            self._writer = None
@@ -0,0 +1,174 @@
+"""
+                    GNU GENERAL PUBLIC LICENSE
+                      Version 3, 29 June 2007
+
+    Risk Assessment and Adaptation for Critical Infrastructure (RA2CE).
+    Copyright (C) 2023-2026 Stichting Deltares
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from threading import Condition
+
+from ra2ce.analysis.analysis_result.analysis_result_wrapper import AnalysisResultWrapper
+from ra2ce.analysis.analysis_result.analysis_result_wrapper_exporter import (
+    AnalysisResultWrapperExporter,
+)
+from ra2ce.analysis.analysis_result.analysis_result_wrapper_protocol import (
+    AnalysisResultWrapperProtocol,
+)
+
+
+@dataclass(kw_only=True)
+class AnalysisResultWrapperExportQueue:
+    """
+    Queue to export analysis results in the background with a bounded pool of threads,
+    so the results of an analysis are written while the next analysis is computed.
+
+    The results are prepared for their export when submitted, then a copy of them
+    is written, so the analyses can keep changing the (shared) results.
+    The (approximate) size of the copies being written is limited by
+    `max_in_flight_bytes`: when exceeded, submitting waits for earlier exports to finish.
+    """
+
+    max_workers: int = 2
+    max_in_flight_bytes: int = 2 * 1024**3
+
+    _executor: ThreadPoolExecutor | None = field(default=None, init=False, repr=False)
+    _exports: list[tuple[str, Future]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _in_flight_bytes: int = field(default=0, init=False, repr=False)
+    _condition: Condition = field(default_factory=Condition, init=False, repr=False)
+
+    @property
+    def in_flight_bytes(self) -> int:
+        """
+        Gets the (approximate) size of the results being exported.
+
+        Returns:
+            int: Size in bytes.
+        """
+        return self._in_flight_bytes
+
+    def submit(
+        self, analysis_name: str, result_wrapper: AnalysisResultWrapperProtocol
+    ) -> None:
+        """
+        Submits the given result to be exported in the background into the
+        analysis requested formats.
+
+        Args:
+            analysis_name (str): Name of the analysis the result belongs to.
+            result_wrapper (AnalysisResultWrapperProtocol): The result to export.
+        """
+        if not result_wrapper.is_valid_result():
+            return
+
+        _exporter = AnalysisResultWrapperExporter()
+        _exporter.prepare_result(result_wrapper)
+
+        _n_bytes = self._get_n_bytes(result_wrapper)
+        with self._condition:
+            # A single export is always allowed, even when exceeding the limit.
+            self._condition.wait_for(
+                lambda: self._in_flight_bytes == 0
+                or self._in_flight_bytes + _n_bytes <= self.max_in_flight_bytes
+            )
+            self._in_flight_bytes += _n_bytes
+
+        if not self._executor:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="ra2ce_export"
+            )
+        self._exports.append(
+            (
+                analysis_name,
+                self._executor.submit(
+                    self._write_result,
+                    _exporter,
+                    self._get_snapshot(result_wrapper),
+                    _n_bytes,
+                ),
+            )
+        )
+
+    def wait(self) -> None:
+        """
+        Waits for all submitted exports to finish.
+
+        Raises:
+            RuntimeError: When the export of any of the results failed.
+        """
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        _failed_exports = [
+            (_analysis_name, _future.exception())
+            for _analysis_name, _future in self._exports
+            if _future.exception()
+        ]
+        self._exports.clear()
+        if not _failed_exports:
+            return
+
+        for _analysis_name, _error in _failed_exports:
+            logging.error(
+                "Export of the results of analysis '%s' failed: %s",
+                _analysis_name,
+                _error,
+            )
+        _analysis_names = ", ".join(f"'{_name}'" for _name, _ in _failed_exports)
+        raise RuntimeError(
+            f"Export of the results of analysis {_analysis_names} failed."
+        ) from _failed_exports[0][1]
+
+    def _write_result(
+        self,
+        exporter: AnalysisResultWrapperExporter,
+        result_wrapper: AnalysisResultWrapperProtocol,
+        n_bytes: int,
+    ) -> None:
+        try:
+            exporter.write_result(result_wrapper)
+        finally:
+            with self._condition:
+                self._in_flight_bytes -= n_bytes
+                self._condition.notify_all()
+
+    @staticmethod
+    def _get_n_bytes(result_wrapper: AnalysisResultWrapperProtocol) -> int:
+        # Shallow memory usage, the (immutable) geometries are shared by the copies.
+        return sum(
+            int(_analysis_result.analysis_result.memory_usage(deep=False).sum())
+            for _analysis_result in result_wrapper.results_collection
+        )
+
+    @staticmethod
+    def _get_snapshot(
+        result_wrapper: AnalysisResultWrapperProtocol,
+    ) -> AnalysisResultWrapper:
+        return AnalysisResultWrapper(
+            results_collection=[
+                replace(
+                    _analysis_result,
+                    analysis_result=_analysis_result.analysis_result.copy(),
+                )
+                for _analysis_result in result_wrapper.results_collection
+            ]
+        )
@@ -19,15 +19,22 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import json
 import logging
-from copy import deepcopy
+import shutil
 from pathlib import Path
 
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pyogrio
 from geopandas import GeoDataFrame
+from pyproj import CRS
 
+from ra2ce.analysis.analysis_result.analysis_result import AnalysisResult
 from ra2ce.analysis.analysis_result.analysis_result_wrapper_protocol import (
     AnalysisResultWrapperProtocol,
 )
+from ra2ce.network.networks_utils import cast_object_columns_to_str
 
 
 class AnalysisResultWrapperExporter:
@@ -36,26 +43,99 @@ class AnalysisResultWrapperExporter:
         result_wrapper: AnalysisResultWrapperProtocol,
     ):
         """
-        Exports the given result into the analysis requested formats ( `.gpkg` and / or `.csv`).
+        Exports the given result into the analysis requested formats ( `.gpkg`, `.parquet` and / or `.csv`).
 
         Args:
             result_wrapper (AnalysisResultWrapper): The result to export.
         """
+        self.prepare_result(result_wrapper)
+        self.write_result(result_wrapper)
+
+    def prepare_result(self, result_wrapper: AnalysisResultWrapperProtocol):
+        """
+        Prepares (in place) the given result for its export into the analysis requested formats.
+
+        Args:
+            result_wrapper (AnalysisResultWrapper): The result to prepare.
+        """
+        if not result_wrapper.is_valid_result():
+            return
+
+        for _analysis_result in result_wrapper.results_collection:
+            if _analysis_result.analysis_result_file:
+                # Prepared when written to its file.
+                continue
+            if (
+                _analysis_result.analysis_config.save_gpkg
+                or _analysis_result.analysis_config.save_parquet
+            ):
+                self._prepare_gdf(_analysis_result.analysis_result)
+
+    def write_result(self, result_wrapper: AnalysisResultWrapperProtocol):
+        """
+        Writes the given (prepared) result into the analysis requested formats ( `.gpkg`, `.parquet` and / or `.csv`).
+        The result itself is not changed.
+
+        Args:
+            result_wrapper (AnalysisResultWrapper): The result to write.
+        """
         if not result_wrapper.is_valid_result():
             return
 
         for _analysis_result in result_wrapper.results_collection:
+            if _analysis_result.analysis_result_file:
+                self._write_result_from_file(_analysis_result)
+                continue
             if _analysis_result.analysis_config.save_gpkg:
                 self._export_gdf(
                     _analysis_result.analysis_result,
                     _analysis_result.base_export_path.with_suffix(".gpkg"),
                 )
+            if _analysis_result.analysis_config.save_parquet:
+                self._export_parquet(
+                    _analysis_result.analysis_result,
+                    _analysis_result.base_export_path.with_suffix(".parquet"),
+                )
             if _analysis_result.analysis_config.save_csv:
                 self._export_csv(
                     _analysis_result.analysis_result,
                     _analysis_result.base_export_path.with_suffix(".csv"),
                 )
 
+    def _write_result_from_file(self, analysis_result: AnalysisResult):
+        _result_file = analysis_result.analysis_result_file
+        if analysis_result.analysis_config.save_gpkg:
+            self._export_gdf_from_parquet(
+                _result_file, analysis_result.base_export_path.with_suffix(".gpkg")
+            )
+        if analysis_result.analysis_config.save_csv:
+            self._export_csv_from_parquet(
+                _result_file, analysis_result.base_export_path.with_suffix(".csv")
+            )
+        _parquet_path = analysis_result.base_export_path.with_suffix(".parquet")
+        if _result_file == _parquet_path:
+            return
+        # Any other result file is intermediate, moved to the `.parquet` export
+        # (when requested) or removed.
+        if analysis_result.analysis_config.save_parquet:
+            self._prepare_export_path(_parquet_path)
+            shutil.move(_result_file, _parquet_path)
+            logging.info("Results saved to: %s", _parquet_path)
+        else:
+            _result_file.unlink()
+
+    @staticmethod
+    def _prepare_gdf(gdf: GeoDataFrame):
+        gdf.crs = "epsg:4326"  # TODO: decide if this should be variable with e.g. an output_crs configured
+        cast_object_columns_to_str(gdf)
+
+    @staticmethod
+    def _prepare_export_path(export_path: Path):
+        if export_path.exists():
+            export_path.unlink()
+        if not export_path.parent.exists():
+            export_path.parent.mkdir(parents=True)
+
     def _export_gdf(self, gdf: GeoDataFrame, export_path: Path):
         """Takes in a geodataframe object and outputs shapefiles at the paths indicated by edge_shp and node_shp
 
@@ -63,25 +143,77 @@ class AnalysisResultWrapperExporter:
             gdf [geodataframe]: geodataframe object to be converted
             export_path [Path]: path to save
         """
-        # save to shapefile
-        gdf.crs = "epsg:4326"  # TODO: decide if this should be variable with e.g. an output_crs configured
+        self._prepare_export_path(export_path)
+
+        # Write all features at once through arrow.
+        gdf.to_file(export_path, driver="GPKG", engine="pyogrio", use_arrow=True)
+        logging.info("Results saved to: %s", export_path)
 
-        for col in gdf.columns:
-            if gdf[col].dtype == object and col != gdf.geometry.name:
-                gdf[col] = gdf[col].astype(str)
+    def _export_parquet(self, gdf: GeoDataFrame, export_path: Path):
+        """Takes in a geodataframe object and outputs a GeoParquet file at the path indicated
 
-        if export_path.exists():
-            export_path.unlink()
+        Arguments:
+            gdf [geodataframe]: geodataframe object to be converted
+            export_path [Path]: path to save
+        """
+        self._prepare_export_path(export_path)
+
+        gdf.to_parquet(export_path)
+        logging.info("Results saved to: %s", export_path)
+
+    def _export_csv(self, result_gdf: GeoDataFrame, export_path: Path):
         if not export_path.parent.exists():
             export_path.parent.mkdir(parents=True)
 
-        gdf.to_file(export_path, driver="GPKG")
+        # Only write the non-geometry columns, instead of copying the result without them.
+        result_gdf.to_csv(
+            export_path,
+            index=False,
+            columns=[
+                _column for _column in result_gdf.columns if _column != "geometry"
+            ],
+        )
+
+    def _export_gdf_from_parquet(self, parquet_path: Path, export_path: Path):
+        """
+        Writes a GeoParquet file into a GeoPackage batch by batch,
+        so the complete result is never held in memory.
+        """
+        self._prepare_export_path(export_path)
+
+        _parquet_file = pq.ParquetFile(parquet_path)
+        _geo_metadata = json.loads(_parquet_file.schema_arrow.metadata[b"geo"])
+        _geometry_column = _geo_metadata["primary_column"]
+        _crs = CRS.from_json_dict(_geo_metadata["columns"][_geometry_column]["crs"])
+        for _i, _batch in enumerate(_parquet_file.iter_batches()):
+            pyogrio.write_arrow(
+                pa.Table.from_batches([_batch]),
+                export_path,
+                driver="GPKG",
+                geometry_name=_geometry_column,
+                geometry_type="Unknown",
+                crs=_crs.to_wkt(),
+                append=_i > 0,
+            )
         logging.info("Results saved to: %s", export_path)
 
-    def _export_csv(self, result_gdf: GeoDataFrame, export_path: Path):
+    def _export_csv_from_parquet(self, parquet_path: Path, export_path: Path):
         if not export_path.parent.exists():
             export_path.parent.mkdir(parents=True)
 
-        _result_copy = deepcopy(result_gdf)
-        del _result_copy["geometry"]
-        _result_copy.to_csv(export_path, index=False)
+        _parquet_file = pq.ParquetFile(parquet_path)
+        _geometry_column = json.loads(_parquet_file.schema_arrow.metadata[b"geo"])[
+            "primary_column"
+        ]
+        _columns = [
+            _column
+            for _column in _parquet_file.schema_arrow.names
+            if _column != _geometry_column
+        ]
+        for _i, _batch in enumerate(_parquet_file.iter_batches(columns=_columns)):
+            # Restore the pandas dtypes, so the values are written as for other results.
+            pa.Table.from_batches([_batch]).replace_schema_metadata(
+                _parquet_file.schema_arrow.metadata
+            ).to_pandas().to_csv(
+                export_path, mode="a" if _i else "w", header=_i == 0, index=False
+            )
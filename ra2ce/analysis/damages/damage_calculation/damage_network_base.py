@@ -25,14 +25,16 @@ from abc import ABC, abstractmethod
 import numpy as np
 import pandas as pd
 from geopandas import GeoDataFrame
-from scipy.interpolate import interp1d
 
 from ra2ce.analysis.analysis_config_data.enums.damage_curve_enum import DamageCurveEnum
+from ra2ce.analysis.damages.damage_calculation.wet_segment_events import (
+    WetSegmentEvents,
+)
 from ra2ce.analysis.damages.damage_functions.manual_damage_functions import (
     ManualDamageFunctions,
 )
 from ra2ce.analysis.damages.damages_lookup import LookUp as lookup
-from ra2ce.analysis.damages.damages_lookup import dataframe_lookup
+from ra2ce.analysis.damages.damages_lookup import LookUpMatrix
 from ra2ce.analysis.damages.damages_utils import (
     clean_lane_data,
     create_summary_statistics,
@@ -48,6 +50,7 @@ class DamageNetworkBase(ABC):
         road_gdf: GeoDataFrame,
         val_cols: list[str],
         representative_damage_percentage: float,
+        lane_stats: dict | None = None,
     ):
         """Construct the Data"""
         self.val_cols = val_cols
@@ -55,6 +58,8 @@ class DamageNetworkBase(ABC):
         # set of hazard info per event
         self.stats = set([x.split("_")[-1] for x in val_cols])
         self.representative_damage_percentage = representative_damage_percentage
+        # lane statistics to interpolate missing lane data, derived from self.gdf if not given
+        self.lane_stats = lane_stats
         # TODO: also track the damage cols after the dam calculation, that is useful for the risk calc. module
         # TODO: also create constructors of the children of this class
 
@@ -99,21 +104,45 @@ class DamageNetworkBase(ABC):
         )
         df = self.gdf
 
-    def clean_and_interpolate_missing_lane_data(self):
-        # cleanup and complete the lane data.
+    @staticmethod
+    def _get_clean_lanes(lanes: pd.Series) -> pd.Series:
         ### Try to convert all data to floats
         try:
-            self.gdf.lanes = self.gdf.lanes.astype(
+            lanes = lanes.astype(
                 "float"
             )  # floats instead of ints because ints cannot be nan.
         except Exception:
             logging.warning(
                 "Available lane data cannot simply be converted to float/int, RA2CE will try a clean-up."
             )
-            self.gdf.lanes = clean_lane_data(self.gdf.lanes)
+            lanes = clean_lane_data(lanes)
 
         # round to nearest integer, but save as float format
-        self.gdf.lanes = self.gdf.lanes.round(0)
+        return lanes.round(0)
+
+    @staticmethod
+    def get_lane_statistics(road_df: pd.DataFrame) -> dict:
+        """
+        Gets the most frequent number of lanes per road type, as used to interpolate missing lane data.
+        This allows to share the statistics of a complete network among the parts it is processed in.
+
+        Args:
+            road_df (pd.DataFrame): road data with (at least) the columns 'highway' and 'lanes'.
+
+        Returns:
+            dict: keys = road types; values = lanes
+        """
+        _lanes_df = pd.DataFrame(
+            {
+                "road_type": road_df["highway"].replace(lookup.road_mapping()),
+                "lanes": DamageNetworkBase._get_clean_lanes(road_df["lanes"]),
+            }
+        )
+        return create_summary_statistics(_lanes_df)
+
+    def clean_and_interpolate_missing_lane_data(self):
+        # cleanup and complete the lane data.
+        self.gdf.lanes = self._get_clean_lanes(self.gdf.lanes)
 
         # boolean with trues for all nans, i.e. all road segements without lane data
         nans = self.gdf.lanes.isnull()
@@ -124,7 +153,7 @@ class DamageNetworkBase(ABC):
                     len(self.gdf.lanes), (~nans).sum(), nans.sum()
                 )
             )
-            lane_stats = create_summary_statistics(self.gdf)
+            lane_stats = self.lane_stats or create_summary_statistics(self.gdf)
 
             # Replace the missing lane data the neat way (without pandas SettingWithCopyWarning)
             lane_nans_mask = self.gdf.lanes.isnull()
@@ -196,19 +225,40 @@ class DamageNetworkBase(ABC):
             len(manual_damage_functions.damage_functions) > 0
         ), "No damage functions were loaded"
 
-        for _damage_func in manual_damage_functions.damage_functions.values():
-            # Add max damage values to df
-            df = _damage_func.add_max_damage(df, _damage_func.prefix)
-            for event in events:
-                # Add apply interpolator objects
-                event_prefix = event
-                df = _damage_func.calculate_damage(
-                    df, _damage_func.prefix, hazard_prefix, event_prefix
-                )
+        # only the flooded (segment, event) pairs are calculated,
+        # all at once as the (hazard of the) event 'wet' of the segments
+        wet = WetSegmentEvents.from_dataframe(df, events, hazard_prefix, "me")
+        wet_prefix = "wet"
+        wet_df = (
+            df[["road_type", "infra_type", "lanes", "length"]]
+            .iloc[wet.segment_index]
+            .reset_index(drop=True)
+        )
+        wet_df = wet_df.assign(
+            **{
+                "{}_{}_me".format(hazard_prefix, wet_prefix): wet.depth,
+                "{}_{}_fr".format(hazard_prefix, wet_prefix): wet.fraction,
+            }
+        )
 
-        # Only transfer the final results to the damage column
-        dam_cols = [c for c in df.columns if c.startswith("dam_")]
-        self.gdf[dam_cols] = df[dam_cols]
+        for _damage_func in manual_damage_functions.damage_functions.values():
+            # Add max damage values to the wet pairs
+            wet_df = _damage_func.add_max_damage(wet_df, _damage_func.prefix)
+            # Add apply interpolator objects
+            wet_df = _damage_func.calculate_damage(
+                wet_df, _damage_func.prefix, hazard_prefix, wet_prefix
+            )
+            damage = wet_df[
+                "dam_{}_{}".format(wet_prefix, _damage_func.prefix)
+            ].to_numpy(dtype=float)
+
+            # Only transfer the final results to the damage column
+            dam_cols = [
+                "dam_{}_{}".format(event, _damage_func.prefix) for event in wet.events
+            ]
+            self.gdf[dam_cols] = pd.DataFrame(
+                wet.scatter(damage), index=df.index, columns=dam_cols
+            )
         logging.info(
             "Damage calculation with the manual damage functions was succesfull."
         )
@@ -241,7 +291,7 @@ class DamageNetworkBase(ABC):
         # Load the Huizinga damage functions
         curve_name = "HZ"
 
-        df_max_damages_huizinga = pd.DataFrame.from_dict(
+        max_damages_huizinga = LookUpMatrix.from_dict(
             lookup.get_max_damages_huizinga()
         )
         interpolator = lookup.get_flood_curves()[
@@ -250,29 +300,24 @@ class DamageNetworkBase(ABC):
 
         df = self._gdf_mask
         df["lanes"] = df["lanes"].astype(int)
-        df["max_dam_hz"] = df.apply(
-            dataframe_lookup,
-            args=(df_max_damages_huizinga, ["lanes", "road_type"]),
-            axis=1,
+        max_dam_hz = max_damages_huizinga.get_values(df["road_type"], df["lanes"])
+        length = df["length"].to_numpy(dtype=float)
+
+        # only the flooded (segment, event) pairs are calculated
+        wet = WetSegmentEvents.from_dataframe(df, events, hazard_prefix, end)
+        damage = np.round(
+            max_dam_hz[wet.segment_index]  # max damage (euro/m)
+            * interpolator(wet.depth).astype(float)  # damage curve  (-)
+            * wet.fraction  # inundated fraction (-)
+            * length[wet.segment_index],  # length segment (m)
+            2,
         )
 
-        for event in events:
-            df["dam_{}_{}".format(event, curve_name)] = round(
-                df["max_dam_hz"].astype(float)  # max damage (euro/m)
-                * interpolator(df["{}_{}_{}".format(hazard_prefix, event, end)]).astype(
-                    float
-                )  # damage curve  (-)
-                * df["{}_{}_{}".format(hazard_prefix, event, "fr")].astype(
-                    float
-                )  # inundated fraction (-)
-                * df["length"],
-                2,
-            )  # length segment (m)
-
         # Add the new columns add the right location to the df
-        dam_cols = [c for c in df.columns if c.startswith("dam_")]
-
-        self.gdf[dam_cols] = df[dam_cols]
+        dam_cols = ["dam_{}_{}".format(event, curve_name) for event in wet.events]
+        self.gdf[dam_cols] = pd.DataFrame(
+            wet.scatter(damage), index=df.index, columns=dam_cols
+        )
         logging.info(
             "calculate_damage_HZ(): Damage calculation with the Huizinga damage functions was successful"
         )
@@ -280,22 +325,30 @@ class DamageNetworkBase(ABC):
     def calculate_damage_OSdaMage(self, events: list[str]) -> None:
         """Damage calculation with the OSdaMage functions"""
 
-        def interpolate_damage(row, representative_damage_percentage):
-            # Extract the tuple of damage values from the row
-            damage_values = row["dam_{}_{}_quartiles".format(curve_name, event)]
-
-            # Quantile values corresponding to the damage values
+        def interpolate_damage(
+            damages: np.ndarray, representative_damage_percentage: float
+        ) -> np.ndarray:
+            # Quantile values corresponding to the damage values (last axis of damages)
             percentages = [0, 25, 50, 75, 100]
 
-            # Perform linear interpolation using interp1d from scipy
-            _interpolator = interp1d(
-                percentages, damage_values, kind="linear", fill_value="extrapolate"
+            # Perform linear (extrapolated) interpolation between the two enclosing quantiles,
+            # equivalent to `interp1d(percentages, damage_values, fill_value="extrapolate")` per row
+            _upper = int(
+                np.clip(
+                    np.searchsorted(percentages, representative_damage_percentage),
+                    1,
+                    len(percentages) - 1,
+                )
+            )
+            _lower_percentage, _upper_percentage = percentages[_upper - 1 : _upper + 1]
+            _lower_damage = damages[..., _upper - 1]
+            _upper_damage = damages[..., _upper]
+            _slope = (_upper_damage - _lower_damage) / (
+                _upper_percentage - _lower_percentage
+            )
+            return _lower_damage + _slope * (
+                representative_damage_percentage - _lower_percentage
             )
-
-            # Interpolate the damage value for the given representative_damage_percentage
-            interpolated_damage = _interpolator(representative_damage_percentage)
-
-            return interpolated_damage
 
         # These factors are derived from: Van Ginkel et al. 2021: https://nhess.copernicus.org/articles/21/1011/2021/
         logging.warning(
@@ -328,7 +381,6 @@ class DamageNetworkBase(ABC):
 
         # Prepare the output files
         df = self._gdf_mask
-        df["tuple"] = [tuple([0] * 5)] * len(df["lanes"])
 
         # CALCULATE MINIMUM AND MAXIMUM CONSTRUCTION COST PER ROAD TYPE
         # pre-calculation of max damages per percentage (same for each C1-C6 category)
@@ -343,69 +395,56 @@ class DamageNetworkBase(ABC):
         cols_to_scale = ["lower_damage", "upper_damage"]
         df = scale_damage_using_lanes(lane_scale_factors, df, cols_to_scale)
 
-        # create separate column for each percentage of construction costs (is faster then tuple)
-        for percentage in [
-            0,
-            25,
-            50,
-            75,
-            100,
-        ]:  # So this interpolates the min to the max damage
-            df["damage_{}".format(percentage)] = (
-                df["upper_damage"] * percentage / 100
-            ) + (df["lower_damage"] * (100 - percentage) / 100)
+        # only the flooded (segment, event) pairs are calculated
+        wet = WetSegmentEvents.from_dataframe(df, events, hazard_prefix, end)
+        lower_damage = df["lower_damage"].to_numpy(dtype=float)[wet.segment_index]
+        upper_damage = df["upper_damage"].to_numpy(dtype=float)[wet.segment_index]
+        length = df["length"].to_numpy(dtype=float)[wet.segment_index]
+
+        # damage per percentage of construction costs (wet pairs x percentages),
+        # so this interpolates the min to the max damage
+        percentages = np.array([0, 25, 50, 75, 100])
+        max_damage_per_percentage = (
+            upper_damage[:, None] * percentages / 100
+            + lower_damage[:, None] * (100 - percentages) / 100
+        )
 
+        dam_df = pd.DataFrame(index=df.index)
         for curve_name, interpolator in interpolators.items():
             # print(curve_name, interpolator)
-            for event in events:
-                for percentage in [0, 25, 50, 75, 100]:
-                    df["dam_{}_{}_{}".format(percentage, curve_name, event)] = round(
-                        df["damage_{}".format(percentage)].astype(
-                            float
-                        )  # max damage (in euro/m)
-                        * interpolator(
-                            df["{}_{}_{}".format(hazard_prefix, event, end)]
-                        ).astype(
-                            float
-                        )  # damage curve: fraction f(depth-cm) #Todo check units
-                        * df["{}_{}_{}".format(hazard_prefix, event, "fr")].astype(
-                            float
-                        )  # inundated fraction of the segment should be in km. because max damage (in euro/km)
-                        * df["length"].astype(float),
-                        3,
-                    )
-
-                # This wraps it all in tuple again
-                df["dam_{}_{}_quartiles".format(curve_name, event)] = tuple(
-                    zip(
-                        df["dam_0_{}_{}".format(curve_name, event)],
-                        df["dam_25_{}_{}".format(curve_name, event)],
-                        df["dam_50_{}_{}".format(curve_name, event)],
-                        df["dam_75_{}_{}".format(curve_name, event)],
-                        df["dam_100_{}_{}".format(curve_name, event)],
-                    )
+            damage_per_percentage = np.round(
+                max_damage_per_percentage  # max damage (in euro/m)
+                * interpolator(wet.depth).astype(float)[
+                    :, None
+                ]  # damage curve: fraction f(depth-cm) #Todo check units
+                * wet.fraction[
+                    :, None
+                ]  # inundated fraction of the segment should be in km. because max damage (in euro/km)
+                * length[:, None],
+                3,
+            )
+            quartiles = np.stack(
+                [wet.scatter(damage_per_percentage[:, i]) for i in range(5)],
+                axis=-1,
+            )
+            representative = wet.scatter(
+                interpolate_damage(
+                    damage_per_percentage, self.representative_damage_percentage
                 )
-                df[f"dam_{curve_name}_{event}_representative"] = (
-                    df.apply(
-                        lambda row: interpolate_damage(
-                            row, self.representative_damage_percentage
-                        ),
-                        axis=1,
-                    )
-                ).astype(float)
-
-                # And throw way all intermediate results (that are not in the tuple)
-                df = df.drop(
-                    columns=[
-                        "dam_{}_{}_{}".format(percentage, curve_name, event)
-                        for percentage in [0, 25, 50, 75, 100]
-                    ]
+            )
+            for i, event in enumerate(wet.events):
+                # This wraps it all in tuple again (also without flooded segments an object column)
+                dam_df["dam_{}_{}_quartiles".format(curve_name, event)] = pd.Series(
+                    list(map(tuple, quartiles[:, i].tolist())),
+                    index=dam_df.index,
+                    dtype=object,
                 )
-
-        df = df.drop(columns=[c for c in df.columns if c.startswith("damage_")])
+                dam_df[f"dam_{curve_name}_{event}_representative"] = representative[
+                    :, i
+                ]
 
         # drop invalid combinations of damage curves and road types (C1-C4 for motorways; C5,C6 for other)
-        all_dam_cols = [c for c in df.columns if c.startswith("dam_")]
+        all_dam_cols = list(dam_df.columns)
         motorway_curves = [
             c for c in all_dam_cols if int(c.split("_")[1][-1]) <= 4
         ]  # C1-C4
@@ -416,13 +455,13 @@ class DamageNetworkBase(ABC):
         is_motorway_mask = df["road_type"].isin(["motorway", "trunk"])
 
         for curve in other_curves:
-            df.loc[is_motorway_mask, curve] = np.nan
+            dam_df.loc[is_motorway_mask, curve] = np.nan
 
         for curve in motorway_curves:
-            df.loc[~is_motorway_mask, curve] = np.nan
+            dam_df.loc[~is_motorway_mask, curve] = np.nan
 
         # Add the new columns add the right location to the df
-        self.gdf[all_dam_cols] = df[all_dam_cols]
+        self.gdf[all_dam_cols] = dam_df
         logging.info(
             "calculate_damage_OSdaMage(): Damage calculation with the OSdaMage functions was succesfull"
         )
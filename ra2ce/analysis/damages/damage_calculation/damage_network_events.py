@@ -43,9 +43,12 @@ class DamageNetworkEvents(DamageNetworkBase):
         road_gdf: GeoDataFrame,
         val_cols: list[str],
         representative_damage_percentage: float,
+        lane_stats: dict | None = None,
     ):
         # Construct using the parent class __init__
-        super().__init__(road_gdf, val_cols, representative_damage_percentage)
+        super().__init__(
+            road_gdf, val_cols, representative_damage_percentage, lane_stats
+        )
         self.events = set([x.split("_")[1] for x in val_cols])  # set of unique events
 
         if not any(self.events):
@@ -19,10 +19,8 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-import logging
 from pathlib import Path
 
-import numpy as np
 import pandas as pd
 from geopandas import GeoDataFrame
 
@@ -36,6 +34,7 @@ from ra2ce.analysis.damages.damage_calculation.damage_network_base import (
 from ra2ce.analysis.damages.shape_to_integrate_object.to_integrate_shaper_factory import (
     ToIntegrateShaperFactory,
 )
+from ra2ce.analysis.risk_calculation_engine import RiskCalculationEngine
 
 
 class DamageNetworkReturnPeriods(DamageNetworkBase):
@@ -54,9 +53,12 @@ class DamageNetworkReturnPeriods(DamageNetworkBase):
         road_gdf: GeoDataFrame,
         val_cols: list[str],
         representative_damage_percentage: float,
+        lane_stats: dict | None = None,
     ):
         # Construct using the parent class __init__
-        super().__init__(road_gdf, val_cols, representative_damage_percentage)
+        super().__init__(
+            road_gdf, val_cols, representative_damage_percentage, lane_stats
+        )
 
         self.return_periods = set(
             [x.split("_")[1] for x in val_cols]
@@ -129,74 +131,11 @@ class DamageNetworkReturnPeriods(DamageNetworkBase):
             return_periods=return_periods
         )
 
-        for vulnerability_curve_name, _to_integrate in _to_integrate_dict.items():
-            if mode == RiskCalculationModeEnum.DEFAULT:
-                _to_integrate = self.rework_damage_data_default(_to_integrate)
-                _risk = self.integrate_df_trapezoidal(_to_integrate.copy())
-
-            _rps = list(_to_integrate.columns)
-
-            if mode == RiskCalculationModeEnum.CUT_FROM_YEAR:
-                """
-                In this mode, the integration mimics the presence of a flood protection
-                """
-
-                if year <= min(_rps):
-                    raise ValueError(
-                        """
-                    RA2CE cannot calculate risk in 'cut_from' mode if 
-                    Return period of the cutoff ({}) <= smallest available return period ({})
-                    Use 'default' mode or 'triangle_to_null_mode' instead.
-                                        """.format(
-                            year, min(_rps)
-                        )
-                    )
-
-                elif (
-                    min(_rps) < year < max(_rps)
-                ):  # if protection level is between min and max RP
-                    _to_integrate = self.rework_damage_data_cut_from(
-                        _to_integrate, year
-                    )
-                    _risk = self.integrate_df_trapezoidal(_to_integrate.copy())
-
-                elif year >= max(
-                    _rps
-                ):  # cutoff is larger or equal than largest return period
-                    # risk is return frequency of cutoff
-                    # times the damage of the most extreme event
-                    _to_integrate = _to_integrate.fillna(0)
-                    _risk = _to_integrate[max(_to_integrate.columns)] / year
-
-            elif mode == RiskCalculationModeEnum.TRIANGLE_TO_NULL_YEAR:
-                """
-                In this mode, an extra data point with zero damage is added at some distance from the smallest known RP,
-                and the area of the Triangle this creates is also calculated
-                """
-
-                if year >= min(_rps) and year != 0:
-                    raise ValueError(
-                        """
-                    RA2CE cannot calculate risk in 'triangle_to_null' mode if 
-                    Return period of the triangle ({}) >= smallest available return period ({})
-                    Use 'default' mode or 'cut_from' instead.
-                                        """.format(
-                            year, min(_rps)
-                        )
-                    )
-
-                if year == 0:
-                    logging.warning(
-                        "Available lane data cannot simply be converted to float/int, RA2CE will try a clean-up."
-                    )
-                    year = 1
-
-                _to_integrate = self.rework_damage_data_triangle_to_null(
-                    _to_integrate, year
-                )
-                _risk = self.integrate_df_trapezoidal(_to_integrate.copy())
-
-            self.gdf[f"risk_{vulnerability_curve_name}"] = _risk
+        _risk = RiskCalculationEngine.from_dataframes(_to_integrate_dict).get_risk(
+            mode, year
+        )
+        for i, vulnerability_curve_name in enumerate(_to_integrate_dict.keys()):
+            self.gdf[f"risk_{vulnerability_curve_name}"] = _risk[:, i]
 
     def verify_damage_data_for_risk_calculation(self):
         """
@@ -207,142 +146,3 @@ class DamageNetworkReturnPeriods(DamageNetworkBase):
         # Check if there is only one unique damage function
         # RP should in the column name
         pass
-
-    @staticmethod
-    def integrate_df_trapezoidal(df: pd.DataFrame) -> np.array:
-        """
-        Arguments:
-            *df* (pd.DataFrame) :
-                Column names should contain return periods (years)
-                Each row should contain a set of damages for one object
-
-        Returns:
-            np.array : integrated result per row
-
-        """
-        # convert return periods to frequencies
-        df.columns = [1 / RP for RP in df.columns]
-        # sort columns by ascending frequency
-        df = df.sort_index(axis="columns")
-        values = df.values
-        frequencies = df.columns
-        return np.trapezoid(values, frequencies, axis=1)
-
-    @staticmethod
-    def rework_damage_data_default(to_integrate: pd.DataFrame) -> pd.DataFrame:
-        """
-        Rework the damage data to make it suitable for integration (risk calculation) in default mode
-
-        :param _to_integrate:
-        :return: _to_integrate
-        """
-        # Copy the maximum return period with an infinitely high damage
-        _max_return_period = max(to_integrate.columns)
-        to_integrate[float("inf")] = to_integrate[_max_return_period]
-
-        # Stop integrating at the last known return period, so no further manipulation needed
-        _min_return_period = min(to_integrate.columns)
-
-        to_integrate = to_integrate.fillna(0)
-
-        logging.info(
-            """Risk calculation runs in 'default' mode. 
-                    Assumptions:
-                        - for all return periods > max RP{}, damage = dam_RP{}
-                        - for all return periods < min RP{}, damage = 0
-
-                    """.format(
-                _max_return_period, _max_return_period, _min_return_period
-            )
-        )
-        return to_integrate
-
-    @staticmethod
-    def rework_damage_data_cut_from(
-        to_integrate: pd.DataFrame, cutoff_rp: int
-    ) -> pd.DataFrame:
-        """
-        Rework the damage data to make it suitable for integration (risk calculation) in default mode
-
-        :param _to_integrate:
-                _cutoff_rp : the return period at which to make the cutoff, aka the flood protection level
-        :return: _to_integrate
-        """
-        _rps = list(to_integrate.columns)
-
-        if cutoff_rp in _rps:
-            _dropcols = [rp for rp in _rps if rp < cutoff_rp]
-            to_integrate = to_integrate.drop(columns=_dropcols)
-        else:
-            # find position of first RP value < PL
-            # pos = _rps.index(next(i for i in _rps if i < _cutoff_rp))
-            # _to_integrate = _to_integrate[_rps[0:pos+1]] #remove all the values with smaller RPs than the PL
-
-            _frequencies = to_integrate.copy()
-            _frequencies.columns = [1 / c for c in _frequencies.columns]
-
-            _frequencies[1 / cutoff_rp] = np.nan
-            _frequencies = _frequencies.interpolate(method="index", axis=1)
-
-            # Drop the columns outside the cutoff
-            _dropcols = [c for c in _frequencies.columns if c > 1 / cutoff_rp]
-            _frequencies = _frequencies.drop(columns=_dropcols)
-
-            to_integrate = _frequencies
-            to_integrate.columns = [1 / c for c in to_integrate.columns]
-
-            # Copy the maximum return period with an infinitely high damage
-            _max_return_period = max(to_integrate.columns)
-            to_integrate[float("inf")] = to_integrate[_max_return_period]
-
-            to_integrate = to_integrate.fillna(0)
-
-        logging.info(
-            """Risk calculation runs in 'cut_from' mode. 
-                                Assumptions:
-                                    - for all return periods > max RP{}, damage = dam_RP{}
-                                    - damage at cutoff is linearly interpolated from known damages
-                                    - no damage for al RPs > RP_cutoff ({})
-
-                                """.format(
-                _max_return_period, _max_return_period, cutoff_rp
-            )
-        )
-
-        return to_integrate
-
-    @staticmethod
-    def rework_damage_data_triangle_to_null(
-        to_integrate: pd.DataFrame, triangle_end: float
-    ) -> pd.DataFrame:
-        """
-        Rework the damage data to make it suitable for integration (risk calculation) in default mode
-
-        :param _to_integrate:
-                _triangle_end_rp : the return period at to end the triangle
-        :return: _to_integrate
-        """
-        # Copy the maximum return period with an infinitely high damage
-        _max_return_period = max(to_integrate.columns)
-        to_integrate[float("inf")] = to_integrate[_max_return_period]
-
-        # At the return period of the triangle end, set all damage values to zero
-        to_integrate[triangle_end] = 0
-
-        to_integrate = to_integrate.sort_index(
-            axis="columns", ascending=False
-        )  # from large to small RP
-
-        to_integrate = to_integrate.fillna(0)
-
-        logging.info(
-            """Risk calculation runs in 'triangle to null' mode. 
-                                Assumptions:
-                                    - for all return periods > max RP{}, damage = dam_RP{}
-                                    - at the end of the triangle {}, damage = 0
-
-                                """.format(
-                _max_return_period, _max_return_period, triangle_end
-            )
-        )
-        return to_integrate
@@ -0,0 +1,109 @@
+"""
+                    GNU GENERAL PUBLIC LICENSE
+                      Version 3, 29 June 2007
+
+    Risk Assessment and Adaptation for Critical Infrastructure (RA2CE).
+    Copyright (C) 2023-2026 Stichting Deltares
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(kw_only=True)
+class WetSegmentEvents:
+    """
+    Sparse representation of the hazard on the road segments: only the
+    (segment, event) pairs with an inundated part of the segment are kept, as coordinate
+    arrays, so damages only need to be calculated for the flooded footprint.
+
+    Pairs with known hazard data but no inundated fraction have no damage, pairs
+    without hazard data have an unknown (nan) damage. The damage curves are still
+    evaluated for inundated pairs without (positive) depth, as these can have damage.
+    """
+
+    n_segments: int
+    events: list[str]
+    segment_index: np.ndarray
+    event_index: np.ndarray
+    depth: np.ndarray
+    fraction: np.ndarray
+    dry_segment_index: np.ndarray
+    dry_event_index: np.ndarray
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        road_df: pd.DataFrame,
+        events: list[str],
+        hazard_prefix: str,
+        depth_statistic: str,
+    ) -> WetSegmentEvents:
+        """
+        Compresses the hazard columns of the road segments to the inundated (segment, event) pairs.
+
+        Args:
+            road_df (pd.DataFrame): road segments with the hazard columns (e.g. `F_EV1_me` and `F_EV1_fr`).
+            events (list[str]): events (or return periods) as found in the hazard column names.
+            hazard_prefix (str): prefix of the hazard columns, e.g. 'F'.
+            depth_statistic (str): statistic of the water depth to use, e.g. 'me'.
+
+        Returns:
+            WetSegmentEvents: The inundated (segment, event) pairs.
+        """
+        _events = list(events)
+        _depths = road_df[
+            [f"{hazard_prefix}_{_event}_{depth_statistic}" for _event in _events]
+        ].to_numpy(dtype=float)
+        _fractions = road_df[
+            [f"{hazard_prefix}_{_event}_fr" for _event in _events]
+        ].to_numpy(dtype=float)
+
+        # Pairs without hazard data are neither wet nor dry.
+        _is_known = ~np.isnan(_depths) & ~np.isnan(_fractions)
+        _segment_index, _event_index = np.nonzero(_is_known & (_fractions != 0))
+        _dry_segment_index, _dry_event_index = np.nonzero(
+            _is_known & (_fractions == 0)
+        )
+        return cls(
+            n_segments=len(road_df),
+            events=_events,
+            segment_index=_segment_index,
+            event_index=_event_index,
+            depth=_depths[_segment_index, _event_index],
+            fraction=_fractions[_segment_index, _event_index],
+            dry_segment_index=_dry_segment_index,
+            dry_event_index=_dry_event_index,
+        )
+
+    def scatter(self, values: np.ndarray) -> np.ndarray:
+        """
+        Scatters values of the wet pairs back to a (segments x events) matrix.
+
+        Args:
+            values (np.ndarray): value of each wet pair.
+
+        Returns:
+            np.ndarray: the values of all pairs, with 0 for the dry pairs and nan for pairs without hazard data.
+        """
+        _matrix = np.full((self.n_segments, len(self.events)), np.nan)
+        _matrix[self.dry_segment_index, self.dry_event_index] = 0.0
+        _matrix[self.segment_index, self.event_index] = values
+        return _matrix
@@ -29,6 +29,7 @@ from ra2ce.analysis.damages.damage_functions.damage_fraction_uniform import (
     DamageFractionUniform,
 )
 from ra2ce.analysis.damages.damage_functions.max_damage import MaxDamage
+from ra2ce.analysis.damages.damages_lookup import LookUpMatrix
 
 
 @dataclass(kw_only=True)
@@ -101,12 +102,10 @@ class DamageFunctionByRoadTypeByLane:
         assert "road_type" in cols, "no column 'road type' in df"
         assert "lanes" in cols, "no column 'lanes in df"
 
-        max_damage_data = self.max_damage.data
-
-        def _get_damage(row):
-            return max_damage_data.at[row["infra_type"], row["lanes"]]
-
-        df["{}_temp_max_dam".format(prefix)] = df.apply(_get_damage, axis=1)
+        _max_damages = LookUpMatrix.from_dataframe(self.max_damage.data)
+        df["{}_temp_max_dam".format(prefix)] = _max_damages.get_values(
+            df["infra_type"], df["lanes"]
+        )
         return df
 
     def calculate_damage(
@@ -18,12 +18,18 @@ from ra2ce.analysis.analysis_config_data.enums.risk_calculation_mode_enum import
 )
 from ra2ce.analysis.analysis_input_wrapper import AnalysisInputWrapper
 from ra2ce.analysis.analysis_result.analysis_result import AnalysisResult
+from ra2ce.analysis.analysis_result.analysis_result_parquet_writer import (
+    AnalysisResultParquetWriter,
+)
 from ra2ce.analysis.analysis_result.analysis_result_wrapper import AnalysisResultWrapper
 from ra2ce.analysis.damages.analysis_damages_protocol import AnalysisDamagesProtocol
 from ra2ce.analysis.damages.damage_calculation import (
     DamageNetworkEvents,
     DamageNetworkReturnPeriods,
 )
+from ra2ce.analysis.damages.damage_calculation.damage_network_base import (
+    DamageNetworkBase,
+)
 from ra2ce.analysis.damages.damage_functions.manual_damage_functions import (
     ManualDamageFunctions,
 )
@@ -42,6 +48,7 @@ class Damages(AnalysisBase, AnalysisDamagesProtocol):
     output_path: Path
     reference_base_graph_hazard: MultiGraph
     manual_damage_functions: ManualDamageFunctions = None
+    hazard_prefix: str = "F"
 
     def __init__(
         self, analysis_input: AnalysisInputWrapper, base_graph_hazard: MultiGraph
@@ -58,6 +65,131 @@ class Damages(AnalysisBase, AnalysisDamagesProtocol):
             )
 
     def execute(self) -> AnalysisResultWrapper:
+        if self.analysis.chunk_size:
+            _segment_based_result = self._get_analysis_result(
+                GeoDataFrame(), self.analysis.name + "_segmented"
+            )
+            # Streamed to the `.parquet` export when requested, otherwise to an
+            # intermediate file which is removed once the result is exported.
+            _segment_based_result.analysis_result_file = (
+                _segment_based_result.base_export_path.with_suffix(
+                    ".parquet"
+                    if self.analysis.save_parquet
+                    else ".intermediate.parquet"
+                )
+            )
+            _segment_based_result.analysis_result = (
+                self._get_result_segment_based_in_chunks(
+                    self.analysis.chunk_size,
+                    _segment_based_result.analysis_result_file,
+                )
+            )
+            return self._get_result_wrapper(_segment_based_result)
+        return self.generate_result_wrapper(
+            self._get_result_segment_based(self.graph_file_hazard.get_graph())
+        )
+
+    def _get_result_segment_based_in_chunks(
+        self, chunk_size: int, result_file: Path
+    ) -> GeoDataFrame:
+        """
+        Calculates the segment based result per chunk of (at most) `chunk_size` segments,
+        so the temporary data of the damage and risk calculation never spans the whole network.
+        The result of each chunk is written to the (GeoParquet) result file, only its
+        damage and risk columns are kept to derive the link based result.
+        The lane statistics are derived from the whole network first, so the result
+        does not depend on the chunk size.
+
+        Args:
+            chunk_size (int): Maximum number of segments per chunk.
+            result_file (Path): GeoParquet file to write the segment based result to.
+
+        Returns:
+            GeoDataFrame: The segment ids with their damage and risk values of all chunks.
+        """
+        _lane_stats = DamageNetworkBase.get_lane_statistics(
+            pd.concat(
+                self.graph_file_hazard.get_graph_chunks(
+                    chunk_size, columns=["highway", "lanes"]
+                )
+            )
+        )
+        _segment_id_column = "rfid_c"
+        _chunk_results = []
+        with AnalysisResultParquetWriter(export_path=result_file) as _writer:
+            for _i, _road_gdf_chunk in enumerate(
+                self.graph_file_hazard.get_graph_chunks(chunk_size)
+            ):
+                logging.info(
+                    "Calculating damages of chunk %s (%s segments).",
+                    _i,
+                    len(_road_gdf_chunk),
+                )
+                _chunk_result = self._get_result_segment_based(
+                    _road_gdf_chunk, _lane_stats
+                )
+                _chunk_results.append(
+                    pd.DataFrame(
+                        _chunk_result[
+                            [_segment_id_column]
+                            + self._get_hazard_columns(_chunk_result.columns)
+                            + self._get_result_columns(_chunk_result.columns)
+                        ]
+                    )
+                )
+                _writer.write(_chunk_result)
+        return GeoDataFrame(pd.concat(_chunk_results))
+
+    def _get_hazard_columns(self, columns: list[str]) -> list[str]:
+        # The hazard columns are named `{hazard_prefix}_{hazard name}_{aggregation}`,
+        # see `_get_result_segment_based`.
+        return [
+            _column
+            for _column in columns
+            if _column.startswith(f"{self.hazard_prefix}_")
+        ]
+
+    def _get_result_columns(self, columns: list[str]) -> list[str]:
+        """
+        Gets the damage (and risk) columns of the segment based result: the damage
+        columns of the damage curve for each hazard (event or return period) of the
+        hazard columns and, for return periods, the risk columns.
+
+        Args:
+            columns (list[str]): Columns of the segment based result.
+
+        Raises:
+            ValueError: When the damage curve is invalid.
+
+        Returns:
+            list[str]: The damage and risk columns, in the order of `columns`.
+        """
+        _damage_curve = self.analysis.damage_curve
+        _patterns = []
+        for _hazard_name in dict.fromkeys(
+            re.escape(_column.split("_")[1])
+            for _column in self._get_hazard_columns(columns)
+        ):
+            if _damage_curve == DamageCurveEnum.HZ:
+                # There is one damage column.
+                _patterns.append(rf"dam_{_hazard_name}_{_damage_curve}")
+            elif _damage_curve == DamageCurveEnum.OSD:
+                _patterns.append(rf"dam_.*_{_hazard_name}_representative")
+            elif _damage_curve == DamageCurveEnum.MAN:
+                _patterns.append(rf"dam_{_hazard_name}_.*")
+            else:
+                raise ValueError(f"damage curve {_damage_curve} is invalid")
+        if self.analysis.event_type == EventTypeEnum.RETURN_PERIOD:
+            _patterns.append(r"risk.*")
+        return [
+            _column
+            for _column in columns
+            if any(re.fullmatch(_pattern, _column) for _pattern in _patterns)
+        ]
+
+    def _get_result_segment_based(
+        self, road_gdf: GeoDataFrame, lane_stats: dict | None = None
+    ) -> GeoDataFrame:
         def _rename_road_gdf_to_conventions(road_gdf_columns: list[str]) -> list[str]:
             """
             Rename the columns in the road_gdf to the conventions of the ra2ce documentation
@@ -78,15 +210,11 @@ class Damages(AnalysisBase, AnalysisDamagesProtocol):
             ### Todo add handling of events if this gives a problem
             return new_cols
 
-        hazard_prefix = "F"
-        # Open the network with hazard data
-        road_gdf = self.graph_file_hazard.get_graph()
+        hazard_prefix = self.hazard_prefix
         road_gdf.columns = _rename_road_gdf_to_conventions(road_gdf.columns)
 
         # Find the hazard columns; these may be events or return periods
-        val_cols = [
-            col for col in road_gdf.columns if f"{hazard_prefix}" in col.split("_")
-        ]
+        val_cols = self._get_hazard_columns(road_gdf.columns)
 
         # Read the desired damage function
         damage_function = self.analysis.damage_curve
@@ -94,18 +222,24 @@ class Damages(AnalysisBase, AnalysisDamagesProtocol):
         # Choose between event or return period based analysis
         if self.analysis.event_type == EventTypeEnum.EVENT:
             event_gdf = DamageNetworkEvents(
-                road_gdf, val_cols, self.analysis.representative_damage_percentage
+                road_gdf,
+                val_cols,
+                self.analysis.representative_damage_percentage,
+                lane_stats,
             )
             event_gdf.main(
                 damage_function=damage_function,
                 manual_damage_functions=self.manual_damage_functions,
             )
 
-            return self.generate_result_wrapper(event_gdf.gdf)
+            return event_gdf.gdf
 
         elif self.analysis.event_type == EventTypeEnum.RETURN_PERIOD:
             return_period_gdf = DamageNetworkReturnPeriods(
-                road_gdf, val_cols, self.analysis.representative_damage_percentage
+                road_gdf,
+                val_cols,
+                self.analysis.representative_damage_percentage,
+                lane_stats,
             )
             return_period_gdf.main(
                 damage_function=damage_function,
@@ -128,7 +262,7 @@ class Damages(AnalysisBase, AnalysisDamagesProtocol):
                              Add key [risk_calculation_mode] to analyses.ini."""
                 )
 
-            return self.generate_result_wrapper(return_period_gdf.gdf)
+            return return_period_gdf.gdf
 
         raise ValueError(
             "The hazard calculation does not know what to do if the analysis specifies {}".format(
@@ -150,26 +284,33 @@ class Damages(AnalysisBase, AnalysisDamagesProtocol):
         Returns:
             AnalysisResultWrapper: Result wrapper containing both link and segment based graphs.
         """
-        _result_segment_based = analyses_results[0]
-        _result_link_based = self._get_result_link_based(
-            base_graph_hazard=self.reference_base_graph_hazard,
-            result_segment_based=_result_segment_based,
+        return self._get_result_wrapper(
+            self._get_analysis_result(
+                analyses_results[0], self.analysis.name + "_segmented"
+            )
         )
 
-        def get_analysis_result(gdf_result: GeoDataFrame, name: str) -> AnalysisResult:
-            _ar = AnalysisResult(
-                analysis_result=gdf_result,
-                analysis_config=self.analysis,
-                output_path=self.output_path,
-            )
-            _ar.analysis_name = name
-            return _ar
+    def _get_analysis_result(
+        self, gdf_result: GeoDataFrame, name: str
+    ) -> AnalysisResult:
+        _ar = AnalysisResult(
+            analysis_result=gdf_result,
+            analysis_config=self.analysis,
+            output_path=self.output_path,
+        )
+        _ar.analysis_name = name
+        return _ar
 
+    def _get_result_wrapper(
+        self, segment_based_result: AnalysisResult
+    ) -> DamagesResultWrapper:
+        _result_link_based = self._get_result_link_based(
+            base_graph_hazard=self.reference_base_graph_hazard,
+            result_segment_based=segment_based_result.analysis_result,
+        )
         return DamagesResultWrapper(
-            segment_based_result=get_analysis_result(
-                _result_segment_based, self.analysis.name + "_segmented"
-            ),
-            link_based_result=get_analysis_result(
+            segment_based_result=segment_based_result,
+            link_based_result=self._get_analysis_result(
                 _result_link_based, self.analysis.name + "_link_based"
             ),
         )
@@ -179,50 +320,68 @@ class Damages(AnalysisBase, AnalysisDamagesProtocol):
         damages_link_based_graph: MultiDiGraph | MultiGraph,
         result_segment_based: pd.DataFrame,
         segment_id_column: str,
-        result_column: str,
-        segment_values_list: str,
+        result_columns: list[str],
     ) -> MultiDiGraph | MultiGraph:
         """
         Derive the values in the provided graph (link_based) based on the results of the segment-based graph.
+        The segment ids of all links are exploded once and all result columns are aggregated per link at once.
 
         Parameters:
         - damages_link_based_graph (MultiDiGraph | MultiGraph): The graph with link-based damage data.
         - result_segment_based (pd.DataFrame): DataFrame containing segment-based damage data.
         - segment_id_column (str): The column name in both the graph data and DataFrame representing segment IDs.
-        - result_column (str): The column name in the graph data and DataFrame representing the damage result.
-        - segment_values_list (str): The column name in the graph data to store the segment damage values.
+        - result_columns (list[str]): The column names in the graph data and DataFrame representing the results.
+            For each of them the segment values are stored in the graph data as `{result_column}_segments`.
 
         Returns:
         - damages_link_based_graph (MultiDiGraph | MultiGraph)
         """
-        for u, v, key, data in damages_link_based_graph.edges(keys=True, data=True):
-            damages_link_based_graph[u][v][key][segment_values_list] = []
-            damages_link_based_graph[u][v][key][result_column] = 0
+        if not result_columns:
+            return damages_link_based_graph
 
-        # Lookup segment_id_list for each edge
-        for u, v, key, data in damages_link_based_graph.edges(keys=True, data=True):
-            link_value = data[result_column]
-            segment_id_list = (
-                data[segment_id_column]
-                if isinstance(data[segment_id_column], list)
-                else [data[segment_id_column]]
+        _edges_data = [
+            _data for _, _, _data in damages_link_based_graph.edges(data=True)
+        ]
+        _segment_ids = [
+            (
+                _data[segment_id_column]
+                if isinstance(_data[segment_id_column], list)
+                else [_data[segment_id_column]]
             )
+            for _data in _edges_data
+        ]
+        _n_segments = np.fromiter(
+            map(len, _segment_ids), dtype=int, count=len(_edges_data)
+        )
+        _link_positions = np.repeat(np.arange(len(_edges_data)), _n_segments)
+        _split_offsets = np.cumsum(_n_segments)[:-1]
+
+        # Hash-indexed lookup of the (rounded) segment values of all exploded segment ids.
+        _segment_values = (
+            result_segment_based.drop_duplicates(subset=segment_id_column)
+            .set_index(segment_id_column)[result_columns]
+            .astype(float)
+            .round(2)
+            .reindex([_id for _ids in _segment_ids for _id in _ids])
+        )
+        _link_values = (
+            _segment_values.fillna(0)
+            .groupby(_link_positions)
+            .sum()
+            .reindex(range(len(_edges_data)), fill_value=0)
+            .round(2)
+        )
 
-            # Read value for each segment_id & append to segment_values_list and calculate link_value
-            for segment_id in segment_id_list:
-                segment_value = result_segment_based.loc[
-                    result_segment_based[segment_id_column] == segment_id,
-                    result_column,
-                ].squeeze()
-
-                data[segment_values_list].append(round(segment_value, 2))
-
-                if np.isnan(segment_value):
-                    segment_value = 0
-
-                link_value += round(segment_value, 2)
-
-            data[result_column] = round(link_value, 2)
+        for result_column in result_columns:
+            _segment_values_list = np.split(
+                _segment_values[result_column].to_numpy(), _split_offsets
+            )
+            _link_value_list = _link_values[result_column].to_numpy()
+            for _data, _segment_value, _link_value in zip(
+                _edges_data, _segment_values_list, _link_value_list
+            ):
+                _data[f"{result_column}_segments"] = _segment_value.tolist()
+                _data[result_column] = _link_value
         return damages_link_based_graph
 
     def _get_result_link_based(
@@ -231,72 +390,24 @@ class Damages(AnalysisBase, AnalysisDamagesProtocol):
         result_segment_based: GeoDataFrame,
     ) -> GeoDataFrame:
         # Step 00: define parameters
-        damage_curve = self.analysis.damage_curve
         segment_id_column = "rfid_c"
 
-        # Find the hazard columns; these may be events or return periods
-        event_cols = [
-            col
-            for col in result_segment_based.columns
-            if (col[0].isupper() and col[1] == "_")
-        ]
-        events = set([x.split("_")[1] for x in event_cols])  # set of unique events
-
         # Step 0: create a deep copy of the base_graph_hazard to compose further as the final outcome of this process
         damages_link_based_graph = base_graph_hazard.copy()
 
-        # Step 1: Create a new attribute damage_segments_list for each edge
-        for event in events:
-            if damage_curve == self.analysis.damage_curve.HZ:
-                damage_result_columns = [
-                    f"dam_{event}_{damage_curve}"
-                ]  # there is one damage column
-            elif damage_curve == self.analysis.damage_curve.OSD:
-                pattern = rf"dam_.*_{event}_representative"
-                damage_result_columns = [
-                    col
-                    for col in result_segment_based.columns
-                    if re.match(pattern, col)
-                ]
-                # there are multiple damage columns
-            elif damage_curve == self.analysis.damage_curve.MAN:
-                pattern = rf"dam_{event}_.*"
-                damage_result_columns = [
-                    col
-                    for col in result_segment_based.columns
-                    if re.match(pattern, col)
-                ]  # there are multiple damage columns
-            else:
-                raise ValueError(f"damage curve {damage_curve} is invalid")
-
-            for damage_result_column in damage_result_columns:
-                # Step 2: Get damage of each link.
-                # Read damage for each segment_id & append to damage_segments_list and calculate link_damage
-                damages_link_based_graph = self._update_link_based_values(
-                    damages_link_based_graph=damages_link_based_graph,
-                    result_segment_based=result_segment_based,
-                    segment_id_column=segment_id_column,
-                    result_column=damage_result_column,
-                    segment_values_list=f"{damage_result_column}_segments",
-                )
+        # Step 1: Collect the damage and risk result columns of each event
+        result_columns = self._get_result_columns(list(result_segment_based.columns))
 
-        # Step 3: get risk of each link.
-        # Read risk for each segment_id & append to risk_segments_list and calculate link_risk
-        if self.analysis.event_type == EventTypeEnum.RETURN_PERIOD:
-            pattern = r"(risk.*)"
-            risk_result_columns = [
-                col for col in result_segment_based.columns if re.match(pattern, col)
-            ]
-            for risk_result_column in risk_result_columns:
-                damages_link_based_graph = self._update_link_based_values(
-                    damages_link_based_graph=damages_link_based_graph,
-                    result_segment_based=result_segment_based,
-                    segment_id_column=segment_id_column,
-                    result_column=risk_result_column,
-                    segment_values_list=f"{risk_result_column}_segments",
-                )
+        # Step 2: get damage and risk of each link.
+        # Read the value for each segment_id into `{column}_segments` and calculate the link value
+        damages_link_based_graph = self._update_link_based_values(
+            damages_link_based_graph=damages_link_based_graph,
+            result_segment_based=result_segment_based,
+            segment_id_column=segment_id_column,
+            result_columns=result_columns,
+        )
 
-        # Step 4: Convert the edge attributes to a GeoDataFrame
+        # Step 3: Convert the edge attributes to a GeoDataFrame
         edge_attributes = []
         for u, v, key, data in damages_link_based_graph.edges(keys=True, data=True):
             edge_attributes.append({**{"u": u, "v": v, "key": key}, **data})
@@ -19,10 +19,12 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+from __future__ import annotations
+
 import os
 from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
 
 import numpy as np
 import pandas as pd
@@ -30,9 +32,80 @@ from pandas import DataFrame
 from scipy.interpolate import interp1d
 
 
-def dataframe_lookup(row: pd.Series, lookup_df: DataFrame, columns: list) -> Any:
-    row_values = [row[column] for column in columns]
-    return lookup_df.loc[tuple(row_values)]
+@dataclass(kw_only=True)
+class LookUpMatrix:
+    """
+    Road type x lane lookup table compiled into a NumPy matrix, so the values
+    for all rows of a dataframe can be retrieved with a single gather
+    instead of a row-wise lookup.
+    """
+
+    road_types: pd.Index
+    lanes: pd.Index
+    values: np.ndarray
+
+    @classmethod
+    def from_dataframe(cls, lookup_df: DataFrame) -> LookUpMatrix:
+        """
+        Compiles a lookup dataframe with the road types as index and the lanes as columns.
+
+        Args:
+            lookup_df (DataFrame): Lookup table (e.g. `MaxDamage.data`).
+
+        Returns:
+            LookUpMatrix: The compiled lookup matrix.
+        """
+        return cls(
+            road_types=pd.Index(lookup_df.index),
+            lanes=pd.Index(lookup_df.columns),
+            values=lookup_df.to_numpy(dtype=float),
+        )
+
+    @classmethod
+    def from_dict(cls, lookup_dict: dict[str, dict[int, float]]) -> LookUpMatrix:
+        """
+        Compiles a nested lookup dictionary `{road_type: {lane: value}}`.
+
+        Args:
+            lookup_dict (dict[str, dict[int, float]]): Lookup table (e.g. `LookUp.get_max_damages_huizinga()`).
+
+        Returns:
+            LookUpMatrix: The compiled lookup matrix.
+        """
+        return cls.from_dataframe(pd.DataFrame.from_dict(lookup_dict, orient="index"))
+
+    def get_values(self, road_types: pd.Series, lanes: pd.Series) -> np.ndarray:
+        """
+        Gets the values for all (road type, lane) combinations at once.
+
+        Args:
+            road_types (pd.Series): Road type of each row.
+            lanes (pd.Series): Number of lanes of each row.
+
+        Raises:
+            KeyError: When a combination does not exist in the lookup table.
+
+        Returns:
+            np.ndarray: Value of each row.
+        """
+        _road_type_codes = pd.Categorical(
+            road_types, categories=self.road_types
+        ).codes
+        _lane_codes = self.lanes.get_indexer(pd.Index(lanes))
+        _unknown = (_road_type_codes < 0) | (_lane_codes < 0)
+        if _unknown.any():
+            _unknown_keys = set(
+                zip(
+                    np.asarray(road_types)[_unknown].tolist(),
+                    np.asarray(lanes)[_unknown].tolist(),
+                )
+            )
+            raise KeyError(
+                "No lookup value found for (road type, lanes): {}".format(
+                    sorted(_unknown_keys, key=str)
+                )
+            )
+        return self.values[_road_type_codes, _lane_codes]
 
 
 class LookUp:
@@ -26,6 +26,8 @@ import numpy as np
 import pandas as pd
 from geopandas import GeoDataFrame
 
+from ra2ce.analysis.damages.damages_lookup import LookUpMatrix
+
 
 def clean_lane_data(lane_col: pd.Series) -> pd.Series:
     """
@@ -155,9 +157,9 @@ def scale_damage_using_lanes(lane_scale_factors, df, cols_to_scale) -> pd.DataFr
     """
     assert "road_type" in df.columns, "Road type data is missing"
     assert "lanes" in df.columns, "Lane number data is missing"
-    df["road_type_scale_factors"] = df.apply(
-        lambda x: lane_scale_factors[x.road_type][x.lanes], axis=1
-    )
+    df["road_type_scale_factors"] = LookUpMatrix.from_dict(
+        lane_scale_factors
+    ).get_values(df["road_type"], df["lanes"])
 
     for col in cols_to_scale:
         df[col] = df[col] * df["road_type_scale_factors"]
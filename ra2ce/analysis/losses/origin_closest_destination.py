@@ -173,10 +173,7 @@ class OriginClosestDestination:
 
         # Calculate the criticality
         hazards = [
-            self.hazard_names.names_df.loc[
-                self.hazard_names.names_df["File name"] == hazard, "RA2CE name"
-            ].values[0]
-            for hazard in self.hazard_names.names
+            self.hazard_names.get_name(hazard) for hazard in self.hazard_names.names
         ]
         hazards.sort()
         for hazard_name in hazards:
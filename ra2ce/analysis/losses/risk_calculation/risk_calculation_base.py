@@ -4,6 +4,11 @@ from abc import ABC, abstractmethod
 import geopandas as gpd
 import numpy as np
 
+from ra2ce.analysis.analysis_config_data.enums.risk_calculation_mode_enum import (
+    RiskCalculationModeEnum,
+)
+from ra2ce.analysis.risk_calculation_engine import RiskCalculationEngine
+
 
 class RiskCalculationBase(ABC):
     risk_calculation_year: int
@@ -60,23 +65,25 @@ class RiskCalculationBase(ABC):
         _to_integrate.columns = [
             float(c.split("_")[1].replace("RP", "")) for c in _to_integrate.columns
         ]
-        return _to_integrate
+        # From large to small RP, instead of in the (text) order of the loss columns.
+        return _to_integrate.sort_index(axis="columns", ascending=False)
 
+    @property
     @abstractmethod
-    def _get_network_risk_calculations(self) -> gpd.GeoDataFrame:
+    def risk_calculation_mode(self) -> RiskCalculationModeEnum:
         pass
 
     def get_integration_of_df_trapezoidal(self) -> np.array:
         """
-        Arguments:
-            *df* (pd.DataFrame) :
-                Column names should contain return periods (years)
-                Each row should contain a set of damages for one object
+        Integrates the losses per return period of each row over the frequencies,
+        reworked according to the risk calculation mode.
 
         Returns:
             np. Array : integrated result per row
 
         """
-        _risk_calculations = self._get_network_risk_calculations()
-        frequencies = sorted(1 / rp for rp in _risk_calculations.columns)
-        return np.trapezoid(_risk_calculations.values, frequencies, axis=1)
+        _engine = RiskCalculationEngine.from_dataframes(
+            {"losses": self._get_to_integrate()}, interpolate_return_periods=True
+        )
+        _risk = _engine.get_risk(self.risk_calculation_mode, self.risk_calculation_year)
+        return _risk[:, 0]
@@ -60,6 +60,12 @@ class SingleLinkRedundancy(AnalysisBase, AnalysisLossesProtocol):
             self.analysis.weighing
         )
 
+        # In an undirected graph there is no alternative route for the bridges only
+        # (parallel edges and self-loops are never bridges).
+        _bridges = None
+        if not self.graph_file.graph.is_directed():
+            _bridges = set(map(frozenset, nx.bridges(self.graph_file.graph)))
+
         # Loop over all edges to temporarily remove them and calculate the alternative route
         for e_remove in list(self.graph_file.graph.edges.data(keys=True)):
             u, v, k, _weighing_analyser.edge_data = e_remove
@@ -69,7 +75,11 @@ class SingleLinkRedundancy(AnalysisBase, AnalysisLossesProtocol):
             self.graph_file.graph.remove_edge(u, v, k)
 
             _alt_value, _alt_nodes, _connected, _diff = np.nan, np.nan, 0, np.nan
-            if nx.has_path(self.graph_file.graph, u, v):
+            if _bridges is not None:
+                _has_path = frozenset((u, v)) not in _bridges
+            else:
+                _has_path = nx.has_path(self.graph_file.graph, u, v)
+            if _has_path:
 
                 # calculate the alternative distance/time and path if that edge is unavailable
                 [_alt_value, _alt_nodes] = nx.single_source_dijkstra(
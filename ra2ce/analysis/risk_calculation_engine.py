@@ -0,0 +1,357 @@
+"""
+                    GNU GENERAL PUBLIC LICENSE
+                      Version 3, 29 June 2007
+
+    Risk Assessment and Adaptation for Critical Infrastructure (RA2CE).
+    Copyright (C) 2023-2026 Stichting Deltares
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from ra2ce.analysis.analysis_config_data.enums.risk_calculation_mode_enum import (
+    RiskCalculationModeEnum,
+)
+
+
+@dataclass(kw_only=True)
+class RiskCalculationEngine:
+    """
+    Calculates the risk (expected annual damage or losses) of several curves at once.
+
+    The values of all curves are stacked in a single (rows x curves x return periods)
+    array, the risk calculation mode is applied as a transformation of the
+    frequency axis and the values, and the result is integrated with one
+    trapezoidal integration over the frequencies.
+
+    In 'cut_from' mode the value at the cutoff is interpolated as `pandas` does
+    (`interpolate(method="index")`) along the columns of the given dataframes:
+    over the frequencies (damages) or over the return periods, including the
+    infinite return period (losses).
+    """
+
+    curve_names: list[str]
+    return_periods: np.ndarray
+    values: np.ndarray
+    column_positions: np.ndarray
+    interpolate_return_periods: bool = False
+
+    @classmethod
+    def from_dataframes(
+        cls,
+        to_integrate_dict: dict[str, pd.DataFrame],
+        interpolate_return_periods: bool = False,
+    ) -> RiskCalculationEngine:
+        """
+        Stacks the values to integrate of each curve.
+
+        Args:
+            to_integrate_dict (dict[str, pd.DataFrame]): Values to integrate per curve name.
+                The columns are the return periods (years), each row contains
+                the values of one object. All curves should share the same return periods.
+            interpolate_return_periods (bool, optional): Whether the value at the cutoff
+                of the 'cut_from' mode is interpolated over the return periods instead
+                of over the frequencies. Defaults to False.
+
+        Raises:
+            ValueError: When the curves do not share the same return periods.
+
+        Returns:
+            RiskCalculationEngine: The engine to calculate the risk of all curves.
+        """
+        _return_periods = [
+            sorted(_to_integrate.columns)
+            for _to_integrate in to_integrate_dict.values()
+        ]
+        if any(_rps != _return_periods[0] for _rps in _return_periods):
+            raise ValueError(
+                "All curves should be defined for the same return periods, but found: {}".format(
+                    _return_periods
+                )
+            )
+
+        # From the largest to the smallest return period (ascending frequency).
+        _descending_return_periods = _return_periods[0][::-1]
+        return cls(
+            curve_names=list(to_integrate_dict.keys()),
+            return_periods=np.array(_descending_return_periods, dtype=float),
+            values=np.stack(
+                [
+                    _to_integrate[_descending_return_periods].to_numpy(dtype=float)
+                    for _to_integrate in to_integrate_dict.values()
+                ],
+                axis=1,
+            ),
+            column_positions=np.array(
+                [
+                    [
+                        list(_to_integrate.columns).index(_return_period)
+                        for _return_period in _descending_return_periods
+                    ]
+                    for _to_integrate in to_integrate_dict.values()
+                ]
+            ),
+            interpolate_return_periods=interpolate_return_periods,
+        )
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        return 1 / self.return_periods
+
+    @property
+    def min_return_period(self) -> float:
+        return self.return_periods[-1]
+
+    @property
+    def max_return_period(self) -> float:
+        return self.return_periods[0]
+
+    def get_risk(self, mode: RiskCalculationModeEnum, year: float) -> np.ndarray:
+        """
+        Integrates the values of all curves over the frequencies.
+
+        Args:
+            mode (RiskCalculationModeEnum): The type of risk calculation to perform.
+            year (float): The cutoff year or return period of the risk calculation.
+
+        Raises:
+            ValueError: When the year is not valid for the given mode.
+            NotImplementedError: When the mode is not supported.
+
+        Returns:
+            np.ndarray: The risk per (row, curve).
+        """
+        if mode == RiskCalculationModeEnum.DEFAULT:
+            _frequencies, _values = self._get_default_integration_data()
+        elif mode == RiskCalculationModeEnum.CUT_FROM_YEAR:
+            _frequencies, _values = self._get_cut_from_year_integration_data(year)
+        elif mode == RiskCalculationModeEnum.TRIANGLE_TO_NULL_YEAR:
+            _frequencies, _values = self._get_triangle_to_null_integration_data(year)
+        else:
+            raise NotImplementedError(
+                "Risk calculation mode {} not yet supported.".format(mode)
+            )
+        return np.trapezoid(_values, _frequencies, axis=-1)
+
+    def _get_default_integration_data(self) -> tuple[np.ndarray, np.ndarray]:
+        logging.info(
+            """Risk calculation runs in 'default' mode.
+                    Assumptions:
+                        - for all return periods > max RP{}, damage = dam_RP{}
+                        - for all return periods < min RP{}, damage = 0
+
+                    """.format(
+                self.max_return_period,
+                self.max_return_period,
+                self.min_return_period,
+            )
+        )
+        # Copy the maximum return period with an infinitely high damage (frequency 0).
+        # Stop integrating at the last known return period, so no further manipulation needed
+        return (
+            np.concatenate([[0.0], self.frequencies]),
+            np.nan_to_num(
+                np.concatenate([self.values[..., :1], self.values], axis=-1), nan=0.0
+            ),
+        )
+
+    def _get_cut_from_year_integration_data(
+        self, year: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        In this mode, the integration mimics the presence of a flood protection
+        """
+        if year <= self.min_return_period:
+            raise ValueError(
+                """
+            RA2CE cannot calculate risk in 'cut_from' mode if
+            Return period of the cutoff ({}) <= smallest available return period ({})
+            Use 'default' mode or 'triangle_to_null_mode' instead.
+                                """.format(
+                    year, self.min_return_period
+                )
+            )
+
+        _cutoff_frequency = 1 / year
+        if year >= self.max_return_period:
+            # risk is return frequency of cutoff
+            # times the damage of the most extreme event
+            _max_values = np.nan_to_num(self.values[..., :1], nan=0.0)
+            return (
+                np.array([0.0, _cutoff_frequency]),
+                np.concatenate([_max_values, _max_values], axis=-1),
+            )
+
+        logging.info(
+            """Risk calculation runs in 'cut_from' mode.
+                                Assumptions:
+                                    - for all return periods > max RP{}, damage = dam_RP{}
+                                    - damage at cutoff is linearly interpolated from known damages
+                                    - no damage for al RPs > RP_cutoff ({})
+
+                                """.format(
+                self.max_return_period, self.max_return_period, year
+            )
+        )
+        if year in self.return_periods:
+            # Only the (known) values from the cutoff are integrated, without tail.
+            _n_kept = np.count_nonzero(self.return_periods >= year)
+            return self.frequencies[:_n_kept], self.values[..., :_n_kept]
+
+        _n_return_periods = len(self.return_periods)
+        _unknown_values = np.full(self.values.shape[:-1] + (1,), np.nan)
+        if self.interpolate_return_periods:
+            # Copy the maximum return period with an infinitely high damage,
+            # before interpolating the cutoff over the return periods.
+            _index = np.concatenate([self.return_periods, [np.inf, year]])
+            _to_interpolate = np.concatenate(
+                [self.values, self.values[..., :1], _unknown_values], axis=-1
+            )
+            _tail = _n_return_periods
+        else:
+            _index = np.concatenate([self.frequencies, [_cutoff_frequency]])
+            _to_interpolate = np.concatenate([self.values, _unknown_values], axis=-1)
+            _tail = 0
+        _column_positions = np.concatenate(
+            [
+                self.column_positions,
+                np.broadcast_to(
+                    np.arange(_n_return_periods, len(_index)),
+                    (len(self.curve_names), len(_index) - _n_return_periods),
+                ),
+            ],
+            axis=-1,
+        )
+        _interpolated = self._interpolate(_index, _column_positions, _to_interpolate)
+
+        # Only the return periods above the cutoff contribute to the risk.
+        _n_kept = np.count_nonzero(self.return_periods > year)
+        # Copy the maximum return period with an infinitely high damage (frequency 0).
+        return (
+            np.concatenate([[0.0], self.frequencies[:_n_kept], [_cutoff_frequency]]),
+            np.nan_to_num(
+                np.concatenate(
+                    [
+                        _interpolated[..., _tail : _tail + 1],
+                        _interpolated[..., :_n_kept],
+                        _interpolated[..., -1:],
+                    ],
+                    axis=-1,
+                ),
+                nan=0.0,
+            ),
+        )
+
+    @staticmethod
+    def _interpolate(
+        index: np.ndarray, column_positions: np.ndarray, values: np.ndarray
+    ) -> np.ndarray:
+        """
+        Fills the missing values as `pandas.DataFrame.interpolate(method="index", axis=1)`:
+        linearly in the index between the enclosing known values, taking the nearest
+        known value outside of them (as `np.interp`), except for the values
+        in the columns before the first known value, which remain missing.
+        """
+        _order = np.argsort(index)
+        _sorted_index = index[_order]
+        _sorted_values = values[..., _order]
+        _n_columns = len(index)
+        _columns = np.arange(_n_columns)
+        _is_known = ~np.isnan(_sorted_values)
+        _previous_known = np.maximum.accumulate(
+            np.where(_is_known, _columns, -1), axis=-1
+        )
+        _next_known = np.flip(
+            np.minimum.accumulate(
+                np.flip(np.where(_is_known, _columns, _n_columns), axis=-1), axis=-1
+            ),
+            axis=-1,
+        )
+        _lower = np.where(_previous_known >= 0, _previous_known, _next_known)
+        _upper = np.where(_next_known < _n_columns, _next_known, _previous_known)
+        # Rows without known values remain missing.
+        _lower = np.clip(_lower, 0, _n_columns - 1)
+        _upper = np.clip(_upper, 0, _n_columns - 1)
+        _lower_values = np.take_along_axis(_sorted_values, _lower, axis=-1)
+        _upper_values = np.take_along_axis(_sorted_values, _upper, axis=-1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            _interpolated = _lower_values + (_upper_values - _lower_values) * (
+                _sorted_index - _sorted_index[_lower]
+            ) / (_sorted_index[_upper] - _sorted_index[_lower])
+        _interpolated = np.where(_lower == _upper, _lower_values, _interpolated)
+
+        _filled = np.empty_like(_interpolated)
+        _filled[..., _order] = _interpolated
+        _first_known_position = np.where(
+            ~np.isnan(values), column_positions, _n_columns
+        ).min(axis=-1, keepdims=True)
+        return np.where(column_positions < _first_known_position, np.nan, _filled)
+
+    def _get_triangle_to_null_integration_data(
+        self, year: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        In this mode, an extra data point with zero damage is added at some distance from the smallest known RP,
+        and the area of the Triangle this creates is also calculated
+        """
+        if year >= self.min_return_period and year != 0:
+            raise ValueError(
+                """
+            RA2CE cannot calculate risk in 'triangle_to_null' mode if
+            Return period of the triangle ({}) >= smallest available return period ({})
+            Use 'default' mode or 'cut_from' instead.
+                                """.format(
+                    year, self.min_return_period
+                )
+            )
+
+        if year == 0:
+            logging.warning(
+                "No return period given for the end of the triangle, a return period of 1 year will be used."
+            )
+            year = 1
+
+        logging.info(
+            """Risk calculation runs in 'triangle to null' mode.
+                                Assumptions:
+                                    - for all return periods > max RP{}, damage = dam_RP{}
+                                    - at the end of the triangle {}, damage = 0
+
+                                """.format(
+                self.max_return_period, self.max_return_period, year
+            )
+        )
+        # At the return period of the triangle end, set all damage values to zero
+        return (
+            np.concatenate([[0.0], self.frequencies, [1 / year]]),
+            np.nan_to_num(
+                np.concatenate(
+                    [
+                        self.values[..., :1],
+                        self.values,
+                        np.zeros(self.values.shape[:-1] + (1,)),
+                    ],
+                    axis=-1,
+                ),
+                nan=0.0,
+            ),
+        )
@@ -14,6 +14,7 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
+
 import logging
 import math
 from pathlib import Path
@@ -218,12 +219,26 @@ class AvgSpeedCalculator:
                 _speed = self.avg_speed.get_avg_speed(AvgSpeed.get_road_type_list(_rt))
             return max(round(_speed, 0), 1)
 
+        # Calculate the missing lengths (m) at once.
+        _edges_without_length = [
+            (u, v, k)
+            for u, v, k, _length in self.graph.edges(keys=True, data="length")
+            if not _length
+        ]
+        if _edges_without_length:
+            _lengths = nut.line_lengths(
+                [
+                    self.graph.edges[_edge]["geometry"]
+                    for _edge in _edges_without_length
+                ],
+                self.graph.graph["crs"],
+            )
+            for _edge, _length in zip(_edges_without_length, _lengths.tolist()):
+                self.graph.edges[_edge]["length"] = _length
+
         for u, v, k, edata in self.graph.edges.data(keys=True):
             _speed = get_speed(edata)  # km/h
-            _length = edata.get("length", None)  # m
-            if not _length:
-                _length = nut.line_length(edata["geometry"], self.graph.graph["crs"])
-                self.graph.edges[u, v, k]["length"] = _length
+            _length = edata["length"]  # m
             self.graph.edges[u, v, k]["avgspeed"] = max(
                 round(_speed, 0), 1
             )  # km/h (at least 1)
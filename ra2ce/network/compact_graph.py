@@ -0,0 +1,488 @@
+"""
+                    GNU GENERAL PUBLIC LICENSE
+                      Version 3, 29 June 2007
+
+    Risk Assessment and Adaptation for Critical Infrastructure (RA2CE).
+    Copyright (C) 2023-2026 Stichting Deltares
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as pa_feather
+import shapely
+from geopandas.array import GeometryDtype, from_shapely
+from pyproj import CRS
+
+
+# Values that can be stored in a typed (non-object) column without changing them.
+_TYPED_VALUES = ("integer", "floating", "boolean", "datetime", "datetime64")
+_MASK_PREFIX = "__has__"
+_NODE_ID = "__node_id"
+_EDGE_SOURCE = "__source"
+_EDGE_TARGET = "__target"
+_EDGE_KEY = "__key"
+
+
+def _to_columns(
+    items_data: list[dict[str, Any]],
+) -> tuple[pd.DataFrame, dict[str, np.ndarray]]:
+    """
+    Converts the attribute dictionaries of nodes or edges to columns,
+    with the geometries in a `GeometryArray`.
+
+    Returns:
+        tuple[pd.DataFrame, dict[str, np.ndarray]]:
+            - The attributes as columns, in order of appearance.
+            - The mask of the items having the attribute, for the attributes
+              not set on all items.
+    """
+    _names = list(dict.fromkeys(_name for _data in items_data for _name in _data))
+    _columns = {}
+    _masks = {}
+    for _name in _names:
+        _mask = np.fromiter(
+            (_name in _data for _data in items_data), dtype=bool, count=len(items_data)
+        )
+        _values = [_data.get(_name) for _data in items_data]
+        if not _mask.all():
+            _masks[_name] = _mask
+        if _name == "geometry":
+            try:
+                _columns[_name] = pd.Series(from_shapely(_values))
+                continue
+            except TypeError:
+                pass
+        if _mask.all() and pd.api.types.infer_dtype(_values, skipna=False) in (
+            _TYPED_VALUES
+        ):
+            _columns[_name] = pd.Series(_values)
+        else:
+            # Keep the values as they are (e.g. not casting integers to float).
+            _columns[_name] = pd.Series(_values, dtype=object)
+    return pd.DataFrame(_columns, index=pd.RangeIndex(len(items_data))), _masks
+
+
+def _to_dicts(data: pd.DataFrame, masks: dict[str, np.ndarray]) -> list[dict[str, Any]]:
+    """
+    Converts the columns back to an attribute dictionary per node or edge.
+    """
+    _dicts = [{} for _ in range(len(data))]
+    for _name in data.columns:
+        _mask = masks.get(_name)
+        for _index, (_dict, _value) in enumerate(zip(_dicts, data[_name].tolist())):
+            if _mask is None or _mask[_index]:
+                _dict[_name] = _value
+    return _dicts
+
+
+def _is_same_value(value: Any, other: Any) -> bool:
+    """
+    Whether the value is restored as the same value, numpy scalars as python scalars.
+    """
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, list):
+        return (
+            isinstance(other, list)
+            and len(value) == len(other)
+            and all(map(_is_same_value, value, other))
+        )
+    if isinstance(value, dict):
+        return (
+            isinstance(other, dict)
+            and value.keys() == other.keys()
+            and all(_is_same_value(_item, other[_key]) for _key, _item in value.items())
+        )
+    if isinstance(value, float) and isinstance(other, float) and math.isnan(value):
+        return math.isnan(other)
+    return type(value) is type(other) and value == other
+
+
+def _to_union_array(values: list[Any]) -> pa.UnionArray:
+    """
+    Converts values of several types (e.g. strings and NaN, or integers and lists)
+    to a (dense) union of an arrow array per type.
+    """
+    _type_ids: dict[type, int] = {}
+    _value_types = np.fromiter(
+        (_type_ids.setdefault(type(_value), len(_type_ids)) for _value in values),
+        dtype=np.int8,
+        count=len(values),
+    )
+    _offsets = np.zeros(len(values), dtype=np.int32)
+    _children = []
+    for _type_id in range(len(_type_ids)):
+        _positions = np.flatnonzero(_value_types == _type_id)
+        _offsets[_positions] = np.arange(len(_positions), dtype=np.int32)
+        _children.append(pa.array([values[_position] for _position in _positions]))
+    return pa.UnionArray.from_dense(
+        pa.array(_value_types), pa.array(_offsets), _children
+    )
+
+
+def _to_arrow_array(
+    name: str, values: list[Any], mask: np.ndarray | None
+) -> tuple[pa.Array, str]:
+    """
+    Converts an object column to an arrow array: as strings, integers or geometries (WKB)
+    when possible and otherwise as the (nested) type inferred by arrow, e.g. lists or
+    structs. Columns with values of several types (e.g. `osmid` as integers and lists,
+    or strings and NaN) are stored as a union of the types.
+
+    Raises:
+        ValueError: When the values cannot be stored in an arrow array without changing them.
+
+    Returns:
+        tuple[pa.Array, str]: The array and its encoding (`arrow`, `wkb` or `pylist`).
+    """
+    _has_value = np.ones(len(values), dtype=bool) if mask is None else mask
+    if all(
+        isinstance(_value, str) or not _has_value[_index]
+        for _index, _value in enumerate(values)
+    ):
+        return pa.array(values, type=pa.string()), "arrow"
+    if mask is None and pd.api.types.infer_dtype(values, skipna=False) in (
+        "integer",
+        "boolean",
+    ):
+        try:
+            return pa.array(values), "arrow"
+        except (pa.ArrowInvalid, OverflowError):
+            pass
+    if any(isinstance(_value, shapely.Geometry) for _value in values) and all(
+        _value is None or isinstance(_value, shapely.Geometry) for _value in values
+    ):
+        _wkb = shapely.to_wkb(np.array(values, dtype=object))
+        return pa.array(_wkb, type=pa.binary()), "wkb"
+
+    def is_restored(array: pa.Array) -> bool:
+        return all(
+            _is_same_value(_value, _restored)
+            for _value, _restored, _has in zip(values, array.to_pylist(), _has_value)
+            if _has
+        )
+
+    try:
+        _array = pa.array(values)
+        if not is_restored(_array):
+            _array = _to_union_array(values)
+    except (pa.ArrowException, TypeError, ValueError, OverflowError):
+        try:
+            _array = _to_union_array(values)
+        except (pa.ArrowException, TypeError, ValueError, OverflowError) as exc_err:
+            raise ValueError(
+                f"Column {name} cannot be stored in the columnar graph format: {exc_err}"
+            ) from exc_err
+    if not is_restored(_array):
+        raise ValueError(
+            f"Column {name} cannot be stored in the columnar graph format without changing its values."
+        )
+    return _array, "pylist"
+
+
+def _to_table(
+    data: pd.DataFrame,
+    masks: dict[str, np.ndarray],
+    index_columns: dict[str, np.ndarray],
+) -> tuple[pa.Table, dict[str, Any]]:
+    """
+    Converts the columns of nodes or edges to an arrow table, with the geometries as WKB.
+
+    Returns:
+        tuple[pa.Table, dict[str, Any]]: The table and its metadata.
+    """
+    _arrays = {}
+    _encodings = {}
+    _columns = index_columns | {_name: data[_name] for _name in data.columns}
+    for _name, _values in _columns.items():
+        if isinstance(_values.dtype, GeometryDtype):
+            _arrays[_name] = pa.array(shapely.to_wkb(_values.array), type=pa.binary())
+            _encodings[_name] = "wkb"
+        elif _values.dtype == object:
+            _arrays[_name], _encodings[_name] = _to_arrow_array(
+                _name, list(_values), masks.get(_name)
+            )
+        else:
+            _arrays[_name], _encodings[_name] = pa.array(_values), "arrow"
+    for _name, _mask in masks.items():
+        _arrays[f"{_MASK_PREFIX}{_name}"] = pa.array(_mask)
+    return pa.table(_arrays), dict(encodings=_encodings, masked=list(masks))
+
+
+def _from_table(
+    table: pa.Table, metadata: dict[str, Any], index_names: list[str]
+) -> tuple[pd.DataFrame, dict[str, np.ndarray], dict[str, pd.Series]]:
+    """
+    Converts an arrow table (see `_to_table`) back to the columns of nodes or edges.
+
+    Returns:
+        tuple[pd.DataFrame, dict[str, np.ndarray], dict[str, pd.Series]]:
+            The attributes, masks and index columns.
+    """
+    _columns = {}
+    for _name, _encoding in metadata["encodings"].items():
+        _column = table.column(_name)
+        if _encoding == "wkb":
+            _columns[_name] = pd.Series(
+                from_shapely(shapely.from_wkb(_column.to_numpy(zero_copy_only=False)))
+            )
+        elif _encoding == "pylist":
+            _columns[_name] = pd.Series(_column.to_pylist(), dtype=object)
+        else:
+            _columns[_name] = _column.to_pandas()
+    _masks = {
+        _name: table.column(f"{_MASK_PREFIX}{_name}").to_numpy()
+        for _name in metadata["masked"]
+    }
+    _index_columns = {_name: _columns.pop(_name) for _name in index_names}
+    _data = pd.DataFrame(_columns, index=pd.RangeIndex(table.num_rows))
+    return _data, _masks, _index_columns
+
+
+def _to_json_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
+    """
+    Converts the graph attributes to a json serializable dictionary, CRS as WKT
+    and dictionaries with other than string keys (e.g. node ids) as their items.
+
+    Raises:
+        ValueError: When an attribute cannot be stored in json without changing it.
+    """
+
+    def is_json_value(value: Any) -> bool:
+        try:
+            return json.loads(json.dumps(value)) == value
+        except (TypeError, ValueError):
+            return False
+
+    _json_attributes = dict(names=list(attributes), values={}, crs={}, items={})
+    for _name, _value in attributes.items():
+        if isinstance(_value, CRS):
+            _json_attributes["crs"][_name] = _value.to_wkt()
+        elif is_json_value(_value):
+            _json_attributes["values"][_name] = _value
+        elif isinstance(_value, dict) and is_json_value(
+            _items := list(map(list, _value.items()))
+        ):
+            _json_attributes["items"][_name] = _items
+        else:
+            raise ValueError(
+                f"Graph attribute {_name} cannot be stored in the columnar graph format."
+            )
+    return _json_attributes
+
+
+def _from_json_attributes(json_attributes: dict[str, Any]) -> dict[str, Any]:
+    """
+    Converts the json attributes (see `_to_json_attributes`) back to graph attributes.
+    """
+    _attributes = dict(json_attributes["values"])
+    _attributes |= {
+        _name: CRS.from_wkt(_wkt) for _name, _wkt in json_attributes["crs"].items()
+    }
+    _attributes |= {
+        _name: {_key: _value for _key, _value in _items}
+        for _name, _items in json_attributes["items"].items()
+    }
+    return {_name: _attributes[_name] for _name in json_attributes["names"]}
+
+
+@dataclass(kw_only=True)
+class CompactGraph:
+    """
+    Array-backed representation of a (directed) `networkx.MultiGraph`,
+    to store it in (and read it from) the columnar graph format.
+
+    Nodes and edges are numbered with consecutive integers, the edges refer to
+    their nodes by these numbers and the attributes of nodes and edges are stored
+    as columns, with their geometries as a `GeometryArray`.
+    """
+
+    node_ids: np.ndarray
+    node_data: pd.DataFrame
+    edge_sources: np.ndarray
+    edge_targets: np.ndarray
+    edge_keys: np.ndarray
+    edge_data: pd.DataFrame
+    is_directed: bool = False
+    graph_data: dict[str, Any] = field(default_factory=dict)
+    node_masks: dict[str, np.ndarray] = field(default_factory=dict)
+    edge_masks: dict[str, np.ndarray] = field(default_factory=dict)
+
+    nodes_name = "nodes.arrow"
+    edges_name = "edges.arrow"
+    metadata_name = "graph.json"
+
+    def __post_init__(self) -> None:
+        self.edge_sources = np.asarray(self.edge_sources, dtype=np.int64)
+        self.edge_targets = np.asarray(self.edge_targets, dtype=np.int64)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.edge_sources)
+
+    @classmethod
+    def from_graph(cls, graph: nx.MultiGraph) -> CompactGraph:
+        """
+        Creates a compact graph from a (directed) `networkx.MultiGraph`.
+
+        Args:
+            graph (nx.MultiGraph): The graph to convert.
+
+        Returns:
+            CompactGraph: The compact graph, with the nodes and edges in the order of the graph.
+        """
+        _node_ids = list(graph.nodes)
+        _node_ids_array = np.empty(len(_node_ids), dtype=object)
+        _node_ids_array[:] = _node_ids
+        _node_index = {_id: _index for _index, _id in enumerate(_node_ids)}
+        _u, _v, _keys = (
+            zip(*graph.edges(keys=True)) if graph.number_of_edges() else ((), (), ())
+        )
+        _node_data, _node_masks = _to_columns(
+            [_data for _, _data in graph.nodes(data=True)]
+        )
+        _edge_data, _edge_masks = _to_columns(
+            [_data for *_, _data in graph.edges(keys=True, data=True)]
+        )
+        _edge_keys = np.empty(len(_keys), dtype=object)
+        _edge_keys[:] = _keys
+        return cls(
+            node_ids=_node_ids_array,
+            node_data=_node_data,
+            edge_sources=np.array([_node_index[_id] for _id in _u], dtype=np.int64),
+            edge_targets=np.array([_node_index[_id] for _id in _v], dtype=np.int64),
+            edge_keys=_edge_keys,
+            edge_data=_edge_data,
+            is_directed=graph.is_directed(),
+            graph_data=dict(graph.graph),
+            node_masks=_node_masks,
+            edge_masks=_edge_masks,
+        )
+
+    def to_graph(self) -> nx.MultiGraph:
+        """
+        Converts the compact graph to a (directed) `networkx.MultiGraph`,
+        for the logic that still requires one.
+
+        Returns:
+            nx.MultiGraph: The graph, `nx.MultiDiGraph` when the compact graph is directed.
+        """
+        _graph = nx.MultiDiGraph() if self.is_directed else nx.MultiGraph()
+        _graph.graph.update(self.graph_data)
+        _graph.add_nodes_from(
+            zip(
+                self.node_ids,
+                _to_dicts(self.node_data, self.node_masks),
+            )
+        )
+        _graph.add_edges_from(
+            zip(
+                self.node_ids[self.edge_sources],
+                self.node_ids[self.edge_targets],
+                self.edge_keys,
+                _to_dicts(self.edge_data, self.edge_masks),
+            )
+        )
+        return _graph
+
+    @classmethod
+    def from_file(cls, file_path: Path) -> CompactGraph:
+        """
+        Reads a compact graph stored in the columnar graph format (see `export`).
+
+        Args:
+            file_path (Path): Path to the `.graph` directory.
+
+        Returns:
+            CompactGraph: The compact graph.
+        """
+        _metadata = json.loads(file_path.joinpath(cls.metadata_name).read_text())
+        _node_data, _node_masks, _node_index = _from_table(
+            pa_feather.read_table(file_path.joinpath(cls.nodes_name)),
+            _metadata["nodes"],
+            [_NODE_ID],
+        )
+        _edge_data, _edge_masks, _edge_index = _from_table(
+            pa_feather.read_table(file_path.joinpath(cls.edges_name)),
+            _metadata["edges"],
+            [_EDGE_SOURCE, _EDGE_TARGET, _EDGE_KEY],
+        )
+        return cls(
+            node_ids=_node_index[_NODE_ID].to_numpy(dtype=object),
+            node_data=_node_data,
+            edge_sources=_edge_index[_EDGE_SOURCE].to_numpy(),
+            edge_targets=_edge_index[_EDGE_TARGET].to_numpy(),
+            edge_keys=_edge_index[_EDGE_KEY].to_numpy(dtype=object),
+            edge_data=_edge_data,
+            is_directed=_metadata["directed"],
+            graph_data=_from_json_attributes(_metadata["graph"]),
+            node_masks=_node_masks,
+            edge_masks=_edge_masks,
+        )
+
+    def export(self, export_path: Path) -> None:
+        """
+        Exports the compact graph in the columnar graph format: a `.graph` directory
+        with a node and an edge table (Arrow IPC, geometries as WKB) and a
+        json file with the graph attributes (e.g. `crs`).
+        When the directory exists then its content will be overwritten.
+
+        Args:
+            export_path (Path): Path of the `.graph` directory.
+        """
+        export_path.mkdir(parents=True, exist_ok=True)
+        _nodes_table, _nodes_metadata = _to_table(
+            self.node_data,
+            self.node_masks,
+            {_NODE_ID: self.node_ids},
+        )
+        _edges_table, _edges_metadata = _to_table(
+            self.edge_data,
+            self.edge_masks,
+            {
+                _EDGE_SOURCE: self.edge_sources,
+                _EDGE_TARGET: self.edge_targets,
+                _EDGE_KEY: self.edge_keys,
+            },
+        )
+        pa_feather.write_feather(_nodes_table, export_path.joinpath(self.nodes_name))
+        pa_feather.write_feather(_edges_table, export_path.joinpath(self.edges_name))
+        export_path.joinpath(self.metadata_name).write_text(
+            json.dumps(
+                dict(
+                    directed=self.is_directed,
+                    graph=_to_json_attributes(self.graph_data),
+                    nodes=_nodes_metadata,
+                    edges=_edges_metadata,
+                )
+            )
+        )
+        logging.info("Saved (or overwrote) %s", export_path.name)
@@ -42,5 +42,8 @@ class GeoDataFrameNetworkExporter(NetworkExporterBase):
 
     def export_to_pickle(self, output_dir: Path, export_data: gpd.GeoDataFrame) -> None:
         self.pickle_path = output_dir.joinpath(self.basename + ".feather")
-        export_data.to_feather(self.pickle_path, index=False)
+        # Uncompressed, so the file can be read memory-mapped without decompressing it.
+        export_data.to_feather(
+            self.pickle_path, index=False, compression="uncompressed"
+        )
         logging.info("Saved %s in %s.", self.pickle_path.stem, output_dir)
@@ -21,11 +21,13 @@
 
 import logging
 import pickle
+import shutil
 from pathlib import Path
 from typing import Optional
 
 from geopandas import GeoDataFrame
 
+from ra2ce.network.compact_graph import CompactGraph
 from ra2ce.network.exporters.network_exporter_base import (
     MULTIGRAPH_TYPE,
     NetworkExporterBase,
@@ -55,8 +57,21 @@ class MultiGraphNetworkExporter(NetworkExporterBase):
 
     def export_to_pickle(self, output_dir: Path, export_data: MULTIGRAPH_TYPE) -> None:
         self.pickle_path = output_dir.joinpath(self.basename + ".p")
+        # The columnar graph is read instead of the pickle file when present.
+        _columnar_path = output_dir.joinpath(self.basename + ".graph")
+        if _columnar_path.is_dir():
+            logging.info("Removing previous graph %s.", _columnar_path)
+            shutil.rmtree(_columnar_path)
         with open(self.pickle_path, "wb") as f:
             pickle.dump(export_data, f, protocol=4)
         logging.info(
             "Saved %s in %s.", self.pickle_path.stem, self.pickle_path.resolve().parent
         )
+
+    def export_to_graph(self, output_dir: Path, export_data: MULTIGRAPH_TYPE) -> None:
+        self.pickle_path = output_dir.joinpath(self.basename + ".graph")
+        CompactGraph.from_graph(export_data).export(self.pickle_path)
+        _pickle_path = output_dir.joinpath(self.basename + ".p")
+        if _pickle_path.is_file():
+            logging.info("Removing previous graph %s.", _pickle_path)
+            _pickle_path.unlink()
@@ -58,6 +58,17 @@ class NetworkExporterBase(Ra2ceExporterProtocol):
         """
         pass
 
+    def export_to_graph(self, output_dir: Path, export_data: NETWORK_TYPE) -> None:
+        """
+        Exports the given data into the columnar graph format (`*.graph` directory).
+        By default (data without a graph format) the data is exported as with `export_to_pickle`.
+
+        Args:
+            output_dir (Path): Output directory where the save the exported data.
+            export_data (NETWORK_TYPE): Data that needs to be exported.
+        """
+        self.export_to_pickle(output_dir, export_data)
+
     def export(self, export_path: Path, export_data: NETWORK_TYPE) -> None:
         """
         Exports the given data to the specified types.
@@ -70,5 +81,8 @@ class NetworkExporterBase(Ra2ceExporterProtocol):
         if "pickle" in self.export_types:
             self.export_to_pickle(export_path, export_data)
 
+        if "graph" in self.export_types:
+            self.export_to_graph(export_path, export_data)
+
         if "gpkg" in self.export_types:
             self.export_to_gpkg(export_path, export_data)
@@ -1,9 +1,11 @@
+import logging
 from dataclasses import dataclass
 from pathlib import Path
 
 from networkx import MultiGraph
 
 from ra2ce.common.io.readers.graph_pickle_reader import GraphPickleReader
+from ra2ce.network.compact_graph import CompactGraph
 from ra2ce.network.graph_files.graph_files_protocol import GraphFileProtocol
 
 
@@ -11,28 +13,58 @@ from ra2ce.network.graph_files.graph_files_protocol import GraphFileProtocol
 class GraphFile(GraphFileProtocol):
     """
     Note this class resembles NetworkFile to a large extent
+
+    The graph is read from the columnar graph format (`<name>.graph` directory,
+    see `CompactGraph.export`) when present, otherwise from the pickle file.
     """
 
     name: str = ""
     folder: Path = None
     graph: MultiGraph = None
 
+    @property
+    def columnar_name(self) -> str:
+        return Path(self.name).with_suffix(".graph").name
+
     @property
     def file(self) -> Path | None:
         if not self.folder:
             return None
+        _columnar_file = self.folder.joinpath(self.columnar_name)
+        if _columnar_file.is_dir():
+            return _columnar_file
         return self.folder.joinpath(self.name)
 
+    def locate(self, folder: Path) -> None:
+        if not folder:
+            return
+        if (
+            folder.joinpath(self.columnar_name).is_dir()
+            or folder.joinpath(self.name).is_file()
+        ):
+            self.folder = folder
+
     def read_graph(self, folder: Path) -> None:
         if not folder:
             return
+        _columnar_file = folder.joinpath(self.columnar_name)
         _file = folder.joinpath(self.name)
-        if _file and _file.is_file():
+        if _columnar_file.is_dir():
+            self.folder = folder
+            self.graph = CompactGraph.from_file(_columnar_file).to_graph()
+        elif _file and _file.is_file():
             self.folder = folder
             _pickle_reader = GraphPickleReader()
             self.graph = _pickle_reader.read(self.file)
+        else:
+            return
+        logging.info("Read graph file %s", self.file)
 
     def get_graph(self) -> MultiGraph:
         if self.graph is None:
             self.read_graph(self.folder)
         return self.graph
+
+    def unload(self) -> None:
+        if self.file and self.file.exists():
+            self.graph = None
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import logging
+import shutil
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -127,7 +129,8 @@ class GraphFilesCollection:
     @classmethod
     def set_files(cls, parent_dir: Path) -> GraphFilesCollection:
         """
-        Create a new collection with 1 or more graph files that match the default names
+        Create a new collection with 1 or more graph files that match the default names.
+        Only the files are located, the graphs are read when requested (see `get_graph`).
 
         Args:
             parent_dir (Path): Path of the parent folder in which the files are searched
@@ -137,15 +140,16 @@ class GraphFilesCollection:
         """
         _collection = cls()
 
-        _collection.base_graph.read_graph(parent_dir)
-        _collection.base_graph_edges.read_graph(parent_dir)
-        _collection.base_graph_hazard.read_graph(parent_dir)
-        _collection.base_graph_hazard_edges.read_graph(parent_dir)
-        _collection.origins_destinations_graph.read_graph(parent_dir)
-        _collection.origins_destinations_graph_hazard.read_graph(parent_dir)
-        _collection.base_network.read_graph(parent_dir)
-        _collection.base_network_hazard.read_graph(parent_dir)
-        _collection.locations_hazard.read_graph(parent_dir)
+        for _gf in _collection._graph_collection:
+            _gf.locate(parent_dir)
+        logging.info(
+            "Graph files found in %s: %s",
+            parent_dir,
+            ", ".join(
+                _gf.file.name for _gf in _collection._graph_collection if _gf.file
+            )
+            or "none",
+        )
 
         return _collection
 
@@ -188,7 +192,47 @@ class GraphFilesCollection:
 
         Returns: None
         """
-        _gf = next((gf for gf in self._graph_collection if gf.name == file.name), None)
+        _gf = next(
+            (
+                gf
+                for gf in self._graph_collection
+                if file.name in (gf.name, getattr(gf, "columnar_name", None))
+            ),
+            None,
+        )
         if _gf is None:
             raise ValueError(f"Unknown graph file {file} provided.")
         _gf.read_graph(file.parent)
+
+    def remove_file(self, graph_file_type: str) -> None:
+        """
+        Removes the file(s) of a graph from disk and the graph from the collection.
+
+        Args:
+            graph_file_type (str): Type of graph file
+
+        Raises:
+            ValueError: If the graph_file_type is not one of the known types
+        """
+        _gf = self._get_graph_file(graph_file_type)
+        if _gf.folder:
+            for _name in (_gf.name, getattr(_gf, "columnar_name", None)):
+                if not _name:
+                    continue
+                _file = _gf.folder.joinpath(_name)
+                if _file.is_dir():
+                    shutil.rmtree(_file)
+                elif _file.is_file():
+                    _file.unlink()
+        _gf.folder = None
+        _gf.graph = None
+
+    def unload(self) -> None:
+        """
+        Releases the graphs stored in a file from memory,
+        they are read again when requested (see `get_graph`).
+
+        Returns: None
+        """
+        for _gf in self._graph_collection:
+            _gf.unload()
@@ -20,6 +20,18 @@ class GraphFileProtocol(Protocol):
             Path | None: _description_
         """
 
+    def locate(self, folder: Path) -> None:
+        """
+        Sets the folder of the graph file when the file exists in it,
+        without reading the graph (see `get_graph`).
+
+        Args:
+            folder (Path): Folder of the graph
+
+        Returns: None
+        """
+        pass
+
     def read_graph(self, folder: Path) -> None:
         """
         Read a graph file
@@ -42,3 +54,13 @@ class GraphFileProtocol(Protocol):
             MultiGraph | GeoDataFrame: the graph
         """
         pass
+
+    def unload(self) -> None:
+        """
+        Releases the graph from memory, it is read again from file
+        on the next `get_graph`.
+        A graph that is not stored in a file is kept.
+
+        Returns: None
+        """
+        pass
@@ -1,10 +1,39 @@
+import json
+import logging
+import operator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Iterator
 
-from geopandas import GeoDataFrame, read_feather, read_file
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.fs
+import pyarrow.parquet as pq
+import pyogrio
+import shapely
+from geopandas import GeoDataFrame, read_file
 
 from ra2ce.network.graph_files.graph_files_protocol import GraphFileProtocol
 
+# Filters in disjunctive normal form, as in `pyarrow.parquet.read_table`:
+# a list of (column, operator, value) conditions that all should hold,
+# or a list of such lists of which any should hold.
+FILTERS_TYPE = list[tuple[str, str, Any]] | list[list[tuple[str, str, Any]]]
+
+_FILTER_OPERATORS = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda column, values: column.isin(values),
+    "not in": lambda column, values: ~column.isin(values),
+}
+
 
 @dataclass
 class NetworkFile(GraphFileProtocol):
@@ -22,6 +51,12 @@ class NetworkFile(GraphFileProtocol):
             return None
         return self.folder.joinpath(self.name)
 
+    def locate(self, folder: Path) -> None:
+        if not folder:
+            return
+        if folder.joinpath(self.name).is_file():
+            self.folder = folder
+
     def read_graph(self, folder: Path) -> None:
         if not folder:
             return
@@ -29,13 +64,278 @@ class NetworkFile(GraphFileProtocol):
         if _file and _file.is_file():
             self.folder = folder
             if _file.suffix == ".feather":
-                self.graph = read_feather(_file)
+                _table = self._read_table()
+                self.graph = self._to_geodataframe(
+                    _table.to_pandas(), json.loads(_table.schema.metadata[b"geo"])
+                )
             elif _file.suffix == ".gpkg":
                 self.graph = read_file(_file, driver="GPKG")
             else:
                 raise ValueError(f"Unknown file type: {self.name}")
+            logging.info("Read graph file %s", _file)
+
+    def get_graph(
+        self,
+        columns: list[str] | None = None,
+        filters: FILTERS_TYPE | None = None,
+    ) -> GeoDataFrame | pd.DataFrame:
+        """
+        Gets the graph, read from file if not done yet.
+        When columns and/or filters are given only those columns and rows are returned.
+        If the graph is not in memory yet, these are read from file without reading
+        (or keeping) the whole graph: for `.feather` the column projection and filter
+        are done by `pyarrow.dataset`.
+
+        Args:
+            columns (list[str] | None, optional): Columns to get, all if None.
+                A `DataFrame` is returned when the geometry column is not included.
+            filters (FILTERS_TYPE | None, optional): Conditions the rows should meet,
+                e.g. `[("RP100_ma", ">", 0.5)]`. Rows with a missing value
+                in a filtered column are excluded.
+
+        Returns:
+            GeoDataFrame | pd.DataFrame: The (selection of the) graph, keeping the index of the whole graph.
+        """
+        if columns is None and not filters:
+            if self.graph is None:
+                self.read_graph(self.folder)
+            return self.graph
+
+        if self.graph is not None:
+            _graph = self.graph
+            if filters:
+                _graph = _graph[self._get_filter_mask(_graph, filters)]
+            return _graph if columns is None else _graph[columns]
+
+        if not self.file or not self.file.is_file():
+            return None
+        if self.file.suffix == ".feather":
+            return self._read_feather(columns, filters)
+        if self.file.suffix == ".gpkg":
+            return self._read_gpkg(columns, filters)
+        raise ValueError(f"Unknown file type: {self.name}")
+
+    def get_columns(self) -> list[str]:
+        """
+        Gets the column names of the graph, without reading the graph from file.
+
+        Returns:
+            list[str]: The column names, empty if there is no graph.
+        """
+        if self.graph is not None:
+            return list(self.graph.columns)
+        if not self.file or not self.file.is_file():
+            return []
+        if self.file.suffix == ".feather":
+            with pa.memory_map(str(self.file)) as _source:
+                # Only the schema (footer) of the file is read.
+                return pa.ipc.open_file(_source).schema.names
+        if self.file.suffix == ".gpkg":
+            return pyogrio.read_info(self.file)["fields"].tolist() + ["geometry"]
+        raise ValueError(f"Unknown file type: {self.name}")
+
+    @staticmethod
+    def _get_filter_columns(filters: FILTERS_TYPE | None) -> list[str]:
+        if not filters:
+            return []
+        _disjunction = filters if isinstance(filters[0], list) else [filters]
+        return list(
+            dict.fromkeys(
+                _column for _conjunction in _disjunction for _column, *_ in _conjunction
+            )
+        )
+
+    @staticmethod
+    def _get_filter_mask(data: pd.DataFrame, filters: FILTERS_TYPE) -> np.ndarray:
+        _disjunction = filters if isinstance(filters[0], list) else [filters]
+        _mask = np.zeros(len(data), dtype=bool)
+        for _conjunction in _disjunction:
+            _conjunction_mask = np.ones(len(data), dtype=bool)
+            for _column, _operator, _value in _conjunction:
+                if _operator not in _FILTER_OPERATORS:
+                    raise ValueError(f"Unknown filter operator: {_operator}")
+                _conjunction_mask &= data[_column].notna().to_numpy() & np.asarray(
+                    _FILTER_OPERATORS[_operator](data[_column], _value), dtype=bool
+                )
+            _mask |= _conjunction_mask
+        return _mask
+
+    def _read_table(self) -> pa.Table:
+        """
+        Reads the whole `.feather` (Arrow IPC) file memory-mapped.
+        For an uncompressed file the data is not decompressed into Arrow memory
+        first. Converting the table to pandas does copy the columns, as the
+        (Geo)DataFrames are modified by the analyses and therefore cannot be
+        backed by the (read-only) mapped file.
+        """
+        return pa.ipc.open_file(pa.memory_map(str(self.file))).read_all()
+
+    def _get_dataset(self) -> ds.Dataset:
+        """
+        Gets the `.feather` (Arrow IPC) file as (memory-mapped) dataset, so only
+        the selected columns are loaded (and decompressed), instead of the whole
+        table.
+        """
+        return ds.dataset(
+            str(self.file),
+            format="ipc",
+            filesystem=pa.fs.LocalFileSystem(use_mmap=True),
+        )
+
+    def _read_feather(
+        self, columns: list[str] | None, filters: FILTERS_TYPE | None
+    ) -> GeoDataFrame | pd.DataFrame:
+        _dataset = self._get_dataset()
+        _geo_metadata = json.loads(_dataset.schema.metadata[b"geo"])
+        _table = _dataset.to_table(
+            columns=(
+                None
+                if columns is None
+                else list(dict.fromkeys(columns + self._get_filter_columns(filters)))
+            )
+        )
+        # The row numbers are kept to restore the index of the whole graph.
+        _row_numbers = "__row_number"
+        _table = _table.append_column(
+            _row_numbers, pa.array(np.arange(_table.num_rows, dtype=np.int64))
+        )
+        if filters:
+            _table = _table.filter(pq.filters_to_expression(filters))
+        _data = (
+            _table.select(
+                (_dataset.schema.names if columns is None else columns) + [_row_numbers]
+            )
+            .replace_schema_metadata(_dataset.schema.metadata)
+            .to_pandas()
+        )
+        _row_index = _data.pop(_row_numbers)
+        if isinstance(_data.index, pd.RangeIndex):
+            _data.index = pd.Index(_row_index.to_numpy())
+        return self._to_geodataframe(_data, _geo_metadata)
+
+    def _read_gpkg(
+        self, columns: list[str] | None, filters: FILTERS_TYPE | None
+    ) -> GeoDataFrame | pd.DataFrame:
+        _columns = (
+            None
+            if columns is None
+            else list(dict.fromkeys(columns + self._get_filter_columns(filters)))
+        )
+        _data = pyogrio.read_dataframe(
+            self.file,
+            columns=(
+                None
+                if _columns is None
+                else [_c for _c in _columns if _c != "geometry"]
+            ),
+            read_geometry=columns is None or "geometry" in columns,
+        )
+        if filters:
+            _data = _data[self._get_filter_mask(_data, filters)]
+        return _data if columns is None else _data[columns]
+
+    def unload(self) -> None:
+        if self.file and self.file.exists():
+            self.graph = None
+
+    def get_graph_chunks(
+        self, chunk_size: int, columns: list[str] | None = None
+    ) -> Iterator[GeoDataFrame | pd.DataFrame]:
+        """
+        Gets the graph in consecutive chunks of at most `chunk_size` rows.
+        When the graph is not in memory yet, the chunks are streamed from file
+        (record batches for `.feather`, feature ranges for `.gpkg`)
+        so the whole network is never materialized at once.
+
+        Args:
+            chunk_size (int): Maximum number of rows per chunk.
+            columns (list[str] | None, optional): Columns to read, all if None.
+                A `DataFrame` is returned when the geometry column is not included.
+
+        Yields:
+            Iterator[GeoDataFrame | pd.DataFrame]: The chunks of the graph.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size should be a positive number: {chunk_size}")
+
+        if self.graph is not None:
+            _graph = self.graph if columns is None else self.graph[columns]
+            for _start in range(0, len(_graph), chunk_size):
+                # A copy, so changes of the chunk do not affect the graph in memory.
+                yield _graph.iloc[_start : _start + chunk_size].copy()
+            return
+
+        if not self.file or not self.file.is_file():
+            return
+        if self.file.suffix == ".feather":
+            yield from self._read_feather_chunks(chunk_size, columns)
+        elif self.file.suffix == ".gpkg":
+            yield from self._read_gpkg_chunks(chunk_size, columns)
+        else:
+            raise ValueError(f"Unknown file type: {self.name}")
+
+    def _read_feather_chunks(
+        self, chunk_size: int, columns: list[str] | None
+    ) -> Iterator[GeoDataFrame | pd.DataFrame]:
+        # The record batches are read one by one from the file, as the dataset
+        # scanner reads (and decompresses) ahead the whole file.
+        with pa.memory_map(str(self.file)) as _source:
+            _schema = pa.ipc.open_file(_source).schema
+            _reader = pa.ipc.open_file(
+                _source,
+                options=pa.ipc.IpcReadOptions(
+                    included_fields=(
+                        None
+                        if columns is None
+                        else [_schema.get_field_index(_c) for _c in columns]
+                    )
+                ),
+            )
+            _geo_metadata = json.loads(_schema.metadata[b"geo"])
+            _offset = 0
+            for _i in range(_reader.num_record_batches):
+                _batch = _reader.get_batch(_i)
+                if columns is not None:
+                    _batch = _batch.select(columns)
+                for _start in range(0, _batch.num_rows, chunk_size):
+                    # Keep the schema metadata to restore the pandas index and dtypes.
+                    _chunk = (
+                        pa.Table.from_batches([_batch.slice(_start, chunk_size)])
+                        .replace_schema_metadata(_schema.metadata)
+                        .to_pandas()
+                    )
+                    if isinstance(_chunk.index, pd.RangeIndex):
+                        _chunk.index = pd.RangeIndex(_offset, _offset + len(_chunk))
+                    _offset += len(_chunk)
+                    yield self._to_geodataframe(_chunk, _geo_metadata)
+
+    def _read_gpkg_chunks(
+        self, chunk_size: int, columns: list[str] | None
+    ) -> Iterator[GeoDataFrame | pd.DataFrame]:
+        _n_features = pyogrio.read_info(self.file)["features"]
+        _read_geometry = columns is None or "geometry" in columns
+        _columns = (
+            None if columns is None else [_c for _c in columns if _c != "geometry"]
+        )
+        for _start in range(0, _n_features, chunk_size):
+            _chunk = pyogrio.read_dataframe(
+                self.file,
+                columns=_columns,
+                read_geometry=_read_geometry,
+                skip_features=_start,
+                max_features=chunk_size,
+            )
+            _chunk.index = pd.RangeIndex(_start, _start + len(_chunk))
+            yield _chunk
 
-    def get_graph(self) -> GeoDataFrame:
-        if self.graph is None:
-            self.read_graph(self.folder)
-        return self.graph
+    @staticmethod
+    def _to_geodataframe(
+        chunk: pd.DataFrame, geo_metadata: dict
+    ) -> GeoDataFrame | pd.DataFrame:
+        _geometry_column = geo_metadata["primary_column"]
+        if _geometry_column not in chunk.columns:
+            return chunk
+        # As in `geopandas.read_feather` a missing crs means the GeoParquet default.
+        _crs = geo_metadata["columns"][_geometry_column].get("crs", "OGC:CRS84")
+        chunk[_geometry_column] = shapely.from_wkb(chunk[_geometry_column])
+        return GeoDataFrame(chunk, geometry=_geometry_column, crs=_crs)
@@ -21,13 +21,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import pandas as pd
 
-from ra2ce.analysis.analysis_config_wrapper import AnalysisConfigWrapper
+if TYPE_CHECKING:
+    # Only for typing, avoids a circular import through the hazard overlay.
+    from ra2ce.analysis.analysis_config_wrapper import AnalysisConfigWrapper
 
 FILE_NAME_KEY = "File name"
 RA2CE_NAME_KEY = "RA2CE name"
@@ -36,6 +39,22 @@ RA2CE_NAME_KEY = "RA2CE name"
 @dataclass
 class HazardNames:
     names_df: pd.DataFrame
+    _names: list[str] = field(init=False, repr=False)
+    _ra2ce_names: dict[str, str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Plain python lookups, as these are done often in the analyses.
+        if self.names_df.empty:
+            self._names = []
+            self._ra2ce_names = {}
+            return
+        self._names = self.names_df[FILE_NAME_KEY].tolist()
+        self._ra2ce_names = {}
+        for _name, _ra2ce_name in zip(
+            self._names, self.names_df[RA2CE_NAME_KEY].tolist()
+        ):
+            # The first RA2CE name of a hazard is its name.
+            self._ra2ce_names.setdefault(_name, _ra2ce_name)
 
     @classmethod
     def from_file(cls, hazard_names_file: Optional[Path]) -> HazardNames:
@@ -43,21 +62,26 @@ class HazardNames:
         Create a HazardNames object from a file.
 
         Args:
-            hazard_names_file (Path): Path to the files with the hazard names.
+            hazard_names_file (Path): Path to the file (`.json` or `.xlsx`) with the hazard names.
 
         Returns:
             HazardNames: HazardNames object.
         """
-        if hazard_names_file and hazard_names_file.is_file():
-            _names_df = pd.read_excel(hazard_names_file)
-        else:
+        if not hazard_names_file or not hazard_names_file.is_file():
             _names_df = pd.DataFrame(data=None)
+        elif hazard_names_file.suffix == ".json":
+            _names_df = pd.DataFrame(
+                json.loads(hazard_names_file.read_text(encoding="utf-8"))
+            )
+        else:
+            _names_df = pd.read_excel(hazard_names_file)
         return cls(names_df=_names_df)
 
     @classmethod
     def from_config(cls, analysis_config: AnalysisConfigWrapper) -> HazardNames:
         """
         Create a HazardNames object from an analysis configuration.
+        The `hazard_names.json` file is preferred over the (older) `hazard_names.xlsx` file.
 
         Args:
             analysis_config (AnalysisConfigWrapper): Analysis configuration.
@@ -66,9 +90,12 @@ class HazardNames:
             HazardNames: HazardNames object.
         """
         if analysis_config.config_data.static_path:
-            _hazard_file = analysis_config.config_data.static_path.joinpath(
-                "output_graph", "hazard_names.xlsx"
+            _output_graph_dir = analysis_config.config_data.static_path.joinpath(
+                "output_graph"
             )
+            _hazard_file = _output_graph_dir.joinpath("hazard_names.json")
+            if not _hazard_file.is_file():
+                _hazard_file = _output_graph_dir.joinpath("hazard_names.xlsx")
         else:
             _hazard_file = None
         return cls.from_file(_hazard_file)
@@ -81,9 +108,7 @@ class HazardNames:
         Returns:
             list[str]: List of hazard names.
         """
-        if self.names_df.empty:
-            return []
-        return self.names_df[FILE_NAME_KEY].tolist()
+        return self._names
 
     def get_name(self, hazard: str) -> str:
         """
@@ -95,7 +120,20 @@ class HazardNames:
         Returns:
             str: RA2CE name of the hazard.
         """
-        return self.names_df.loc[
-            self.names_df[FILE_NAME_KEY] == hazard,
-            RA2CE_NAME_KEY,
-        ].values[0]
+        return self._ra2ce_names[hazard]
+
+    def export(self, export_path: Path) -> None:
+        """
+        Exports the hazard names to a `.json` file, or to an `.xlsx` file (any other suffix).
+
+        Args:
+            export_path (Path): File path where to store the hazard names.
+        """
+        if export_path.suffix == ".json":
+            # Through pandas for plain json types (e.g. `null` for missing values).
+            _records = json.loads(
+                self.names_df.to_json(orient="records", default_handler=str)
+            )
+            export_path.write_text(json.dumps(_records, indent=4), encoding="utf-8")
+        else:
+            self.names_df.to_excel(export_path, index=False)
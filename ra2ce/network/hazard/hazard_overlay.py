@@ -20,12 +20,14 @@
 """
 
 import logging
+from pathlib import Path
 
 import geopandas as gpd
 import networkx as nx
 import numpy as np
 import pandas as pd
 import pyproj
+import rasterio
 from rasterstats import point_query, zonal_stats
 from tqdm import tqdm
 
@@ -46,6 +48,8 @@ from ra2ce.network.hazard.hazard_intersect.hazard_intersect_builder_for_table im
 from ra2ce.network.hazard.hazard_intersect.hazard_intersect_builder_for_tif import (
     HazardIntersectBuilderForTif,
 )
+from ra2ce.network.hazard.hazard_names import HazardNames
+from ra2ce.network.network_build_cache import NetworkBuildCache
 from ra2ce.network.network_config_data.network_config_data import NetworkConfigData
 
 
@@ -64,12 +68,15 @@ class HazardOverlay:
         config: NetworkConfigData,
         graph_files: GraphFilesCollection,
     ):
+        self._config_data = config
+
         # Sections properties
         self._network_file_id = config.network.file_id
         self._output_graph_dir = config.static_path.joinpath("output_graph")
         self._origins = config.origins_destinations.origins
         self._destinations = config.origins_destinations.destinations
         self._save_gpkg = config.network.save_gpkg
+        self._columnar_graph_files = config.network.columnar_graph_files
         self._isolation_locations = config.static_path.joinpath(
             "network", config.isolation.locations
         )
@@ -87,6 +94,7 @@ class HazardOverlay:
         self._hazard_aggregate_wl = config.hazard.aggregate_wl.config_value
         self._hazard_directory = config.static_path.joinpath("hazard")
         self._overlay_segmented_network = config.hazard.overlay_segmented_network
+        self._save_hazard_names_excel = config.hazard.save_hazard_names_excel
 
         # graph files
         self.graph_files = graph_files
@@ -288,6 +296,7 @@ class HazardOverlay:
                 for rp in rps
                 for agg_type in chosen_agg_types
             ]
+            df["Return period"] = [rp for rp in rps for _ in chosen_agg_types]
         else:
             # Event hazard maps are used
             # Note: no hazard type is indicated because the name became too long
@@ -296,9 +305,25 @@ class HazardOverlay:
                 for i in range(len(self._hazard_map))
                 for agg_type in chosen_agg_types
             ]
+            df["Return period"] = None
         df["Full path"] = [haz for haz in self._hazard_map for _ in chosen_agg_types]
+        df["CRS"] = self._hazard_crs
+        _grid_signatures = list(map(self._get_grid_signature, self._hazard_map))
+        df["Grid signature"] = [
+            _grid_signature
+            for _grid_signature in _grid_signatures
+            for _ in chosen_agg_types
+        ]
         return df
 
+    @staticmethod
+    def _get_grid_signature(hazard_map: Path) -> str | None:
+        # Only the header of the raster is read.
+        if hazard_map.suffix != ".tif" or not hazard_map.is_file():
+            return None
+        with rasterio.open(hazard_map) as _raster:
+            return f"{_raster.width}x{_raster.height} {tuple(_raster.transform)[:6]}"
+
     def hazard_intersect(
         self, to_overlay: gpd.GeoDataFrame | nx.Graph
     ) -> gpd.GeoDataFrame | nx.Graph:
@@ -511,7 +536,9 @@ class HazardOverlay:
             write all the objects
 
         """
-        types_to_export = ["pickle"] if not self._save_gpkg else ["pickle", "gpkg"]
+        types_to_export = ["graph" if self._columnar_graph_files else "pickle"]
+        if self._save_gpkg:
+            types_to_export.append("gpkg")
 
         if (
             not self.graph_files.base_graph.file
@@ -601,8 +628,11 @@ class HazardOverlay:
             self._export_network_files("locations_hazard", "pickle")
 
         # Save the hazard name bookkeeping table.
-        self.hazard_name_table.to_excel(
-            self._output_graph_dir.joinpath("hazard_names.xlsx"), index=False
-        )
+        _hazard_names = HazardNames(names_df=self.hazard_name_table)
+        _hazard_names.export(self._output_graph_dir.joinpath("hazard_names.json"))
+        if self._save_hazard_names_excel:
+            _hazard_names.export(self._output_graph_dir.joinpath("hazard_names.xlsx"))
+
+        NetworkBuildCache.from_config(self._config_data).update("hazard")
 
         return self.graph_files
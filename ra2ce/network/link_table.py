@@ -0,0 +1,211 @@
+"""
+                    GNU GENERAL PUBLIC LICENSE
+                      Version 3, 29 June 2007
+
+    Risk Assessment and Adaptation for Critical Infrastructure (RA2CE).
+    Copyright (C) 2023-2026 Stichting Deltares
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(kw_only=True)
+class LinkTable:
+    """
+    Columnar table linking the ids of the simple graph (`rfid`) to the ids
+    of the complex (segmented) graph (`rfid_c`).
+
+    The table is stored as two aligned integer arrays sorted by simple id,
+    lookups in either direction are done with `np.searchsorted`.
+    """
+
+    simple_ids: np.ndarray
+    complex_ids: np.ndarray
+    _complex_order: np.ndarray = field(init=False, repr=False)
+
+    simple_id_name = "rfid"
+    complex_id_name = "rfid_c"
+
+    def __post_init__(self) -> None:
+        _simple_ids = np.asarray(self.simple_ids, dtype=np.int64)
+        _complex_ids = np.asarray(self.complex_ids, dtype=np.int64)
+        if _simple_ids.shape != _complex_ids.shape:
+            raise ValueError(
+                "The simple and complex ids of a link table should have the same length."
+            )
+        # Stable sort, so the complex ids of a simple id keep their original order.
+        _order = np.argsort(_simple_ids, kind="stable")
+        self.simple_ids = _simple_ids[_order]
+        self.complex_ids = _complex_ids[_order]
+        self._complex_order = np.argsort(self.complex_ids, kind="stable")
+
+    def __len__(self) -> int:
+        return len(self.simple_ids)
+
+    @classmethod
+    def from_simple_to_complex(
+        cls, simple_to_complex: dict[int, int | list[int]]
+    ) -> LinkTable:
+        """
+        Creates a link table from a lookup dictionary of the simple ids to
+        one or more complex ids.
+
+        Args:
+            simple_to_complex (dict[int, int | list[int]]): Complex id(s) per simple id.
+
+        Returns:
+            LinkTable: The link table.
+        """
+        _n_complex_ids = [
+            len(_value) if isinstance(_value, list) else 1
+            for _value in simple_to_complex.values()
+        ]
+        _complex_ids = [
+            _id
+            for _value in simple_to_complex.values()
+            for _id in (_value if isinstance(_value, list) else [_value])
+        ]
+        return cls(
+            simple_ids=np.repeat(
+                np.array(list(simple_to_complex.keys()), dtype=np.int64),
+                _n_complex_ids,
+            ),
+            complex_ids=np.array(_complex_ids, dtype=np.int64),
+        )
+
+    @classmethod
+    def from_file(cls, file_path: Path) -> LinkTable:
+        """
+        Reads a link table from a parquet or feather file.
+
+        Args:
+            file_path (Path): Path to the `.parquet` or `.feather` file.
+
+        Returns:
+            LinkTable: The link table.
+        """
+        if file_path.suffix == ".parquet":
+            _df = pd.read_parquet(file_path)
+        else:
+            _df = pd.read_feather(file_path)
+        return cls(
+            simple_ids=_df[cls.simple_id_name].to_numpy(),
+            complex_ids=_df[cls.complex_id_name].to_numpy(),
+        )
+
+    def get_complex_ids(self, simple_id: int) -> np.ndarray:
+        """
+        Gets the complex ids belonging to a simple id.
+
+        Args:
+            simple_id (int): Id of the simple graph.
+
+        Returns:
+            np.ndarray: The complex ids, empty when the simple id is unknown.
+        """
+        _start = np.searchsorted(self.simple_ids, simple_id, side="left")
+        _end = np.searchsorted(self.simple_ids, simple_id, side="right")
+        return self.complex_ids[_start:_end]
+
+    def get_simple_ids(self, complex_ids: np.ndarray) -> np.ndarray:
+        """
+        Gets the simple id belonging to each of the complex ids.
+
+        Args:
+            complex_ids (np.ndarray): Ids of the complex graph.
+
+        Raises:
+            KeyError: When any of the complex ids is unknown.
+
+        Returns:
+            np.ndarray: The simple id per complex id.
+        """
+        _complex_ids = np.atleast_1d(np.asarray(complex_ids, dtype=np.int64))
+        _sorted_complex_ids = self.complex_ids[self._complex_order]
+        _positions = np.searchsorted(_sorted_complex_ids, _complex_ids)
+        _found = _positions < len(self)
+        _found[_found] = (
+            _sorted_complex_ids[_positions[_found]] == _complex_ids[_found]
+        )
+        if not _found.all():
+            raise KeyError(f"Unknown complex ids: {_complex_ids[~_found].tolist()}")
+        return self.simple_ids[self._complex_order[_positions]]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Gets the link table as a dataframe with the columns `rfid` and `rfid_c`.
+
+        Returns:
+            pd.DataFrame: The link table.
+        """
+        return pd.DataFrame(
+            {
+                self.simple_id_name: self.simple_ids,
+                self.complex_id_name: self.complex_ids,
+            }
+        )
+
+    def to_dicts(self) -> tuple[dict[int, int | list[int]], dict[int, int]]:
+        """
+        Gets the (legacy) lookup dictionaries of the link table.
+
+        Returns:
+            tuple[dict[int, int | list[int]], dict[int, int]]:
+                - Dictionary mapping each simple id to one or more complex ids.
+                - Dictionary mapping each complex id to its simple id.
+        """
+        _unique_simple_ids, _starts = np.unique(self.simple_ids, return_index=True)
+        _complex_ids_per_simple_id = np.split(self.complex_ids, _starts[1:])
+        _simple_to_complex = {
+            _simple_id: _complex_ids[0] if len(_complex_ids) == 1 else _complex_ids
+            for _simple_id, _complex_ids in zip(
+                _unique_simple_ids.tolist(),
+                map(np.ndarray.tolist, _complex_ids_per_simple_id),
+            )
+        }
+        _sorted_complex_ids = self.complex_ids[self._complex_order]
+        _complex_to_simple = dict(
+            zip(
+                _sorted_complex_ids.tolist(),
+                self.simple_ids[self._complex_order].tolist(),
+            )
+        )
+        return _simple_to_complex, _complex_to_simple
+
+    def export(self, export_path: Path) -> None:
+        """
+        Exports the link table to a parquet (`.parquet`) or feather (any other suffix) file.
+        When the parent(s) directory does not exist then it will be created.
+
+        Args:
+            export_path (Path): File path where to store the link table.
+        """
+        _export_dir = export_path.parent
+        if not _export_dir.is_dir():
+            _export_dir.mkdir(parents=True)
+
+        if export_path.suffix == ".parquet":
+            self.to_dataframe().to_parquet(export_path)
+        else:
+            self.to_dataframe().to_feather(export_path)
+        logging.info("Saved (or overwrote) %s", export_path.name)
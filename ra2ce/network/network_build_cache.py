@@ -0,0 +1,221 @@
+"""
+                    GNU GENERAL PUBLIC LICENSE
+                      Version 3, 29 June 2007
+
+    Risk Assessment and Adaptation for Critical Infrastructure (RA2CE).
+    Copyright (C) 2023-2026 Stichting Deltares
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, ClassVar
+
+from ra2ce.network.graph_files.graph_files_collection import GraphFilesCollection
+from ra2ce.network.network_config_data.network_config_data import NetworkConfigData
+
+
+@dataclass(kw_only=True)
+class NetworkBuildCache:
+    """
+    Bookkeeping of the inputs the network creation outputs (graph files) were built from.
+
+    For each build stage (network, origins and destinations, hazard) a key is stored,
+    being a hash of the relevant configuration and the fingerprints (size and
+    modification time) of the input files, including the files sharing their
+    name (e.g. the `.dbf` and `.prj` files of a shapefile). The key of a stage includes the key of
+    the stage it depends on, so a change of the inputs also affects the later stages.
+    Outputs of a stage built from other inputs than the current ones are stale,
+    these are removed so the stage is rebuilt.
+    """
+
+    config_data: NetworkConfigData
+    stage_keys: dict[str, str] = field(default_factory=dict)
+
+    cache_file_name: ClassVar[str] = "network_build_cache.json"
+    stage_graph_files: ClassVar[dict[str, list[str]]] = {
+        "network": ["base_graph", "base_graph_edges", "base_network"],
+        "origins_destinations": ["origins_destinations_graph"],
+        "hazard": [
+            "base_graph_hazard",
+            "base_graph_hazard_edges",
+            "origins_destinations_graph_hazard",
+            "base_network_hazard",
+            "locations_hazard",
+        ],
+    }
+    # Options that only affect the format of the outputs or how these are created.
+    _output_options: ClassVar[list[str]] = [
+        "save_gpkg",
+        "save_link_tables_json",
+        "columnar_graph_files",
+        "reuse_network_output",
+        "save_hazard_names_excel",
+        "osm_tile_cache",
+        "osm_tile_size",
+    ]
+
+    @classmethod
+    def from_config(cls, config_data: NetworkConfigData) -> NetworkBuildCache:
+        """
+        Creates the build cache of a network configuration,
+        with the stage keys stored in its output graph directory (if any).
+
+        Args:
+            config_data (NetworkConfigData): Network configuration.
+
+        Returns:
+            NetworkBuildCache: The build cache.
+        """
+        _build_cache = cls(config_data=config_data)
+        _cache_file = _build_cache.cache_file
+        if _cache_file and _cache_file.is_file():
+            _build_cache.stage_keys = json.loads(_cache_file.read_text())
+        return _build_cache
+
+    @property
+    def cache_file(self) -> Path | None:
+        if not self.config_data.output_graph_dir:
+            return None
+        return self.config_data.output_graph_dir.joinpath(self.cache_file_name)
+
+    def get_stage_key(self, stage: str) -> str:
+        """
+        Gets the key of the current inputs of a build stage.
+
+        Args:
+            stage (str): Name of the build stage.
+
+        Raises:
+            ValueError: If the stage is not one of the known build stages.
+
+        Returns:
+            str: Hash of the inputs of the stage.
+        """
+        _inputs = json.dumps(
+            self._get_stage_inputs(stage), sort_keys=True, default=self._to_json
+        )
+        return hashlib.sha256(_inputs.encode()).hexdigest()
+
+    def is_stale(self, stage: str) -> bool:
+        """
+        Checks whether the outputs of a build stage were built from other inputs
+        than the current ones. Outputs without a stored key are not considered stale.
+
+        Args:
+            stage (str): Name of the build stage.
+
+        Returns:
+            bool: True when the stored key differs from the current key.
+        """
+        _stored_key = self.stage_keys.get(stage)
+        return _stored_key is not None and _stored_key != self.get_stage_key(stage)
+
+    def remove_stale_outputs(self, graph_files: GraphFilesCollection) -> None:
+        """
+        Removes the outputs (graph files) of the stale build stages,
+        so these are rebuilt.
+
+        Args:
+            graph_files (GraphFilesCollection): Collection of the graph files.
+        """
+        for _stage, _graph_file_types in self.stage_graph_files.items():
+            if not self.is_stale(_stage):
+                continue
+            logging.info(
+                "The inputs of the '%s' stage changed, its outputs will be rebuilt.",
+                _stage,
+            )
+            for _graph_file_type in _graph_file_types:
+                graph_files.remove_file(_graph_file_type)
+            del self.stage_keys[_stage]
+        self._write()
+
+    def update(self, stage: str) -> None:
+        """
+        Stores the key of the current inputs of a (built) stage.
+
+        Args:
+            stage (str): Name of the build stage.
+        """
+        self.stage_keys[stage] = self.get_stage_key(stage)
+        self._write()
+
+    def _write(self) -> None:
+        if not self.cache_file or not self.cache_file.parent.is_dir():
+            return
+        self.cache_file.write_text(json.dumps(self.stage_keys, indent=4))
+
+    def _get_section_inputs(self, section: Any) -> dict:
+        return {
+            _key: _value
+            for _key, _value in asdict(section).items()
+            if _key not in self._output_options
+        }
+
+    def _get_stage_inputs(self, stage: str) -> dict:
+        if stage == "network":
+            return dict(
+                crs=self.config_data.crs,
+                network=self._get_section_inputs(self.config_data.network),
+                cleanup=self._get_section_inputs(self.config_data.cleanup),
+            )
+        if stage == "origins_destinations":
+            return dict(
+                network=self.get_stage_key("network"),
+                origins_destinations=self._get_section_inputs(
+                    self.config_data.origins_destinations
+                ),
+            )
+        if stage == "hazard":
+            _isolation_locations = None
+            if self.config_data.network_dir and self.config_data.isolation.locations:
+                _isolation_locations = self.config_data.network_dir.joinpath(
+                    self.config_data.isolation.locations
+                )
+            return dict(
+                origins_destinations=self.get_stage_key("origins_destinations"),
+                hazard=self._get_section_inputs(self.config_data.hazard),
+                isolation_locations=_isolation_locations,
+            )
+        raise ValueError(f"Unknown build stage {stage} provided.")
+
+    @staticmethod
+    def _to_json(value: Any) -> Any:
+        if isinstance(value, Path):
+            # Fingerprints of the file and the files sharing its name
+            # (e.g. of a shapefile) instead of their (full) content.
+            if not value.is_file():
+                return value.name
+            _fingerprints = []
+            for _file in sorted(value.parent.iterdir()):
+                if not _file.name.startswith(f"{value.stem}.") or not _file.is_file():
+                    continue
+                _stat = _file.stat()
+                _fingerprints.append(
+                    dict(
+                        file=_file.name, size=_stat.st_size, modified=_stat.st_mtime_ns
+                    )
+                )
+            return _fingerprints
+        if isinstance(value, Enum):
+            return value.name
+        return str(value)
@@ -22,6 +22,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import date
 from pathlib import Path
 from typing import Optional
 
@@ -52,6 +53,7 @@ class NetworkSection:
         Source of the network data. Default is ``SourceEnum.INVALID``.
     primary_file
         If ``source`` is set to ``SourceEnum.SHAPEFILE``, provide a list of shapefiles for the network.
+        If ``source`` is set to ``SourceEnum.OSM_DOWNLOAD``, optionally provide a local OSM extract (``.osm.pbf`` or ``.osm``) to read the network from instead of downloading it.
     diversion_file
         List of diversion files.
     file_id
@@ -68,6 +70,16 @@ class NetworkSection:
         List of attributes not to simplify.
     save_gpkg
         Whether to save a GeoPackage file of the network in the output_graph folder. Default is ``False``.
+    save_link_tables_json
+        Whether to also save the tables linking the simple and complex graph ids as (legacy) json files in the output_graph folder. Default is ``False``.
+    columnar_graph_files
+        Whether to save the graphs in the columnar graph format (``.graph`` directories) instead of as pickle (``.p``) files in the output_graph folder. Default is ``False``.
+    osm_tile_cache
+        If ``source`` is set to ``SourceEnum.OSM_DOWNLOAD``, whether to cache the downloaded OSM data per tile in the ``osm_tile_cache`` folder of the network directory, to reuse it in later runs. The cached data is not updated: later runs keep using the OSM data of the first download (or of ``osm_date``), also for the tiles downloaded later. Whole tiles are downloaded, also for small polygons. Default is ``False``.
+    osm_tile_size
+        Size (in degrees) of the tiles of the OSM tile cache. Default is ``0.45`` (about 50 by 50 km).
+    osm_date
+        Date of the OSM data to download into the OSM tile cache. Default is ``None``: the data of the date of the first download into the cache.
     """
 
     directed: bool = False
@@ -83,7 +95,12 @@ class NetworkSection:
         default_factory=list
     )
     save_gpkg: bool = False
+    save_link_tables_json: bool = False
+    columnar_graph_files: bool = False
     reuse_network_output: bool = False
+    osm_tile_cache: bool = False
+    osm_tile_size: float = 0.45
+    osm_date: Optional[date] = None
 
 
 @dataclass
@@ -113,6 +130,8 @@ class OriginsDestinationsSection:
         (Optional) Path to a shapefile or other supported file containing the region polygon.
     region_var
         (Optional) Field name of the attribute in the region file that contains the region variable.
+    origins_raster_resolution
+        Resolution (in meter) to which an origins (population) raster is rescaled before generating the origin points. Default is 1000.
     """
 
     origins: Optional[Path] = None
@@ -124,6 +143,7 @@ class OriginsDestinationsSection:
     category: Optional[str] = ""
     region: Optional[Path] = None
     region_var: Optional[str] = ""
+    origins_raster_resolution: float = 1000
 
 
 @dataclass
@@ -150,6 +170,8 @@ class HazardSection:
         Coordinate reference system of the hazard maps.
     overlay_segmented_network
         If False no overlay of the segmented network will be created. Default is ``True``.
+    save_hazard_names_excel
+        If True the hazard names bookkeeping is also saved as (human-readable) ``hazard_names.xlsx``. Default is ``False``.
     """
 
     hazard_map: list[Path] = field(default_factory=list)
@@ -159,6 +181,7 @@ class HazardSection:
     hazard_crs: str = ""
     # If False no overlay of the segmented network will be created.
     overlay_segmented_network: Optional[bool] = True
+    save_hazard_names_excel: bool = False
 
 
 @dataclass
@@ -1,6 +1,7 @@
 import logging
 import re
 from configparser import ConfigParser
+from datetime import date
 from pathlib import Path
 from typing import Any, Union
 
@@ -162,11 +163,33 @@ class NetworkConfigDataReader(ConfigDataReaderProtocol):
         _network_section.save_gpkg = self._parser.getboolean(
             _section, "save_gpkg", fallback=_network_section.save_gpkg
         )
+        _network_section.save_link_tables_json = self._parser.getboolean(
+            _section,
+            "save_link_tables_json",
+            fallback=_network_section.save_link_tables_json,
+        )
+        _network_section.columnar_graph_files = self._parser.getboolean(
+            _section,
+            "columnar_graph_files",
+            fallback=_network_section.columnar_graph_files,
+        )
         _network_section.reuse_network_output = self._parser.getboolean(
             _section,
             "reuse_network_output",
             fallback=_network_section.reuse_network_output,
         )
+        _network_section.osm_tile_cache = self._parser.getboolean(
+            _section,
+            "osm_tile_cache",
+            fallback=_network_section.osm_tile_cache,
+        )
+        _network_section.osm_tile_size = self._parser.getfloat(
+            _section,
+            "osm_tile_size",
+            fallback=_network_section.osm_tile_size,
+        )
+        _osm_date = self._parser.get(_section, "osm_date", fallback=None)
+        _network_section.osm_date = date.fromisoformat(_osm_date) if _osm_date else None
         _network_section.network_type = NetworkTypeEnum.get_enum(
             self._parser.get(_section, "network_type", fallback=None)
         )
@@ -210,6 +233,11 @@ class NetworkConfigDataReader(ConfigDataReaderProtocol):
         _od_section.origin_out_fraction = self._parser.getint(
             _section, "origin_out_fraction", fallback=_od_section.origin_out_fraction
         )
+        _od_section.origins_raster_resolution = self._parser.getfloat(
+            _section,
+            "origins_raster_resolution",
+            fallback=_od_section.origins_raster_resolution,
+        )
         _od_section.origins = self._get_str_as_path(_od_section.origins)
         _od_section.destinations = self._get_str_as_path(_od_section.destinations)
         _od_section.region = self._get_str_as_path(_od_section.region)
@@ -245,6 +273,11 @@ class NetworkConfigDataReader(ConfigDataReaderProtocol):
             "overlay_segmented_network",
             fallback=_hazard_section.overlay_segmented_network,
         )
+        _hazard_section.save_hazard_names_excel = self._parser.getboolean(
+            _section,
+            "save_hazard_names_excel",
+            fallback=_hazard_section.save_hazard_names_excel,
+        )
         return _hazard_section
 
     def get_cleanup_section(self) -> CleanupSection:
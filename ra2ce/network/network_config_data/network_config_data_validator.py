@@ -38,6 +38,9 @@ NetworkDictValues: dict[str, list[Any]] = {
     "origins": ["file", None],
     "destinations": ["file", None],
     "save_gpkg": [True, False, None],
+    "save_link_tables_json": [True, False, None],
+    "columnar_graph_files": [True, False, None],
+    "osm_tile_cache": [True, False, None],
     "save_csv": [True, False, None],
     "hazard_map": ["file", None],
     "save_traffic": [True, False, None],
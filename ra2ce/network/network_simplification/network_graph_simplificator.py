@@ -24,6 +24,7 @@ from dataclasses import dataclass
 import networkx as nx
 from tqdm import tqdm
 
+from ra2ce.network.link_table import LinkTable
 from ra2ce.network.network_simplification.network_simplification_with_attribute_exclusion import (
     NetworkSimplificationWithAttributeExclusion,
 )
@@ -46,12 +47,12 @@ class NetworkGraphSimplificator:
 
     def simplify(
         self,
-    ) -> tuple[nx.Graph, nx.Graph, tuple[dict, dict]]:
+    ) -> tuple[nx.Graph, nx.Graph, LinkTable]:
         """
         Create a simplified graph with unique ids from a complex graph
 
         Returns:
-            tuple[nx.Graph, nx.Graph, tuple[dict, dict]]: The simple and complex graph and the "id" tables.
+            tuple[nx.Graph, nx.Graph, LinkTable]: The simple and complex graph and the "id" table.
         """
         logging.info("Simplifying graph")
         try:
@@ -67,7 +68,7 @@ class NetworkGraphSimplificator:
             ) = self._graph_link_simple_id_to_complex(_graph_simple)
 
             # Store id table and add simple ids to complex graph
-            _id_tables = (_simple_to_complex, _complex_to_simple)
+            _id_tables = LinkTable.from_simple_to_complex(_simple_to_complex)
             _graph_complex = self._add_simple_id_to_graph_complex(
                 _graph_complex, _complex_to_simple, self.new_id
             )
@@ -15,14 +15,20 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+from __future__ import annotations
+
 import logging
-from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable
 
 import geopandas as gpd
 import networkx as nx
 import numpy as np
 import pandas as pd
+import shapely
 from networkx import MultiGraph
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 from shapely.geometry import LineString, MultiLineString, MultiPoint, Point
 from shapely.ops import linemerge
 from snkit.network import Network as SnkitNetwork
@@ -40,6 +46,373 @@ its current state.
 """
 
 
+@dataclass(kw_only=True)
+class _EdgeIndex:
+    """
+    Compressed sparse row (CSR) index of the edges incident to each node,
+    built from the integer `from_id` / `to_id` arrays of the edges.
+    """
+
+    node_ids: pd.Index
+    n_edges: int
+    indptr: np.ndarray
+    edge_positions: np.ndarray
+    neighbour_ids: np.ndarray
+    edge_positions_by_end_nodes: dict[tuple, np.ndarray]
+
+    @classmethod
+    def from_edges(cls, edges: gpd.GeoDataFrame) -> _EdgeIndex:
+        _from_ids = edges["from_id"].to_numpy()
+        _to_ids = edges["to_id"].to_numpy()
+        _positions = np.arange(len(edges))
+
+        # A self-loop is incident to its node only once.
+        _is_loop = _from_ids == _to_ids
+        _incident_node_ids = np.concatenate([_from_ids, _to_ids[~_is_loop]])
+        _incident_positions = np.concatenate([_positions, _positions[~_is_loop]])
+        _neighbour_ids = np.concatenate([_to_ids, _from_ids[~_is_loop]])
+
+        _node_codes, _node_ids = pd.factorize(_incident_node_ids, sort=True)
+        _order = np.lexsort((_incident_positions, _node_codes))
+        _indptr = np.zeros(len(_node_ids) + 1, dtype=int)
+        np.cumsum(np.bincount(_node_codes, minlength=len(_node_ids)), out=_indptr[1:])
+
+        _edge_positions_by_end_nodes = (
+            pd.DataFrame({"from_id": _from_ids, "to_id": _to_ids})
+            .groupby(["from_id", "to_id"], sort=False)
+            .indices
+            if len(edges)
+            else {}
+        )
+        return cls(
+            node_ids=pd.Index(_node_ids),
+            n_edges=len(edges),
+            indptr=_indptr,
+            edge_positions=_incident_positions[_order],
+            neighbour_ids=_neighbour_ids[_order],
+            edge_positions_by_end_nodes=_edge_positions_by_end_nodes,
+        )
+
+    def _get_slice(self, node_id: int | float) -> slice:
+        _code = self.node_ids.get_indexer([node_id])[0]
+        if _code < 0:
+            return slice(0, 0)
+        return slice(self.indptr[_code], self.indptr[_code + 1])
+
+    def get_degrees(self, node_ids: pd.Series) -> np.ndarray:
+        """Number of edges connected to each of the given nodes."""
+        _codes = self.node_ids.get_indexer(node_ids)
+        _degrees = np.diff(self.indptr)
+        return np.where(_codes < 0, 0, _degrees[_codes])
+
+    def get_neighbours(self, node_id: int | float) -> set:
+        """Nodes connected to the given node, regardless of the edge direction."""
+        return set(self.neighbour_ids[self._get_slice(node_id)].tolist())
+
+    def get_incident_edge_positions(self, node_ids: set) -> np.ndarray:
+        """Sorted positions of the edges connected to any of the given nodes."""
+        return np.unique(
+            np.concatenate(
+                [
+                    self.edge_positions[self._get_slice(_node_id)]
+                    for _node_id in node_ids
+                ]
+                + [np.empty(0, dtype=int)]
+            )
+        )
+
+    def get_edge_positions(
+        self, from_node: int | float, to_node: int | float
+    ) -> np.ndarray:
+        """Positions of the edges from one node to another."""
+        return self.edge_positions_by_end_nodes.get(
+            (from_node, to_node), np.empty(0, dtype=int)
+        )
+
+    def get_chain_ids(self, node_ids: set) -> np.ndarray:
+        """
+        Labels the edges connected to each other through the given nodes with the same
+        chain id (0, 1, ...), and the edges not connected to any of them with -1.
+        """
+        _is_chain_node = np.zeros(len(self.node_ids), dtype=bool)
+        _codes = self.node_ids.get_indexer(list(node_ids))
+        _is_chain_node[_codes[_codes >= 0]] = True
+        _degrees = np.diff(self.indptr)
+        _slot_codes = np.repeat(np.arange(len(self.node_ids)), _degrees)
+        _slot_is_chain_node = np.repeat(_is_chain_node, _degrees)
+
+        # Link each edge to the next edge incident to the same chain node.
+        _links = np.flatnonzero(
+            _slot_is_chain_node[:-1] & (_slot_codes[:-1] == _slot_codes[1:])
+        )
+        _adjacency = coo_matrix(
+            (
+                np.ones(len(_links), dtype=bool),
+                (self.edge_positions[_links], self.edge_positions[_links + 1]),
+            ),
+            shape=(self.n_edges, self.n_edges),
+        )
+        _, _components = connected_components(_adjacency, directed=False)
+
+        _is_chain_edge = np.zeros(self.n_edges, dtype=bool)
+        _is_chain_edge[self.edge_positions[_slot_is_chain_node]] = True
+        _chain_ids = np.full(self.n_edges, -1)
+        _chain_ids[_is_chain_edge] = pd.factorize(_components[_is_chain_edge])[0]
+        return _chain_ids
+
+
+@dataclass(kw_only=True)
+class _EdgeChains:
+    """
+    Chains of edges connected through the nodes to merge (of degree 2 with one
+    predecessor and one successor, or bidirectional of degree 4).
+
+    The open chains between two other nodes, without demand edges, are contracted
+    at once: their edges are ordered along the (one-way, or forward and backward)
+    paths of the chain, split where the excluded attributes change, aggregated per
+    part and their geometries merged together. The nodes of the other chains
+    (loops, demand edges, both node degrees) are left to be merged per path.
+    """
+
+    edges: gpd.GeoDataFrame
+    path_ids: np.ndarray
+    path_ranks: np.ndarray
+    merge_orders: np.ndarray
+    remaining_node_ids: set
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: gpd.GeoDataFrame,
+        edge_index: _EdgeIndex,
+        degree_2_node_ids: set,
+        degree_4_node_ids: set,
+    ) -> _EdgeChains:
+        _chain_node_ids = degree_2_node_ids | degree_4_node_ids
+        _chain_ids = edge_index.get_chain_ids(_chain_node_ids)
+        _is_chain_edge = _chain_ids >= 0
+        _chain_edges = pd.DataFrame(
+            {
+                "chain_id": _chain_ids[_is_chain_edge],
+                "position": np.flatnonzero(_is_chain_edge),
+                "from_id": edges["from_id"].to_numpy()[_is_chain_edge],
+                "to_id": edges["to_id"].to_numpy()[_is_chain_edge],
+                "is_demand_edge": (
+                    edges["demand_edge"].to_numpy()[_is_chain_edge] == 1
+                    if "demand_edge" in edges.columns
+                    else False
+                ),
+            }
+        )
+        _chain_edges = _chain_edges.join(
+            cls._get_contractible_chains(
+                _chain_edges, degree_2_node_ids, degree_4_node_ids
+            ),
+            on="chain_id",
+        )
+        _open_edges = _chain_edges[
+            _chain_edges["is_one_way"] | _chain_edges["is_bidirectional"]
+        ]
+
+        # Trace all paths at once: each path starts with an edge leaving the chain,
+        # followed by the edge leaving the node it enters (without going back).
+        _next_edges = _open_edges[_open_edges["to_id"].isin(_chain_node_ids)].merge(
+            _open_edges[["chain_id", "position", "from_id", "to_id"]],
+            left_on=["chain_id", "to_id"],
+            right_on=["chain_id", "from_id"],
+            suffixes=("", "_next"),
+        )
+        _next_edges = _next_edges[_next_edges["to_id_next"] != _next_edges["from_id"]]
+        _next_positions = np.full(len(edges), -1)
+        _next_positions[_next_edges["position"].to_numpy()] = _next_edges[
+            "position_next"
+        ].to_numpy()
+
+        _path_ids = np.full(len(edges), -1)
+        _path_ranks = np.full(len(edges), -1)
+        _positions = _open_edges["position"].to_numpy()[
+            ~_open_edges["from_id"].isin(_chain_node_ids).to_numpy()
+        ]
+        _paths = np.arange(len(_positions))
+        _rank = 0
+        while len(_positions):
+            _path_ids[_positions] = _paths
+            _path_ranks[_positions] = _rank
+            _positions = _next_positions[_positions]
+            _paths = _paths[_positions >= 0]
+            _positions = _positions[_positions >= 0]
+            _rank += 1
+
+        # As when merged per path, the edges of a one-way path are merged in the order
+        # of the edges and those of a bidirectional path in the order along the path.
+        _merge_orders = np.arange(len(edges))
+        _bidirectional_positions = _open_edges["position"].to_numpy()[
+            _open_edges["is_bidirectional"].to_numpy()
+        ]
+        _merge_orders[_bidirectional_positions] = _path_ranks[_bidirectional_positions]
+
+        return cls(
+            edges=edges,
+            path_ids=_path_ids,
+            path_ranks=_path_ranks,
+            merge_orders=_merge_orders,
+            remaining_node_ids=_chain_node_ids
+            - set(_open_edges["from_id"])
+            - set(_open_edges["to_id"]),
+        )
+
+    @staticmethod
+    def _get_contractible_chains(
+        chain_edges: pd.DataFrame, degree_2_node_ids: set, degree_4_node_ids: set
+    ) -> pd.DataFrame:
+        """
+        Flags the chains without demand edges that are an open path between two
+        other (distinct) nodes, either one-way (`is_one_way`) or bidirectional
+        (`is_bidirectional`).
+        """
+        _chain_nodes = pd.concat(
+            [
+                chain_edges[["chain_id", _column]].set_axis(
+                    ["chain_id", "node_id"], axis=1
+                )
+                for _column in ("from_id", "to_id")
+            ]
+        ).drop_duplicates()
+        _is_degree_2 = _chain_nodes["node_id"].isin(degree_2_node_ids)
+        _is_degree_4 = _chain_nodes["node_id"].isin(degree_4_node_ids)
+        _n_nodes = (
+            pd.DataFrame(
+                {
+                    "chain_id": _chain_nodes["chain_id"],
+                    "degree_2": _is_degree_2,
+                    "degree_4": _is_degree_4,
+                    "other": ~(_is_degree_2 | _is_degree_4),
+                }
+            )
+            .groupby("chain_id")
+            .sum()
+        )
+
+        _chain_groups = chain_edges.groupby("chain_id")
+        _n_edges = _chain_groups.size()
+        _n_directed_pairs = (
+            chain_edges.drop_duplicates(["chain_id", "from_id", "to_id"])
+            .groupby("chain_id")
+            .size()
+        )
+        _end_ids = np.sort(chain_edges[["from_id", "to_id"]].to_numpy(), axis=1)
+        _n_pairs = (
+            pd.DataFrame(
+                {
+                    "chain_id": chain_edges["chain_id"].to_numpy(),
+                    "node_a": _end_ids[:, 0],
+                    "node_b": _end_ids[:, 1],
+                }
+            )
+            .drop_duplicates()
+            .groupby("chain_id")
+            .size()
+        )
+        _is_open = (_n_nodes["other"] == 2) & ~_chain_groups["is_demand_edge"].any()
+        return pd.DataFrame(
+            {
+                # Nodes of degree 2, each entered and left by one edge.
+                "is_one_way": _is_open
+                & (_n_nodes["degree_4"] == 0)
+                & (_n_edges == _n_nodes["degree_2"] + 1),
+                # Nodes of degree 4, connected by one edge in each direction.
+                "is_bidirectional": _is_open
+                & (_n_nodes["degree_2"] == 0)
+                & (_n_pairs == _n_nodes["degree_4"] + 1)
+                & (_n_edges == 2 * _n_pairs)
+                & (_n_directed_pairs == _n_edges),
+            }
+        )
+
+    def get_contracted_edge_ids(self) -> list:
+        """Ids of the edges of the contracted chains."""
+        return self.edges["id"].to_numpy()[self.path_ids >= 0].tolist()
+
+    def contract(self, by: list, aggregate_func: dict) -> gpd.GeoDataFrame:
+        """
+        Contracts the parts of the paths with the same excluded attributes (`by`)
+        into one edge each, aggregating their attributes with the given functions.
+
+        Args:
+            by (list): Column names of the excluded attributes.
+            aggregate_func (dict): Aggregation function per column.
+
+        Returns:
+            gpd.GeoDataFrame: The contracted edges (without `id`).
+        """
+        _is_contracted = self.path_ids >= 0
+        if not _is_contracted.any():
+            return gpd.GeoDataFrame(
+                columns=self.edges.columns.drop("id"), crs=self.edges.crs
+            )
+        _edges = self.edges[_is_contracted].copy()
+        _path_ids = self.path_ids[_is_contracted]
+        _merge_orders = self.merge_orders[_is_contracted]
+        for _column in by:
+            _edges[_column] = _edges[_column].fillna("None")
+
+        # Split the paths where the excluded attributes change.
+        _along_paths = np.lexsort((self.path_ranks[_is_contracted], _path_ids))
+        _edges = _edges.iloc[_along_paths]
+        _path_ids = _path_ids[_along_paths]
+        _merge_orders = _merge_orders[_along_paths]
+        _is_part_start = np.ones(len(_edges), dtype=bool)
+        _is_part_start[1:] = _path_ids[1:] != _path_ids[:-1]
+        for _column in by:
+            _values = _edges[_column].to_numpy()
+            _is_part_start[1:] |= _values[1:] != _values[:-1]
+        _part_ids = np.cumsum(_is_part_start) - 1
+        _firsts = np.flatnonzero(_is_part_start)
+        _lasts = np.append(_firsts[1:] - 1, len(_edges) - 1)
+
+        # As when merged per path, a part runs from the end merged first.
+        _from_ids = _get_float_values(_edges["from_id"]).to_numpy()
+        _to_ids = _get_float_values(_edges["to_id"]).to_numpy()
+        _is_reversed = _merge_orders[_firsts] > _merge_orders[_lasts]
+        _part_from_ids = np.where(_is_reversed, _to_ids[_lasts], _from_ids[_firsts])
+        _part_to_ids = np.where(_is_reversed, _from_ids[_firsts], _to_ids[_lasts])
+
+        _in_merge_order = np.lexsort((_merge_orders, _part_ids))
+        _edges = _edges.iloc[_in_merge_order]
+        _part_ids = _part_ids[_in_merge_order]
+        _contracted = {}
+        for _column in _edges.columns:
+            if _column == "geometry":
+                _contracted[_column] = shapely.line_merge(
+                    shapely.multilinestrings(
+                        _edges["geometry"].to_numpy(), indices=_part_ids
+                    )
+                )
+            elif _column in ("from_id", "node_A"):
+                _contracted[_column] = _part_from_ids
+            elif _column in ("to_id", "node_B"):
+                _contracted[_column] = _part_to_ids
+            elif _column != "id":
+                _contracted[_column] = self._aggregate(
+                    _edges[_column], _part_ids, aggregate_func[_column]
+                )
+        return gpd.GeoDataFrame(_contracted, geometry="geometry", crs=self.edges.crs)
+
+    @staticmethod
+    def _aggregate(
+        values: pd.Series, part_ids: np.ndarray, aggregate_func: Callable
+    ) -> np.ndarray:
+        # As when merged per path, the values are aggregated as floats when possible.
+        _float_values = _get_float_values(values)
+        if _float_values.dtype != float:
+            return (
+                values.groupby(part_ids)
+                .agg(lambda _values: aggregate_func(_get_float_values(_values)))
+                .to_numpy()
+            )
+        return _float_values.groupby(part_ids).agg(aggregate_func).to_numpy()
+
+
 def merge_edges(
     snkit_network: SnkitNetwork,
     networkx_graph: NxGraph,
@@ -61,14 +434,6 @@ def merge_edges(
         SnkitNetwork: _description_
     """
 
-    def node_connectivity_degree(node, snkit_network: SnkitNetwork) -> int:
-        return len(
-            snkit_network.edges[
-                (snkit_network.edges.from_id == node)
-                | (snkit_network.edges.to_id == node)
-            ]
-        )
-
     def get_edge_ids_to_update(edges_list: list) -> list:
         ids_to_update = []
         for edges in edges_list:
@@ -81,17 +446,18 @@ def merge_edges(
         aggfunc: str | dict,
         net: SnkitNetwork,
     ) -> gpd.GeoDataFrame:
-        updated_edges = gpd.GeoDataFrame(
-            columns=net.edges.columns, crs=net.edges.crs
-        )  # merged edges
+        merged_edges_list = [
+            gpd.GeoDataFrame(columns=net.edges.columns, crs=net.edges.crs)
+        ]  # merged edges
 
         for edge_path in tqdm(paths_to_group, desc="merge_edge_paths"):
             # Convert None values to a placeholder value
             placeholder = "None"
             for col in by:
                 edge_path[col] = edge_path[col].fillna(placeholder)
-            merged_edges = _get_merge_edge_paths(edge_path, by, aggfunc, net)
-            updated_edges = pd.concat([updated_edges, merged_edges], ignore_index=True)
+            merged_edges_list.append(_get_merge_edge_paths(edge_path, by, aggfunc, net))
+        # Concatenate all merged paths at once, instead of growing the dataframe per path.
+        updated_edges = pd.concat(merged_edges_list, ignore_index=True)
 
         updated_edges_gdf = gpd.GeoDataFrame(updated_edges, geometry="geometry")
         updated_edges_gdf.set_crs(net.edges.crs, inplace=True)
@@ -117,28 +483,10 @@ def merge_edges(
         return _filtered
 
     def get_edge_paths(node_set: set, _snkit_network: SnkitNetwork) -> list:
-        def get_adjacency_list(
-            edges_gdf: gpd.GeoDataFrame, from_id_column: str, to_id_column: str
-        ) -> defaultdict:
-            # Convert the edges of a GeoDataFrame to an adjacency list using vectorized operations.
-            _edge_dict = defaultdict(set)
-            # Extract the 'from_id' and 'to_id' columns as numpy arrays for efficient processing
-            from_ids = edges_gdf[from_id_column].values
-            to_ids = edges_gdf[to_id_column].values
-            # Vectorized operation to populate the adjacency list
-            for from_id, to_id in np.nditer([from_ids, to_ids]):
-                _edge_dict[int(from_id)].add(int(to_id))
-                _edge_dict[int(to_id)].add(int(from_id))
-
-            return _edge_dict
-
         def retrieve_edge(node1: int | float, node2: int | float) -> gpd.GeoDataFrame:
             """Retrieve the edge from snkit_network.edges GeoDataFrame between two nodes."""
-            edge = _snkit_network.edges[
-                (_snkit_network.edges["from_id"] == node1)
-                & (_snkit_network.edges["to_id"] == node2)
-            ]
-            return edge if not edge.empty else None
+            _positions = edge_index.get_edge_positions(node1, node2)
+            return _snkit_network.edges.iloc[_positions] if len(_positions) else None
 
         def construct_path(
             start_node: int | float, end_node: int | float, intermediate_nodes: list
@@ -187,12 +535,6 @@ def merge_edges(
                     _edge_paths_results.append(backward_gdf)
             return _edge_paths_results
 
-        # Convert edges to an adjacency list using vectorized operations
-        edge_dict = get_adjacency_list(
-            edges_gdf=snkit_network.edges,
-            from_id_column="from_id",
-            to_id_column="to_id",
-        )
         _edge_paths: list = []
 
         # find the edge paths for the nodes in node_set
@@ -207,7 +549,7 @@ def merge_edges(
             while candidates:
                 popped_cand = candidates.pop()
                 # matches are the nodes that belong to a node_path
-                matches = edge_dict[popped_cand]
+                matches = edge_index.get_neighbours(popped_cand)
                 matches = matches - node_path
                 for match in matches:
                     intermediates.add(popped_cand)
@@ -228,17 +570,19 @@ def merge_edges(
                     _edge_paths = find_and_append_degree_4_paths(_edge_paths)
                 else:
                     # node_path has nodes with degree 2 => find the edges connected to the intermediates
-                    edge_paths_gdf = snkit_network.edges[
-                        snkit_network.edges.from_id.isin(intermediates)
-                        | snkit_network.edges.to_id.isin(intermediates)
+                    edge_paths_gdf = snkit_network.edges.iloc[
+                        edge_index.get_incident_edge_positions(intermediates)
                     ]
                     _edge_paths.append(edge_paths_gdf)
         return _edge_paths
 
+    # Index the edges by their end nodes once, so paths can be traced without scanning all edges.
+    edge_index = _EdgeIndex.from_edges(snkit_network.edges)
+
     # Adds degree column which is needed to find the to-be-simplified nodes and edges.
     if "degree" not in snkit_network.nodes.columns:
-        snkit_network.nodes["degree"] = snkit_network.nodes[id_col].apply(
-            lambda x: node_connectivity_degree(x, snkit_network)
+        snkit_network.nodes["degree"] = edge_index.get_degrees(
+            snkit_network.nodes[id_col]
         )
 
     # Filter on the nodes with degree 2 and 4 which suffice the following criteria:
@@ -256,18 +600,33 @@ def merge_edges(
     )
     filtered_degree_4_set = filter_node(degree_4_set, _degrees=4)
 
-    nodes_of_interest = filtered_degree_2_set | filtered_degree_4_set
-
-    edge_paths = get_edge_paths(sorted(nodes_of_interest), snkit_network)
+    # Contract the open chains of these nodes at once, only the remaining chains
+    # (loops, demand edges) are traced and merged per path.
+    edge_chains = _EdgeChains.from_edges(
+        edges=snkit_network.edges,
+        edge_index=edge_index,
+        degree_2_node_ids=filtered_degree_2_set,
+        degree_4_node_ids=filtered_degree_4_set,
+    )
+    edge_paths = get_edge_paths(sorted(edge_chains.remaining_node_ids), snkit_network)
 
-    edge_ids_to_update = get_edge_ids_to_update(edge_paths)
+    edge_ids_to_update = (
+        get_edge_ids_to_update(edge_paths) + edge_chains.get_contracted_edge_ids()
+    )
     edges_to_keep = snkit_network.edges[
         ~snkit_network.edges["id"].isin(edge_ids_to_update)
     ]
 
-    updated_edges = get_merged_edges(
-        paths_to_group=edge_paths, by=by, aggfunc=aggregate_func, net=snkit_network
-    )
+    updated_edges = edge_chains.contract(by=by, aggregate_func=aggregate_func)
+    if edge_paths:
+        merged_path_edges = get_merged_edges(
+            paths_to_group=edge_paths, by=by, aggfunc=aggregate_func, net=snkit_network
+        )
+        updated_edges = (
+            merged_path_edges
+            if updated_edges.empty
+            else pd.concat([merged_path_edges, updated_edges], ignore_index=True)
+        )
     edges_to_keep = edges_to_keep.drop(columns=["id"])
     updated_edges = updated_edges.reset_index(drop=True)
 
@@ -281,9 +640,9 @@ def merge_edges(
     new_nodes_gdf = new_nodes_gdf.reset_index(drop=True)
 
     merged_snkit_network = SnkitNetwork(nodes=new_nodes_gdf, edges=new_edges_gdf)
-    merged_snkit_network.nodes["degree"] = merged_snkit_network.nodes[id_col].apply(
-        lambda x: node_connectivity_degree(x, merged_snkit_network)
-    )
+    merged_snkit_network.nodes["degree"] = _EdgeIndex.from_edges(
+        merged_snkit_network.edges
+    ).get_degrees(merged_snkit_network.nodes[id_col])
 
     return merged_snkit_network
 
@@ -315,17 +674,22 @@ def _merge_connected_lines(
     # Combine the attributes using the aggregation function
     for col, func in aggfunc.items():
         if col != "geometry":
-            # Try to convert the column to float if needed
-            if gdf[col].dtype != float:
-                try:
-                    gdf[col] = gdf[col].astype(float)
-                except ValueError:
-                    pass  # Skip conversion if it fails
+            gdf[col] = _get_float_values(gdf[col])
             merged_gdf[col] = [func(gdf[col])]
 
     return merged_gdf
 
 
+def _get_float_values(values: pd.Series) -> pd.Series:
+    # Try to convert the values to float if needed, otherwise keep them.
+    if values.dtype == float:
+        return values
+    try:
+        return values.astype(float)
+    except ValueError:
+        return values
+
+
 def _get_merge_edge_paths(
     edges: gpd.GeoDataFrame,
     excluded_edge_types: list,
@@ -30,7 +30,7 @@ from ra2ce.network.network_simplification.snkit_network_merge_wrapper import mer
 from ra2ce.network.network_simplification.snkit_to_nx_network_converter import (
     SnkitToNxNetworkConverter,
 )
-from ra2ce.network.networks_utils import line_length
+from ra2ce.network.networks_utils import line_lengths
 
 NxGraph = nx.Graph | nx.MultiGraph | nx.MultiDiGraph
 
@@ -111,8 +111,8 @@ class SnkitNetworkWrapper:
 
     def process_network(self) -> None:
         _network_crs = self.snkit_network.edges.crs
-        self.snkit_network.edges["length"] = self.snkit_network.edges["geometry"].apply(
-            lambda x: line_length(x, _network_crs)
+        self.snkit_network.edges["length"] = line_lengths(
+            self.snkit_network.edges["geometry"], _network_crs
         )  # length in m
         self.snkit_network.edges = self.snkit_network.edges[
             self.snkit_network.edges["length"] != 0
@@ -26,6 +26,7 @@ from geopandas import GeoDataFrame
 from networkx import MultiGraph
 
 from ra2ce.common.io.readers import GraphPickleReader
+from ra2ce.network.compact_graph import CompactGraph
 from ra2ce.network.network_config_data.enums.source_enum import SourceEnum
 from ra2ce.network.network_config_data.network_config_data import NetworkConfigData
 from ra2ce.network.network_wrappers.network_wrapper_protocol import (
@@ -65,9 +66,15 @@ class NetworkWrapperFactory(NetworkWrapperProtocol):
             return OsmNetworkWrapper(self._config_data).get_network()
         elif source == SourceEnum.PICKLE:
             logging.info("Start importing a network from pickle")
-            base_graph = GraphPickleReader().read(
-                self._config_data.output_graph_dir.joinpath("base_graph.p")
+            _columnar_file = self._config_data.output_graph_dir.joinpath(
+                "base_graph.graph"
             )
+            if _columnar_file.is_dir():
+                base_graph = CompactGraph.from_file(_columnar_file).to_graph()
+            else:
+                base_graph = GraphPickleReader().read(
+                    self._config_data.output_graph_dir.joinpath("base_graph.p")
+                )
             network_gdf = gpd.read_feather(
                 self._config_data.output_graph_dir.joinpath("base_network.feather")
             )
@@ -0,0 +1,196 @@
+"""
+                    GNU GENERAL PUBLIC LICENSE
+                      Version 3, 29 June 2007
+
+    Risk Assessment and Adaptation for Critical Infrastructure (RA2CE).
+    Copyright (C) 2023-2026 Stichting Deltares
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pyogrio
+from geopandas import GeoDataFrame
+from networkx import MultiDiGraph
+from shapely.geometry.base import BaseGeometry
+
+from ra2ce.network.network_wrappers.osm_network_wrapper.osm_utils import (
+    create_graph_from_response_jsons,
+    get_buffered_polygon,
+    get_way_filter,
+    validate_polygon,
+)
+
+# Clauses of an Overpass way filter, e.g. `["highway"]` or `["highway"!~"footway|path"]`.
+_FILTER_CLAUSE = re.compile(r'\["([^"]+)"(?:(!?[~=])"([^"]*)")?\]')
+# Tags in GDAL's `other_tags` (hstore) field, e.g. `"oneway"=>"yes","lanes"=>"2"`.
+_OTHER_TAG = re.compile(r'"((?:[^"\\]|\\.)*)"=>"((?:[^"\\]|\\.)*)"')
+
+
+@dataclass(kw_only=True)
+class OsmExtractReader:
+    """
+    Reads the ways of a local OSM extract (`.osm.pbf` or `.osm`) into a graph,
+    as alternative to downloading them from the Overpass API
+    (`osmnx.graph_from_polygon`).
+
+    The extract is streamed by GDAL's OSM driver (through `pyogrio`), reading only the
+    ways within the (buffered) polygon. The ways are filtered with the same Overpass
+    filter `osmnx` would use and the graph is created (not simplified, with all its
+    components) like `osmnx.graph_from_polygon` does.
+    GDAL does not provide the OSM ids of the nodes of a way, therefore the nodes
+    are identified by their coordinates and numbered in order of appearance.
+    """
+
+    osm_extract_file: Path
+
+    # Fields of the `lines` layer of GDAL's OSM driver (default configuration).
+    _tag_columns = ["name", "highway"]
+    _other_tags_column = "other_tags"
+
+    def get_graph_from_polygon(
+        self,
+        polygon: BaseGeometry,
+        network_type: str = "all",
+        custom_filter: str | None = None,
+    ) -> MultiDiGraph:
+        """
+        Gets the graph of the ways of the extract within the polygon, matching
+        the given network type or (instead) the custom Overpass filter.
+
+        Args:
+            polygon (BaseGeometry): (Multi)polygon to get the graph within.
+            network_type (str, optional): `osmnx` network type. Defaults to "all".
+            custom_filter (str | None, optional): Overpass way filter, used instead of the network type.
+
+        Raises:
+            ValueError: When the polygon is invalid.
+            TypeError: When the polygon is not a (multi)polygon.
+
+        Returns:
+            MultiDiGraph: The (complex) graph.
+        """
+        validate_polygon(polygon)
+
+        # As `osmnx`, first get the graph within a polygon buffered by 500 meters.
+        _polygon_buffered = get_buffered_polygon(polygon)
+        _ways = self._read_ways(_polygon_buffered)
+
+        _filter_clauses = _FILTER_CLAUSE.findall(
+            get_way_filter(network_type, custom_filter)
+        )
+        _response_json = self._get_response_json(
+            filter(
+                lambda _way: self._matches_filter(_way["tags"], _filter_clauses),
+                _ways,
+            )
+        )
+        # Same creation of the graph (edge attributes, one-ways, lengths) as from an Overpass response.
+        _graph = create_graph_from_response_jsons(
+            [_response_json], polygon, _polygon_buffered, network_type
+        )
+        logging.info(
+            "Read %s ways from %s, resulting in a graph with %s nodes and %s edges.",
+            len(_ways),
+            self.osm_extract_file.name,
+            len(_graph.nodes),
+            len(_graph.edges),
+        )
+        return _graph
+
+    def _read_ways(self, polygon: BaseGeometry) -> list[dict[str, Any]]:
+        _lines_gdf: GeoDataFrame = pyogrio.read_dataframe(
+            self.osm_extract_file,
+            layer="lines",
+            columns=["osm_id", *self._tag_columns, self._other_tags_column],
+            mask=polygon,
+            where="highway IS NOT NULL",
+        )
+        _ways = []
+        for _line in _lines_gdf.itertuples(index=False):
+            _tags = {
+                _column: getattr(_line, _column)
+                for _column in self._tag_columns
+                if getattr(_line, _column) is not None
+            }
+            _tags.update(self._get_other_tags(getattr(_line, self._other_tags_column)))
+            _ways.append(
+                dict(
+                    id=int(_line.osm_id),
+                    coords=list(_line.geometry.coords),
+                    tags=_tags,
+                )
+            )
+        return _ways
+
+    @staticmethod
+    def _get_other_tags(other_tags: str | None) -> dict[str, str]:
+        if not other_tags:
+            return {}
+        return {
+            _key.replace('\\"', '"')
+            .replace("\\\\", "\\"): _value.replace('\\"', '"')
+            .replace("\\\\", "\\")
+            for _key, _value in _OTHER_TAG.findall(other_tags)
+        }
+
+    @staticmethod
+    def _matches_filter(
+        tags: dict[str, str], filter_clauses: list[tuple[str, str, str]]
+    ) -> bool:
+        def matches_clause(key: str, operator: str, value: str) -> bool:
+            _tag = tags.get(key)
+            if not operator:
+                return _tag is not None
+            if operator == "~":
+                return _tag is not None and re.search(value, _tag) is not None
+            if operator == "!~":
+                return _tag is None or re.search(value, _tag) is None
+            if operator == "=":
+                return _tag == value
+            return _tag != value
+
+        return all(matches_clause(*_clause) for _clause in filter_clauses)
+
+    @staticmethod
+    def _get_response_json(ways: list[dict[str, Any]]) -> dict[str, Any]:
+        _node_ids: dict[tuple[float, float], int] = {}
+        _elements = []
+        for _way in ways:
+            _way_node_ids = []
+            for _x, _y in _way["coords"]:
+                # OSM stores coordinates with 7 decimals.
+                _coords = (round(_x, 7), round(_y, 7))
+                if _coords not in _node_ids:
+                    _node_ids[_coords] = len(_node_ids) + 1
+                    _elements.append(
+                        dict(
+                            type="node",
+                            id=_node_ids[_coords],
+                            lon=_coords[0],
+                            lat=_coords[1],
+                        )
+                    )
+                _way_node_ids.append(_node_ids[_coords])
+            _elements.append(
+                dict(type="way", id=_way["id"], nodes=_way_node_ids, tags=_way["tags"])
+            )
+        return dict(elements=_elements)
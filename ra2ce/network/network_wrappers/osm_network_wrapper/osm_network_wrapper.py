@@ -19,7 +19,6 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any
 
 import networkx as nx
 import osmnx
@@ -31,6 +30,7 @@ from shapely.geometry.base import BaseGeometry
 import ra2ce.network.networks_utils as nut
 from ra2ce.network.avg_speed.avg_speed_calculator import AvgSpeedCalculator
 from ra2ce.network.exporters.json_exporter import JsonExporter
+from ra2ce.network.link_table import LinkTable
 from ra2ce.network.network_config_data.enums.network_type_enum import NetworkTypeEnum
 from ra2ce.network.network_config_data.enums.road_type_enum import RoadTypeEnum
 from ra2ce.network.network_config_data.network_config_data import NetworkConfigData
@@ -41,6 +41,12 @@ from ra2ce.network.network_wrappers.network_wrapper_protocol import (
 from ra2ce.network.network_wrappers.osm_network_wrapper.extremities_data import (
     ExtremitiesData,
 )
+from ra2ce.network.network_wrappers.osm_network_wrapper.osm_extract_reader import (
+    OsmExtractReader,
+)
+from ra2ce.network.network_wrappers.osm_network_wrapper.osm_tile_cache import (
+    OsmTileCache,
+)
 from ra2ce.network.network_wrappers.osm_network_wrapper.osm_utils import (
     get_node_nearest_edge,
     is_endnode_check,
@@ -60,11 +66,22 @@ class OsmNetworkWrapper(NetworkWrapperProtocol):
             config_data.network.attributes_to_exclude_in_simplification
         )
         self.output_graph_dir = config_data.output_graph_dir
+        self.save_link_tables_json = config_data.network.save_link_tables_json
         self.crs = config_data.crs
 
         # Network
         self.network_type = config_data.network.network_type
         self.road_types = config_data.network.road_types
+        self.osm_extract_file = self._get_osm_extract_file(
+            config_data.network.primary_file
+        )
+        self.osm_tile_cache_dir = (
+            config_data.network_dir.joinpath("osm_tile_cache")
+            if config_data.network_dir and config_data.network.osm_tile_cache
+            else None
+        )
+        self.osm_tile_size = config_data.network.osm_tile_size
+        self.osm_date = config_data.network.osm_date
         self.polygon_graph = self._get_clean_graph_from_osm(config_data.network.polygon)
         self.is_directed = config_data.network.directed
         self.link_type_column = config_data.network.link_type_column
@@ -181,18 +198,22 @@ class OsmNetworkWrapper(NetworkWrapperProtocol):
 
         return graph_simple, edges_complex
 
-    def _export_linking_tables(self, linking_tables: tuple[Any]) -> None:
+    def _export_linking_tables(self, linking_tables: LinkTable) -> None:
         if not self.output_graph_dir:
             logging.warning(
                 "No `output_graph_dir` is set, therefore no intermediate results will be exported."
             )
             return
+        linking_tables.export(self.output_graph_dir.joinpath("link_table.feather"))
+        if not self.save_link_tables_json:
+            return
+        _simple_to_complex, _complex_to_simple = linking_tables.to_dicts()
         _exporter = JsonExporter()
         _exporter.export(
-            self.output_graph_dir.joinpath("simple_to_complex.json"), linking_tables[0]
+            self.output_graph_dir.joinpath("simple_to_complex.json"), _simple_to_complex
         )
         _exporter.export(
-            self.output_graph_dir.joinpath("complex_to_simple.json"), linking_tables[1]
+            self.output_graph_dir.joinpath("complex_to_simple.json"), _complex_to_simple
         )
 
     def _get_clean_graph_from_osm(self, polygon_path: Path) -> MultiDiGraph | None:
@@ -238,31 +259,27 @@ class OsmNetworkWrapper(NetworkWrapperProtocol):
             raise ValueError("Either of the link_type or network_type should be known")
         elif not _available_road_types:
             # The user specified only the network type.
-            _complex_graph = osmnx.graph_from_polygon(
+            _complex_graph = self._get_complex_graph_from_polygon(
                 polygon=polygon,
                 network_type=network_type.config_value,
-                simplify=False,
-                retain_all=True,
             )
         elif not network_type:
             # The user specified only the road types.
             cf = f'["highway"~"{"|".join(_road_types_as_str)}"]'
-            _complex_graph = osmnx.graph_from_polygon(
-                polygon=polygon, custom_filter=cf, simplify=False, retain_all=True
+            _complex_graph = self._get_complex_graph_from_polygon(
+                polygon=polygon, custom_filter=cf
             )
         else:
             # _available_road_types and network_type
             cf = f'["highway"~"{"|".join(_road_types_as_str)}"]'
-            _complex_graph = osmnx.graph_from_polygon(
+            _complex_graph = self._get_complex_graph_from_polygon(
                 polygon=polygon,
                 network_type=network_type.config_value,
                 custom_filter=cf,
-                simplify=False,
-                retain_all=True,
             )
 
         logging.info(
-            "graph downloaded from OSM with {:,} nodes and {:,} edges".format(
+            "graph retrieved from OSM with {:,} nodes and {:,} edges".format(
                 len(list(_complex_graph.nodes())), len(list(_complex_graph.edges()))
             )
         )
@@ -271,6 +288,68 @@ class OsmNetworkWrapper(NetworkWrapperProtocol):
         self.get_clean_graph(_complex_graph)
         return _complex_graph
 
+    @staticmethod
+    def _get_osm_extract_file(primary_file: Path | None) -> Path | None:
+        if not isinstance(primary_file, Path):
+            return None
+        if not primary_file.name.lower().endswith((".osm.pbf", ".osm")):
+            return None
+        if not primary_file.is_file():
+            logging.warning(
+                "No OSM extract file found at %s, the network will be downloaded instead.",
+                primary_file,
+            )
+            return None
+        return primary_file
+
+    def _get_complex_graph_from_polygon(
+        self,
+        polygon: BaseGeometry,
+        network_type: str = "all",
+        custom_filter: str | None = None,
+    ) -> MultiDiGraph:
+        """
+        Gets the complex graph within the polygon from the local OSM extract (when provided),
+        otherwise by downloading it from the Overpass API (through the tile cache, when
+        a network directory is available and the cache is not disabled).
+
+        Args:
+            polygon (BaseGeometry): Polygon to get the graph within.
+            network_type (str, optional): `osmnx` network type. Defaults to "all".
+            custom_filter (str | None, optional): Overpass way filter. Defaults to None.
+
+        Returns:
+            MultiDiGraph: Complex (not simplified) graph.
+        """
+        if self.osm_extract_file:
+            logging.info(
+                "Reading the network from OSM extract %s.", self.osm_extract_file
+            )
+            return OsmExtractReader(
+                osm_extract_file=self.osm_extract_file
+            ).get_graph_from_polygon(
+                polygon=polygon,
+                network_type=network_type,
+                custom_filter=custom_filter,
+            )
+        if self.osm_tile_cache_dir:
+            return OsmTileCache(
+                cache_dir=self.osm_tile_cache_dir,
+                tile_size=self.osm_tile_size,
+                osm_date=self.osm_date,
+            ).get_graph_from_polygon(
+                polygon=polygon,
+                network_type=network_type,
+                custom_filter=custom_filter,
+            )
+        return osmnx.graph_from_polygon(
+            polygon=polygon,
+            network_type=network_type,
+            custom_filter=custom_filter,
+            simplify=False,
+            retain_all=True,
+        )
+
     @staticmethod
     def get_clean_graph(complex_graph: MultiDiGraph):
         complex_graph = OsmNetworkWrapper.drop_duplicates(complex_graph)
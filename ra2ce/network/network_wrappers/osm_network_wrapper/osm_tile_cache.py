@@ -0,0 +1,236 @@
+"""
+                    GNU GENERAL PUBLIC LICENSE
+                      Version 3, 29 June 2007
+
+    Risk Assessment and Adaptation for Critical Infrastructure (RA2CE).
+    Copyright (C) 2023-2026 Stichting Deltares
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import osmnx
+from networkx import MultiDiGraph
+from shapely.geometry import Polygon, box
+from shapely.geometry.base import BaseGeometry
+
+from ra2ce.network.network_wrappers.osm_network_wrapper.osm_utils import (
+    create_graph_from_response_jsons,
+    get_buffered_polygon,
+    get_way_filter,
+    validate_polygon,
+)
+
+
+@dataclass(kw_only=True)
+class OsmTileCache:
+    """
+    Persistent cache of the (raw) Overpass API responses of the OSM network,
+    as alternative to downloading the whole network at every run
+    (`osmnx.graph_from_polygon`).
+
+    The (buffered) polygon is covered by the tiles of a fixed grid (in degrees),
+    so overlapping study areas and re-runs share the same tiles. The default tile
+    (about 50 by 50 km) is as large as the areas `osmnx` queries at once
+    (`osmnx.settings.max_query_area_size`). The response of each tile is stored
+    in the cache directory, keyed by the tile, the way filter and the date of
+    the OSM data. Missing tiles are downloaded and all tiles are read
+    concurrently, before being stitched into one graph.
+
+    When no `osm_date` is given, the date of the first download is recorded in
+    the manifest of the cache directory as the snapshot date of the cache. Later
+    runs keep using the OSM data of that date, also for tiles downloaded later,
+    which is logged whenever cached tiles are reused. Remove the manifest (or the
+    cache directory) to use the current OSM data again.
+    """
+
+    cache_dir: Path
+    tile_size: float = 0.45
+    osm_date: date | None = None
+    max_workers: int = 2
+
+    manifest_name = "manifest.json"
+    _snapshot_date: date | None = field(default=None, init=False, repr=False)
+
+    def get_graph_from_polygon(
+        self,
+        polygon: BaseGeometry,
+        network_type: str = "all",
+        custom_filter: str | None = None,
+    ) -> MultiDiGraph:
+        """
+        Gets the graph of the ways within the polygon, matching the given network
+        type or (instead) the custom Overpass filter, from the cached tiles.
+
+        Args:
+            polygon (BaseGeometry): (Multi)polygon to get the graph within.
+            network_type (str, optional): `osmnx` network type. Defaults to "all".
+            custom_filter (str | None, optional): Overpass way filter, used instead of the network type.
+
+        Raises:
+            ValueError: When the polygon is invalid.
+            TypeError: When the polygon is not a (multi)polygon.
+
+        Returns:
+            MultiDiGraph: The (complex) graph.
+        """
+        validate_polygon(polygon)
+
+        # As `osmnx`, first get the graph within a polygon buffered by 500 meters.
+        _polygon_buffered = get_buffered_polygon(polygon)
+        _way_filter = get_way_filter(network_type, custom_filter)
+        _tiles = self.get_tiles(_polygon_buffered)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        _n_cached = sum(
+            self.get_tile_file(_tile, _way_filter).is_file() for _tile in _tiles
+        )
+        if _n_cached:
+            logging.warning(
+                "Reusing %s of %s OSM tile(s) from the cache %s, with the OSM data "
+                "as of %s. Remove the cache to use the current OSM data.",
+                _n_cached,
+                len(_tiles),
+                self.cache_dir,
+                self.get_snapshot_date(),
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="ra2ce_osm_tile"
+        ) as _executor:
+            _response_jsons = list(
+                _executor.map(
+                    lambda _tile: self._get_response_json(_tile, _way_filter),
+                    _tiles,
+                )
+            )
+        return create_graph_from_response_jsons(
+            _response_jsons, polygon, _polygon_buffered, network_type
+        )
+
+    def get_tiles(self, polygon: BaseGeometry) -> list[tuple[int, int]]:
+        """
+        Gets the tiles of the grid intersecting the polygon.
+
+        Args:
+            polygon (BaseGeometry): Polygon in geographic coordinates.
+
+        Returns:
+            list[tuple[int, int]]: Column and row of the tiles.
+        """
+        _min_x, _min_y, _max_x, _max_y = polygon.bounds
+        return [
+            (_column, _row)
+            for _column in range(
+                math.floor(_min_x / self.tile_size),
+                math.floor(_max_x / self.tile_size) + 1,
+            )
+            for _row in range(
+                math.floor(_min_y / self.tile_size),
+                math.floor(_max_y / self.tile_size) + 1,
+            )
+            if polygon.intersects(self._get_tile_box(_column, _row))
+        ]
+
+    def get_tile_file(self, tile: tuple[int, int], way_filter: str) -> Path:
+        """
+        Gets the file in which the response of the tile is cached.
+
+        Args:
+            tile (tuple[int, int]): Column and row of the tile.
+            way_filter (str): Overpass way filter of the response.
+
+        Returns:
+            Path: The cache file.
+        """
+        _key = hashlib.sha256(
+            f"{self.tile_size}|{way_filter}|{self.get_snapshot_date()}".encode()
+        ).hexdigest()[:16]
+        return self.cache_dir.joinpath(f"tile_{tile[0]}_{tile[1]}_{_key}.json")
+
+    def get_snapshot_date(self) -> date:
+        """
+        Gets the date of the OSM data in the cache: the `osm_date` when given,
+        otherwise the snapshot date recorded in the manifest of the cache directory.
+        Without manifest, today is recorded as the snapshot date.
+
+        Returns:
+            date: The date of the OSM data.
+        """
+        if self.osm_date:
+            return self.osm_date
+        if self._snapshot_date:
+            return self._snapshot_date
+
+        _manifest_file = self.cache_dir.joinpath(self.manifest_name)
+        if _manifest_file.is_file():
+            self._snapshot_date = date.fromisoformat(
+                json.loads(_manifest_file.read_text())["snapshot_date"]
+            )
+        else:
+            self._snapshot_date = date.today()
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _manifest_file.write_text(
+                json.dumps(dict(snapshot_date=self._snapshot_date.isoformat()))
+            )
+        return self._snapshot_date
+
+    def _get_tile_box(self, column: int, row: int) -> Polygon:
+        return box(
+            column * self.tile_size,
+            row * self.tile_size,
+            (column + 1) * self.tile_size,
+            (row + 1) * self.tile_size,
+        )
+
+    def _get_response_json(
+        self, tile: tuple[int, int], way_filter: str
+    ) -> dict[str, Any]:
+        _tile_file = self.get_tile_file(tile, way_filter)
+        if _tile_file.is_file():
+            return json.loads(_tile_file.read_text())
+
+        _response_json = self._download_response_json(tile, way_filter)
+        # Write to a temporary file first, so no partial responses are cached.
+        _temp_file = _tile_file.with_suffix(".tmp")
+        _temp_file.write_text(json.dumps(_response_json))
+        _temp_file.replace(_tile_file)
+        return _response_json
+
+    def _download_response_json(
+        self, tile: tuple[int, int], way_filter: str
+    ) -> dict[str, Any]:
+        logging.info("Downloading OSM tile %s from the Overpass API.", tile)
+        # Private `osmnx` functions, hence the upper bound of `osmnx` in `pyproject.toml`.
+        _overpass_settings = osmnx._overpass._make_overpass_settings()
+        _snapshot_date = self.get_snapshot_date()
+        if _snapshot_date < date.today():
+            _overpass_settings += f'[date:"{_snapshot_date.isoformat()}T00:00:00Z"]'
+        _min_x, _min_y, _max_x, _max_y = self._get_tile_box(*tile).bounds
+        _query = (
+            f"{_overpass_settings};"
+            f"(way{way_filter}({_min_y},{_min_x},{_max_y},{_max_x});>;);out;"
+        )
+        return osmnx._overpass._overpass_request(OrderedDict(data=_query))
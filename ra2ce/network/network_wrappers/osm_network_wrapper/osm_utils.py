@@ -21,13 +21,16 @@
 
 import logging
 from pathlib import Path
+from typing import Any, Iterable
 
 import geopandas as gpd
 import networkx as nx
 import numpy as np
+import osmnx
 from geopandas import GeoDataFrame
 from osmnx import graph_to_gdfs
-from shapely.geometry import LineString, Point
+from shapely.geometry import LineString, MultiPolygon, Point, Polygon
+from shapely.geometry.base import BaseGeometry
 
 from ra2ce.network import networks_utils as nut
 
@@ -418,3 +421,98 @@ def create_edge(graph: nx.MultiDiGraph, u: int, v: int, data: dict) -> nx.MultiD
     else:
         graph.add_edge(u, v, **data[0])
         return graph
+
+
+def validate_polygon(polygon: BaseGeometry) -> None:
+    """
+    Validates the polygon to get a graph within, as `osmnx.graph_from_polygon` does.
+
+    Args:
+        polygon (BaseGeometry): Polygon to validate.
+
+    Raises:
+        ValueError: When the geometry is invalid.
+        TypeError: When the geometry is not a (multi)polygon.
+    """
+    if not polygon.is_valid:
+        raise ValueError("The geometry of `polygon` is invalid.")
+    if not isinstance(polygon, (Polygon, MultiPolygon)):
+        raise TypeError(
+            "Geometry must be a shapely Polygon or MultiPolygon. If you "
+            "requested graph from place name, make sure your query resolves "
+            "to a Polygon or MultiPolygon, and not some other geometry, like "
+            "a Point. See OSMnx documentation for details."
+        )
+
+
+def get_way_filter(network_type: str, custom_filter: str | None) -> str:
+    """
+    Gets the Overpass way filter as `osmnx` uses it: the custom filter when given,
+    otherwise the `osmnx` preset for the network type.
+
+    Args:
+        network_type (str): `osmnx` network type.
+        custom_filter (str | None): Overpass way filter, used instead of the network type.
+
+    Returns:
+        str: The Overpass way filter.
+    """
+    if custom_filter:
+        return custom_filter
+    # Private `osmnx` function, hence the upper bound of `osmnx` in `pyproject.toml`.
+    return osmnx._overpass._get_network_filter(network_type)
+
+
+def get_buffered_polygon(polygon: BaseGeometry) -> BaseGeometry:
+    """
+    Gets the polygon buffered by 500 meters, as `osmnx` queries the
+    network within such a buffered polygon.
+
+    Args:
+        polygon (BaseGeometry): (Multi)polygon in geographic coordinates.
+
+    Returns:
+        BaseGeometry: The buffered (multi)polygon in geographic coordinates.
+    """
+    _polygon_proj, _crs_utm = osmnx.projection.project_geometry(polygon)
+    _polygon_buffered, _ = osmnx.projection.project_geometry(
+        _polygon_proj.buffer(500), crs=_crs_utm, to_latlong=True
+    )
+    return _polygon_buffered
+
+
+def create_graph_from_response_jsons(
+    response_jsons: Iterable[dict[str, Any]],
+    polygon: BaseGeometry,
+    polygon_buffered: BaseGeometry,
+    network_type: str,
+) -> nx.MultiDiGraph:
+    """
+    Creates the (complex) graph within the polygon from Overpass (like) responses,
+    the same way `osmnx.graph_from_polygon` does (not simplified, with all its components).
+    Nodes and ways present in several responses are only added once.
+
+    Args:
+        response_jsons (Iterable[dict[str, Any]]): Responses with the ways and their nodes.
+        polygon (BaseGeometry): Polygon to truncate the graph to.
+        polygon_buffered (BaseGeometry): Buffered polygon the responses were queried within.
+        network_type (str): `osmnx` network type, determining whether one-way streets are bidirectional.
+
+    Returns:
+        nx.MultiDiGraph: The (complex) graph.
+    """
+    # Private `osmnx` function, hence the upper bound of `osmnx` in `pyproject.toml`.
+    _graph_buffered = osmnx.graph._create_graph(
+        response_jsons,
+        bidirectional=network_type in osmnx.settings.bidirectional_network_types,
+    )
+    _graph_buffered = osmnx.truncate.truncate_graph_polygon(
+        _graph_buffered, polygon_buffered
+    )
+    _graph = osmnx.truncate.truncate_graph_polygon(_graph_buffered, polygon)
+    nx.set_node_attributes(
+        _graph,
+        values=osmnx.stats.count_streets_per_node(_graph_buffered, nodes=_graph.nodes),
+        name="street_count",
+    )
+    return _graph
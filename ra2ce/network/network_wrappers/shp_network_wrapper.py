@@ -99,9 +99,7 @@ class ShpNetworkWrapper(NetworkWrapperProtocol):
             lines = lines.drop(labels=mls_idx, axis=0)
 
         # append the length of the road stretches
-        lines["length"] = lines["geometry"].apply(
-            lambda x: nut.line_length(x, self.crs)
-        )
+        lines["length"] = nut.line_lengths(lines["geometry"], self.crs)
 
         logging.info(
             "Shapefile(s) loaded with attributes: {}.".format(
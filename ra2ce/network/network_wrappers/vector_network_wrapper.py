@@ -21,7 +21,6 @@
 
 import logging
 from pathlib import Path
-from typing import Any
 
 import geopandas as gpd
 import momepy
@@ -33,6 +32,7 @@ from tqdm import tqdm
 import ra2ce.network.networks_utils as nut
 from ra2ce.network.avg_speed.avg_speed_calculator import AvgSpeedCalculator
 from ra2ce.network.exporters.json_exporter import JsonExporter
+from ra2ce.network.link_table import LinkTable
 from ra2ce.network.network_config_data.network_config_data import NetworkConfigData
 from ra2ce.network.network_simplification import NetworkGraphSimplificator
 from ra2ce.network.network_wrappers.network_wrapper_protocol import (
@@ -66,6 +66,7 @@ class VectorNetworkWrapper(NetworkWrapperProtocol):
         self.file_id = config_data.network.file_id
         self.link_type_column = config_data.network.link_type_column
         self.output_graph_dir = config_data.output_graph_dir
+        self.save_link_tables_json = config_data.network.save_link_tables_json
 
         # Cleanup
         self.segmentation_length = config_data.cleanup.segmentation_length
@@ -150,7 +151,7 @@ class VectorNetworkWrapper(NetworkWrapperProtocol):
 
         #  Update rfid_c after segmentation, which created more edges n teh complex graph
         graph_simple = nut.add_complex_id_to_graph_simple(
-            graph_simple, link_tables[0], "rfid"
+            graph_simple, link_tables, "rfid"
         )
 
         logging.info("Finished converting the complex graph to a simple graph")
@@ -427,11 +428,15 @@ class VectorNetworkWrapper(NetworkWrapperProtocol):
         ]
         return gpd
 
-    def _export_linking_tables(self, linking_tables: tuple[Any]) -> None:
+    def _export_linking_tables(self, linking_tables: LinkTable) -> None:
+        linking_tables.export(self.output_graph_dir.joinpath("link_table.feather"))
+        if not self.save_link_tables_json:
+            return
+        _simple_to_complex, _complex_to_simple = linking_tables.to_dicts()
         _exporter = JsonExporter()
         _exporter.export(
-            self.output_graph_dir.joinpath("simple_to_complex.json"), linking_tables[0]
+            self.output_graph_dir.joinpath("simple_to_complex.json"), _simple_to_complex
         )
         _exporter.export(
-            self.output_graph_dir.joinpath("complex_to_simple.json"), linking_tables[1]
+            self.output_graph_dir.joinpath("complex_to_simple.json"), _complex_to_simple
         )
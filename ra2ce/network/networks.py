@@ -32,6 +32,7 @@ import pyproj
 from ra2ce.network import networks_utils as nut
 from ra2ce.network.exporters.network_exporter_factory import NetworkExporterFactory
 from ra2ce.network.graph_files.graph_files_collection import GraphFilesCollection
+from ra2ce.network.network_build_cache import NetworkBuildCache
 from ra2ce.network.network_config_data.network_config_data import NetworkConfigData
 from ra2ce.network.network_wrappers.network_wrapper_factory import NetworkWrapperFactory
 
@@ -71,6 +72,9 @@ class Network:
         self.od_category = _origins_destinations.category
         self.region = _origins_destinations.region
         self.region_var = _origins_destinations.region_var
+        self.origins_raster_resolution = (
+            _origins_destinations.origins_raster_resolution
+        )
 
         # graph files
         self.graph_files = graph_files
@@ -126,6 +130,7 @@ class Network:
             self._network_dir,
             self._network_config.polygon,
             self.origins,
+            self.origins_raster_resolution,
         )
 
         return out_fn
@@ -220,16 +225,21 @@ class Network:
         Returns:
             (GraphFilesCollection): A collection of a network (GeoDataFrame) and 1 (base NetworkX graph) or 2 graphs (base NetworkX and OD graph)
         """
-        # Save the 'base' network as gpickle and if the user requested, also as shapefile.
-        to_save = (
-            ["pickle"] if not self._network_config.save_gpkg else ["pickle", "gpkg"]
-        )
+        # Save the 'base' network as gpickle (or in the columnar graph format) and if the user requested, also as shapefile.
+        to_save = ["graph" if self._network_config.columnar_graph_files else "pickle"]
+        if self._network_config.save_gpkg:
+            to_save.append("gpkg")
+
+        # Outputs built from other inputs (configuration or input files) are removed, so they are rebuilt.
+        _build_cache = NetworkBuildCache.from_config(self._config_data)
+        _build_cache.remove_stale_outputs(self.graph_files)
 
         # For all graph and networks - check if it exists, otherwise, make the graph and/or network.
         if not (self.graph_files.base_graph.file or self.graph_files.base_network.file):
             self._get_new_network_and_graph(to_save)
         else:
             self._get_stored_network_and_graph()
+        _build_cache.update("network")
 
         # create origins destinations graph
         if (
@@ -244,5 +254,7 @@ class Network:
                 self.origins = self.generate_origins_from_raster()
             od_graph = self.add_od_nodes(base_graph, self.base_graph_crs)
             self._export_network_files(od_graph, "origins_destinations_graph", to_save)
+        if self.graph_files.origins_destinations_graph.file:
+            _build_cache.update("origins_destinations")
 
         return self.graph_files
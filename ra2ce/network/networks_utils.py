@@ -35,6 +35,7 @@ import pandas as pd
 import pyproj
 import rasterio
 import rtree
+import shapely
 from geopy import distance
 from numpy.ma import MaskedArray
 from osmnx import graph_to_gdfs
@@ -45,6 +46,8 @@ from shapely.geometry.base import BaseGeometry, BaseMultipartGeometry
 from shapely.ops import linemerge, unary_union
 from tqdm import tqdm
 
+from ra2ce.network.link_table import LinkTable
+
 
 def convert_unit(unit: str) -> Optional[float]:
     """Converts unit to meters.
@@ -244,7 +247,7 @@ def merge_lines_automatic(
                 add_idx = 0 if merged.empty else max(merged.index) + 1
                 merged.loc[add_idx] = properties_dict
 
-    merged["length"] = merged["geometry"].apply(lambda x: line_length(x, crs_))
+    merged["length"] = line_lengths(merged["geometry"], crs_)
 
     return merged, lines_merged
 
@@ -272,6 +275,8 @@ def get_distance(a_b_tuple: tuple[tuple[float, float], tuple[float, float]]) ->
 def line_length(line: LineString, crs: pyproj.CRS) -> float:
     """Calculate length of a line in meters, given in geographic coordinates.
 
+    Prefer `line_lengths` when calculating the length of multiple lines.
+
     Args:
         line: a shapely LineString object with coordinate reference system 'crs'
         crs: the coordinate reference system of the 'line' LineString
@@ -279,41 +284,62 @@ def line_length(line: LineString, crs: pyproj.CRS) -> float:
     Returns:
         Length of line in m
     """
-    # Check if the coordinate system is projected or geographic
+    _length = line_lengths([line], crs)[0]
+    if np.isnan(_length):
+        return np.nan
+    return float(_length)
+
+
+def line_lengths(lines: gpd.GeoSeries | np.ndarray, crs: pyproj.CRS) -> np.ndarray:
+    """Calculate the lengths of lines in meters in one batch, given in geographic coordinates.
+
+    For geographic coordinates the geodesic (WGS-84) distances between all
+    consecutive coordinates of all lines are calculated at once.
+
+    Args:
+        lines: shapely LineString / MultiLineString objects with coordinate reference system 'crs'
+        crs: the coordinate reference system of the lines
+
+    Returns:
+        Length of each line in m, nan for geometries that are not lines.
+    """
+    _lines = np.asarray(lines, dtype=object)
+    _lengths = np.full(len(_lines), np.nan)
+    _is_line = np.isin(
+        shapely.get_type_id(_lines),
+        [shapely.GeometryType.LINESTRING, shapely.GeometryType.MULTILINESTRING],
+    )
+    if not _is_line.all():
+        logging.error(
+            "The road stretch is not a Shapely LineString or MultiLineString so the length cannot be computed."
+            "Please check your data network data."
+        )
+    _line_positions = np.flatnonzero(_is_line)
+
     if crs.is_geographic:
-        try:
-            # Swap shapely (lonlat) to geopy (latlon) points
-            if isinstance(line, LineString):
-                total_length = sum(map(get_distance, zip(line.coords, line.coords[1:])))
-            elif isinstance(line, MultiLineString):
-                total_length = sum(
-                    [
-                        sum(map(get_distance, zip(l.coords, l.coords[1:])))
-                        for l in line.geoms
-                    ]
-                )
-            else:
-                logging.error(
-                    "The road strech is not a Shapely LineString or MultiLineString so the length cannot be computed."
-                    "Please check your data network data."
-                )
-                return np.nan
-        except Exception:
-            logging.error(
-                "The CRS is not EPSG:4326. Quit the analysis, reproject the layer to EPSG:4326 and try again to run the tool."
-            )
-            return np.nan
+        # Distances between consecutive coordinates of the same (part of a) line
+        _parts, _part_line_index = shapely.get_parts(
+            _lines[_line_positions], return_index=True
+        )
+        _coords, _coord_part_index = shapely.get_coordinates(
+            _parts, return_index=True
+        )
+        _is_same_part = _coord_part_index[1:] == _coord_part_index[:-1]
+        _, _, _distances = pyproj.Geod(ellps="WGS84").inv(
+            _coords[:-1, 0][_is_same_part],
+            _coords[:-1, 1][_is_same_part],
+            _coords[1:, 0][_is_same_part],
+            _coords[1:, 1][_is_same_part],
+        )
+        _lengths[_line_positions] = np.bincount(
+            _part_line_index[_coord_part_index[:-1][_is_same_part]],
+            weights=_distances,
+            minlength=len(_line_positions),
+        )
     elif crs.is_projected:
         # line length of projected linestrings
-        if isinstance(line, LineString | MultiLineString):
-            total_length = line.length
-        else:
-            logging.error(
-                "The road stretch is not a Shapely LineString or MultiLineString so the length cannot be computed."
-                "Please check your data network data."
-            )
-            return np.nan
-    return round(total_length, 0)
+        _lengths[_line_positions] = shapely.length(_lines[_line_positions])
+    return np.round(_lengths, 0)
 
 
 def snap_endpoints_lines(
@@ -643,6 +669,7 @@ def cut_lines(lines_gdf, nodes, id_name: str, tolerance, crs_: str):
         if points_to_cut:
             # cut lines
             newlines = split_line_with_points(line=line, points=points_to_cut)
+            newline_lengths = line_lengths(newlines, crs_).tolist()
 
             # copy and remove the row of the original linestring
             properties_dict = {}
@@ -658,7 +685,7 @@ def cut_lines(lines_gdf, nodes, id_name: str, tolerance, crs_: str):
                         {
                             id_name: i,
                             "geometry": newline,
-                            "length": line_length(newline, crs_),
+                            "length": newline_lengths[j],
                         }
                     )
                     logging.info(
@@ -671,7 +698,7 @@ def cut_lines(lines_gdf, nodes, id_name: str, tolerance, crs_: str):
                         {
                             id_name: max_id + 1,
                             "geometry": newline,
-                            "length": line_length(newline, crs_),
+                            "length": newline_lengths[j],
                         }
                     )
                     logging.info(
@@ -1108,20 +1135,27 @@ def graph_from_gdf(
     _created_graph = nx.MultiGraph(crs=gdf.crs)
 
     # create nodes on the Graph
-    for _, row in gdf_nodes.iterrows():
-        c = {
-            node_id: row[node_id],
-            "geometry": row.geometry,
-            "x": row.geometry.x,
-            "y": row.geometry.y,
-        }
-        _created_graph.add_node(row[node_id], **c)
+    _node_ids = gdf_nodes[node_id].tolist()
+    _node_geometries = gdf_nodes.geometry.tolist()
+    _node_xs = shapely.get_x(gdf_nodes.geometry.values).tolist()
+    _node_ys = shapely.get_y(gdf_nodes.geometry.values).tolist()
+    _created_graph.add_nodes_from(
+        (_id, {node_id: _id, "geometry": _geometry, "x": _x, "y": _y})
+        for _id, _geometry, _x, _y in zip(
+            _node_ids, _node_geometries, _node_xs, _node_ys
+        )
+    )
 
     # create edges on top of the nodes
-    for _, row in gdf.iterrows():
-        dict_row = row.to_dict()
-        _created_graph.add_edge(
-            u_for_edge=dict_row["node_A"], v_for_edge=dict_row["node_B"], **dict_row
+    _edges_data = gdf.to_dict("records")
+    if "key" in gdf.columns:
+        _created_graph.add_edges_from(
+            (_data["node_A"], _data["node_B"], _data.pop("key"), _data)
+            for _data in _edges_data
+        )
+    else:
+        _created_graph.add_edges_from(
+            (_data["node_A"], _data["node_B"], _data) for _data in _edges_data
         )
 
     # make a name
@@ -1130,6 +1164,27 @@ def graph_from_gdf(
     return _created_graph
 
 
+def cast_object_columns_to_str(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """
+    Casts all object columns (except the geometry) of the `GeoDataFrame` to string,
+    as needed to export them.
+
+    Args:
+        gdf (gpd.GeoDataFrame): The `GeoDataFrame` to cast (in place).
+
+    Returns:
+        gpd.GeoDataFrame: The `GeoDataFrame` with the object columns as string.
+    """
+    _object_columns = [
+        _column
+        for _column, _dtype in gdf.dtypes.items()
+        if _dtype == object and _column != gdf.geometry.name
+    ]
+    if _object_columns:
+        gdf[_object_columns] = gdf[_object_columns].astype(str)
+    return gdf
+
+
 def graph_to_gdf(
     graph_to_convert: nx.Graph,
     save_nodes: bool = False,
@@ -1162,9 +1217,7 @@ def graph_to_gdf(
         )
         if to_save:
             for df in [edges, nodes]:
-                for col in df.columns:
-                    if df[col].dtype == object and col != df.geometry.name:
-                        df[col] = df[col].astype(str)
+                cast_object_columns_to_str(df)
     elif not save_nodes and save_edges:
         edges = graph_to_gdfs(graph_to_convert, nodes=save_nodes, edges=save_edges)
     elif save_nodes and not save_edges:
@@ -1195,11 +1248,8 @@ def get_nodes_and_edges_from_origin_graph(
     # The nodes should have a geometry attribute (perhaps on top of the x and y attributes)
     _edges, _nodes = graph_to_gdf(origin_graph, save_nodes=True)
 
-    dfs = [_edges, _nodes]
-    for df in dfs:
-        for col in df.columns:
-            if df[col].dtype == object and col != df.geometry.name:
-                df[col] = df[col].astype(str)
+    for df in [_edges, _nodes]:
+        cast_object_columns_to_str(df)
 
     # Add a CRS to the nodes
     if _nodes.crs is None and _edges.crs is not None:
@@ -1287,7 +1337,7 @@ def read_merge_shp(shp_file_analyse, id_name, shp_file_diversion=[], crs_=4326):
     lines.crs = crs_
 
     # append the length of the road stretches
-    lines["length"] = lines["geometry"].apply(lambda x: line_length(x, crs_))
+    lines["length"] = line_lengths(lines["geometry"], crs_)
 
     if lines["geometry"].apply(lambda row: isinstance(row, MultiLineString)).any():
         for line in lines.loc[
@@ -1612,13 +1662,13 @@ def buffer_geometry(
 
 
 def add_complex_id_to_graph_simple(
-    simple_graph: nx.classes.Graph, simple_to_complex, simple_id: str
+    simple_graph: nx.classes.Graph, link_table: LinkTable, simple_id: str
 ) -> nx.classes.Graph:
     """Adds the appropriate ID of the complex graph to each edge of the simple graph as a new attribute 'rfid_c'
 
     Arguments:
         simple_graph (Graph) : The simple graph, to update its 'rfid_c'
-        simple_to_complex (dict) : lookup table linking complex to simple graphs
+        link_table (LinkTable) : lookup table linking complex to simple graphs
         simple_id (str): simple_id attribute to update
 
     Returns:
@@ -1633,17 +1683,18 @@ def add_complex_id_to_graph_simple(
 
     # {(u,v,k) : 'rfid'}
     for key, value in obtained_simple_ids.items():
-        try:
-            # find simple id belonging to the complex id
-            new_value = simple_to_complex[value]
-            complex_ids_per_simple_id[key] = new_value
-        except KeyError as e:
+        # find complex ids belonging to the simple id
+        complex_ids = link_table.get_complex_ids(value).tolist()
+        if not complex_ids:
             logging.error(
-                "Could not find the simple ID belonging to complex ID %s; value set to None. Full error: %s",
+                "Could not find the complex ID belonging to simple ID %s; value set to None.",
                 key,
-                e,
             )
             complex_ids_per_simple_id[key] = None
+        elif len(complex_ids) == 1:
+            complex_ids_per_simple_id[key] = complex_ids[0]
+        else:
+            complex_ids_per_simple_id[key] = complex_ids
 
     # Now the format of simple_ids_per_complex_id is: {(u,v,k) : 'rfid}
     nx.set_edge_attributes(simple_graph, complex_ids_per_simple_id, f"{simple_id}_c")
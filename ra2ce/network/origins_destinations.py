@@ -19,10 +19,13 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import bisect
 import logging
+import math
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional
 
 import geopandas as gpd
 import networkx as nx
@@ -31,13 +34,14 @@ import pandas as pd
 import pyproj
 import rasterio
 import rasterio.mask
-import rasterio.transform
+import shapely
 from rasterio import Affine
 from rasterio.warp import Resampling, calculate_default_transform, reproject
+from scipy.spatial import cKDTree
 from shapely.geometry import LineString, Point
 from tqdm import tqdm
 
-from ra2ce.network.networks_utils import cut, line_length
+from ra2ce.network.networks_utils import cut, line_lengths
 
 """
 TODO: This whole file should be throughouly tested / redesigned.
@@ -70,7 +74,10 @@ def read_origin_destination_files(
     # Origins
     origins = gpd.GeoDataFrame(columns=["o_id", "geometry"], crs=crs)
 
-    origins_in = gpd.read_file(origins_path, crs=crs, engine="pyogrio")
+    if origins_path.suffix == ".feather":
+        origins_in = gpd.read_feather(origins_path)
+    else:
+        origins_in = gpd.read_file(origins_path, crs=crs, engine="pyogrio")
     # Check geometry types
     if not (origins_in.geometry.geom_type == "Point").all():
         bad_types = origins_in.geometry.geom_type.unique()
@@ -122,6 +129,35 @@ def closest_node(node: np.ndarray, nodes: np.ndarray) -> np.ndarray:
     return np.round(nodes[min_dist_indices], decimals=7)[0]
 
 
+def closest_nodes(points: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+    """
+    Gets for each of the points the closest of the nodes, as `closest_node` does
+    for a single point, with one batched query on a KD-tree of the nodes.
+
+    Args:
+        points (np.ndarray): Coordinates of the points, one row per point.
+        nodes (np.ndarray): Coordinates of the nodes, one row per node.
+
+    Returns:
+        np.ndarray: Coordinates (rounded to 7 decimals) of the closest node per point.
+    """
+    if not len(points):
+        return np.empty((0, nodes.shape[1]))
+    _tree = cKDTree(nodes)
+    _distances, _ = _tree.query(points)
+    # Gather all nodes (nearly) as close as the nearest one to resolve ties as `closest_node` does.
+    _candidates = _tree.query_ball_point(points, r=_distances * (1 + 1e-9))
+    _n_candidates = np.fromiter(map(len, _candidates), dtype=int, count=len(points))
+    _point_index = np.repeat(np.arange(len(points)), _n_candidates)
+    _node_index = np.concatenate(_candidates).astype(int)
+    _deltas = nodes[_node_index] - points[_point_index]
+    _dist_2 = np.einsum("ij,ij->i", _deltas, _deltas)
+    # Per point the first of the nodes with the minimum distance.
+    _order = np.lexsort((_node_index, _dist_2, _point_index))
+    _first = np.concatenate(([0], np.cumsum(_n_candidates)[:-1]))
+    return np.round(nodes[_node_index[_order[_first]]], decimals=7)
+
+
 def get_od(o_id: str, d_id: str) -> str:
     """
     Gets a valid origin id node from the given pair.
@@ -153,250 +189,217 @@ def add_data_to_existing_node(graph, node, match_name):
     return graph
 
 
-def update_edges_with_new_node(
-    graph: nx.MultiGraph,
-    edge_data: dict,
-    node_a: int,
-    node_b: int,
-    k: int,
-    line_a: LineString,
-    line_b: LineString,
-    new_node_id: int,
-    graph_crs: pyproj.CRS,
-    inverse_vertices_dict: dict,
-):
-    # Check which line is connected to which node. There can be 8 different combinations and there should be two
-    # edges added to the graph.
-    cnt = 0
-
-    if Point(graph.nodes[node_a]["geometry"].coords[0]).equals_exact(
-        Point(line_b.coords[-1]), tolerance=1e-6
-    ):
-        if node_a == node_b and graph.has_edge(*(node_a, new_node_id, 0)):
-            if line_b != graph.edges[(node_a, new_node_id, 0)]["geometry"]:
-                k_new = 1
-            else:
-                k_new = 0
-        else:
-            k_new = 0
-        edge_data.update(
-            length=line_length(line_b, graph_crs),
-            geometry=line_b,
-            node_A=node_a,
-            node_B=new_node_id,
-            edge_fid=f"{node_a}_{new_node_id}",
-        )
-        graph.add_edge(node_a, new_node_id, k_new, **edge_data)
-
-        # Update the inverse vertices dict
-        inverse_vertices_dict.update(
-            {p: (node_a, new_node_id, k_new) for p in set(list(line_b.coords[1:-1]))}
-        )
-
-        cnt += 1
-
-    if Point(graph.nodes[node_b]["geometry"].coords[0]).equals_exact(
-        Point(line_b.coords[0]), tolerance=1e-6
-    ):
-        if node_a == node_b and graph.has_edge(*(node_a, new_node_id, 0)):
-            if line_b != graph.edges[(node_a, new_node_id, 0)]["geometry"]:
-                k_new = 1
-            else:
-                k_new = 0
-        else:
-            k_new = 0
-        edge_data.update(
-            length=line_length(line_b, graph_crs),
-            geometry=line_b,
-            node_A=new_node_id,
-            node_B=node_b,
-            edge_fid=f"{new_node_id}_{node_b}",
-        )
-        graph.add_edge(
-            new_node_id, node_b, k_new, **edge_data
-        )  # changed the u, v order
-
-        # Update the inverse vertices dict
-        inverse_vertices_dict.update(
-            {p: (node_b, new_node_id, k_new) for p in set(list(line_b.coords[1:-1]))}
-        )
-
-        cnt += 1
-
-    if Point(graph.nodes[node_a]["geometry"].coords[0]).equals_exact(
-        Point(line_b.coords[0]), tolerance=1e-6
-    ):
-        if node_a == node_b and graph.has_edge(*(node_a, new_node_id, 0)):
-            if line_b != graph.edges[(node_a, new_node_id, 0)]["geometry"]:
-                k_new = 1
-            else:
-                k_new = 0
-        else:
-            k_new = 0
-        edge_data.update(
-            length=line_length(line_b, graph_crs),
-            geometry=line_b,
-            node_A=node_a,
-            node_B=new_node_id,
-            edge_fid=f"{node_b}_{new_node_id}",
-        )
-        graph.add_edge(node_a, new_node_id, k_new, **edge_data)
-
-        # Update the inverse vertices dict
-        inverse_vertices_dict.update(
-            {p: (node_a, new_node_id, k_new) for p in set(list(line_b.coords[1:-1]))}
-        )
+@dataclass(kw_only=True)
+class _NodeIndex:
+    """
+    Lookup of the graph nodes by position, so a node never has to be searched
+    by scanning the graph.
+    """
 
-        cnt += 1
+    positions: dict[tuple[float, ...], int] = field(default_factory=dict)
 
-    if Point(graph.nodes[node_b]["geometry"].coords[0]).equals_exact(
-        Point(line_b.coords[-1]), tolerance=1e-6
-    ):
-        if node_a == node_b and graph.has_edge(*(node_a, new_node_id, 0)):
-            if line_b != graph.edges[(node_a, new_node_id, 0)]["geometry"]:
-                k_new = 1
-            else:
-                k_new = 0
-        else:
-            k_new = 0
-        edge_data.update(
-            length=line_length(line_b, graph_crs),
-            geometry=line_b,
-            node_A=new_node_id,
-            node_B=node_b,
-            edge_fid=f"{new_node_id}_{node_b}",
-        )
-        graph.add_edge(
-            new_node_id, node_b, k_new, **edge_data
-        )  # changed the u, v order
+    @classmethod
+    def from_graph(cls, graph: nx.Graph) -> "_NodeIndex":
+        """
+        Creates the index of the nodes (with geometry) of the graph.
 
-        # Update the inverse vertices dict
-        inverse_vertices_dict.update(
-            {p: (node_b, new_node_id, k_new) for p in set(list(line_b.coords[1:-1]))}
-        )
+        Args:
+            graph (nx.Graph): Graph whose nodes are indexed.
 
-        cnt += 1
+        Returns:
+            _NodeIndex: The node index.
+        """
+        _node_index = cls()
+        for _node, _data in graph.nodes.data():
+            _node_index.add_node(_node, _data["geometry"].coords[0])
+        return _node_index
 
-    if Point(graph.nodes[node_b]["geometry"].coords[0]).equals_exact(
-        Point(line_a.coords[0]), tolerance=1e-6
-    ):
-        if node_a == node_b and graph.has_edge(*(node_a, new_node_id, 0)):
-            if line_a != graph.edges[(node_a, new_node_id, 0)]["geometry"]:
-                k_new = 1
-            else:
-                k_new = 0
-        else:
-            k_new = 0
-        edge_data.update(
-            length=line_length(line_a, graph_crs),
-            geometry=line_a,
-            node_A=new_node_id,
-            node_B=node_b,
-            edge_fid=f"{new_node_id}_{node_b}",
-        )
-        graph.add_edge(
-            new_node_id, node_b, k_new, **edge_data
-        )  # changed the u, v order
+    def add_node(self, node: int, position: tuple[float, ...]) -> None:
+        """
+        Adds a node to the index.
 
-        # Update the inverse vertices dict
-        inverse_vertices_dict.update(
-            {p: (node_b, new_node_id, k_new) for p in set(list(line_a.coords[1:-1]))}
-        )
+        Args:
+            node (int): Id of the node.
+            position (tuple[float, ...]): Coordinates of the node.
+        """
+        self.positions[position] = node
 
-        cnt += 1
 
-    if Point(graph.nodes[node_a]["geometry"].coords[0]).equals_exact(
-        Point(line_a.coords[-1]), tolerance=1e-6
-    ):
-        if node_a == node_b and graph.has_edge(*(node_a, new_node_id, 0)):
-            if line_a != graph.edges[(node_a, new_node_id, 0)]["geometry"]:
-                k_new = 1
-            else:
-                k_new = 0
-        else:
-            k_new = 0
-        edge_data.update(
-            length=line_length(line_a, graph_crs),
-            geometry=line_a,
-            node_A=node_a,
-            node_B=new_node_id,
-            edge_fid=f"{node_a}_{new_node_id}",
-        )
-        graph.add_edge(node_a, new_node_id, k_new, **edge_data)
+@dataclass(kw_only=True)
+class _SubEdge:
+    """
+    Sub-edge of an edge split by origin / destination nodes, as the coordinate
+    index range (`start` to `end`) of the geometry of the split edge.
+    """
 
-        # Update the inverse vertices dict
-        inverse_vertices_dict.update(
-            {p: (node_a, new_node_id, k_new) for p in set(list(line_a.coords[1:-1]))}
-        )
+    u: int
+    v: int
+    k: int
+    start: int
+    end: int
 
-        cnt += 1
 
-    if Point(graph.nodes[node_b]["geometry"].coords[0]).equals_exact(
-        Point(line_a.coords[-1]), tolerance=1e-6
-    ):
-        if node_a == node_b and graph.has_edge(*(node_a, new_node_id, 0)):
-            if line_a != graph.edges[(node_a, new_node_id, 0)]["geometry"]:
-                k_new = 1
-            else:
-                k_new = 0
-        else:
-            k_new = 0
-        edge_data.update(
-            length=line_length(line_a, graph_crs),
-            geometry=line_a,
-            node_A=new_node_id,
-            node_B=node_b,
-            edge_fid=f"{new_node_id}_{node_b}",
-        )
-        graph.add_edge(
-            new_node_id, node_b, k_new, **edge_data
-        )  # changed the u, v order
+@dataclass(kw_only=True)
+class _EdgeSplit:
+    """
+    Split of one graph edge at the (inner) vertices of its geometry closest to
+    origins and destinations.
+
+    All vertices of the edge are collected first (`add_vertex`), then the edge is
+    split at once. Along the geometry, a vertex further than the previous split
+    and before the end of the edge is a split, getting a new node (`split_nodes`).
+    The other vertices are matched to the node of the previous split or of the
+    start or end of the edge (`get_node`).
+    """
 
-        # Update the inverse vertices dict
-        inverse_vertices_dict.update(
-            {p: (node_b, new_node_id, k_new) for p in set(list(line_a.coords[1:-1]))}
+    edge: tuple[int, int, int]
+    coords: list[tuple[float, ...]]
+    is_directed: bool
+    is_reversed: bool
+    vertex_index: dict[tuple[float, float], int] = field(init=False)
+    distances: np.ndarray = field(init=False)
+    vertex_indices: set[int] = field(init=False)
+    split_nodes: dict[int, int] = field(init=False)
+    _split_indices: list[int] | None = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.vertex_index = {}
+        for _index, _coord in enumerate(self.coords):
+            self.vertex_index.setdefault(_coord[:2], _index)
+        _coords = np.array([_coord[:2] for _coord in self.coords])
+        self.distances = np.concatenate(
+            ([0.0], np.cumsum(np.hypot(*np.diff(_coords, axis=0).T)))
         )
-
-        cnt += 1
-
-    if Point(graph.nodes[node_a]["geometry"].coords[0]).equals_exact(
-        Point(line_a.coords[0]), tolerance=1e-6
-    ):
-        if node_a == node_b and graph.has_edge(*(node_a, new_node_id, 0)):
-            if line_a != graph.edges[(node_a, new_node_id, 0)]["geometry"]:
-                k_new = 1
-            else:
-                k_new = 0
-        else:
-            k_new = 0
-        edge_data.update(
-            length=line_length(line_a, graph_crs),
-            geometry=line_a,
-            node_A=node_a,
-            node_B=new_node_id,
-            edge_fid=f"{node_a}_{new_node_id}",
+        self.vertex_indices = set()
+        self.split_nodes = {}
+        self._split_indices = None
+
+    @classmethod
+    def from_graph(cls, graph: nx.Graph, edge: tuple[int, int, int]) -> "_EdgeSplit":
+        """
+        Creates the split of an edge (with geometry) of the graph.
+
+        Args:
+            graph (nx.Graph): Graph of the edge.
+            edge (tuple[int, int, int]): The edge (u, v, k).
+
+        Returns:
+            _EdgeSplit: The edge split, without vertices.
+        """
+        _coords = list(graph.edges[edge]["geometry"].coords)
+        # The geometry can run from the end node (v) to the start node (u) of the edge.
+        _u_position = graph.nodes[edge[0]]["geometry"].coords[0][:2]
+        return cls(
+            edge=edge,
+            coords=_coords,
+            is_directed=graph.is_directed(),
+            is_reversed=math.dist(_u_position, _coords[-1][:2])
+            < math.dist(_u_position, _coords[0][:2]),
         )
-        graph.add_edge(node_a, new_node_id, k_new, **edge_data)
 
-        # Update the inverse vertices dict
-        inverse_vertices_dict.update(
-            {p: (node_a, new_node_id, k_new) for p in set(list(line_a.coords[1:-1]))}
+    @property
+    def start_node(self) -> int:
+        return self.edge[1] if self.is_reversed else self.edge[0]
+
+    @property
+    def end_node(self) -> int:
+        return self.edge[0] if self.is_reversed else self.edge[1]
+
+    def add_vertex(self, vertex: tuple[float, float]) -> None:
+        """
+        Adds an (inner) vertex of the geometry of the edge to split the edge at.
+
+        Args:
+            vertex (tuple[float, float]): Coordinates of the vertex.
+        """
+        self.vertex_indices.add(self.vertex_index[vertex])
+        self._split_indices = None
+
+    def get_split_indices(self) -> list[int]:
+        """
+        Gets the coordinate indices of the geometry at which the edge is split.
+
+        Returns:
+            list[int]: The (sorted) coordinate indices.
+        """
+        if self._split_indices is None:
+            self._split_indices = []
+            _previous_distance = 0.0
+            for _index in sorted(self.vertex_indices):
+                if _previous_distance < self.distances[_index] < self.distances[-1]:
+                    self._split_indices.append(_index)
+                    _previous_distance = self.distances[_index]
+        return self._split_indices
+
+    def is_split_at(self, vertex: tuple[float, float]) -> bool:
+        """
+        Checks whether the edge is split at the vertex.
+
+        Args:
+            vertex (tuple[float, float]): Coordinates of the vertex.
+
+        Returns:
+            bool: True when the edge is split at the vertex.
+        """
+        _index = self.vertex_index[vertex]
+        _position = bisect.bisect_left(self.get_split_indices(), _index)
+        return (
+            _position < len(self.get_split_indices())
+            and self.get_split_indices()[_position] == _index
         )
 
-        cnt += 1
-
-    try:
-        assert cnt == 2
-    except AssertionError:
-        logging.warning(
-            "No combination of nodes/road segments found for the OD assignment."
+    def get_node(self, vertex: tuple[float, float]) -> int:
+        """
+        Gets the node matched to the vertex: the node of the split at the vertex,
+        otherwise the node of the previous split (or of the start) of the edge,
+        or the end node for a vertex at the end of the edge.
+
+        Args:
+            vertex (tuple[float, float]): Coordinates of the vertex.
+
+        Returns:
+            int: Id of the node.
+        """
+        _index = self.vertex_index[vertex]
+        if self.is_split_at(vertex):
+            return self.split_nodes[_index]
+        if self.distances[_index] >= self.distances[-1]:
+            return self.end_node
+        _split_indices = self.get_split_indices()
+        _position = bisect.bisect_right(_split_indices, _index) - 1
+        if _position < 0:
+            return self.start_node
+        return self.split_nodes[_split_indices[_position]]
+
+    def get_sub_edges(self) -> list[_SubEdge]:
+        """
+        Gets the sub-edges replacing the split edge, in the order of the geometry.
+        The sub-edges keep the direction of the edge (from u to v).
+
+        Returns:
+            list[_SubEdge]: The sub-edges, empty when the edge is not split.
+        """
+        _split_indices = self.get_split_indices()
+        if not _split_indices:
+            return []
+        _nodes = (
+            [self.start_node]
+            + [self.split_nodes[_index] for _index in _split_indices]
+            + [self.end_node]
         )
-
-    if graph.has_edge(node_a, node_b, k):
-        # remove the edge that is split in two from the graph
-        graph.remove_edge(node_a, node_b, k)
-
-    return graph, inverse_vertices_dict
+        _indices = [0] + _split_indices + [len(self.coords) - 1]
+        _sub_edges = []
+        _n_parallel: dict[tuple[int, int] | frozenset[int], int] = {}
+        for _node_a, _node_b, _start, _end in zip(
+            _nodes[:-1], _nodes[1:], _indices[:-1], _indices[1:]
+        ):
+            _u, _v = (_node_b, _node_a) if self.is_reversed else (_node_a, _node_b)
+            # Parallel sub-edges only occur when splitting a self-loop once.
+            _pair = (_u, _v) if self.is_directed else frozenset((_u, _v))
+            _k = _n_parallel.get(_pair, 0)
+            _n_parallel[_pair] = _k + 1
+            _sub_edges.append(_SubEdge(u=_u, v=_v, k=_k, start=_start, end=_end))
+        return _sub_edges
 
 
 def add_od_nodes(
@@ -405,49 +408,13 @@ def add_od_nodes(
     crs,
     category: Optional[str] = None,
 ):
-    def find_closest_node(
-        closest_node_on_road: np.ndarray,
-        inverse_vertices_dict: dict,
-        inverse_nodes_dict: dict,
-        graph: nx.Graph,
-    ) -> dict[tuple[float, float], int]:
-        closest_u_v_k = inverse_vertices_dict.get(
-            (closest_node_on_road[0], closest_node_on_road[1]), None
-        )
-        if closest_u_v_k:
-            closest_u_data = graph.nodes[closest_u_v_k[0]]
-            closest_v_data = graph.nodes[closest_u_v_k[1]]
-            closest_node_on_extremities = closest_node(
-                np.array((closest_node_on_road[0], closest_node_on_road[1])),
-                np.array(
-                    [
-                        [closest_u_data["x"], closest_u_data["y"]],
-                        [closest_v_data["x"], closest_v_data["y"]],
-                    ]
-                ),
-            )
-            closest_node_on_extremities_id = get_node_id_from_position(
-                graph, *closest_node_on_extremities
-            )
-            inverse_nodes_dict[
-                (closest_node_on_road[0], closest_node_on_road[1])
-            ] = closest_node_on_extremities_id
-
-        return inverse_nodes_dict
-
-    def get_node_id_from_position(
-        g: nx.Graph, x: float, y: float
-    ) -> Union[float, None]:
-        nodes = [
-            (node, data)
-            for node, data in g.nodes(data=True)
-            if "geometry" in data
-            and round(data["geometry"].x, 7) == round(x, 7)
-            and round(data["geometry"].y, 7) == round(y, 7)
-        ]
-        return nodes[0][0] if nodes else None
-
     """Gets from each origin and destination the closest vertex on the graph edge.
+
+    The nodes are added in phases: first the vertices of all origins and destinations
+    are collected per edge, so every edge is split once at all its vertices. Then the
+    nodes of the splits are added, the origins and destinations are matched to their
+    (new) node and every split edge is replaced by its sub-edges.
+
     Args:
         od [Geodataframe]: The GeoDataFrame with the origins and destinations
         graph [networkX graph]: networkX graph
@@ -479,107 +446,117 @@ def add_od_nodes(
     # Make an array from the list
     all_vertices = np.array(all_vertices)
 
-    # Also create an inverse nodes dict of the node geometries as keys and node ID's as values
-    inverse_nodes_dict = {
-        node[-1]["geometry"].coords[0]: node[0] for node in graph.nodes.data()
-    }
+    # Also create an index of the (existing) nodes by their position.
+    node_index = _NodeIndex.from_graph(graph)
 
-    # Get the maximum node id
+    # Find the vertices on the road that are closest to the origins and destinations
+    closest_nodes_on_road = closest_nodes(
+        np.column_stack((od["geometry"].x, od["geometry"].y)), all_vertices
+    )
+    od_vertices = [
+        (closest_node_on_road[0], closest_node_on_road[1])
+        for closest_node_on_road in closest_nodes_on_road
+    ]
+
+    # Collect the vertices per edge. If the vertex is on an end-point of a road,
+    # it is not an (inner) vertex of an edge.
+    edge_splits: dict[tuple[int, int, int], _EdgeSplit] = {}
+    for vertex in od_vertices:
+        if vertex not in inverse_vertices_dict:
+            continue
+        edge = inverse_vertices_dict[vertex]
+        if edge not in edge_splits:
+            edge_splits[edge] = _EdgeSplit.from_graph(graph, edge)
+        edge_splits[edge].add_vertex(vertex)
+
+    def get_edge_split(vertex: tuple[float, float]) -> _EdgeSplit | None:
+        if vertex not in inverse_vertices_dict:
+            return None
+        return edge_splits[inverse_vertices_dict[vertex]]
+
+    # Add a node for every split, in the order of the origins and destinations
     max_node_id = max([n for n in graph.nodes()])
+    for vertex in od_vertices:
+        edge_split = get_edge_split(vertex)
+        if not edge_split or not edge_split.is_split_at(vertex):
+            continue
+        _index = edge_split.vertex_index[vertex]
+        if _index in edge_split.split_nodes:
+            continue
+        new_node_id = max_node_id + 1
+        max_node_id = new_node_id
+        graph.add_node(
+            new_node_id,
+            node_fid=new_node_id,  # Check if this attribute always exists
+            y=vertex[1],
+            x=vertex[0],
+            geometry=Point(vertex),
+        )
+        edge_split.split_nodes[_index] = new_node_id
+
+    # Match the origins and destinations to their (new) node
     od_list = []
     for i, od_data in tqdm(
-        enumerate(
-            list(zip(od["geometry"].x, od["geometry"].y, od["o_id"], od["d_id"]))
-        ),
+        enumerate(list(zip(od["o_id"], od["d_id"]))),
         desc="Adding Origin-Destination nodes to graph",
     ):
-        match_name = get_od(od_data[-2], od_data[-1])
-
-        # Find the vertex on the road that is closest to the origin or destination point
-        closest_node_on_road = closest_node(
-            np.array((od_data[0], od_data[1])), all_vertices
-        )
-        match_od = Point(closest_node_on_road)
-        # Find the road to which this vertex belongs. If the vertex is on an end-point of a road, it cannot be found,
-        # and it goes to the except statement.
-        try:
-            closest_u_v_k = inverse_vertices_dict[
-                (closest_node_on_road[0], closest_node_on_road[1])
-            ]
-            match_edge = graph.edges[closest_u_v_k]
-
-            # Add the node to the graph edge
-            match_geom = match_edge["geometry"]
-
-            new_lines = split_line_with_points(match_geom, [match_od])
-            if len(new_lines) == 1:
-                inverse_nodes_dict = find_closest_node(
-                    closest_node_on_road,
-                    inverse_vertices_dict,
-                    inverse_nodes_dict,
-                    graph,
-                )
+        match_name = get_od(*od_data)
 
-            assert len(new_lines) == 2
-            assert len([match_od]) == 1
-
-            line1, line2 = new_lines
-
-            new_node_id = max_node_id + 1
-            max_node_id = new_node_id
-
-            node_info = {
-                "node_fid": new_node_id,  # Check if this attribute always exists
-                "y": match_od.coords[0][1],
-                "x": match_od.coords[0][0],
-                "geometry": match_od,
-                "od_id": match_name,
-            }
-            if category and od_data[-1] == od_data[-1]:
-                # If the user wants to calculate the routes to multiple locations with categories
-                # and if the current location is a destination (od_data[-1] is not NaN)
-                node_info["category"] = od.iloc[i][category]
-
-            # Add the new node to the graph
-            graph.add_node(new_node_id, **node_info)
-
-            # Update the inverse_nodes_dict with the new node
-            inverse_nodes_dict[match_od.coords[0]] = new_node_id
-
-            # Delete the new node from the inverse_vertices_dict as no end-points are included here
-            del inverse_vertices_dict[match_od.coords[0]]
-
-            # Update the graph edges and the inverse_vertices_dict
-            graph, inverse_vertices_dict = update_edges_with_new_node(
-                graph,
-                match_edge,
-                closest_u_v_k[0],
-                closest_u_v_k[1],
-                closest_u_v_k[2],
-                line1,
-                line2,
-                new_node_id,
-                crs,
-                inverse_vertices_dict,
-            )
-
-        except (KeyError, AssertionError):
+        # The vertex on the road that is closest to the origin or destination point
+        vertex = od_vertices[i]
+        edge_split = get_edge_split(vertex)
+        if edge_split:
+            match_node = edge_split.get_node(vertex)
+        else:
             # If the vertex is at the end of the road it won't be found in the inverse_vertices_dict,
-            # so search in the inverse_nodes_dict.
-            match_node = inverse_nodes_dict[
-                (closest_node_on_road[0], closest_node_on_road[1])
-            ]
+            # so search in the node index.
+            match_node = node_index.positions[vertex]
 
-            # Update the node with the OD attribute
-            graph = add_data_to_existing_node(graph, match_node, match_name)
+        # Update the node with the OD attribute
+        graph = add_data_to_existing_node(graph, match_node, match_name)
 
-            if category and od_data[-1] == od_data[-1]:
-                # If the user wants to calculate the routes to multiple locations with categories
-                # and if the current location is a destination (od_data[-1] is not NaN)
-                graph.nodes[match_node]["category"] = od.iloc[i][category]
+        if category and od_data[-1] == od_data[-1]:
+            # If the user wants to calculate the routes to multiple locations with categories
+            # and if the current location is a destination (od_data[-1] is not NaN)
+            graph.nodes[match_node]["category"] = od.iloc[i][category]
 
         # Save both in lists
-        od_list.append(match_od)  # save the point as a Shapely Point
+        od_list.append(Point(vertex))  # save the point as a Shapely Point
+
+    # Replace the split edges by their sub-edges
+    sub_edges = []
+    for edge, edge_split in edge_splits.items():
+        _edge_sub_edges = edge_split.get_sub_edges()
+        if not _edge_sub_edges:
+            continue
+        _edge_data = graph.edges[edge]
+        sub_edges.extend(
+            (_sub_edge, edge_split.coords, _edge_data) for _sub_edge in _edge_sub_edges
+        )
+        graph.remove_edge(*edge)
+    sub_edge_geometries = [
+        LineString(_coords[_sub_edge.start : _sub_edge.end + 1])
+        for _sub_edge, _coords, _ in sub_edges
+    ]
+    sub_edge_lengths = line_lengths(sub_edge_geometries, crs).tolist()
+    for (_sub_edge, _, _edge_data), _geometry, _length in zip(
+        sub_edges, sub_edge_geometries, sub_edge_lengths
+    ):
+        graph.add_edge(
+            _sub_edge.u,
+            _sub_edge.v,
+            _sub_edge.k,
+            **(
+                _edge_data
+                | dict(
+                    length=_length,
+                    geometry=_geometry,
+                    node_A=_sub_edge.u,
+                    node_B=_sub_edge.v,
+                    edge_fid=f"{_sub_edge.u}_{_sub_edge.v}",
+                )
+            ),
+        )
 
     # save in dataframe
     od["OD"] = od_list
@@ -614,7 +591,7 @@ def split_line_with_points(line, points):
 #########################################################################################
 
 
-def rescale_and_crop(path_name, gdf, output_folder: Path, res: int = 500):
+def rescale_and_crop(path_name, gdf, output_folder: Path, res: float = 500):
     dst_crs = rasterio.crs.CRS.from_dict(gdf.crs.to_dict())
 
     # Rescale and reproject raster to gdf crs
@@ -690,52 +667,64 @@ def export_raster_to_geotiff(array, meta, dir_path: Path, filename: str) -> Path
     return cropped_outputfile
 
 
-def generate_points_from_raster(fn, out_fn):
-    # Read raster coordinate centroid
-    with rasterio.open(fn) as src:
-        points = []
-        for col in range(src.width):
-            x_s, y_s = rasterio.transform.xy(
-                src.transform,
-                [row for row in range(src.height)],
-                [col for _ in range(src.height)],
-            )
-            points += [Point(x, y) for x, y in zip(x_s, y_s)]
+def generate_points_from_raster(fn: Path, out_fn: Path) -> Path:
+    """Makes a point at the centroid of every raster cell with a value larger than 0.
 
-    # Put raster coordinates into geodataframe
-    gdf = gpd.GeoDataFrame()
-    gdf["geometry"] = points
-    gdf["OBJECTID"] = [x for x in range(len(gdf))]
+    Args:
+        fn (Path): Path to the raster.
+        out_fn (Path): Path of the points file, a Feather (`.feather`) or vector (e.g. `.gpkg`) file.
 
-    # Get raster values
-    temp = [gdf["geometry"].x, gdf["geometry"].y]
-    coords = list(map(list, zip(*temp)))
+    Returns:
+        Path: Path of the points file.
+    """
     with rasterio.open(fn) as src:
-        gdf.crs = src.crs
-        gdf["values"] = [sample[0] for sample in src.sample(coords)]
+        values = src.read(1)
+        transform = src.transform
+        raster_crs = src.crs
+
+    # Cells ordered column by column, with the OBJECTID numbering all raster cells.
+    cols, rows = np.nonzero(values.T > 0)
+    x_s, y_s = transform * (cols + 0.5, rows + 0.5)
+
+    gdf = gpd.GeoDataFrame(
+        {
+            "OBJECTID": cols * values.shape[0] + rows,
+            "values": values[rows, cols],
+        },
+        geometry=shapely.points(x_s, y_s),
+        crs=raster_crs,
+    )
 
-    # Save non-zero cells
-    gdf.loc[gdf["values"] > 0].to_file(out_fn)
+    if out_fn.suffix == ".feather":
+        gdf.to_feather(out_fn)
+    else:
+        gdf.to_file(out_fn)
 
     return out_fn
 
 
-def origins_from_raster(output_folder: Path, mask_fn, raster_fn) -> Path:
-    """Makes origin points from a population raster."""
+def origins_from_raster(
+    output_folder: Path, mask_fn, raster_fn, res: float = 1000
+) -> Path:
+    """Makes origin points from a population raster.
+
+    Args:
+        output_folder (Path): Directory where the (intermediate) results are saved.
+        mask_fn (list[Path]): Polygon(s) to crop the raster with.
+        raster_fn (Path): Path to the population raster.
+        res (float, optional): Resolution (in meter) to rescale the raster to. Defaults to 1000.
+
+    Returns:
+        Path: Path of the origin points file.
+    """
     output_fn = output_folder / "origins_raster.tif"
     mask = gpd.read_file(mask_fn[0], engine="pyogrio")
-    res = 1000  # in meter; TODO: put in config file or in network.ini
     out_array, out_meta = rescale_and_crop(raster_fn, mask, output_folder, res)
     outputfile = export_raster_to_geotiff(out_array, out_meta, output_folder, output_fn)
 
-    out_array[out_array > 0] = 1
-    print(
-        "There are "
-        + str(out_array[~np.isnan(out_array)].sum().sum())
-        + " origin points."
-    )
+    logging.info("There are %s origin points.", np.count_nonzero(out_array > 0))
 
-    out_fn = output_folder / "origins_points.gpkg"
+    out_fn = output_folder / "origins_points.feather"
     out_fn = generate_points_from_raster(outputfile, out_fn)
 
     return out_fn
@@ -19,17 +19,22 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import itertools
 import logging
 import math
 from decimal import Decimal
 from typing import Optional, Union
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
 from geopy import distance
 from shapely.geometry import LineString, MultiLineString, Point
 
+from ra2ce.network.link_table import LinkTable
 from ra2ce.network.networks_utils import cut as network_cut
-from ra2ce.network.networks_utils import line_length
+from ra2ce.network.networks_utils import line_lengths
 
 
 class Segmentation:  # Todo: more naturally, this would be METHOD of the network class.
@@ -53,8 +58,8 @@ class Segmentation:  # Todo: more naturally, this would be METHOD of the network
         crs: float,
         edges: gpd.GeoDataFrame,
         export_link_table: bool,
-        link_tables: Optional[tuple] = None,
-    ) -> Union[gpd.GeoDataFrame, tuple[gpd.GeoDataFrame, tuple]]:
+        link_tables: Optional[LinkTable] = None,
+    ) -> Union[gpd.GeoDataFrame, tuple[gpd.GeoDataFrame, LinkTable]]:
         """
         Segments a complex graph based on the given segmentation length.
 
@@ -82,7 +87,7 @@ class Segmentation:  # Todo: more naturally, this would be METHOD of the network
             return edges, link_tables
         elif export_link_table and not link_tables:
             logging.warning("empty link_tables is passed")
-            return edges, tuple()
+            return edges, LinkTable(simple_ids=[], complex_ids=[])
         else:
             return edges
 
@@ -97,9 +102,7 @@ class Segmentation:  # Todo: more naturally, this would be METHOD of the network
         self.edges_segmented = (
             None  # This is where the result will be saved Edges GeoDataframe
         )
-        self.link_tables = (
-            None  # will include dictionaries simple_ids to complex and vice-versa
-        )
+        self.link_tables = None  # will include the table linking simple ids to complex
         self._get_segmentation_length_from_metre(segmentation_length)
         self.save_files = save_files  # Todo not implemented yet
 
@@ -238,6 +241,149 @@ class Segmentation:  # Todo: more naturally, this would be METHOD of the network
 
         return result_list
 
+    def get_number_of_segments(self, lengths: np.ndarray) -> np.ndarray:
+        """Returns the number of segments which will result from chopping up lines
+        with the given lengths in segments of `self.segmentation_length`.
+
+        Args:
+            lengths (np.ndarray): Lengths of the lines (in the units of the projection).
+
+        Returns:
+            np.ndarray: Number of segments of each line (at least 1).
+        """
+        # rounding avoids an extra (almost) zero length segment for lines with a length
+        # that is a multiple of the segmentation length, but not exactly due to
+        # floating point errors.
+        return np.maximum(
+            np.ceil(np.round(lengths / self.segmentation_length, 9)), 1
+        ).astype(int)
+
+    def split_linestrings(
+        self, linestrings: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Cuts all linestrings in segments of length `self.segmentation_length`
+        (and a shorter remainder) at once.
+
+        The cut points are interpolated along the lines and the segments are built
+        from the flattened coordinates of all lines, so no linestring is cut in a
+        Python loop.
+
+        Args:
+            linestrings (np.ndarray): LineString objects (2D).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The segments and, for each segment,
+                the position of its linestring.
+        """
+        _coords, _coord_line_index = shapely.get_coordinates(
+            linestrings, return_index=True
+        )
+        # Cumulative (planar) distance of each vertex along its own line.
+        _is_same_line = _coord_line_index[1:] == _coord_line_index[:-1]
+        _vertex_steps = np.zeros(len(_coords))
+        _vertex_steps[1:] = np.where(
+            _is_same_line, np.hypot(*(_coords[1:] - _coords[:-1]).T), 0.0
+        )
+        _cumulative = np.cumsum(_vertex_steps)
+        _line_starts = np.searchsorted(_coord_line_index, np.arange(len(linestrings)))
+        _line_ends = np.append(_line_starts[1:], len(_coords)) - 1
+        _cumulative -= np.repeat(
+            _cumulative[_line_starts], np.diff(np.append(_line_starts, len(_coords)))
+        )
+        _lengths = _cumulative[_line_ends]
+
+        # Start and end distance of each segment along its line.
+        _n_segments = self.get_number_of_segments(_lengths)
+        _segment_line_index = np.repeat(np.arange(len(linestrings)), _n_segments)
+        _segment_rank = np.arange(len(_segment_line_index)) - np.repeat(
+            np.cumsum(_n_segments) - _n_segments, _n_segments
+        )
+        _segment_starts = _segment_rank * self.segmentation_length
+        _segment_ends = np.minimum(
+            _segment_starts + self.segmentation_length,
+            _lengths[_segment_line_index],
+        )
+        _segment_ends[np.cumsum(_n_segments) - 1] = _lengths
+
+        # Vertices strictly between the start and end of each segment.
+        _first_inner_vertex = self._count_vertices_before(
+            _coord_line_index, _cumulative, _segment_line_index, _segment_starts, True
+        )
+        _end_inner_vertex = self._count_vertices_before(
+            _coord_line_index, _cumulative, _segment_line_index, _segment_ends, False
+        )
+        _n_inner_vertices = np.maximum(_end_inner_vertex - _first_inner_vertex, 0)
+
+        _start_points = shapely.get_coordinates(
+            shapely.line_interpolate_point(
+                linestrings[_segment_line_index], _segment_starts
+            )
+        )
+        _end_points = shapely.get_coordinates(
+            shapely.line_interpolate_point(
+                linestrings[_segment_line_index], _segment_ends
+            )
+        )
+
+        # Flattened coordinates of all segments: start point, inner vertices, end point.
+        _n_points = _n_inner_vertices + 2
+        _point_segment_index = np.repeat(np.arange(len(_n_points)), _n_points)
+        _point_rank = np.arange(len(_point_segment_index)) - np.repeat(
+            np.cumsum(_n_points) - _n_points, _n_points
+        )
+        _segment_coords = np.empty((len(_point_segment_index), 2))
+        _is_start = _point_rank == 0
+        _is_end = _point_rank == np.repeat(_n_points - 1, _n_points)
+        _is_inner = ~(_is_start | _is_end)
+        _segment_coords[_is_start] = _start_points
+        _segment_coords[_is_end] = _end_points
+        _segment_coords[_is_inner] = _coords[
+            np.repeat(_first_inner_vertex, _n_inner_vertices)
+            + _point_rank[_is_inner]
+            - 1
+        ]
+        return (
+            shapely.linestrings(_segment_coords, indices=_point_segment_index),
+            _segment_line_index,
+        )
+
+    @staticmethod
+    def _count_vertices_before(
+        vertex_line_index: np.ndarray,
+        vertex_distances: np.ndarray,
+        query_line_index: np.ndarray,
+        query_distances: np.ndarray,
+        inclusive: bool,
+    ) -> np.ndarray:
+        """
+        Counts the vertices before each query (distance along a line), over all lines,
+        which is the position of the first vertex of the query's line at or after
+        that distance.
+        With `inclusive` a vertex at exactly the queried distance also counts.
+        """
+        _n_vertices = len(vertex_line_index)
+        _is_query = np.concatenate(
+            [
+                np.zeros(_n_vertices, dtype=bool),
+                np.ones(len(query_line_index), dtype=bool),
+            ]
+        )
+        # Sort by line, then distance.
+        # On equal distances the vertices go first when inclusive.
+        _order = np.lexsort(
+            (
+                _is_query if inclusive else ~_is_query,
+                np.concatenate([vertex_distances, query_distances]),
+                np.concatenate([vertex_line_index, query_line_index]),
+            )
+        )
+        _vertices_before = np.cumsum(~_is_query[_order])
+        _counts = np.empty(len(query_line_index), dtype=int)
+        _counts[_order[_is_query[_order]] - _n_vertices] = _vertices_before[
+            _is_query[_order]
+        ]
+        return _counts
+
     def cut_gdf(self):
         """
         Cuts every linestring or multilinestring feature in a gdf to equal length segments. Assumes only linestrings for now.
@@ -246,75 +392,64 @@ class Segmentation:  # Todo: more naturally, this would be METHOD of the network
             *length* (units of the projection) : Typically in degrees, 0.001 degrees ~ 111 m in Europe
         """
         gdf = self.edges_input.copy()
-        columns = gdf.columns
-
-        data = {"splt_id": []}
-
-        for column in columns:
-            data[column] = []
-
-        count = 1
-        for _, row in gdf.iterrows():
-            geom = row["geometry"]
-            assert type(geom) == LineString or type(geom) == MultiLineString
-            linestrings = self.split_linestring(geom, self.segmentation_length)
-
-            for _, linestring in enumerate(linestrings):
-                for key, value in row.items():
-                    if key == "geometry":
-                        data[key].append(linestring)
-                    elif key == "length":
-                        data[key].append(line_length(linestring, self.edges_input.crs))
-                    elif key == "time":
-                        data[key].append(
-                            round((row["length"] / row["avgspeed"]) / 1000, 5)
-                        )
-                    else:
-                        data[key].append(value)
-                data["splt_id"].append(count)
-                count += 1
-        self.edges_segmented = gpd.GeoDataFrame(data)
-
-    def generate_link_tables(
-        self,
-    ) -> tuple[dict[int, Union[int, list[int]]], dict[int, int]]:
-        """Generate mappings between RFIDs and split IDs.
+        geometries = gdf["geometry"].to_numpy()
+        assert all(
+            type(geom) == LineString or type(geom) == MultiLineString
+            for geom in geometries
+        )
+
+        # All linestrings longer than the segmentation length are split at once,
+        # multilinestrings are split one by one.
+        segments = np.array(geometries, dtype=object)[:, None].tolist()
+        is_linestring = (
+            shapely.get_type_id(geometries) == shapely.GeometryType.LINESTRING
+        )
+        to_split = np.flatnonzero(
+            is_linestring
+            & (self.get_number_of_segments(shapely.length(geometries)) > 1)
+        )
+        if len(to_split):
+            _segments, _segment_line_index = self.split_linestrings(
+                shapely.force_2d(geometries[to_split])
+            )
+            for _position, _line_segments in zip(
+                to_split,
+                np.split(_segments, np.cumsum(np.bincount(_segment_line_index))[:-1]),
+            ):
+                segments[_position] = _line_segments.tolist()
+        for _position in np.flatnonzero(~is_linestring):
+            segments[_position] = self.split_linestring(
+                geometries[_position], self.segmentation_length
+            )
+
+        # Repeat the attributes of each input row for each of its segments.
+        n_segments = np.array([len(_segments) for _segments in segments], dtype=int)
+        edges_segmented = gdf.iloc[np.repeat(np.arange(len(gdf)), n_segments)]
+        edges_segmented = pd.DataFrame(edges_segmented).reset_index(drop=True)
+        edges_segmented["geometry"] = list(itertools.chain.from_iterable(segments))
+        if "length" in edges_segmented.columns:
+            edges_segmented["length"] = line_lengths(
+                edges_segmented["geometry"], self.edges_input.crs
+            )
+        if "time" in edges_segmented.columns:
+            edges_segmented["time"] = np.repeat(
+                round((gdf["length"] / gdf["avgspeed"]) / 1000, 5).to_numpy(),
+                n_segments,
+            )
+        edges_segmented.insert(0, "splt_id", np.arange(1, len(edges_segmented) + 1))
+        self.edges_segmented = gpd.GeoDataFrame(edges_segmented)
+
+    def generate_link_tables(self) -> LinkTable:
+        """Generate the mapping between RFIDs and split IDs.
 
-        The first dictionary maps an ``rfid`` to one or more ``splt_id`` values.
-        The second dictionary maps each ``splt_id`` back to its corresponding ``rfid``.
+        Each ``rfid`` maps to one or more ``splt_id`` values, each ``splt_id``
+        maps back to its corresponding ``rfid``.
 
         Returns:
-            tuple[dict[int, Union[int, list[int]]], dict[int, int]]:
-                - Dictionary mapping ``rfid`` to one or more ``splt_id``.
-                - Dictionary mapping ``splt_id`` back to ``rfid``.
+            LinkTable: Table linking the ``rfid`` (simple id) to the ``splt_id`` (complex id).
         """
-        # Initialize result dictionaries
-        splt_id_to_rfid = {}
-        rfid_to_splt_id = {}
-
-        # Create a mapping from splt_id to rfid
-        for _, row in self.edges_segmented.iterrows():
-            splt_id = row["splt_id"]
-            rfid = row["rfid"]
-            splt_id_to_rfid[splt_id] = rfid
-
-        # Create a mapping from rfid to splt_id
-        for _, row in self.edges_segmented.iterrows():
-            splt_id = row["splt_id"]
-            rfid = row["rfid"]
-            rfid_c = row["rfid_c"]
-
-            # Determine the expected rfid from rfid_c
-            if rfid in rfid_to_splt_id:
-                if isinstance(rfid_to_splt_id[rfid], list):
-                    rfid_to_splt_id[rfid].append(splt_id)
-                else:
-                    rfid_to_splt_id[rfid] = [rfid_to_splt_id[rfid], splt_id]
-            else:
-                rfid_to_splt_id[rfid] = splt_id
-
-        # Sort the dictionaries by their keys
-        splt_id_to_rfid_sorted = dict(sorted(splt_id_to_rfid.items()))
-        rfid_to_splt_id_sorted = dict(sorted(rfid_to_splt_id.items()))
-        self.link_tables = (rfid_to_splt_id_sorted, splt_id_to_rfid_sorted)
+        self.link_tables = LinkTable(
+            simple_ids=self.edges_segmented["rfid"].to_numpy(),
+            complex_ids=self.edges_segmented["splt_id"].to_numpy(),
+        )
         return self.link_tables
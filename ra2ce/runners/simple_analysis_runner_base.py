@@ -26,8 +26,8 @@ from abc import abstractmethod
 from ra2ce.analysis.analysis_collection import AnalysisCollection
 from ra2ce.analysis.analysis_protocol import AnalysisProtocol
 from ra2ce.analysis.analysis_result.analysis_result_wrapper import AnalysisResultWrapper
-from ra2ce.analysis.analysis_result.analysis_result_wrapper_exporter import (
-    AnalysisResultWrapperExporter,
+from ra2ce.analysis.analysis_result.analysis_result_wrapper_export_queue import (
+    AnalysisResultWrapperExportQueue,
 )
 from ra2ce.runners.analysis_runner_protocol import AnalysisRunner
 
@@ -64,22 +64,31 @@ class SimpleAnalysisRunnerBase(AnalysisRunner):
         self, analysis_collection: AnalysisCollection
     ) -> list[AnalysisResultWrapper]:
         _results = []
-        for analysis in self.filter_supported_analyses(analysis_collection):
-            logging.info(
-                "----------------------------- Started analyzing '%s'  -----------------------------",
-                analysis.analysis.name,
-            )
-            starttime = time.time()
+        # The results are written in the background while the next analysis runs.
+        _export_queue = AnalysisResultWrapperExportQueue(
+            max_workers=analysis_collection.project.export_max_workers,
+            max_in_flight_bytes=analysis_collection.project.export_max_in_flight_bytes,
+        )
+        try:
+            for analysis in self.filter_supported_analyses(analysis_collection):
+                logging.info(
+                    "----------------------------- Started analyzing '%s'  -----------------------------",
+                    analysis.analysis.name,
+                )
+                starttime = time.time()
 
-            _result_wrapper = analysis.execute()
-            _results.append(_result_wrapper)
-            AnalysisResultWrapperExporter().export_result(_result_wrapper)
+                _result_wrapper = analysis.execute()
+                _results.append(_result_wrapper)
+                _export_queue.submit(analysis.analysis.name, _result_wrapper)
 
-            endtime = time.time()
-            logging.info(
-                "----------------------------- Analysis '%s' finished. "
-                "Time: %ss  -----------------------------",
-                analysis.analysis.name,
-                str(round(endtime - starttime, 2)),
-            )
+                endtime = time.time()
+                logging.info(
+                    "----------------------------- Analysis '%s' finished. "
+                    "Time: %ss  -----------------------------",
+                    analysis.analysis.name,
+                    str(round(endtime - starttime, 2)),
+                )
+        finally:
+            # Also when an analysis fails, the results of the previous ones are written.
+            _export_queue.wait()
         return _results
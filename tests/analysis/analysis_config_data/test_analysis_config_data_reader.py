@@ -75,6 +75,26 @@ class TestAnalysisConfigDataReader:
         # 3. Verify expectations
         assert isinstance(_config.input_path, Path)
 
+    def test_read_project_section_with_export_settings(
+        self, test_result_param_case: Path
+    ):
+        # 1. Define test data
+        _ini_file = test_result_param_case.joinpath("analyses.ini")
+        _ini_file.parent.mkdir(parents=True, exist_ok=True)
+        _ini_file.write_text(
+            "[project]\n"
+            "name = export_settings\n"
+            "export_max_workers = 4\n"
+            "export_max_in_flight_bytes = 1024\n"
+        )
+
+        # 2. Run test
+        _project = AnalysisConfigDataReader().read(_ini_file).project
+
+        # 3. Verify expectations
+        assert _project.export_max_workers == 4
+        assert _project.export_max_in_flight_bytes == 1024
+
     @pytest.mark.parametrize(
         "analysis_config_name, expected_analysis_type",
         [
@@ -108,6 +108,46 @@ class TestAnalysisConfigDataValidator:
         assert not _report.is_valid()
         assert len(_report._errors) == 3
 
+    @pytest.mark.parametrize(
+        "project, expected_error",
+        [
+            pytest.param(
+                ProjectSection(export_max_workers=0),
+                "'export_max_workers' should be a positive integer.",
+                id="No export workers",
+            ),
+            pytest.param(
+                ProjectSection(export_max_in_flight_bytes=-1),
+                "'export_max_in_flight_bytes' should be a non-negative integer.",
+                id="Negative export bytes",
+            ),
+        ],
+    )
+    def test_validate_given_invalid_export_settings_fails(
+        self, project: ProjectSection, expected_error: str
+    ):
+        # 1. Define test data.
+        _test_config_data = AnalysisConfigData(
+            root_path=test_results,
+            output_path=test_results.joinpath("output"),
+            project=project,
+            analyses=[
+                AnalysisSectionDamages(
+                    analysis=AnalysisDamagesEnum.DAMAGES,
+                    name="Damages",
+                    event_type=EventTypeEnum.EVENT,
+                    damage_curve=DamageCurveEnum.HZ,
+                )
+            ],
+        )
+
+        # 2. Run test.
+        _report = self._validate_config(_test_config_data)
+
+        # 3. Verify final expectations.
+        assert not _report.is_valid()
+        assert expected_error in _report._errors
+
     @pytest.fixture(name="section_losses_analysis_config")
     def _get_section_losses_analysis_config_generator(
         self,
@@ -122,3 +122,20 @@ class TestDamagesConfigData:
         assert (
             _report.is_valid()
         ), "Expected valid report due to non-triangle risk calculation mode"
+
+    @pytest.mark.parametrize("chunk_size", [(-5), (0)])
+    def test_given_invalid_chunk_size_when_validate_integrity_then_fails(
+        self, chunk_size: int, valid_damages_config: DamagesConfigData
+    ):
+        # 1. Define test data.
+        _damages_config = valid_damages_config
+        _damages_config.chunk_size = chunk_size
+
+        _expected_error = f"For damage analysis '{_damages_config.name}': 'chunk_size' should be a positive integer."
+
+        # 2. Run test.
+        _report = _damages_config.validate_integrity()
+
+        # 3. Verify expectations for invalid data.
+        assert not _report.is_valid()
+        assert _report._errors == [_expected_error]
@@ -0,0 +1,69 @@
+import shutil
+from pathlib import Path
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+from geopandas import GeoDataFrame
+from shapely import Point
+
+from ra2ce.analysis.analysis_result.analysis_result_parquet_writer import (
+    AnalysisResultParquetWriter,
+)
+from tests import test_results
+
+
+class TestAnalysisResultParquetWriter:
+    @pytest.fixture
+    def _export_path_fixture(self, request: pytest.FixtureRequest) -> Path:
+        _output_dir = test_results.joinpath(request.node.name)
+        if _output_dir.exists():
+            shutil.rmtree(_output_dir)
+        yield _output_dir.joinpath("result.parquet")
+
+    @staticmethod
+    def _get_part(start: int, values: list) -> GeoDataFrame:
+        return GeoDataFrame(
+            {
+                "rfid_c": np.arange(start, start + len(values)),
+                "values": values,
+                "geometry": [Point(_x, 0) for _x in range(start, start + len(values))],
+            }
+        )
+
+    def test_write_parts_into_one_file(self, _export_path_fixture: Path):
+        # 1. Define test data.
+        _parts = [
+            self._get_part(0, [(1, 2), np.nan]),
+            self._get_part(2, [np.nan]),
+            self._get_part(3, [(3, 4)]),
+        ]
+
+        # 2. Run test.
+        with AnalysisResultParquetWriter(export_path=_export_path_fixture) as _writer:
+            for _part in _parts:
+                _writer.write(_part)
+
+        # 3. Verify expectations.
+        _result = gpd.read_parquet(_export_path_fixture)
+        assert _result.crs == "epsg:4326"
+        assert _result["rfid_c"].tolist() == [0, 1, 2, 3]
+        # Object columns as string, also in the parts without objects.
+        assert _result["values"].tolist() == ["(1, 2)", "nan", "nan", "(3, 4)"]
+        assert _result.geometry.x.tolist() == [0, 1, 2, 3]
+
+    def test_write_replaces_existing_file(self, _export_path_fixture: Path):
+        # 1. Define test data.
+        _export_path_fixture.parent.mkdir(parents=True)
+        _export_path_fixture.write_text("previous result")
+
+        # 2. Run test.
+        with AnalysisResultParquetWriter(export_path=_export_path_fixture) as _writer:
+            _writer.write(self._get_part(0, [1.0]))
+
+        # 3. Verify expectations.
+        pd.testing.assert_series_equal(
+            gpd.read_parquet(_export_path_fixture)["values"],
+            pd.Series([1.0], name="values"),
+        )
@@ -0,0 +1,86 @@
+import pytest
+
+from ra2ce.analysis.analysis_result.analysis_result_wrapper import AnalysisResultWrapper
+from ra2ce.analysis.analysis_result.analysis_result_wrapper_export_queue import (
+    AnalysisResultWrapperExportQueue,
+)
+
+
+class TestAnalysisResultWrapperExportQueue:
+    def test_initialize(self):
+        _queue = AnalysisResultWrapperExportQueue()
+        assert isinstance(_queue, AnalysisResultWrapperExportQueue)
+        assert _queue.in_flight_bytes == 0
+
+    def test_given_invalid_result_doesnot_raise(self):
+        # 1. Define test data
+        _queue = AnalysisResultWrapperExportQueue()
+        _result_wrapper = AnalysisResultWrapper(results_collection=[])
+        assert _result_wrapper.is_valid_result() is False
+
+        # 2. Run test
+        _queue.submit("Invalid", _result_wrapper)
+        _queue.wait()
+
+    def test_submit_exports_snapshot_of_result(
+        self, mocked_analysis_result_wrapper: AnalysisResultWrapper
+    ):
+        # 1. Define test data.
+        _single_result = mocked_analysis_result_wrapper.results_collection[0]
+        _single_result.analysis_config.save_csv = True
+        _single_result.analysis_config.save_gpkg = True
+        _queue = AnalysisResultWrapperExportQueue()
+
+        # 2. Run test.
+        _queue.submit("Mocked Analysis", mocked_analysis_result_wrapper)
+        # Changes after submitting are not exported.
+        _single_result.analysis_result["extra_column"] = 42
+        _queue.wait()
+
+        # 3. Verify expectations
+        _base_export_path = _single_result.base_export_path
+        assert _base_export_path.with_suffix(".gpkg").is_file()
+        assert _base_export_path.with_suffix(".csv").read_text().splitlines() == [
+            "dummy_column",
+            "left",
+            "right",
+        ]
+        assert _single_result.analysis_result.crs == "epsg:4326"
+        assert _queue.in_flight_bytes == 0
+
+    def test_given_max_in_flight_bytes_exceeded_still_exports(
+        self, mocked_analysis_result_wrapper: AnalysisResultWrapper
+    ):
+        # 1. Define test data.
+        _single_result = mocked_analysis_result_wrapper.results_collection[0]
+        _single_result.analysis_config.save_csv = True
+        _queue = AnalysisResultWrapperExportQueue(max_workers=1, max_in_flight_bytes=0)
+
+        # 2. Run test.
+        _queue.submit("First", mocked_analysis_result_wrapper)
+        _queue.submit("Second", mocked_analysis_result_wrapper)
+        _queue.wait()
+
+        # 3. Verify expectations
+        assert _single_result.base_export_path.with_suffix(".csv").is_file()
+        assert _queue.in_flight_bytes == 0
+
+    def test_given_failing_export_wait_raises_with_analysis_name(
+        self, mocked_analysis_result_wrapper: AnalysisResultWrapper
+    ):
+        # 1. Define test data.
+        _single_result = mocked_analysis_result_wrapper.results_collection[0]
+        _single_result.analysis_config.save_csv = True
+        # A file where the export directory is expected.
+        _single_result.output_path.mkdir(parents=True)
+        _single_result.base_export_path.parent.touch()
+        _queue = AnalysisResultWrapperExportQueue()
+
+        # 2. Run test.
+        _queue.submit("Failing Analysis", mocked_analysis_result_wrapper)
+        with pytest.raises(RuntimeError) as exc_err:
+            _queue.wait()
+
+        # 3. Verify expectations
+        assert "'Failing Analysis'" in str(exc_err.value)
+        assert _queue.in_flight_bytes == 0
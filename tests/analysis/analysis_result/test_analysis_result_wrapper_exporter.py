@@ -1,5 +1,11 @@
+import geopandas as gpd
+import pandas as pd
+import pyogrio
 import pytest
 
+from ra2ce.analysis.analysis_result.analysis_result_parquet_writer import (
+    AnalysisResultParquetWriter,
+)
 from ra2ce.analysis.analysis_result.analysis_result_wrapper import AnalysisResultWrapper
 from ra2ce.analysis.analysis_result.analysis_result_wrapper_exporter import (
     AnalysisResultWrapperExporter,
@@ -28,16 +34,25 @@ class TestAnalysisResultWrapperExporter:
         "save_csv",
         [pytest.param(True, id="WITH csv"), pytest.param(False, id="WITHOUT csv")],
     )
+    @pytest.mark.parametrize(
+        "save_parquet",
+        [
+            pytest.param(True, id="WITH parquet"),
+            pytest.param(False, id="WITHOUT parquet"),
+        ],
+    )
     def test_given_export_properties_then_generates_files(
         self,
         save_gpkg: bool,
         save_csv: bool,
+        save_parquet: bool,
         mocked_analysis_result_wrapper: AnalysisResultWrapper,
     ):
         # 1. Define test data.
         _single_result = mocked_analysis_result_wrapper.results_collection[0]
         _single_result.analysis_config.save_gpkg = save_gpkg
         _single_result.analysis_config.save_csv = save_csv
+        _single_result.analysis_config.save_parquet = save_parquet
         _exporter = AnalysisResultWrapperExporter()
 
         assert _single_result.output_path.exists() is False
@@ -52,3 +67,89 @@ class TestAnalysisResultWrapperExporter:
 
         assert exists_exported_file(".csv") == save_csv
         assert exists_exported_file(".gpkg") == save_gpkg
+        assert exists_exported_file(".parquet") == save_parquet
+
+    def test_given_result_file_exports_from_file(
+        self, mocked_analysis_result_wrapper: AnalysisResultWrapper
+    ):
+        # 1. Define test data.
+        _single_result = mocked_analysis_result_wrapper.results_collection[0]
+        _single_result.analysis_config.save_gpkg = True
+        _single_result.analysis_config.save_csv = True
+        _single_result.analysis_config.save_parquet = True
+        _result_gdf = _single_result.analysis_result
+        _result_file = _single_result.output_path.joinpath("streamed.parquet")
+        with AnalysisResultParquetWriter(export_path=_result_file) as _writer:
+            _writer.write(_result_gdf.iloc[:1].copy())
+            _writer.write(_result_gdf.iloc[1:].copy())
+        _single_result.analysis_result_file = _result_file
+        # Only the columns needed for other results are held in memory.
+        _single_result.analysis_result = gpd.GeoDataFrame(_result_gdf[["dummy_column"]])
+
+        # 2. Run test.
+        AnalysisResultWrapperExporter().export_result(mocked_analysis_result_wrapper)
+
+        # 3. Verify expectations
+        _base_export_path = _single_result.base_export_path
+        _expected_gdf = _result_gdf.set_crs("epsg:4326")
+        pd.testing.assert_frame_equal(
+            pyogrio.read_dataframe(_base_export_path.with_suffix(".gpkg")),
+            _expected_gdf,
+        )
+        pd.testing.assert_frame_equal(
+            gpd.read_parquet(_base_export_path.with_suffix(".parquet")), _expected_gdf
+        )
+        assert _base_export_path.with_suffix(".csv").read_text().splitlines() == [
+            "dummy_column",
+            "left",
+            "right",
+        ]
+
+    @pytest.mark.parametrize(
+        "save_parquet",
+        [pytest.param(True, id="Moved"), pytest.param(False, id="Removed")],
+    )
+    def test_given_intermediate_result_file_then_removes_it(
+        self,
+        save_parquet: bool,
+        mocked_analysis_result_wrapper: AnalysisResultWrapper,
+    ):
+        # 1. Define test data.
+        _single_result = mocked_analysis_result_wrapper.results_collection[0]
+        _single_result.analysis_config.save_csv = True
+        _single_result.analysis_config.save_parquet = save_parquet
+        _base_export_path = _single_result.base_export_path
+        _parquet_path = _base_export_path.with_suffix(".parquet")
+        _parquet_path.unlink(missing_ok=True)
+        _result_file = _base_export_path.with_suffix(".intermediate.parquet")
+        with AnalysisResultParquetWriter(export_path=_result_file) as _writer:
+            _writer.write(_single_result.analysis_result.copy())
+        _single_result.analysis_result_file = _result_file
+
+        # 2. Run test.
+        AnalysisResultWrapperExporter().export_result(mocked_analysis_result_wrapper)
+
+        # 3. Verify expectations
+        assert not _result_file.exists()
+        assert _parquet_path.is_file() == save_parquet
+        assert _base_export_path.with_suffix(".csv").is_file()
+
+    def test_export_csv_without_geometry(
+        self, mocked_analysis_result_wrapper: AnalysisResultWrapper
+    ):
+        # 1. Define test data.
+        _single_result = mocked_analysis_result_wrapper.results_collection[0]
+        _export_path = _single_result.base_export_path.with_suffix(".csv")
+
+        # 2. Run test.
+        AnalysisResultWrapperExporter()._export_csv(
+            _single_result.analysis_result, _export_path
+        )
+
+        # 3. Verify expectations
+        assert _export_path.read_text().splitlines() == [
+            "dummy_column",
+            "left",
+            "right",
+        ]
+        assert "geometry" in _single_result.analysis_result.columns
@@ -1,10 +1,21 @@
 import geopandas as gpd
 import numpy as np
+import pandas as pd
 import pytest
 
 from ra2ce.analysis.damages.damage_calculation.damage_network_base import (
     DamageNetworkBase,
 )
+from ra2ce.analysis.damages.damage_functions.damage_fraction_uniform import (
+    DamageFractionUniform,
+)
+from ra2ce.analysis.damages.damage_functions.damage_function_road_type_lane import (
+    DamageFunctionByRoadTypeByLane,
+)
+from ra2ce.analysis.damages.damage_functions.manual_damage_functions import (
+    ManualDamageFunctions,
+)
+from ra2ce.analysis.damages.damage_functions.max_damage import MaxDamage
 
 
 class MockedDNB(DamageNetworkBase):
@@ -60,3 +71,57 @@ class TestDamageNetworkBase:
         assert all(np.isnan(v) for v in _dnb.gdf["dam_abc"].values)
         assert len(_dnb.gdf["dam_cde"].values) == 2
         assert all(np.isnan(v) for v in _dnb.gdf["dam_cde"].values)
+
+    def test_calculate_damage_manual_functions_equals_all_segments_calculation(self):
+        # 1. Define test data.
+        # Damage curve with damage at (and below) depth 0.
+        _damage_fraction = DamageFractionUniform(
+            name="damage_fraction",
+            hazard_unit="m",
+            data=pd.DataFrame({"damage": [0.1, 0.5, 1.0]}, index=[0.0, 0.5, 1.0]),
+            origin_path=None,
+        )
+        _damage_fraction.create_interpolator()
+        _damage_function = DamageFunctionByRoadTypeByLane(
+            max_damage=MaxDamage(
+                name="max_damage",
+                damage_unit="euro/m",
+                data=pd.DataFrame({1: [100.0], 2: [200.0]}, index=["motorway"]),
+            ),
+            damage_fraction=_damage_fraction,
+            name="A",
+        )
+        _road_df = pd.DataFrame(
+            {
+                "road_type": ["motorway"] * 5,
+                "infra_type": ["motorway"] * 5,
+                "lanes": [1, 2, 1, 2, 1],
+                "length": [10.0, 20.0, 30.0, 40.0, 50.0],
+                "F_EV1_me": [np.nan, 0.5, 0.0, 1.0, 0.0],
+                "F_EV1_fr": [0.0, 0.2, 0.0, 0.0, 0.4],
+                "F_EV2_me": [2.0, np.nan, 0.3, 1.5, -0.2],
+                "F_EV2_fr": [1.0, 0.0, 0.5, 0.1, 0.3],
+            },
+            index=[3, 5, 7, 9, 11],
+        )
+        _dnb = MockedDNB(None, [], 50)
+        _dnb.gdf = _road_df.copy()
+        _dnb._gdf_mask = _road_df.copy()
+
+        # 2. Run test.
+        _dnb.calculate_damage_manual_functions(
+            ["EV1", "EV2"],
+            ManualDamageFunctions(damage_functions={"A": _damage_function}),
+        )
+
+        # 3. Verify expectations.
+        # Same as calculating the damage of all segments.
+        _expected_df = _damage_function.add_max_damage(_road_df.copy(), "A")
+        for _event in ["EV1", "EV2"]:
+            _expected_df = _damage_function.calculate_damage(
+                _expected_df, "A", "F", _event
+            )
+            pd.testing.assert_series_equal(
+                _dnb.gdf[f"dam_{_event}_A"], _expected_df[f"dam_{_event}_A"]
+            )
+        assert _dnb.gdf.loc[11, "dam_EV1_A"] == 200.0
@@ -3,6 +3,9 @@ import pandas as pd
 import pytest
 
 from ra2ce.analysis.analysis_config_data.enums.damage_curve_enum import DamageCurveEnum
+from ra2ce.analysis.analysis_config_data.enums.risk_calculation_mode_enum import (
+    RiskCalculationModeEnum,
+)
 from ra2ce.analysis.damages.damage_calculation.damage_network_base import (
     DamageNetworkBase,
 )
@@ -65,14 +68,99 @@ class TestDamageNetworkReturnPeriods:
 
         # 3. Verify expectations.
 
-    def test_integrate_df_trapezoidal(self):
+    @staticmethod
+    def _integrate_df_trapezoidal(df: pd.DataFrame) -> np.ndarray:
+        """
+        Integrates the damages (columns named by return period) over the
+        frequencies, per row, as was done before the `RiskCalculationEngine`.
+        """
+        df.columns = [1 / _return_period for _return_period in df.columns]
+        df = df.sort_index(axis="columns")
+        return np.trapezoid(df.values, df.columns, axis=1)
+
+    @classmethod
+    def _get_previous_risk(
+        cls, to_integrate: pd.DataFrame, mode: RiskCalculationModeEnum, year: int
+    ) -> np.ndarray:
+        """
+        The risk as calculated before the `RiskCalculationEngine`
+        (`rework_damage_data_*` followed by the trapezoidal integration).
+        """
+        _max_return_period = max(to_integrate.columns)
+        if mode == RiskCalculationModeEnum.DEFAULT:
+            to_integrate[float("inf")] = to_integrate[_max_return_period]
+            return cls._integrate_df_trapezoidal(to_integrate.fillna(0))
+        if mode == RiskCalculationModeEnum.TRIANGLE_TO_NULL_YEAR:
+            to_integrate[float("inf")] = to_integrate[_max_return_period]
+            to_integrate[year or 1] = 0
+            return cls._integrate_df_trapezoidal(to_integrate.fillna(0))
+        if year >= _max_return_period:
+            return (to_integrate.fillna(0)[_max_return_period] / year).to_numpy()
+
+        _frequencies = to_integrate.copy()
+        _frequencies.columns = [1 / c for c in _frequencies.columns]
+        _frequencies[1 / year] = np.nan
+        _frequencies = _frequencies.interpolate(method="index", axis=1)
+        _frequencies = _frequencies.drop(
+            columns=[c for c in _frequencies.columns if c > 1 / year]
+        )
+        _frequencies.columns = [1 / c for c in _frequencies.columns]
+        _frequencies[float("inf")] = _frequencies[max(_frequencies.columns)]
+        return cls._integrate_df_trapezoidal(_frequencies.fillna(0))
+
+    @pytest.mark.parametrize(
+        "mode, year",
+        [
+            pytest.param(RiskCalculationModeEnum.DEFAULT, 0, id="default"),
+            pytest.param(RiskCalculationModeEnum.CUT_FROM_YEAR, 20, id="cut_from_20"),
+            pytest.param(RiskCalculationModeEnum.CUT_FROM_YEAR, 75, id="cut_from_75"),
+            pytest.param(RiskCalculationModeEnum.CUT_FROM_YEAR, 750, id="cut_from_750"),
+            pytest.param(
+                RiskCalculationModeEnum.CUT_FROM_YEAR, 1000, id="cut_from_max"
+            ),
+            pytest.param(
+                RiskCalculationModeEnum.CUT_FROM_YEAR, 2000, id="cut_from_above"
+            ),
+            pytest.param(
+                RiskCalculationModeEnum.TRIANGLE_TO_NULL_YEAR, 0, id="triangle_0"
+            ),
+            pytest.param(
+                RiskCalculationModeEnum.TRIANGLE_TO_NULL_YEAR, 5, id="triangle_5"
+            ),
+        ],
+    )
+    def test_control_risk_calculation_equals_previous_risk(
+        self, mode: RiskCalculationModeEnum, year: int
+    ):
         # 1. Define test data.
-        data = np.array(([[1000, 2000], [500, 1000]]))
-        rps = [100, 200]
-        df = pd.DataFrame(data, columns=rps)
+        _return_periods = [10, 50, 100, 500, 1000]
+        _curves = ["A", "B"]
+        _rng = np.random.default_rng(42)
+        _damages = _rng.uniform(0, 1000, size=(40, len(_curves), len(_return_periods)))
+        # Missing damages, including rows without any (known) damage.
+        _damages[_rng.uniform(size=_damages.shape) < 0.3] = np.nan
+        _damages[0] = np.nan
+        _road_gdf = pd.DataFrame(
+            {
+                f"dam_RP{_return_period}_{_curve}": _damages[:, i, j]
+                for i, _curve in enumerate(_curves)
+                for j, _return_period in enumerate(_return_periods)
+            }
+        )
+        _damage_network = DamageNetworkReturnPeriods(
+            _road_gdf, [f"F_RP{_rp}_me" for _rp in _return_periods], 100
+        )
 
         # 2. Run test.
-        res = DamageNetworkReturnPeriods.integrate_df_trapezoidal(df)
+        _damage_network.control_risk_calculation(DamageCurveEnum.MAN, mode, year)
 
         # 3. Verify expectations.
-        assert np.array_equal(res, np.array([7.5, 3.75]))
+        for i, _curve in enumerate(_curves):
+            _to_integrate = pd.DataFrame(
+                _damages[:, i, ::-1],
+                columns=[float(_rp) for _rp in _return_periods[::-1]],
+            )
+            np.testing.assert_allclose(
+                _damage_network.gdf[f"risk_{_curve}"].to_numpy(),
+                self._get_previous_risk(_to_integrate, mode, year),
+            )
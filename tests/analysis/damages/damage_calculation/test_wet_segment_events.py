@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ra2ce.analysis.damages.damage_calculation.wet_segment_events import (
+    WetSegmentEvents,
+)
+
+
+class TestWetSegmentEvents:
+    @pytest.fixture(name="wet_segment_events")
+    def _get_wet_segment_events(self) -> WetSegmentEvents:
+        _road_df = pd.DataFrame(
+            {
+                "F_EV1_me": [np.nan, 0.5, 0.0, 1.0, 0.0],
+                "F_EV1_fr": [0.0, 0.2, 0.0, 0.0, 0.4],
+                "F_EV2_me": [2.0, np.nan, 0.3, 1.5, -0.2],
+                "F_EV2_fr": [1.0, 0.0, 0.5, 0.1, 0.3],
+            }
+        )
+        return WetSegmentEvents.from_dataframe(_road_df, ["EV1", "EV2"], "F", "me")
+
+    def test_from_dataframe(self, wet_segment_events: WetSegmentEvents):
+        # 1. Verify expectations.
+        assert wet_segment_events.n_segments == 5
+        # Inundated pairs without (positive) depth are also kept.
+        np.testing.assert_array_equal(
+            wet_segment_events.segment_index, [0, 1, 2, 3, 4, 4]
+        )
+        np.testing.assert_array_equal(
+            wet_segment_events.event_index, [1, 0, 1, 1, 0, 1]
+        )
+        np.testing.assert_array_equal(
+            wet_segment_events.depth, [2.0, 0.5, 0.3, 1.5, 0.0, -0.2]
+        )
+        np.testing.assert_array_equal(
+            wet_segment_events.fraction, [1.0, 0.2, 0.5, 0.1, 0.4, 0.3]
+        )
+        np.testing.assert_array_equal(wet_segment_events.dry_segment_index, [2, 3])
+        np.testing.assert_array_equal(wet_segment_events.dry_event_index, [0, 0])
+
+    def test_scatter(self, wet_segment_events: WetSegmentEvents):
+        # 1. Run test.
+        _matrix = wet_segment_events.scatter(
+            np.array([10.0, 20.0, 30.0, 40.0, 50.0, 60.0])
+        )
+
+        # 2. Verify expectations.
+        np.testing.assert_array_equal(
+            _matrix,
+            np.array(
+                [
+                    [np.nan, 10.0],
+                    [20.0, np.nan],
+                    [0.0, 30.0],
+                    [0.0, 40.0],
+                    [50.0, 60.0],
+                ]
+            ),
+        )
@@ -1,12 +1,24 @@
+import shutil
 from pathlib import Path
 
+import geopandas as gpd
+import numpy as np
 import pandas as pd
 import pytest
+from networkx import MultiGraph
 
+from ra2ce.analysis.analysis_config_data.analysis_config_data import (
+    AnalysisSectionDamages,
+)
+from ra2ce.analysis.analysis_config_data.enums.analysis_damages_enum import (
+    AnalysisDamagesEnum,
+)
 from ra2ce.analysis.analysis_config_data.enums.damage_curve_enum import DamageCurveEnum
+from ra2ce.analysis.analysis_config_data.enums.event_type_enum import EventTypeEnum
 from ra2ce.analysis.analysis_config_data.enums.risk_calculation_mode_enum import (
     RiskCalculationModeEnum,
 )
+from ra2ce.analysis.analysis_input_wrapper import AnalysisInputWrapper
 from ra2ce.analysis.damages.damage_calculation.damage_network_events import (
     DamageNetworkEvents,
 )
@@ -19,7 +31,12 @@ from ra2ce.analysis.damages.damage_functions.manual_damage_functions import (
 from ra2ce.analysis.damages.damage_functions.manual_damage_functions_reader import (
     ManualDamageFunctionsReader,
 )
-from tests import test_data
+from ra2ce.analysis.damages.damages import Damages
+from ra2ce.analysis.damages.damages_result_wrapper import DamagesResultWrapper
+from ra2ce.network.graph_files.graph_file import GraphFile
+from ra2ce.network.graph_files.network_file import NetworkFile
+from ra2ce.network.networks_utils import cast_object_columns_to_str
+from tests import test_data, test_results
 
 damages_test_data = test_data / "damages"
 
@@ -427,3 +444,116 @@ class TestDamages:
                 0,
             )
             assert test_result == reference_result
+
+    @staticmethod
+    def _get_analysis_input(
+        analysis: AnalysisSectionDamages, graph_file_hazard: NetworkFile | None = None
+    ) -> AnalysisInputWrapper:
+        return AnalysisInputWrapper(
+            analysis=analysis,
+            graph_file=None,
+            graph_file_hazard=graph_file_hazard,
+            input_path=None,
+            static_path=None,
+            output_path=None,
+            hazard_names=None,
+            origins_destinations=None,
+            file_id=None,
+        )
+
+    @pytest.mark.parametrize(
+        "damage_curve",
+        [
+            pytest.param(DamageCurveEnum.HZ, id="Huizinga"),
+            pytest.param(DamageCurveEnum.OSD, id="OSdaMage"),
+        ],
+    )
+    def test_execute_in_chunks_equals_execute(
+        self, damage_curve: DamageCurveEnum, request: pytest.FixtureRequest
+    ):
+        # 1. Define test data.
+        _graph_folder = test_data.joinpath("adaptation", "static", "output_graph")
+        _base_graph_hazard = GraphFile(name="base_graph_hazard.p")
+        _base_graph_hazard.read_graph(_graph_folder)
+        _output_path = test_results.joinpath(request.node.name)
+        if _output_path.exists():
+            shutil.rmtree(_output_path)
+
+        def execute_damages(chunk_size: int | None) -> DamagesResultWrapper:
+            _analysis = AnalysisSectionDamages(
+                name="damages",
+                analysis=AnalysisDamagesEnum.DAMAGES,
+                event_type=EventTypeEnum.EVENT,
+                damage_curve=damage_curve,
+                chunk_size=chunk_size,
+            )
+            _graph_file_hazard = NetworkFile(
+                name="base_network_hazard.feather", folder=_graph_folder
+            )
+            _analysis_input = self._get_analysis_input(_analysis, _graph_file_hazard)
+            _analysis_input.output_path = _output_path
+            return Damages(_analysis_input, _base_graph_hazard.get_graph()).execute()
+
+        # 2. Run test.
+        _result = execute_damages(None)
+        _result_in_chunks = execute_damages(17)
+
+        # 3. Verify expectations.
+        _segment_based_result = _result.segment_based_result.analysis_result
+        # The complete result is streamed to an intermediate file, as
+        # `save_parquet` is not requested.
+        _result_file = _result_in_chunks.segment_based_result.analysis_result_file
+        assert _result_file == _output_path.joinpath(
+            "damages", "damages_segmented.intermediate.parquet"
+        )
+        _expected_file_result = cast_object_columns_to_str(
+            _segment_based_result.set_crs("epsg:4326", allow_override=True)
+        ).reset_index(drop=True)
+        pd.testing.assert_frame_equal(
+            gpd.read_parquet(_result_file), _expected_file_result
+        )
+        # Only the columns to derive the link based result are kept in memory.
+        _result_columns = _result_in_chunks.segment_based_result.analysis_result.columns
+        assert "geometry" not in _result_columns
+        pd.testing.assert_frame_equal(
+            pd.DataFrame(_result_in_chunks.segment_based_result.analysis_result),
+            pd.DataFrame(_segment_based_result[_result_columns]),
+        )
+        pd.testing.assert_frame_equal(
+            _result_in_chunks.link_based_result.analysis_result,
+            _result.link_based_result.analysis_result,
+        )
+
+    def test_get_result_link_based_aggregates_segments(self):
+        # 1. Define test data.
+        _analysis_input = self._get_analysis_input(
+            AnalysisSectionDamages(
+                name="damages",
+                event_type=EventTypeEnum.EVENT,
+                damage_curve=DamageCurveEnum.HZ,
+            )
+        )
+        _base_graph_hazard = MultiGraph()
+        _base_graph_hazard.add_edge(0, 1, rfid_c=[1, 2, 3])
+        _base_graph_hazard.add_edge(1, 2, rfid_c=4)
+        _base_graph_hazard.add_edge(2, 3, rfid_c=[5])
+        _result_segment_based = pd.DataFrame(
+            {
+                "rfid_c": [1, 2, 3, 4, 5],
+                "F_EV1_me": [0.1, np.nan, 0.3, 0.4, np.nan],
+                "dam_EV1_HZ": [1.004, np.nan, 2.0, 3.456, np.nan],
+            }
+        )
+
+        # 2. Run test.
+        _result = Damages(_analysis_input, _base_graph_hazard)._get_result_link_based(
+            _base_graph_hazard, _result_segment_based
+        )
+
+        # 3. Verify expectations.
+        assert list(_result["dam_EV1_HZ"]) == [3.0, 3.46, 0.0]
+        assert _result["dam_EV1_HZ_segments"][0] == pytest.approx(
+            [1.0, np.nan, 2.0], nan_ok=True
+        )
+        assert _result["dam_EV1_HZ_segments"][1] == [3.46]
+        assert np.isnan(_result["dam_EV1_HZ_segments"][2][0])
@@ -1,6 +1,15 @@
 from collections import OrderedDict
+from typing import Iterator
 
-from ra2ce.analysis.damages.damages_lookup import CreateLookupTables, LookUp
+import numpy as np
+import pandas as pd
+import pytest
+
+from ra2ce.analysis.damages.damages_lookup import (
+    CreateLookupTables,
+    LookUp,
+    LookUpMatrix,
+)
 from tests import test_data
 
 _lookup_keys = [
@@ -56,3 +65,68 @@ class TestCreateLookupTables:
         _list_results = list(_result)
         assert len(_list_results) == 4
         assert all(isinstance(_lt, OrderedDict) for _lt in _list_results)
+
+
+class TestLookUpMatrix:
+    @pytest.fixture(name="lookup_matrix")
+    def _get_lookup_matrix(self) -> Iterator[LookUpMatrix]:
+        yield LookUpMatrix.from_dict(
+            {"motorway": {1: 10.0, 2: 20.0}, "track": {1: 1.0, 2: 2.0}}
+        )
+
+    def test_from_dataframe(self):
+        # 1. Define test data.
+        _lookup_df = pd.DataFrame(
+            [[10.0, 20.0], [1.0, 2.0]], index=["motorway", "track"], columns=[1, 2]
+        )
+
+        # 2. Run test.
+        _matrix = LookUpMatrix.from_dataframe(_lookup_df)
+
+        # 3. Verify expectations.
+        assert list(_matrix.road_types) == ["motorway", "track"]
+        assert list(_matrix.lanes) == [1, 2]
+        assert _matrix.values.shape == (2, 2)
+
+    def test_get_values_returns_value_per_row(self, lookup_matrix: LookUpMatrix):
+        # 1. Define test data.
+        _road_types = pd.Series(["track", "motorway", "motorway", "track"])
+        _lanes = pd.Series([1.0, 2.0, 1.0, 2.0])
+
+        # 2. Run test.
+        _values = lookup_matrix.get_values(_road_types, _lanes)
+
+        # 3. Verify expectations.
+        assert list(_values) == [1.0, 20.0, 10.0, 2.0]
+
+    @pytest.mark.parametrize(
+        "road_type, lanes",
+        [
+            pytest.param("unknown", 1, id="Unknown road type"),
+            pytest.param("track", 3, id="Unknown lanes"),
+            pytest.param("track", np.nan, id="Missing lanes"),
+        ],
+    )
+    def test_get_values_with_unknown_key_raises(
+        self, lookup_matrix: LookUpMatrix, road_type: str, lanes: float
+    ):
+        # 1. Run test.
+        with pytest.raises(KeyError):
+            lookup_matrix.get_values(pd.Series([road_type]), pd.Series([lanes]))
+
+    def test_get_values_matches_huizinga_lookup(self):
+        # 1. Define test data.
+        _huizinga = LookUp.get_max_damages_huizinga()
+        _road_types, _lanes = zip(
+            *((_rt, _lane) for _rt, _v in _huizinga.items() for _lane in _v)
+        )
+
+        # 2. Run test.
+        _values = LookUpMatrix.from_dict(_huizinga).get_values(
+            pd.Series(_road_types), pd.Series(_lanes)
+        )
+
+        # 3. Verify expectations.
+        assert list(_values) == [
+            _huizinga[_rt][_lane] for _rt, _lane in zip(_road_types, _lanes)
+        ]
@@ -1,4 +1,6 @@
+import numpy as np
 import pandas as pd
+import pytest
 
 from ra2ce.analysis.analysis_config_data.enums.risk_calculation_mode_enum import (
     RiskCalculationModeEnum,
@@ -44,3 +46,149 @@ class TestRiskCalculation:
             rtol=1e-0,
             atol=1e-2,
         )
+
+    @staticmethod
+    def _get_previous_risk(
+        losses_gdf: pd.DataFrame, mode: RiskCalculationModeEnum, year: int
+    ) -> np.ndarray:
+        """
+        The risk as calculated before the `RiskCalculationEngine`
+        (`_get_network_risk_calculations` followed by `get_integration_of_df_trapezoidal`),
+        with the losses ordered from large to small return period.
+        """
+        _loss_columns = sorted(
+            (c for c in losses_gdf.columns if c.startswith("vlh_")),
+            key=lambda c: float(c.split("_")[1].replace("RP", "")),
+            reverse=True,
+        )
+        _to_integrate = losses_gdf[_loss_columns].copy()
+        _to_integrate.columns = [
+            float(c.split("_")[1].replace("RP", "")) for c in _to_integrate.columns
+        ]
+        _return_periods = list(_to_integrate.columns)
+        _max_return_period = max(_return_periods)
+
+        if mode == RiskCalculationModeEnum.DEFAULT:
+            _to_integrate[float("inf")] = _to_integrate[_max_return_period]
+            _to_integrate = _to_integrate.sort_index(
+                axis="columns", ascending=False
+            ).fillna(0)
+        elif mode == RiskCalculationModeEnum.TRIANGLE_TO_NULL_YEAR:
+            _to_integrate[float("inf")] = _to_integrate[_max_return_period]
+            _to_integrate[year or 1] = 0
+            _to_integrate = _to_integrate.sort_index(
+                axis="columns", ascending=False
+            ).fillna(0)
+        elif year >= _max_return_period:
+            _to_integrate = _to_integrate.fillna(0)
+            _to_integrate[year] = _to_integrate[_max_return_period]
+            _to_integrate[float("inf")] = _to_integrate[_max_return_period]
+            _to_integrate = _to_integrate[[year, float("inf")]]
+        elif year in _return_periods:
+            _to_integrate = _to_integrate.drop(
+                columns=[rp for rp in _return_periods if rp < year]
+            )
+        else:
+            _to_integrate[float("inf")] = _to_integrate[_max_return_period]
+            _to_integrate[year] = np.nan
+            _to_integrate = _to_integrate.interpolate(method="index", axis=1)
+            _to_integrate = _to_integrate.drop(
+                columns=[c for c in _to_integrate.columns if c < year]
+            ).fillna(0)
+            _to_integrate = _to_integrate[sorted(_to_integrate.columns, reverse=True)]
+
+        _frequencies = sorted(1 / rp for rp in _to_integrate.columns)
+        return np.trapezoid(_to_integrate.values, _frequencies, axis=1)
+
+    @pytest.mark.parametrize(
+        "mode, year",
+        [
+            pytest.param(RiskCalculationModeEnum.DEFAULT, 0, id="default"),
+            pytest.param(RiskCalculationModeEnum.CUT_FROM_YEAR, 20, id="cut_from_20"),
+            pytest.param(RiskCalculationModeEnum.CUT_FROM_YEAR, 50, id="cut_from_50"),
+            pytest.param(RiskCalculationModeEnum.CUT_FROM_YEAR, 75, id="cut_from_75"),
+            pytest.param(RiskCalculationModeEnum.CUT_FROM_YEAR, 500, id="cut_from_500"),
+            pytest.param(RiskCalculationModeEnum.CUT_FROM_YEAR, 750, id="cut_from_750"),
+            pytest.param(
+                RiskCalculationModeEnum.CUT_FROM_YEAR, 1000, id="cut_from_max"
+            ),
+            pytest.param(
+                RiskCalculationModeEnum.CUT_FROM_YEAR, 2000, id="cut_from_above"
+            ),
+            pytest.param(
+                RiskCalculationModeEnum.TRIANGLE_TO_NULL_YEAR, 0, id="triangle_0"
+            ),
+            pytest.param(
+                RiskCalculationModeEnum.TRIANGLE_TO_NULL_YEAR, 5, id="triangle_5"
+            ),
+        ],
+    )
+    def test_risk_calculation_equals_previous_risk(
+        self, mode: RiskCalculationModeEnum, year: int
+    ):
+        # 1. Define test data.
+        _return_periods = [10, 50, 100, 500, 1000]
+        _rng = np.random.default_rng(42)
+        _losses = _rng.uniform(0, 1000, size=(40, len(_return_periods)))
+        # Missing losses, including rows without any (known) losses.
+        _losses[_rng.uniform(size=_losses.shape) < 0.3] = np.nan
+        _losses[0] = np.nan
+        _losses_gdf = pd.DataFrame(
+            {
+                f"RP{_return_period}_me": np.ones(len(_losses))
+                for _return_period in _return_periods
+            }
+            | {
+                f"vlh_RP{_return_period}_total": _losses[:, j]
+                for j, _return_period in enumerate(_return_periods)
+            }
+        )
+
+        # 2. Run test.
+        _risk = RiskCalculationFactory.get_risk_calculation(
+            risk_calculation_mode=mode,
+            risk_calculation_year=year,
+            losses_gdf=_losses_gdf,
+        ).get_integration_of_df_trapezoidal()
+
+        # 3. Verify expectations.
+        np.testing.assert_allclose(
+            _risk, self._get_previous_risk(_losses_gdf, mode, year)
+        )
+
+    @pytest.mark.parametrize(
+        "mode, year, expected_risk",
+        [
+            pytest.param(RiskCalculationModeEnum.DEFAULT, 0, 6.55, id="default"),
+            pytest.param(
+                RiskCalculationModeEnum.CUT_FROM_YEAR, 50, 3.15, id="cut_from_50"
+            ),
+        ],
+    )
+    def test_risk_calculation_integrates_by_return_period(
+        self, mode: RiskCalculationModeEnum, year: int, expected_risk: float
+    ):
+        # 1. Define test data.
+        # The (text) order of the loss columns differs from the order of the return periods.
+        _losses_gdf = pd.DataFrame(
+            {
+                "RP10_me": [1.0],
+                "RP50_me": [1.0],
+                "RP100_me": [1.0],
+                "RP500_me": [1.0],
+                "vlh_RP10_total": [10.0],
+                "vlh_RP50_total": [50.0],
+                "vlh_RP100_total": [100.0],
+                "vlh_RP500_total": [500.0],
+            }
+        )
+
+        # 2. Run test.
+        _risk = RiskCalculationFactory.get_risk_calculation(
+            risk_calculation_mode=mode,
+            risk_calculation_year=year,
+            losses_gdf=_losses_gdf,
+        ).get_integration_of_df_trapezoidal()
+
+        # 3. Verify expectations.
+        np.testing.assert_allclose(_risk, np.array([expected_risk]))
@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ra2ce.analysis.analysis_config_data.enums.risk_calculation_mode_enum import (
+    RiskCalculationModeEnum,
+)
+from ra2ce.analysis.risk_calculation_engine import RiskCalculationEngine
+
+
+class TestRiskCalculationEngine:
+    @pytest.fixture(name="risk_calculation_engine")
+    def _get_risk_calculation_engine(self) -> RiskCalculationEngine:
+        _to_integrate = pd.DataFrame({10.0: [10.0, np.nan], 100.0: [100.0, np.nan]})
+        return RiskCalculationEngine.from_dataframes(
+            {"A": _to_integrate, "B": 2 * _to_integrate}
+        )
+
+    def test_from_dataframes(self, risk_calculation_engine: RiskCalculationEngine):
+        # 1. Verify expectations.
+        assert risk_calculation_engine.curve_names == ["A", "B"]
+        np.testing.assert_array_equal(
+            risk_calculation_engine.frequencies, np.array([0.01, 0.1])
+        )
+        assert risk_calculation_engine.values.shape == (2, 2, 2)
+        np.testing.assert_array_equal(
+            risk_calculation_engine.values[0], np.array([[100.0, 10.0], [200.0, 20.0]])
+        )
+        assert risk_calculation_engine.min_return_period == 10
+        assert risk_calculation_engine.max_return_period == 100
+
+    def test_from_dataframes_with_different_return_periods_raises(self):
+        # 1. Define test data.
+        _to_integrate_dict = {
+            "A": pd.DataFrame({10.0: [1.0], 100.0: [2.0]}),
+            "B": pd.DataFrame({10.0: [1.0], 50.0: [2.0]}),
+        }
+
+        # 2. Run test.
+        with pytest.raises(ValueError) as exc_err:
+            RiskCalculationEngine.from_dataframes(_to_integrate_dict)
+
+        # 3. Verify expectations.
+        assert "same return periods" in str(exc_err.value)
+
+    @pytest.mark.parametrize(
+        "mode, year, expected_risk",
+        [
+            pytest.param(RiskCalculationModeEnum.DEFAULT, 0, 5.95, id="default"),
+            pytest.param(
+                RiskCalculationModeEnum.CUT_FROM_YEAR, 20, 4.2, id="cut_from_between"
+            ),
+            pytest.param(
+                RiskCalculationModeEnum.CUT_FROM_YEAR, 100, 1.0, id="cut_from_max"
+            ),
+            pytest.param(
+                RiskCalculationModeEnum.CUT_FROM_YEAR, 1000, 0.1, id="cut_from_above"
+            ),
+            pytest.param(
+                RiskCalculationModeEnum.TRIANGLE_TO_NULL_YEAR, 2, 7.95, id="triangle"
+            ),
+        ],
+    )
+    def test_get_risk(
+        self,
+        risk_calculation_engine: RiskCalculationEngine,
+        mode: RiskCalculationModeEnum,
+        year: int,
+        expected_risk: float,
+    ):
+        # 1. Run test.
+        _risk = risk_calculation_engine.get_risk(mode, year)
+
+        # 2. Verify expectations.
+        np.testing.assert_allclose(
+            _risk, np.array([[expected_risk, 2 * expected_risk], [0.0, 0.0]])
+        )
+
+    def test_get_risk_cut_from_year_interpolates_missing_values(self):
+        # 1. Define test data.
+        _engine = RiskCalculationEngine.from_dataframes(
+            {"A": pd.DataFrame({10.0: [10.0], 50.0: [np.nan], 100.0: [100.0]})}
+        )
+
+        # 2. Run test.
+        _risk = _engine.get_risk(RiskCalculationModeEnum.CUT_FROM_YEAR, 20)
+
+        # 3. Verify expectations.
+        np.testing.assert_allclose(_risk, np.array([[4.2]]))
+
+    def test_get_risk_cut_from_known_return_period_excludes_tail(self):
+        # 1. Define test data.
+        _engine = RiskCalculationEngine.from_dataframes(
+            {"A": pd.DataFrame({10.0: [10.0], 50.0: [50.0], 100.0: [100.0]})}
+        )
+
+        # 2. Run test.
+        _risk = _engine.get_risk(RiskCalculationModeEnum.CUT_FROM_YEAR, 50)
+
+        # 3. Verify expectations.
+        np.testing.assert_allclose(_risk, np.array([[0.75]]))
+
+    @pytest.mark.parametrize(
+        "mode, year",
+        [
+            pytest.param(RiskCalculationModeEnum.CUT_FROM_YEAR, 10, id="cut_from"),
+            pytest.param(
+                RiskCalculationModeEnum.TRIANGLE_TO_NULL_YEAR, 10, id="triangle"
+            ),
+        ],
+    )
+    def test_get_risk_with_invalid_year_raises(
+        self,
+        risk_calculation_engine: RiskCalculationEngine,
+        mode: RiskCalculationModeEnum,
+        year: int,
+    ):
+        # 1. Run test.
+        with pytest.raises(ValueError) as exc_err:
+            risk_calculation_engine.get_risk(mode, year)
+
+        # 2. Verify expectations.
+        assert "RA2CE cannot calculate risk" in str(exc_err.value)
+
+    def test_get_risk_with_invalid_mode_raises(
+        self, risk_calculation_engine: RiskCalculationEngine
+    ):
+        # 1. Run test.
+        with pytest.raises(NotImplementedError):
+            risk_calculation_engine.get_risk(RiskCalculationModeEnum.INVALID, 0)
@@ -1,8 +1,10 @@
 import shutil
 from pathlib import Path
 
+import pyarrow as pa
 import pytest
 from geopandas import GeoDataFrame
+from shapely.geometry import Point
 
 from ra2ce.network.exporters.geodataframe_network_exporter import (
     GeoDataFrameNetworkExporter,
@@ -60,3 +62,32 @@ class TestGeodataframeNetworkExporter:
         # 3. Verify final expectations.
         assert _output_dir.is_dir()
         assert (_output_dir / (_basename + ".feather")).is_file()
+
+    def test_export_to_pickle_writes_uncompressed_feather(
+        self, test_result_param_case: Path
+    ):
+        # 1. Define test data.
+        _output_dir = test_result_param_case
+        if _output_dir.is_dir():
+            shutil.rmtree(_output_dir)
+        _output_dir.mkdir(parents=True)
+
+        _exporter = GeoDataFrameNetworkExporter(
+            basename="dummy_test", export_types=["pickle"]
+        )
+        _export_data = GeoDataFrame(
+            {"rfid": range(100)},
+            geometry=[Point(_x, 0) for _x in range(100)],
+            crs="EPSG:4326",
+        )
+
+        # 2. Run test.
+        _exporter.export_to_pickle(_output_dir, _export_data)
+
+        # 3. Verify final expectations.
+        assert _exporter.pickle_path == _output_dir.joinpath("dummy_test.feather")
+        # An uncompressed file is memory-mapped without allocating (copying) its data.
+        _allocated_bytes = pa.total_allocated_bytes()
+        _table = pa.ipc.open_file(pa.memory_map(str(_exporter.pickle_path))).read_all()
+        assert _table.num_rows == 100
+        assert pa.total_allocated_bytes() == _allocated_bytes
@@ -1,12 +1,15 @@
 import shutil
 
+import networkx as nx
 import pytest
 
 from ra2ce.common.io.writers.ra2ce_exporter_protocol import Ra2ceExporterProtocol
+from ra2ce.network.compact_graph import CompactGraph
 from ra2ce.network.exporters.multi_graph_network_exporter import (
     MultiGraphNetworkExporter,
 )
 from ra2ce.network.exporters.network_exporter_base import NetworkExporterBase
+from ra2ce.network.graph_files.graph_file import GraphFile
 from tests import test_results
 
 
@@ -58,3 +61,59 @@ class TestMultigraphNetworkExporter:
 
         # 3. Verify expectations.
         assert _test_dir.exists()
+
+    def test_export_to_graph(self, request: pytest.FixtureRequest):
+        # 1. Define test data.
+        _basename = "dummy_test"
+        _exporter = MultiGraphNetworkExporter(
+            basename=_basename, export_types=["graph"]
+        )
+        _test_dir = test_results / request.node.name
+        if _test_dir.is_dir():
+            shutil.rmtree(_test_dir)
+        _graph = nx.MultiGraph([(1, 2), (2, 3)])
+
+        # 2. Run test.
+        _exporter.export(_test_dir, _graph)
+
+        # 3. Verify expectations.
+        assert _exporter.pickle_path == _test_dir.joinpath(_basename + ".graph")
+        _exported_graph = CompactGraph.from_file(_exporter.pickle_path).to_graph()
+        assert list(_exported_graph.edges(keys=True)) == list(_graph.edges(keys=True))
+
+    @pytest.mark.parametrize(
+        "export_type, previous_export_type",
+        [
+            pytest.param("graph", "pickle", id="Graph replaces pickle"),
+            pytest.param("pickle", "graph", id="Pickle replaces graph"),
+        ],
+    )
+    def test_export_removes_previous_graph_format(
+        self,
+        export_type: str,
+        previous_export_type: str,
+        request: pytest.FixtureRequest,
+    ):
+        # 1. Define test data.
+        _basename = "dummy_test"
+        _test_dir = test_results / request.node.name
+        if _test_dir.is_dir():
+            shutil.rmtree(_test_dir)
+        _test_dir.mkdir(parents=True)
+        _previous_exporter = MultiGraphNetworkExporter(
+            basename=_basename, export_types=[previous_export_type]
+        )
+        _previous_exporter.export(_test_dir, nx.MultiGraph([(1, 2)]))
+        _exporter = MultiGraphNetworkExporter(
+            basename=_basename, export_types=[export_type]
+        )
+
+        # 2. Run test.
+        _exporter.export(_test_dir, nx.MultiGraph([(1, 2), (2, 3)]))
+
+        # 3. Verify expectations.
+        assert _exporter.pickle_path.exists()
+        assert not _previous_exporter.pickle_path.exists()
+        _graph_file = GraphFile(name=_basename + ".p")
+        _graph_file.read_graph(_test_dir)
+        assert list(_graph_file.graph.edges()) == [(1, 2), (2, 3)]
@@ -1,9 +1,13 @@
+import shutil
 from pathlib import Path
 
+import pytest
 from networkx import MultiGraph
 
+from ra2ce.network.compact_graph import CompactGraph
 from ra2ce.network.graph_files.graph_file import GraphFile
 from ra2ce.network.graph_files.graph_files_protocol import GraphFileProtocol
+from tests import test_results
 
 
 class TestGraphFile:
@@ -34,6 +38,62 @@ class TestGraphFile:
         assert _gf.file == _file
         assert _gf.graph is not None
 
+    def test_read_graph_from_columnar_format(
+        self, graph_folder: Path, request: pytest.FixtureRequest
+    ):
+        # 1. Define test data
+        _name = "base_graph.p"
+        _graph = GraphFile(name=_name, folder=graph_folder).get_graph()
+        _test_folder = test_results.joinpath(request.node.name)
+        if _test_folder.exists():
+            shutil.rmtree(_test_folder)
+        _file = _test_folder.joinpath("base_graph.graph")
+        CompactGraph.from_graph(_graph).export(_file)
+        _gf = GraphFile(name=_name)
+
+        # 2. Execute test
+        _gf.read_graph(_test_folder)
+
+        # 3. Verify results
+        assert _gf.file == _file
+        assert isinstance(_gf.graph, MultiGraph)
+        assert list(_gf.graph.edges(keys=True)) == list(_graph.edges(keys=True))
+
+    def test_locate_does_not_read_graph(self, graph_folder: Path):
+        # 1. Define test data
+        _name = "base_graph.p"
+        _gf = GraphFile(name=_name)
+
+        # 2. Execute test
+        _gf.locate(graph_folder)
+
+        # 3. Verify results
+        assert _gf.file == graph_folder.joinpath(_name)
+        assert _gf.graph is None
+
+    def test_locate_without_file_keeps_folder_none(self, graph_folder: Path):
+        # 1. Define test data
+        _gf = GraphFile(name="unknown_graph.p")
+
+        # 2. Execute test
+        _gf.locate(graph_folder)
+
+        # 3. Verify results
+        assert _gf.file is None
+
+    def test_unload_rereads_graph(self, graph_folder: Path):
+        # 1. Define test data
+        _gf = GraphFile(name="base_graph.p", folder=graph_folder)
+        _graph = _gf.get_graph()
+
+        # 2. Execute test
+        _gf.unload()
+
+        # 3. Verify results
+        assert _gf.graph is None
+        assert _gf.get_graph() is not _graph
+        assert list(_gf.graph.edges(keys=True)) == list(_graph.edges(keys=True))
+
     def test_get_graph_without_graph_is_none(self):
         # 1. Define test data
         _gf = GraphFile()
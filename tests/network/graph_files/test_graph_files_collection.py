@@ -4,7 +4,7 @@ import pytest
 
 from ra2ce.network.graph_files.graph_files_collection import GraphFilesCollection
 from ra2ce.network.graph_files.graph_files_protocol import GraphFileProtocol
-from tests import test_data
+from tests import test_data, test_results
 
 
 class TestGraphFilesCollection:
@@ -53,6 +53,43 @@ class TestGraphFilesCollection:
 
         # 3. Verify results
         assert _collection.base_graph.file == _file
+        assert not _collection.has_graphs()
+        assert _collection.get_graph("base_graph") is not None
+
+    def test_unload(self):
+        # 1. Define test data
+        _collection = GraphFilesCollection.set_files(
+            test_data.joinpath("readers_test_data")
+        )
+        _collection.get_graph("base_graph")
+        _collection.set_graph("origins_destinations_graph", "JustNotNone")
+
+        # 2. Execute test
+        _collection.unload()
+
+        # 3. Verify results
+        assert _collection.base_graph.graph is None
+        assert _collection.origins_destinations_graph.graph == "JustNotNone"
+
+    def test_remove_file(self, request: pytest.FixtureRequest):
+        # 1. Define test data
+        _dir = test_results.joinpath(request.node.name)
+        _dir.mkdir(parents=True, exist_ok=True)
+        _dir.joinpath("base_graph.p").touch()
+        _dir.joinpath("base_graph.graph").mkdir(exist_ok=True)
+        _dir.joinpath("base_network.feather").touch()
+        _collection = GraphFilesCollection.set_files(_dir)
+        _collection.set_graph("base_graph", "JustNotNone")
+
+        # 2. Execute test
+        _collection.remove_file("base_graph")
+
+        # 3. Verify results
+        assert _collection.base_graph.file is None
+        assert _collection.base_graph.graph is None
+        assert not _dir.joinpath("base_graph.p").exists()
+        assert not _dir.joinpath("base_graph.graph").exists()
+        assert _collection.base_network.file == _dir.joinpath("base_network.feather")
 
     def test_get_file(self):
         # 1. Define test data
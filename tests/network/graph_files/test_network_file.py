@@ -1,7 +1,11 @@
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather
 import pytest
-from geopandas import GeoDataFrame
+from geopandas import GeoDataFrame, points_from_xy
 
 from ra2ce.network.graph_files.graph_files_protocol import GraphFileProtocol
 from ra2ce.network.graph_files.network_file import NetworkFile
@@ -47,6 +51,30 @@ class TestNetworkFile:
         # 3. Verify results
         assert exc.match("Unknown file type")
 
+    def test_locate_does_not_read_graph(self, graph_folder: Path):
+        # 1. Define test data
+        _name = "base_network.feather"
+        _nf = NetworkFile(name=_name)
+
+        # 2. Execute test
+        _nf.locate(graph_folder)
+
+        # 3. Verify results
+        assert _nf.file == graph_folder.joinpath(_name)
+        assert _nf.graph is None
+        assert isinstance(_nf.get_graph(), GeoDataFrame)
+
+    def test_unload_without_file_keeps_graph(self):
+        # 1. Define test data
+        _graph = GeoDataFrame()
+        _nf = NetworkFile(name="base_network.feather", graph=_graph)
+
+        # 2. Execute test
+        _nf.unload()
+
+        # 3. Verify results
+        assert _nf.graph is _graph
+
     def test_get_graph_without_graph_is_none(self):
         # 1. Define test data
         _nf = NetworkFile()
@@ -70,3 +98,163 @@ class TestNetworkFile:
         assert _graph is not None
         assert len(_graph) == len(_nf.graph)
         assert isinstance(_graph, GeoDataFrame)
+
+    @pytest.mark.parametrize("name", ["base_network.feather", "base_graph_edges.gpkg"])
+    @pytest.mark.parametrize(
+        "read_first", [True, False], ids=["in memory", "from file"]
+    )
+    def test_get_graph_chunks(self, graph_folder: Path, name: str, read_first: bool):
+        # 1. Define test data
+        _nf = NetworkFile(name=name, folder=graph_folder)
+        _reference = NetworkFile(name=name)
+        _reference.read_graph(graph_folder)
+        _reference = _reference.graph
+        if read_first:
+            _nf.read_graph(graph_folder)
+
+        # 2. Execute test
+        _chunks = list(_nf.get_graph_chunks(7))
+
+        # 3. Verify results
+        assert all(isinstance(_chunk, GeoDataFrame) for _chunk in _chunks)
+        assert all(len(_chunk) <= 7 for _chunk in _chunks)
+        _result = pd.concat(_chunks)
+        assert _result.crs == _reference.crs
+        assert list(_result.index) == list(range(len(_reference)))
+        assert _result.geometry.geom_equals(_reference.geometry).all()
+
+    def test_get_graph_chunks_in_memory_are_copies(self, graph_folder: Path):
+        # 1. Define test data
+        _nf = NetworkFile(name="base_network.feather")
+        _nf.read_graph(graph_folder)
+        _lengths = _nf.graph["length"].copy()
+
+        # 2. Execute test
+        for _chunk in _nf.get_graph_chunks(7):
+            _chunk["length"] = -1.0
+
+        # 3. Verify results
+        pd.testing.assert_series_equal(_nf.graph["length"], _lengths)
+
+    @pytest.mark.parametrize("name", ["base_network.feather", "base_graph_edges.gpkg"])
+    def test_get_graph_chunks_with_columns(self, graph_folder: Path, name: str):
+        # 1. Define test data
+        _nf = NetworkFile(name=name, folder=graph_folder)
+
+        # 2. Execute test
+        _chunks = list(_nf.get_graph_chunks(10, columns=["length"]))
+
+        # 3. Verify results
+        assert all(list(_chunk.columns) == ["length"] for _chunk in _chunks)
+        assert all(not isinstance(_chunk, GeoDataFrame) for _chunk in _chunks)
+
+    @pytest.mark.parametrize("name", ["base_network.feather", "base_graph_edges.gpkg"])
+    @pytest.mark.parametrize(
+        "read_first", [True, False], ids=["in memory", "from file"]
+    )
+    @pytest.mark.parametrize(
+        "columns",
+        [pytest.param(None, id="all columns"), ["rfid", "geometry"], ["rfid"]],
+    )
+    def test_get_graph_with_columns_and_filters(
+        self, graph_folder: Path, name: str, read_first: bool, columns: list[str]
+    ):
+        # 1. Define test data
+        _filters = [[("length", ">", 100), ("rfid", "!=", 3)], [("rfid", "in", [1, 2])]]
+        _nf = NetworkFile(name=name, folder=graph_folder)
+        _reference = NetworkFile(name=name, folder=graph_folder).get_graph()
+        _reference = _reference[
+            ((_reference["length"] > 100) & (_reference["rfid"] != 3))
+            | _reference["rfid"].isin([1, 2])
+        ]
+        if columns:
+            _reference = _reference[columns]
+        if read_first:
+            _nf.get_graph()
+
+        # 2. Execute test
+        _graph = _nf.get_graph(columns=columns, filters=_filters)
+
+        # 3. Verify results
+        assert 0 < len(_graph) < len(_nf.get_graph())
+        assert list(_graph.columns) == list(_reference.columns)
+        assert list(_graph.index) == list(_reference.index)
+        assert isinstance(_graph, GeoDataFrame) == isinstance(_reference, GeoDataFrame)
+        pd.testing.assert_series_equal(_graph["rfid"], _reference["rfid"])
+        if "geometry" in _graph.columns:
+            assert _graph.crs == _reference.crs
+            assert _graph.geometry.geom_equals(_reference.geometry).all()
+
+    def test_get_graph_with_columns_does_not_keep_graph(self, graph_folder: Path):
+        # 1. Define test data
+        _nf = NetworkFile(name="base_network.feather", folder=graph_folder)
+
+        # 2. Execute test
+        _graph = _nf.get_graph(columns=["length"])
+
+        # 3. Verify results
+        assert list(_graph.columns) == ["length"]
+        assert _nf.graph is None
+
+    def test_get_graph_with_unknown_filter_operator_throws(self, graph_folder: Path):
+        # 1. Define test data
+        _nf = NetworkFile(name="base_graph_edges.gpkg", folder=graph_folder)
+
+        # 2. Execute test
+        with pytest.raises(ValueError) as exc:
+            _nf.get_graph(filters=[("length", "~", 100)])
+
+        # 3. Verify results
+        assert exc.match("Unknown filter operator: ~")
+
+    @pytest.mark.parametrize("name", ["base_network.feather", "base_graph_edges.gpkg"])
+    def test_get_columns(self, graph_folder: Path, name: str):
+        # 1. Define test data
+        _nf = NetworkFile(name=name, folder=graph_folder)
+
+        # 2. Execute test
+        _columns = _nf.get_columns()
+
+        # 3. Verify results
+        assert sorted(_columns) == sorted(_nf.get_graph().columns)
+        assert _nf.get_columns() == list(_nf.graph.columns)
+
+    def test_get_graph_chunks_invalid_chunk_size_throws(self, graph_folder: Path):
+        # 1. Define test data
+        _nf = NetworkFile(name="base_network.feather", folder=graph_folder)
+
+        # 2. Execute test
+        with pytest.raises(ValueError) as exc:
+            list(_nf.get_graph_chunks(0))
+
+        # 3. Verify results
+        assert exc.match("Chunk size should be a positive number")
+
+    def test_get_graph_chunks_compressed_does_not_read_whole_graph(
+        self, test_result_param_case: Path
+    ):
+        # 1. Define test data
+        _chunk_size = 1000
+        _n_rows = 200 * _chunk_size
+        _graph = GeoDataFrame(
+            {"length": np.random.default_rng(42).random(_n_rows)},
+            geometry=points_from_xy(np.arange(_n_rows), np.arange(_n_rows)),
+            crs="EPSG:4326",
+        )
+        test_result_param_case.mkdir(parents=True, exist_ok=True)
+        _graph.to_feather(
+            test_result_param_case.joinpath("base_network.feather"),
+            compression="lz4",
+            chunksize=_chunk_size,
+        )
+        _nf = NetworkFile(name="base_network.feather", folder=test_result_param_case)
+        _table_size = pa.feather.read_table(_nf.file).nbytes
+        _allocated_before = pa.total_allocated_bytes()
+
+        # 2. Execute test
+        _chunks = _nf.get_graph_chunks(_chunk_size)
+        _chunk = next(_chunks)
+
+        # 3. Verify results
+        assert len(_chunk) == _chunk_size
+        assert pa.total_allocated_bytes() - _allocated_before < _table_size / 10
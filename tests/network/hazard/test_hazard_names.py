@@ -72,6 +72,33 @@ class TestHazardNames:
         assert _hazard_names.names_df.equals(pd.read_excel(_file))
         assert _hazard_names.names == ["a", "b", "c"]
 
+    def test_export_and_create_from_json_file(self, hazard_names_file: Path):
+        # 1. Define test data
+        _json_file = hazard_names_file.with_suffix(".json")
+        _hazard_names = HazardNames.from_file(hazard_names_file)
+
+        # 2. Run test
+        _hazard_names.export(_json_file)
+        _json_hazard_names = HazardNames.from_file(_json_file)
+
+        # 3. Verify expectations
+        assert _json_hazard_names.names_df.equals(_hazard_names.names_df)
+        assert _json_hazard_names.names == ["a", "b", "c"]
+        assert _json_hazard_names.get_name("b") == "B"
+
+    def test_create_from_config_prefers_json_file(self, hazard_names_file: Path):
+        # 1. Define test data
+        _names_df = pd.DataFrame([["d", "D"]], columns=["File name", "RA2CE name"])
+        HazardNames(names_df=_names_df).export(hazard_names_file.with_suffix(".json"))
+        _analysis_config = AnalysisConfigWrapper()
+        _analysis_config.config_data.static_path = hazard_names_file.parent.parent
+
+        # 2. Run test
+        _hazard_names = HazardNames.from_config(_analysis_config)
+
+        # 3. Verify expectations
+        assert _hazard_names.names == ["d"]
+
     def test_get_name(self, hazard_names_file: Path):
         # 1. Define test data
         _file = hazard_names_file
@@ -82,3 +109,15 @@ class TestHazardNames:
 
         # 3. Verify expectations
         assert _name == "A"
+
+    def test_get_name_of_duplicate_hazard_returns_first(self):
+        # 1. Define test data
+        _data = [["a", "EV1_ma"], ["a", "EV1_fr"]]
+        _columns = ["File name", "RA2CE name"]
+        _hazard_names = HazardNames(names_df=pd.DataFrame(_data, columns=_columns))
+
+        # 2. Run test
+        _name = _hazard_names.get_name("a")
+
+        # 3. Verify expectations
+        assert _name == "EV1_ma"
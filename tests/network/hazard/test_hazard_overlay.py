@@ -3,6 +3,7 @@ from pathlib import Path
 from ra2ce.network.hazard.hazard_overlay import HazardOverlay
 from ra2ce.network.network_config_data.enums.aggregate_wl_enum import AggregateWlEnum
 from ra2ce.network.network_config_data.network_config_data import NetworkConfigData
+from tests import test_data
 
 
 class TestHazardOverlay:
@@ -22,3 +23,29 @@ class TestHazardOverlay:
         assert any(_hazard.hazard_names)
         assert any(_hazard.ra2ce_names)
         assert any(_hazard.hazard_files.table)
+
+    def test_get_hazard_name_table_with_metadata(self):
+        # 1. Define test data.
+        _hazard_dir = test_data.joinpath("4_analyses_losses", "static", "hazard")
+        _config = NetworkConfigData()
+        _config.static_path = Path("static")
+        _config.hazard.aggregate_wl = AggregateWlEnum.MAX
+        _config.hazard.hazard_crs = "EPSG:32617"
+        _config.hazard.hazard_map = [
+            _hazard_dir.joinpath("future_depth_RP_100_broward.tif"),
+            _hazard_dir.joinpath("future_depth_RP_500_broward.tif"),
+        ]
+
+        # 2. Run test.
+        _table = HazardOverlay(_config, {}).hazard_name_table
+
+        # 3. Verify final expectations.
+        assert _table["RA2CE name"].tolist() == [
+            "RP100_ma",
+            "RP100_fr",
+            "RP500_ma",
+            "RP500_fr",
+        ]
+        assert _table["Return period"].tolist() == ["100", "100", "500", "500"]
+        assert (_table["CRS"] == "EPSG:32617").all()
+        assert _table["Grid signature"].notna().all()
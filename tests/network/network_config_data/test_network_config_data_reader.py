@@ -1,4 +1,5 @@
 from configparser import ConfigParser
+from datetime import date
 from pathlib import Path
 
 import pytest
@@ -10,7 +11,7 @@ from ra2ce.network.network_config_data.network_config_data import NetworkConfigD
 from ra2ce.network.network_config_data.network_config_data_reader import (
     NetworkConfigDataReader,
 )
-from tests import test_data
+from tests import test_data, test_results
 
 
 class TestNetworkConfigDataReader:
@@ -39,3 +40,27 @@ class TestNetworkConfigDataReader:
     def test_read(self, network_ini_filepath: Path):
         _config_data = NetworkConfigDataReader().read(network_ini_filepath)
         assert isinstance(_config_data, NetworkConfigData)
+
+    def test_read_osm_tile_cache_options(self, request: pytest.FixtureRequest):
+        # 1. Define test data.
+        _network_ini = test_results.joinpath(request.node.name, "network.ini")
+        _network_ini.parent.mkdir(parents=True, exist_ok=True)
+        _network_ini.write_text(
+            test_data.joinpath("3_network_osm_download", "network.ini")
+            .read_text()
+            .replace(
+                "[network]\n",
+                "[network]\n"
+                "osm_tile_cache = True\n"
+                "osm_tile_size = 0.1\n"
+                "osm_date = 2026-01-01\n",
+            )
+        )
+
+        # 2. Run test.
+        _network_section = NetworkConfigDataReader().read(_network_ini).network
+
+        # 3. Verify expectations.
+        assert _network_section.osm_tile_cache is True
+        assert _network_section.osm_tile_size == 0.1
+        assert _network_section.osm_date == date(2026, 1, 1)
@@ -0,0 +1,173 @@
+import geopandas as gpd
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import LineString
+
+from ra2ce.network.network_simplification.snkit_network_merge_wrapper import (
+    _EdgeChains,
+    _EdgeIndex,
+)
+from ra2ce.network.network_simplification.snkit_network_wrapper import (
+    SnkitNetworkWrapper,
+)
+
+
+class TestEdgeIndex:
+    @pytest.fixture(name="edge_index")
+    def _get_edge_index(self) -> _EdgeIndex:
+        # 1 -> 2 -> 3, 3 -> 2, 3 -> 3 (self-loop), 4 -> 1
+        _edges = gpd.GeoDataFrame(
+            {"from_id": [1, 2, 3, 3, 4], "to_id": [2, 3, 2, 3, 1]}
+        )
+        return _EdgeIndex.from_edges(_edges)
+
+    def test_get_degrees(self, edge_index: _EdgeIndex):
+        # 1. Run test.
+        _degrees = edge_index.get_degrees(pd.Series([1, 2, 3, 4, 5]))
+
+        # 2. Verify expectations.
+        np.testing.assert_array_equal(_degrees, [2, 3, 3, 1, 0])
+
+    def test_get_neighbours(self, edge_index: _EdgeIndex):
+        # 1. Run test.
+        _neighbours = edge_index.get_neighbours(3)
+
+        # 2. Verify expectations.
+        assert _neighbours == {2, 3}
+        assert edge_index.get_neighbours(5) == set()
+
+    def test_get_incident_edge_positions(self, edge_index: _EdgeIndex):
+        # 1. Run test.
+        _positions = edge_index.get_incident_edge_positions({1, 4})
+
+        # 2. Verify expectations.
+        np.testing.assert_array_equal(_positions, [0, 4])
+        assert len(edge_index.get_incident_edge_positions(set())) == 0
+
+    def test_get_edge_positions(self, edge_index: _EdgeIndex):
+        # 1. Verify expectations.
+        np.testing.assert_array_equal(edge_index.get_edge_positions(3, 2), [2])
+        assert len(edge_index.get_edge_positions(2, 1)) == 0
+
+    @pytest.mark.parametrize(
+        "node_ids, expected_chain_ids",
+        [
+            pytest.param({1, 3}, [0, 1, 1, 1, 0], id="Two chains"),
+            pytest.param({1, 2}, [0, 0, 0, -1, 0], id="Connected nodes"),
+            pytest.param(set(), [-1, -1, -1, -1, -1], id="No nodes"),
+        ],
+    )
+    def test_get_chain_ids(
+        self, edge_index: _EdgeIndex, node_ids: set, expected_chain_ids: list[int]
+    ):
+        # 1. Run test.
+        _chain_ids = edge_index.get_chain_ids(node_ids)
+
+        # 2. Verify expectations.
+        np.testing.assert_array_equal(_chain_ids, expected_chain_ids)
+
+
+class TestMergeEdges:
+    @staticmethod
+    def _get_random_graph(seed: int) -> nx.MultiDiGraph:
+        # Chains of 0 to 4 nodes (one-way or two-way, some looping back)
+        # between random pairs of 8 hubs, with random attributes.
+        _rng = np.random.default_rng(seed)
+        _graph = nx.MultiDiGraph(crs="EPSG:4326")
+        _coords = {_hub: tuple(_rng.uniform(0, 1, 2)) for _hub in range(1, 9)}
+
+        def get_attributes() -> dict:
+            return dict(
+                bridge=_rng.choice(["yes", "None", np.nan]),
+                highway=str(_rng.choice(["primary", "secondary"])),
+                lanes=_rng.choice(["1", "2", np.nan]),
+                rfid_c=int(_rng.integers(100)),
+                maxspeed=float(_rng.choice([30, 50, 80])),
+            )
+
+        for _ in range(14):
+            _from_hub, _to_hub = _rng.choice(np.arange(1, 9), 2, replace=False)
+            _n_nodes = int(_rng.integers(0, 5))
+            _node_ids = [_from_hub]
+            for _step in range(1, _n_nodes + 1):
+                _node_ids.append(len(_coords) + 1)
+                _fraction = _step / (_n_nodes + 1)
+                _coords[_node_ids[-1]] = tuple(
+                    np.multiply(_coords[_from_hub], 1 - _fraction)
+                    + np.multiply(_coords[_to_hub], _fraction)
+                    + _rng.normal(0, 0.01, 2)
+                )
+            _node_ids.append(
+                _from_hub if _n_nodes > 1 and _rng.random() < 0.1 else _to_hub
+            )
+            _is_two_way = _rng.random() < 0.5
+            for _u, _v in zip(_node_ids[:-1], _node_ids[1:]):
+                _attributes = get_attributes()
+                _graph.add_edge(
+                    _u,
+                    _v,
+                    geometry=LineString([_coords[_u], _coords[_v]]),
+                    **_attributes,
+                )
+                if _is_two_way:
+                    _graph.add_edge(
+                        _v,
+                        _u,
+                        geometry=LineString([_coords[_v], _coords[_u]]),
+                        **(_attributes if _rng.random() < 0.8 else get_attributes()),
+                    )
+        for _node_id in _graph.nodes:
+            _graph.nodes[_node_id].update(zip(["x", "y"], _coords[_node_id]))
+        return _graph
+
+    @staticmethod
+    def _get_merged_edges(graph: nx.MultiDiGraph) -> list[tuple]:
+        _wrapper = SnkitNetworkWrapper.from_networkx(
+            graph,
+            dict(
+                node_id_column_name="id",
+                edge_from_id_column_name="from_id",
+                edge_to_id_column_name="to_id",
+            ),
+        )
+        _wrapper.merge_edges(["bridge"])
+
+        def get_value(value):
+            return value.item() if isinstance(value, np.generic) else value
+
+        _edges = _wrapper.snkit_network.edges
+        return sorted(
+            (
+                _row["geometry"].wkt,
+                *(
+                    repr(get_value(_row[_column]))
+                    for _column in sorted(_edges.columns.drop("geometry"))
+                ),
+            )
+            for _, _row in _edges.iterrows()
+        )
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_merge_edges_equals_merging_per_path(
+        self, seed: int, monkeypatch: pytest.MonkeyPatch
+    ):
+        # 1. Define test data.
+        _graph = self._get_random_graph(seed)
+        _get_contractible_chains = _EdgeChains._get_contractible_chains
+        with monkeypatch.context() as _patch:
+            # Merge all chains per path, as before contracting the chains at once.
+            _patch.setattr(
+                _EdgeChains,
+                "_get_contractible_chains",
+                staticmethod(lambda *args: _get_contractible_chains(*args) & False),
+            )
+            _merged_per_path = self._get_merged_edges(_graph.copy())
+
+        # 2. Run test.
+        _merged = self._get_merged_edges(_graph)
+
+        # 3. Verify expectations.
+        assert len(_merged) < _graph.number_of_edges()
+        assert _merged == _merged_per_path
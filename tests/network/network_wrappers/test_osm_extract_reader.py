@@ -0,0 +1,108 @@
+import pytest
+from networkx import MultiDiGraph
+from osmnx._errors import InsufficientResponseError
+from shapely.geometry import LineString, box
+
+from ra2ce.network.network_wrappers.osm_network_wrapper.osm_extract_reader import (
+    OsmExtractReader,
+)
+from tests import test_data
+
+_osm_extract_file = test_data.joinpath(
+    "network", "test_osm_network_wrapper", "osm_extract.osm"
+)
+
+
+class TestOsmExtractReader:
+    @pytest.fixture
+    def _reader_fixture(self) -> OsmExtractReader:
+        assert _osm_extract_file.is_file()
+        yield OsmExtractReader(osm_extract_file=_osm_extract_file)
+
+    def test_given_invalid_polygon_raises(self, _reader_fixture: OsmExtractReader):
+        with pytest.raises(TypeError) as exc_err:
+            _reader_fixture.get_graph_from_polygon(LineString([[0, 0], [1, 0], [1, 1]]))
+
+        assert str(exc_err.value).startswith(
+            "Geometry must be a shapely Polygon or MultiPolygon."
+        )
+
+    @pytest.mark.parametrize(
+        "network_type, custom_filter, expected_way_ids, expected_n_edges",
+        [
+            pytest.param("drive", None, {101, 102, 103, 104}, 12, id="Drive"),
+            pytest.param(
+                "all",
+                '["highway"~"primary|residential"]',
+                {101, 102, 103, 104, 107},
+                14,
+                id="Custom filter",
+            ),
+            pytest.param("walk", None, {101, 102, 103, 104, 105, 106}, 22, id="Walk"),
+        ],
+    )
+    def test_get_graph_from_polygon(
+        self,
+        _reader_fixture: OsmExtractReader,
+        network_type: str,
+        custom_filter: str | None,
+        expected_way_ids: set[int],
+        expected_n_edges: int,
+    ):
+        # 1. Define test data.
+        # Ways 108 (waterway) and 109 (outside of the polygon) are never read.
+        _polygon = box(4.3895, 51.9855, 4.3925, 51.9885)
+
+        # 2. Run test.
+        _graph = _reader_fixture.get_graph_from_polygon(
+            _polygon, network_type=network_type, custom_filter=custom_filter
+        )
+
+        # 3. Verify expectations.
+        assert isinstance(_graph, MultiDiGraph)
+        assert len(_graph.nodes) == 9
+        assert len(_graph.edges) == expected_n_edges
+        assert {_data["osmid"] for *_, _data in _graph.edges(data=True)} == (
+            expected_way_ids
+        )
+        assert all("street_count" in _data for _, _data in _graph.nodes(data=True))
+
+    def test_get_graph_from_polygon_sets_way_tags_and_direction(
+        self, _reader_fixture: OsmExtractReader
+    ):
+        # 1. Define test data.
+        _polygon = box(4.3895, 51.9855, 4.3925, 51.9885)
+
+        # 2. Run test.
+        _graph = _reader_fixture.get_graph_from_polygon(_polygon, network_type="drive")
+
+        # 3. Verify expectations.
+        _edges_per_way = {}
+        for _, _, _data in _graph.edges(data=True):
+            _edges_per_way.setdefault(_data["osmid"], []).append(_data)
+
+        # Two-way road, with the tags stored by GDAL in its `other_tags` field.
+        assert len(_edges_per_way[101]) == 4
+        assert all(
+            _data["name"] == "Main street"
+            and _data["maxspeed"] == "50"
+            and _data["lanes"] == "2"
+            and _data["oneway"] is False
+            for _data in _edges_per_way[101]
+        )
+        # One-way roads, in (`oneway=yes`) and against (`oneway=-1`) the way direction.
+        assert len(_edges_per_way[102]) == 2
+        assert len(_edges_per_way[103]) == 2
+        assert all(_data["oneway"] for _data in _edges_per_way[103])
+        assert all(_data["length"] > 0 for _data in _edges_per_way[104])
+
+    def test_get_graph_from_polygon_without_ways_raises(
+        self, _reader_fixture: OsmExtractReader
+    ):
+        # 1. Define test data.
+        _polygon = box(5.0, 52.5, 5.001, 52.501)
+
+        # 2. Run test.
+        # Same as an empty response of the Overpass API.
+        with pytest.raises(InsufficientResponseError):
+            _reader_fixture.get_graph_from_polygon(_polygon)
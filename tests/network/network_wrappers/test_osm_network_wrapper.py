@@ -1,3 +1,4 @@
+import shutil
 from pathlib import Path
 
 import networkx as nx
@@ -22,7 +23,13 @@ from ra2ce.network.network_wrappers.network_wrapper_protocol import (
 from ra2ce.network.network_wrappers.osm_network_wrapper.osm_network_wrapper import (
     OsmNetworkWrapper,
 )
-from tests import slow_test, temp_dir, test_data
+from ra2ce.network.network_wrappers.osm_network_wrapper.osm_tile_cache import (
+    OsmTileCache,
+)
+from ra2ce.network.network_wrappers.osm_network_wrapper.osm_utils import (
+    get_way_filter,
+)
+from tests import slow_test, temp_dir, test_data, test_results
 
 
 class TestOsmNetworkWrapper:
@@ -46,6 +53,17 @@ class TestOsmNetworkWrapper:
         assert isinstance(_wrapper, NetworkWrapperProtocol)
         assert _wrapper.crs.to_epsg() == 4326
 
+    def test_initialize_without_osm_tile_cache_by_default(self):
+        # 1. Define test data.
+        _network_config_data = self._get_dummy_network_config_data()
+
+        # 2. Run test.
+        _wrapper = OsmNetworkWrapper(_network_config_data)
+
+        # 3. Verify final expectations.
+        assert _network_config_data.network_dir
+        assert _wrapper.osm_tile_cache_dir is None
+
     @staticmethod
     def _get_dummy_network_config_data() -> NetworkConfigData:
         _network_section = NetworkSection(
@@ -394,6 +412,81 @@ class TestOsmNetworkWrapper:
         assert isinstance(_wrapper, OsmNetworkWrapper)
         assert isinstance(_wrapper.polygon_graph, MultiDiGraph)
 
+    def test_given_osm_extract_with_polygon_reads_extract(self):
+        # 1. Define test data.
+        _osm_extract_file = test_data.joinpath(
+            "network", "test_osm_network_wrapper", "osm_extract.osm"
+        )
+        assert _osm_extract_file.is_file()
+        _network_config_data = self._get_dummy_network_config_data()
+        _network_config_data.network.primary_file = _osm_extract_file
+        _network_config_data.network.network_type = NetworkTypeEnum.NONE
+        _network_config_data.network.road_types = [
+            RoadTypeEnum.PRIMARY,
+            RoadTypeEnum.RESIDENTIAL,
+        ]
+        _polygon = Polygon(
+            [
+                (4.3895, 51.9855),
+                (4.3925, 51.9855),
+                (4.3925, 51.9885),
+                (4.3895, 51.9885),
+            ]
+        )
+
+        # 2. Run test.
+        _wrapper = OsmNetworkWrapper.with_polygon(_network_config_data, _polygon)
+
+        # 3. Verify expectations.
+        assert _wrapper.osm_extract_file == _osm_extract_file
+        assert isinstance(_wrapper.polygon_graph, MultiDiGraph)
+        assert {
+            _data["osmid"] for *_, _data in _wrapper.polygon_graph.edges(data=True)
+        } == {101, 102, 103, 104, 107}
+
+    def test_given_cached_osm_tiles_with_polygon_reads_tile_cache(
+        self, request: pytest.FixtureRequest
+    ):
+        # 1. Define test data.
+        _static_path = test_results.joinpath(request.node.name, "static")
+        if _static_path.exists():
+            shutil.rmtree(_static_path)
+        _network_config_data = self._get_dummy_network_config_data()
+        _network_config_data.static_path = _static_path
+        _network_config_data.network.network_type = NetworkTypeEnum.DRIVE
+        _network_config_data.network.road_types = []
+        _network_config_data.network.osm_tile_cache = True
+        _polygon = Polygon(
+            [
+                (4.3895, 51.9855),
+                (4.3925, 51.9855),
+                (4.3925, 51.9885),
+                (4.3895, 51.9885),
+            ]
+        )
+        # Recorded Overpass response of the only tile covering the (buffered) polygon.
+        _tile_cache = OsmTileCache(
+            cache_dir=_network_config_data.network_dir.joinpath("osm_tile_cache")
+        )
+        _tile_file = _tile_cache.get_tile_file((9, 115), get_way_filter("drive", None))
+        _tile_file.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(
+            test_data.joinpath(
+                "network", "test_osm_network_wrapper", "overpass_response.json"
+            ),
+            _tile_file,
+        )
+
+        # 2. Run test.
+        _wrapper = OsmNetworkWrapper.with_polygon(_network_config_data, _polygon)
+
+        # 3. Verify expectations.
+        assert _wrapper.osm_tile_cache_dir == _tile_file.parent
+        assert isinstance(_wrapper.polygon_graph, MultiDiGraph)
+        assert {
+            _data["osmid"] for *_, _data in _wrapper.polygon_graph.edges(data=True)
+        } == {101, 102, 103, 104}
+
     @slow_test
     def test_given_no_output_graph_dir_when_get_network(self):
         # 1. Define test data.
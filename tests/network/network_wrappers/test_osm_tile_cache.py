@@ -0,0 +1,201 @@
+import json
+import logging
+import shutil
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import pytest
+from networkx import MultiDiGraph
+from shapely.geometry import LineString, Point, box
+
+from ra2ce.network.network_wrappers.osm_network_wrapper.osm_tile_cache import (
+    OsmTileCache,
+)
+from ra2ce.network.network_wrappers.osm_network_wrapper.osm_utils import (
+    get_way_filter,
+)
+from tests import test_data, test_results
+
+_recorded_response_file = test_data.joinpath(
+    "network", "test_osm_network_wrapper", "overpass_response.json"
+)
+_drive_filter = get_way_filter("drive", None)
+
+
+@dataclass(kw_only=True)
+class RecordedOsmTileCache(OsmTileCache):
+    """
+    Tile cache replaying the recorded Overpass response (clipped to the tiles)
+    instead of downloading it.
+    """
+
+    downloaded_tiles: list[tuple[int, int]] = field(default_factory=list)
+
+    def _download_response_json(
+        self, tile: tuple[int, int], way_filter: str
+    ) -> dict[str, Any]:
+        self.downloaded_tiles.append(tile)
+        _response_json = json.loads(_recorded_response_file.read_text())
+        _tile_box = self._get_tile_box(*tile)
+        _nodes = {
+            _element["id"]: _element
+            for _element in _response_json["elements"]
+            if _element["type"] == "node"
+        }
+        # As Overpass, the ways within the tile with all their nodes.
+        _ways = [
+            _element
+            for _element in _response_json["elements"]
+            if _element["type"] == "way"
+            and any(
+                _tile_box.intersects(
+                    Point(_nodes[_node_id]["lon"], _nodes[_node_id]["lat"])
+                )
+                for _node_id in _element["nodes"]
+            )
+        ]
+        _node_ids = sorted({_node_id for _way in _ways for _node_id in _way["nodes"]})
+        _response_json["elements"] = [
+            _nodes[_node_id] for _node_id in _node_ids
+        ] + _ways
+        return _response_json
+
+
+class TestOsmTileCache:
+    @pytest.fixture
+    def _cache_dir_fixture(self, request: pytest.FixtureRequest) -> Path:
+        _cache_dir = test_results.joinpath(request.node.name)
+        if _cache_dir.exists():
+            shutil.rmtree(_cache_dir)
+        yield _cache_dir
+
+    def test_initialize(self, _cache_dir_fixture: Path):
+        _cache = OsmTileCache(cache_dir=_cache_dir_fixture)
+        assert isinstance(_cache, OsmTileCache)
+        assert _cache.tile_size == 0.45
+        assert _cache.osm_date is None
+
+    def test_given_invalid_polygon_raises(self, _cache_dir_fixture: Path):
+        with pytest.raises(TypeError) as exc_err:
+            OsmTileCache(cache_dir=_cache_dir_fixture).get_graph_from_polygon(
+                LineString([[0, 0], [1, 0], [1, 1]])
+            )
+
+        assert str(exc_err.value).startswith(
+            "Geometry must be a shapely Polygon or MultiPolygon."
+        )
+
+    def test_get_tiles(self, _cache_dir_fixture: Path):
+        # 1. Define test data.
+        _cache = OsmTileCache(cache_dir=_cache_dir_fixture, tile_size=0.01)
+        _polygon = box(4.385, 51.985, 4.395, 51.995)
+
+        # 2. Run test.
+        _tiles = _cache.get_tiles(_polygon)
+
+        # 3. Verify expectations.
+        assert _tiles == [(438, 5198), (438, 5199), (439, 5198), (439, 5199)]
+
+    def test_get_tile_file_keyed_by_filter_and_date(self, _cache_dir_fixture: Path):
+        # 1. Define test data.
+        _tile = (9, 115)
+        _cache = OsmTileCache(cache_dir=_cache_dir_fixture)
+        _dated_cache = OsmTileCache(
+            cache_dir=_cache_dir_fixture, osm_date=date(2026, 1, 1)
+        )
+
+        # 2. Run test.
+        _tile_file = _cache.get_tile_file(_tile, _drive_filter)
+
+        # 3. Verify expectations.
+        assert _tile_file.parent == _cache_dir_fixture
+        assert _tile_file.name.startswith("tile_9_115_")
+        assert _tile_file == _cache.get_tile_file(_tile, _drive_filter)
+        assert _tile_file != _cache.get_tile_file(_tile, '["highway"]')
+        assert _tile_file != _dated_cache.get_tile_file(_tile, _drive_filter)
+
+    def test_get_snapshot_date_recorded_in_manifest(self, _cache_dir_fixture: Path):
+        # 1. Define test data.
+        _tile = (9, 115)
+        _cache = OsmTileCache(cache_dir=_cache_dir_fixture)
+        _manifest_file = _cache_dir_fixture.joinpath(OsmTileCache.manifest_name)
+
+        # 2. Run test.
+        _snapshot_date = _cache.get_snapshot_date()
+
+        # 3. Verify expectations.
+        assert _snapshot_date == date.today()
+        assert json.loads(_manifest_file.read_text()) == dict(
+            snapshot_date=date.today().isoformat()
+        )
+
+        # Later runs (e.g. on another day) keep using the recorded snapshot date.
+        _manifest_file.write_text(json.dumps(dict(snapshot_date="2026-01-01")))
+        _later_cache = OsmTileCache(cache_dir=_cache_dir_fixture)
+        _dated_cache = OsmTileCache(
+            cache_dir=_cache_dir_fixture, osm_date=date(2026, 1, 1)
+        )
+        assert _later_cache.get_snapshot_date() == date(2026, 1, 1)
+        assert _later_cache.get_tile_file(
+            _tile, _drive_filter
+        ) == _dated_cache.get_tile_file(_tile, _drive_filter)
+
+    def test_given_cached_tile_does_not_download(
+        self, _cache_dir_fixture: Path, caplog: pytest.LogCaptureFixture
+    ):
+        # 1. Define test data.
+        _cache = RecordedOsmTileCache(cache_dir=_cache_dir_fixture)
+        _polygon = box(4.3895, 51.9855, 4.3925, 51.9885)
+        _tiles = _cache.get_tiles(box(4.382, 51.981, 4.397, 51.990))
+        assert _tiles == [(9, 115)]
+        _tile_file = _cache.get_tile_file(_tiles[0], _drive_filter)
+        _tile_file.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(_recorded_response_file, _tile_file)
+
+        # 2. Run test.
+        with caplog.at_level(logging.WARNING):
+            _graph = _cache.get_graph_from_polygon(_polygon, network_type="drive")
+
+        # 3. Verify expectations.
+        assert not _cache.downloaded_tiles
+        assert f"OSM data as of {_cache.get_snapshot_date()}" in caplog.text
+        assert isinstance(_graph, MultiDiGraph)
+        assert len(_graph.nodes) == 9
+        assert len(_graph.edges) == 12
+        assert {_data["osmid"] for *_, _data in _graph.edges(data=True)} == {
+            101,
+            102,
+            103,
+            104,
+        }
+
+    def test_given_no_cached_tiles_downloads_and_stitches_tiles(
+        self, _cache_dir_fixture: Path
+    ):
+        # 1. Define test data.
+        # Small tiles, so the ways are split over several tiles.
+        _cache = RecordedOsmTileCache(
+            cache_dir=_cache_dir_fixture, tile_size=0.001, max_workers=4
+        )
+        _polygon = box(4.3895, 51.9855, 4.3925, 51.9885)
+
+        # 2. Run test.
+        _graph = _cache.get_graph_from_polygon(_polygon, network_type="drive")
+
+        # 3. Verify expectations.
+        _downloaded_tiles = list(_cache.downloaded_tiles)
+        assert len(_downloaded_tiles) > 1
+        assert len(set(_downloaded_tiles)) == len(_downloaded_tiles)
+        assert len(list(_cache_dir_fixture.glob("tile_*.json"))) == len(
+            _downloaded_tiles
+        )
+        assert not any(_cache_dir_fixture.glob("*.tmp"))
+        # Ways in several tiles are only added once.
+        assert len(_graph.nodes) == 9
+        assert len(_graph.edges) == 12
+
+        # Re-running reuses the cached tiles.
+        _cache.get_graph_from_polygon(_polygon, network_type="drive")
+        assert _cache.downloaded_tiles == _downloaded_tiles
@@ -0,0 +1,165 @@
+import json
+import shutil
+from typing import Any
+
+import networkx as nx
+import numpy as np
+import pytest
+from pyproj import CRS
+from shapely.geometry import LineString, Point
+
+from ra2ce.network.compact_graph import CompactGraph
+from tests import test_results
+
+
+class TestCompactGraph:
+    @pytest.fixture(name="graph")
+    def _get_graph(self) -> nx.MultiGraph:
+        # Triangle 1-2-3 with a dangling edge 3-4, parallel edges 4-5 and a self-loop on 5.
+        _graph = nx.MultiGraph(crs="EPSG:4326")
+        for _node in range(1, 6):
+            _graph.add_node(_node, x=float(_node), geometry=Point(_node, 0))
+        _graph.add_edge(1, 2, length=1.0, geometry=LineString([(1, 0), (2, 0)]))
+        _graph.add_edge(2, 3, length=2.0, highway="primary")
+        _graph.add_edge(3, 1, length=3.0)
+        _graph.add_edge(3, 4, length=4.0)
+        _graph.add_edge(4, 5, length=5.0)
+        _graph.add_edge(4, 5, length=6.0)
+        _graph.add_edge(5, 5, length=7.0)
+        return _graph
+
+    def test_from_graph(self, graph: nx.MultiGraph):
+        # 1. Run test.
+        _compact_graph = CompactGraph.from_graph(graph)
+
+        # 2. Verify expectations.
+        assert _compact_graph.n_nodes == 5
+        assert _compact_graph.n_edges == 7
+        assert _compact_graph.graph_data == {"crs": "EPSG:4326"}
+        np.testing.assert_array_equal(_compact_graph.node_data["x"], [1, 2, 3, 4, 5])
+        np.testing.assert_array_equal(
+            _compact_graph.edge_data["length"], [1, 3, 2, 4, 5, 6, 7]
+        )
+        np.testing.assert_array_equal(
+            _compact_graph.edge_masks["highway"],
+            [False, False, True, False, False, False, False],
+        )
+        assert _compact_graph.edge_data["geometry"][0].equals(
+            LineString([(1, 0), (2, 0)])
+        )
+        assert _compact_graph.edge_data["geometry"][1] is None
+
+    def test_to_graph(self, graph: nx.MultiGraph):
+        # 1. Define test data.
+        _compact_graph = CompactGraph.from_graph(graph)
+
+        # 2. Run test.
+        _graph = _compact_graph.to_graph()
+
+        # 3. Verify expectations.
+        assert isinstance(_graph, nx.MultiGraph)
+        assert _graph.graph == graph.graph
+        assert list(_graph.nodes(data=True)) == list(graph.nodes(data=True))
+        assert list(_graph.edges(keys=True, data=True)) == list(
+            graph.edges(keys=True, data=True)
+        )
+
+    def test_export_and_from_file(
+        self, graph: nx.MultiGraph, request: pytest.FixtureRequest
+    ):
+        # 1. Define test data.
+        graph.graph["crs"] = CRS.from_epsg(4326)
+        graph.graph["streets_per_node"] = {1: 2, 2: 2}
+        graph.edges[1, 2, 0]["osmid"] = [11, 12]
+        graph.edges[2, 3, 0]["osmid"] = 13
+        _export_path = test_results.joinpath(request.node.name, "base_graph.graph")
+        if _export_path.exists():
+            shutil.rmtree(_export_path)
+
+        # 2. Run test.
+        CompactGraph.from_graph(graph).export(_export_path)
+        _graph = CompactGraph.from_file(_export_path).to_graph()
+
+        # 3. Verify expectations.
+        assert _export_path.joinpath(CompactGraph.nodes_name).is_file()
+        assert _export_path.joinpath(CompactGraph.edges_name).is_file()
+        assert _export_path.joinpath(CompactGraph.metadata_name).is_file()
+        assert _graph.graph == graph.graph
+        assert list(_graph.nodes(data=True)) == list(graph.nodes(data=True))
+        assert list(_graph.edges(keys=True, data=True)) == list(
+            graph.edges(keys=True, data=True)
+        )
+
+    def test_export_stores_attributes_as_arrow_types(
+        self, graph: nx.MultiGraph, request: pytest.FixtureRequest
+    ):
+        # 1. Define test data.
+        graph.edges[1, 2, 0]["highway"] = ["primary", "secondary"]
+        graph.edges[3, 1, 0]["highway"] = None
+        graph.edges[1, 2, 0]["speeds"] = {"min": 30, "max": 50}
+        graph.edges[2, 3, 0]["speeds"] = {"min": 50, "max": 80}
+        graph.nodes[1]["centroid"] = Point(1, 1)
+        for _index, (*_, _data) in enumerate(graph.edges(data=True)):
+            # Values of several types, as in the graphs of the OSM network.
+            _data["bridge"] = "yes" if _index % 2 else np.nan
+            _data["avgspeed"] = 60 if _index % 3 else 62.5
+        _export_path = test_results.joinpath(request.node.name, "base_graph.graph")
+        if _export_path.exists():
+            shutil.rmtree(_export_path)
+
+        # 2. Run test.
+        CompactGraph.from_graph(graph).export(_export_path)
+        _graph = CompactGraph.from_file(_export_path).to_graph()
+
+        # 3. Verify expectations.
+        _metadata = json.loads(
+            _export_path.joinpath(CompactGraph.metadata_name).read_text()
+        )
+        assert all(
+            _metadata["edges"]["encodings"][_name] == "pylist"
+            for _name in ["highway", "speeds", "bridge", "avgspeed"]
+        )
+        assert _metadata["nodes"]["encodings"]["centroid"] == "wkb"
+        assert list(_graph.nodes(data=True)) == list(graph.nodes(data=True))
+        for (*_, _data), (*_, _expected_data) in zip(
+            _graph.edges(data=True), graph.edges(data=True)
+        ):
+            assert _data["bridge"] == _expected_data["bridge"] or (
+                _expected_data["bridge"] is np.nan
+                and isinstance(_data["bridge"], float)
+                and np.isnan(_data["bridge"])
+            )
+            assert type(_data["avgspeed"]) is type(_expected_data["avgspeed"])
+            assert _data.keys() == _expected_data.keys()
+            assert all(
+                _data[_name] == _expected_data[_name]
+                for _name in _data
+                if _name != "bridge"
+            )
+
+    @pytest.mark.parametrize(
+        "edge_attribute, graph_attribute",
+        [
+            pytest.param({1, 2}, None, id="Set attribute"),
+            pytest.param([1, "2"], None, id="Mixed list"),
+            pytest.param(1, object(), id="Object graph attribute"),
+        ],
+    )
+    def test_export_with_unsupported_attribute_raises(
+        self,
+        graph: nx.MultiGraph,
+        edge_attribute: Any,
+        graph_attribute: Any,
+        request: pytest.FixtureRequest,
+    ):
+        # 1. Define test data.
+        graph.edges[1, 2, 0]["unsupported"] = edge_attribute
+        graph.graph["unsupported"] = graph_attribute
+        _export_path = test_results.joinpath(request.node.name, "base_graph.graph")
+
+        # 2. Run test.
+        with pytest.raises(ValueError) as exc_err:
+            CompactGraph.from_graph(graph).export(_export_path)
+
+        # 3. Verify expectations.
+        assert "cannot be stored in the columnar graph format" in str(exc_err.value)
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from ra2ce.network.link_table import LinkTable
+from tests import test_results
+
+
+class TestLinkTable:
+    @pytest.fixture(name="link_table")
+    def _get_link_table(self) -> LinkTable:
+        return LinkTable.from_simple_to_complex({3: [7, 5], 1: 2, 2: [4, 1, 3]})
+
+    def test_from_simple_to_complex(self, link_table: LinkTable):
+        # 1. Verify expectations.
+        assert len(link_table) == 6
+        np.testing.assert_array_equal(link_table.simple_ids, [1, 2, 2, 2, 3, 3])
+        np.testing.assert_array_equal(link_table.complex_ids, [2, 4, 1, 3, 7, 5])
+
+    def test_init_with_different_lengths_raises(self):
+        # 1. Run test.
+        with pytest.raises(ValueError) as exc_err:
+            LinkTable(simple_ids=[1, 2], complex_ids=[1])
+
+        # 2. Verify expectations.
+        assert "same length" in str(exc_err.value)
+
+    @pytest.mark.parametrize(
+        "simple_id, expected_complex_ids",
+        [
+            pytest.param(1, [2], id="One complex id"),
+            pytest.param(2, [4, 1, 3], id="Multiple complex ids"),
+            pytest.param(42, [], id="Unknown simple id"),
+        ],
+    )
+    def test_get_complex_ids(
+        self, link_table: LinkTable, simple_id: int, expected_complex_ids: list[int]
+    ):
+        # 1. Run test.
+        _complex_ids = link_table.get_complex_ids(simple_id)
+
+        # 2. Verify expectations.
+        assert _complex_ids.tolist() == expected_complex_ids
+
+    def test_get_simple_ids(self, link_table: LinkTable):
+        # 1. Run test.
+        _simple_ids = link_table.get_simple_ids([5, 1, 2, 7])
+
+        # 2. Verify expectations.
+        assert _simple_ids.tolist() == [3, 2, 1, 3]
+
+    def test_get_simple_ids_with_unknown_id_raises(self, link_table: LinkTable):
+        # 1. Run test.
+        with pytest.raises(KeyError) as exc_err:
+            link_table.get_simple_ids([1, 6, 8])
+
+        # 2. Verify expectations.
+        assert "[6, 8]" in str(exc_err.value)
+
+    def test_to_dicts(self, link_table: LinkTable):
+        # 1. Run test.
+        _simple_to_complex, _complex_to_simple = link_table.to_dicts()
+
+        # 2. Verify expectations.
+        assert _simple_to_complex == {1: 2, 2: [4, 1, 3], 3: [7, 5]}
+        assert _complex_to_simple == {1: 2, 2: 1, 3: 2, 4: 2, 5: 3, 7: 3}
+
+    @pytest.mark.parametrize("suffix", [".feather", ".parquet"])
+    def test_export_and_from_file(
+        self, link_table: LinkTable, suffix: str, request: pytest.FixtureRequest
+    ):
+        # 1. Define test data.
+        _export_path = test_results.joinpath(request.node.name, f"link_table{suffix}")
+        if _export_path.exists():
+            _export_path.unlink()
+
+        # 2. Run test.
+        link_table.export(_export_path)
+        _read_link_table = LinkTable.from_file(_export_path)
+
+        # 3. Verify expectations.
+        assert _export_path.is_file()
+        np.testing.assert_array_equal(
+            _read_link_table.simple_ids, link_table.simple_ids
+        )
+        np.testing.assert_array_equal(
+            _read_link_table.complex_ids, link_table.complex_ids
+        )
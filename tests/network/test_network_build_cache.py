@@ -0,0 +1,171 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ra2ce.network.graph_files.graph_files_collection import GraphFilesCollection
+from ra2ce.network.network_build_cache import NetworkBuildCache
+from ra2ce.network.network_config_data.network_config_data import NetworkConfigData
+from tests import test_results
+
+
+class TestNetworkBuildCache:
+    @pytest.fixture(name="network_config_data")
+    def _get_network_config_data(
+        self, request: pytest.FixtureRequest
+    ) -> NetworkConfigData:
+        _static_path = test_results.joinpath(request.node.name, "static")
+        _static_path.joinpath("output_graph").mkdir(parents=True, exist_ok=True)
+        _static_path.joinpath("network").mkdir(parents=True, exist_ok=True)
+        _primary_file = _static_path.joinpath("network", "network.shp")
+        _primary_file.write_text("network")
+
+        _config_data = NetworkConfigData(static_path=_static_path)
+        _config_data.network.primary_file = _primary_file
+        _config_data.cleanup.segmentation_length = 100
+        return _config_data
+
+    def test_initialize_from_config_without_cache_file(
+        self, network_config_data: NetworkConfigData
+    ):
+        # 1./2. Define test data / Run test
+        _build_cache = NetworkBuildCache.from_config(network_config_data)
+
+        # 3. Verify expectations
+        assert isinstance(_build_cache, NetworkBuildCache)
+        assert _build_cache.stage_keys == {}
+        assert _build_cache.cache_file == network_config_data.output_graph_dir.joinpath(
+            "network_build_cache.json"
+        )
+        assert not _build_cache.is_stale("network")
+
+    def test_update_stores_stage_key(self, network_config_data: NetworkConfigData):
+        # 1. Define test data
+        _build_cache = NetworkBuildCache.from_config(network_config_data)
+
+        # 2. Run test
+        _build_cache.update("network")
+
+        # 3. Verify expectations
+        _stored_cache = NetworkBuildCache.from_config(network_config_data)
+        assert _stored_cache.stage_keys == {
+            "network": _build_cache.get_stage_key("network")
+        }
+        assert not _stored_cache.is_stale("network")
+
+    def test_get_stage_key_given_unknown_stage_raises_value_error(
+        self, network_config_data: NetworkConfigData
+    ):
+        # 1. Define test data
+        _build_cache = NetworkBuildCache.from_config(network_config_data)
+
+        # 2. Run test
+        with pytest.raises(ValueError) as exc_err:
+            _build_cache.get_stage_key("unknown")
+
+        # 3. Verify expectations
+        assert str(exc_err.value) == "Unknown build stage unknown provided."
+
+    @pytest.mark.parametrize(
+        "option, value",
+        [("save_gpkg", True), ("osm_tile_cache", True), ("osm_tile_size", 0.1)],
+    )
+    def test_given_output_option_changed_stage_is_not_stale(
+        self, network_config_data: NetworkConfigData, option: str, value: Any
+    ):
+        # 1. Define test data
+        _build_cache = NetworkBuildCache.from_config(network_config_data)
+        _build_cache.update("network")
+
+        # 2. Run test
+        setattr(network_config_data.network, option, value)
+
+        # 3. Verify expectations
+        assert not _build_cache.is_stale("network")
+
+    def test_given_segmentation_length_changed_stages_are_stale(
+        self, network_config_data: NetworkConfigData
+    ):
+        # 1. Define test data
+        _build_cache = NetworkBuildCache.from_config(network_config_data)
+        for _stage in ["network", "origins_destinations", "hazard"]:
+            _build_cache.update(_stage)
+
+        # 2. Run test
+        network_config_data.cleanup.segmentation_length = 50
+
+        # 3. Verify expectations
+        assert _build_cache.is_stale("network")
+        assert _build_cache.is_stale("origins_destinations")
+        assert _build_cache.is_stale("hazard")
+
+    def test_given_hazard_map_changed_only_hazard_stage_is_stale(
+        self, network_config_data: NetworkConfigData
+    ):
+        # 1. Define test data
+        _build_cache = NetworkBuildCache.from_config(network_config_data)
+        for _stage in ["network", "origins_destinations", "hazard"]:
+            _build_cache.update(_stage)
+
+        # 2. Run test
+        network_config_data.hazard.hazard_map = [Path("hazard.tif")]
+
+        # 3. Verify expectations
+        assert not _build_cache.is_stale("network")
+        assert not _build_cache.is_stale("origins_destinations")
+        assert _build_cache.is_stale("hazard")
+
+    def test_given_input_file_changed_stage_is_stale(
+        self, network_config_data: NetworkConfigData
+    ):
+        # 1. Define test data
+        _build_cache = NetworkBuildCache.from_config(network_config_data)
+        _build_cache.update("network")
+
+        # 2. Run test
+        network_config_data.network.primary_file.write_text("changed network")
+
+        # 3. Verify expectations
+        assert _build_cache.is_stale("network")
+
+    def test_given_sidecar_file_changed_stage_is_stale(
+        self, network_config_data: NetworkConfigData
+    ):
+        # 1. Define test data
+        _build_cache = NetworkBuildCache.from_config(network_config_data)
+        _build_cache.update("network")
+
+        # 2. Run test
+        network_config_data.network.primary_file.with_suffix(".dbf").write_text(
+            "attributes"
+        )
+
+        # 3. Verify expectations
+        assert _build_cache.is_stale("network")
+
+    def test_remove_stale_outputs(self, network_config_data: NetworkConfigData):
+        # 1. Define test data
+        _output_graph_dir = network_config_data.output_graph_dir
+        for _name in ["base_graph.p", "base_network.feather", "base_graph_hazard.p"]:
+            _output_graph_dir.joinpath(_name).touch()
+        _graph_files = GraphFilesCollection.set_files(_output_graph_dir)
+        _build_cache = NetworkBuildCache.from_config(network_config_data)
+        _build_cache.update("network")
+        network_config_data.hazard.hazard_map = [Path("hazard.tif")]
+        _build_cache.update("hazard")
+        network_config_data.hazard.hazard_map = [Path("other_hazard.tif")]
+
+        # 2. Run test
+        _build_cache.remove_stale_outputs(_graph_files)
+
+        # 3. Verify expectations
+        assert _graph_files.base_graph.file == _output_graph_dir.joinpath(
+            "base_graph.p"
+        )
+        assert _graph_files.base_network.file
+        assert _graph_files.base_graph_hazard.file is None
+        assert not _output_graph_dir.joinpath("base_graph_hazard.p").exists()
+        assert (
+            "hazard"
+            not in NetworkBuildCache.from_config(network_config_data).stage_keys
+        )
@@ -71,8 +71,7 @@ class TestNetworks:
                 [
                     _base_graph_p_filename,
                     _base_network_feather_filename,
-                    "simple_to_complex.json",
-                    "complex_to_simple.json",
+                    "link_table.feather",
                 ],
                 id="Case 3. OSM download",
             ),
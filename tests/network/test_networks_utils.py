@@ -124,6 +124,28 @@ class TestLineLength:
         # 3. Verify expectations.
         assert _return_value is np.nan
 
+    @pytest.mark.parametrize(
+        "crs_code, expected_lengths",
+        [
+            pytest.param(4326, [222639, 222639, np.nan], id="Geographic"),
+            pytest.param(26915, [2, 2, np.nan], id="Projected"),
+        ],
+    )
+    def test_line_lengths(self, crs_code: int, expected_lengths: list[float]):
+        # 1. Define test data.
+        _crs = CRS.from_user_input(crs_code)
+        _lines = [
+            LineString([[0, 0], [1, 0], [2, 0]]),
+            MultiLineString([[[0, 0], [1, 0]], [[1, 0], [2, 0]]]),
+            Point([0, 1]),
+        ]
+
+        # 2. Run test.
+        _return_value = nu.line_lengths(_lines, _crs)
+
+        # 3. Verify expectations.
+        np.testing.assert_allclose(_return_value, expected_lengths, rtol=0.0001)
+
 
 class TestVerticesFromLines:
     def test_with_linestrings(self):
@@ -348,6 +370,61 @@ class TestNetworksUtils:
         assert _return_polygon.bounds[3] == pytest.approx(26.221675, _tolerance)
 
 
+class TestGraphFromGdf:
+    def test_graph_from_gdf(self):
+        # 1. Define test data.
+        _nodes = gpd.GeoDataFrame(
+            {"node_fid": [1, 2, 3]},
+            geometry=[Point(0, 0), Point(1, 0), Point(1, 1)],
+            crs="EPSG:4326",
+        )
+        _edges = gpd.GeoDataFrame(
+            {
+                "node_A": [1, 2, 1],
+                "node_B": [2, 3, 2],
+                "highway": ["primary", None, "secondary"],
+            },
+            geometry=[
+                LineString([(0, 0), (1, 0)]),
+                LineString([(1, 0), (1, 1)]),
+                LineString([(0, 0), (0.5, 0.5), (1, 0)]),
+            ],
+            crs="EPSG:4326",
+        )
+
+        # 2. Run test.
+        _graph = nu.graph_from_gdf(_edges, _nodes, node_id="node_fid")
+
+        # 3. Verify expectations.
+        assert _graph.graph["crs"] == _edges.crs
+        assert dict(_graph.nodes(data="x")) == {1: 0.0, 2: 1.0, 3: 1.0}
+        assert _graph.nodes[3]["node_fid"] == 3
+        assert list(_graph.edges(keys=True, data="highway")) == [
+            (1, 2, 0, "primary"),
+            (1, 2, 1, "secondary"),
+            (2, 3, 0, None),
+        ]
+        assert _graph.edges[2, 3, 0]["geometry"].equals(_edges.geometry[1])
+
+
+class TestCastObjectColumnsToStr:
+    def test_cast_object_columns_to_str(self):
+        # 1. Define test data.
+        _gdf = gpd.GeoDataFrame(
+            {"rfid": [1, 2], "osmid": [[1, 2], 3], "highway": ["primary", None]},
+            geometry=[Point(0, 0), Point(1, 1)],
+        )
+
+        # 2. Run test.
+        _result = nu.cast_object_columns_to_str(_gdf)
+
+        # 3. Verify expectations.
+        assert _result["rfid"].tolist() == [1, 2]
+        assert _result["osmid"].tolist() == ["[1, 2]", "3"]
+        assert _result["highway"].tolist() == ["primary", "None"]
+        assert isinstance(_result.geometry[0], Point)
+
+
 class TestAddMissingGeomsGraph:
     def test_with_valid_data(self):
         # 1. Define test data
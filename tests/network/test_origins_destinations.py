@@ -1,6 +1,20 @@
+import geopandas as gpd
+import networkx as nx
 import numpy as np
+import pytest
+import rasterio
+from pyproj import CRS
+from rasterio.transform import from_origin
+from shapely.geometry import LineString, Point
 
-from ra2ce.network.origins_destinations import closest_node
+from ra2ce.network.origins_destinations import (
+    _NodeIndex,
+    add_od_nodes,
+    closest_node,
+    closest_nodes,
+    generate_points_from_raster,
+)
+from tests import test_results
 
 
 class TestOriginsDestinations:
@@ -15,3 +29,181 @@ class TestOriginsDestinations:
         # 3. Verify final expectations.
         assert len(_result) == 4
         assert list(_result) == [0, 1, 2, 3]
+
+    def test_closest_nodes(self):
+        # 1. Define test.
+        _points = np.array([[0.4, 0.0], [1.0, 1.0], [2.6, 0.1]])
+        _nodes = np.array([[3.0, 0.0], [0.0, 0.0], [2.0, 1.0], [1.0, 0.0], [0.0, 1.0]])
+
+        # 2. Run test.
+        _result = closest_nodes(_points, _nodes)
+
+        # 3. Verify final expectations.
+        # Ties are resolved by taking the first node, as `closest_node` does.
+        assert _result.tolist() == [[0.0, 0.0], [2.0, 1.0], [3.0, 0.0]]
+        for _point, _closest in zip(_points, _result):
+            assert list(closest_node(_point, _nodes)) == list(_closest)
+
+    def test_add_od_nodes_splits_edge_at_all_od_nodes(self):
+        # 1. Define test.
+        _crs = CRS.from_user_input(4326)
+        _graph = nx.MultiGraph(crs=_crs)
+        _graph.add_node(1, geometry=Point(0, 0), x=0, y=0)
+        _graph.add_node(2, geometry=Point(4, 0), x=4, y=0)
+        _graph.add_edge(
+            1,
+            2,
+            0,
+            geometry=LineString([(0, 0), (1, 0), (2, 0), (3, 0), (4, 0)]),
+            rfid=7,
+        )
+        _od = gpd.GeoDataFrame(
+            {
+                "o_id": ["O_1", "O_2", np.nan],
+                "d_id": [np.nan, np.nan, "D_1"],
+                "geometry": [Point(2, 0.1), Point(1, 0.1), Point(1, -0.1)],
+            },
+            crs=_crs,
+        )
+
+        # 2. Run test.
+        _, _result_graph = add_od_nodes(_od, _graph, _crs)
+
+        # 3. Verify final expectations.
+        assert dict(_result_graph.nodes(data="od_id")) == {
+            1: None,
+            2: None,
+            3: "O_1",
+            4: "O_2,D_1",
+        }
+        _edges = {
+            (u, v): (data["geometry"].wkt, data["edge_fid"], data["rfid"])
+            for u, v, data in _result_graph.edges(data=True)
+        }
+        assert _edges == {
+            (1, 4): ("LINESTRING (0 0, 1 0)", "1_4", 7),
+            (2, 3): ("LINESTRING (2 0, 3 0, 4 0)", "3_2", 7),
+            (3, 4): ("LINESTRING (1 0, 2 0)", "4_3", 7),
+        }
+
+    def test_add_od_nodes_splits_reversed_edge_once(self):
+        # 1. Define test.
+        _crs = CRS.from_user_input(4326)
+        _graph = nx.MultiDiGraph(crs=_crs)
+        _graph.add_node(1, geometry=Point(0, 0), x=0, y=0)
+        _graph.add_node(2, geometry=Point(4, 0), x=4, y=0)
+        # The geometry runs from node 2 to node 1.
+        _graph.add_edge(
+            1, 2, 0, geometry=LineString([(4, 0), (3, 0), (2, 0), (1, 0), (0, 0)])
+        )
+        _od = gpd.GeoDataFrame(
+            {
+                "o_id": ["O_1", "O_2", np.nan],
+                "d_id": [np.nan, np.nan, "D_1"],
+                "geometry": [Point(1, 0.1), Point(3, 0.1), Point(1, -0.1)],
+            },
+            crs=_crs,
+        )
+
+        # 2. Run test.
+        _, _result_graph = add_od_nodes(_od, _graph, _crs)
+
+        # 3. Verify final expectations.
+        assert dict(_result_graph.nodes(data="od_id")) == {
+            1: None,
+            2: None,
+            3: "O_1,D_1",
+            4: "O_2",
+        }
+        _edges = {
+            (u, v, k): (data["geometry"].wkt, data["node_A"], data["node_B"])
+            for u, v, k, data in _result_graph.edges(keys=True, data=True)
+        }
+        assert _edges == {
+            (1, 3, 0): ("LINESTRING (1 0, 0 0)", 1, 3),
+            (3, 4, 0): ("LINESTRING (3 0, 2 0, 1 0)", 3, 4),
+            (4, 2, 0): ("LINESTRING (4 0, 3 0)", 4, 2),
+        }
+
+    def test_add_od_nodes_splits_self_loop(self):
+        # 1. Define test.
+        _crs = CRS.from_user_input(4326)
+        _graph = nx.MultiGraph(crs=_crs)
+        _graph.add_node(1, geometry=Point(0, 0), x=0, y=0)
+        _graph.add_edge(
+            1, 1, 0, geometry=LineString([(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)])
+        )
+        _od = gpd.GeoDataFrame(
+            {"o_id": ["O_1"], "d_id": [np.nan], "geometry": [Point(1.1, 1.1)]},
+            crs=_crs,
+        )
+
+        # 2. Run test.
+        _, _result_graph = add_od_nodes(_od, _graph, _crs)
+
+        # 3. Verify final expectations.
+        assert dict(_result_graph.nodes(data="od_id")) == {1: None, 2: "O_1"}
+        assert sorted(
+            (u, v, k, data["geometry"].wkt)
+            for u, v, k, data in _result_graph.edges(keys=True, data=True)
+        ) == [
+            (1, 2, 0, "LINESTRING (0 0, 1 0, 1 1)"),
+            (1, 2, 1, "LINESTRING (1 1, 0 1, 0 0)"),
+        ]
+
+
+class TestNodeIndex:
+    def test_from_graph(self):
+        # 1. Define test.
+        _graph = nx.MultiGraph()
+        _graph.add_node(1, geometry=Point(0.123456789, 1))
+        _graph.add_node(2, geometry=Point(0.12345679, 1))
+
+        # 2. Run test.
+        _node_index = _NodeIndex.from_graph(_graph)
+
+        # 3. Verify final expectations.
+        assert _node_index.positions == {(0.123456789, 1.0): 1, (0.12345679, 1.0): 2}
+
+
+class TestGeneratePointsFromRaster:
+    @pytest.mark.parametrize("suffix", [".feather", ".gpkg"])
+    def test_generate_points_from_raster(
+        self, suffix: str, request: pytest.FixtureRequest
+    ):
+        # 1. Define test.
+        _output_dir = test_results.joinpath(request.node.name)
+        _output_dir.mkdir(parents=True, exist_ok=True)
+        _raster_path = _output_dir.joinpath("population.tif")
+        _values = np.array([[0.0, 2.0, np.nan], [4.0, 0.0, 1.0]], dtype="float32")
+        with rasterio.open(
+            _raster_path,
+            "w",
+            driver="GTiff",
+            height=2,
+            width=3,
+            count=1,
+            dtype="float32",
+            crs="EPSG:4326",
+            transform=from_origin(4.0, 52.0, 1.0, 1.0),
+        ) as _dst:
+            _dst.write(_values, 1)
+
+        # 2. Run test.
+        _points_path = generate_points_from_raster(
+            _raster_path, _output_dir.joinpath(f"points{suffix}")
+        )
+
+        # 3. Verify final expectations.
+        if suffix == ".feather":
+            _points = gpd.read_feather(_points_path)
+        else:
+            _points = gpd.read_file(_points_path)
+        assert _points["OBJECTID"].tolist() == [1, 2, 5]
+        assert _points["values"].tolist() == [4.0, 2.0, 1.0]
+        assert [(_p.x, _p.y) for _p in _points.geometry] == [
+            (4.5, 50.5),
+            (5.5, 51.5),
+            (6.5, 50.5),
+        ]
+        assert _points.crs.to_epsg() == 4326
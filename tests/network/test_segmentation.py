@@ -1,5 +1,7 @@
 import math
 
+import geopandas as gpd
+import numpy as np
 import pytest
 from shapely.geometry import LineString
 
@@ -90,3 +92,94 @@ class TestSegmentation:
 
         # 3. Verify expectations
         assert _return_value == [_line]
+
+    @pytest.mark.parametrize(
+        "length, segments",
+        [
+            pytest.param(0.0, 1, id="Zero length"),
+            pytest.param(0.5, 1, id="Shorter than segmentation length"),
+            pytest.param(3.0, 3, id="Multiple of segmentation length"),
+            pytest.param(0.1 * 3 / 0.1, 3, id="Multiple with floating point error"),
+            pytest.param(3.5, 4, id="With remainder"),
+        ],
+    )
+    def test_get_number_of_segments(self, length: float, segments: int):
+        # 1. Define test data.
+        _segmentation = Segmentation(None, None, False)
+        _segmentation.segmentation_length = 1.0
+
+        # 2. Run test.
+        _return_value = _segmentation.get_number_of_segments(np.array([length]))
+
+        # 3. Verify expectations
+        assert _return_value.tolist() == [segments]
+
+    def test_split_linestrings(self):
+        # 1. Define test data.
+        _segmentation = Segmentation(None, None, False)
+        _segmentation.segmentation_length = 1.0
+        _lines = np.array(
+            [
+                LineString([[0, 0], [1, 0], [2.5, 0]]),
+                LineString([[0, 0], [0, 0.5], [0, 1.5]]),
+            ]
+        )
+
+        # 2. Run test.
+        _segments, _line_index = _segmentation.split_linestrings(_lines)
+
+        # 3. Verify expectations
+        assert _line_index.tolist() == [0, 0, 0, 1, 1]
+        assert [list(_segment.coords) for _segment in _segments] == [
+            [(0, 0), (1, 0)],
+            [(1, 0), (2, 0)],
+            [(2, 0), (2.5, 0)],
+            [(0, 0), (0, 0.5), (0, 1)],
+            [(0, 1), (0, 1.5)],
+        ]
+
+    def test_cut_gdf(self):
+        # 1. Define test data.
+        _segmentation = Segmentation(None, None, False)
+        _segmentation.segmentation_length = 0.01
+        _segmentation.edges_input = gpd.GeoDataFrame(
+            {
+                "rfid": [1, 2],
+                "length": [np.nan, np.nan],
+                "geometry": [
+                    LineString([[4, 52], [4.025, 52]]),
+                    LineString([[4, 52], [4.005, 52]]),
+                ],
+            },
+            crs="EPSG:4326",
+        )
+
+        # 2. Run test.
+        _segmentation.cut_gdf()
+
+        # 3. Verify expectations
+        _edges_segmented = _segmentation.edges_segmented
+        assert list(_edges_segmented.columns) == ["splt_id", "rfid", "length", "geometry"]
+        assert _edges_segmented["splt_id"].tolist() == [1, 2, 3, 4]
+        assert _edges_segmented["rfid"].tolist() == [1, 1, 1, 2]
+        assert _edges_segmented["length"].tolist() == pytest.approx(
+            [686, 686, 343, 343], abs=1
+        )
+
+    def test_generate_link_tables(self):
+        # 1. Define test data.
+        _segmentation = Segmentation(None, None, False)
+        _segmentation.edges_segmented = gpd.GeoDataFrame(
+            {"splt_id": [1, 2, 3, 4], "rfid": [2, 1, 1, 2]}
+        )
+
+        # 2. Run test.
+        _link_table = _segmentation.generate_link_tables()
+
+        # 3. Verify expectations
+        assert _link_table.get_complex_ids(1).tolist() == [2, 3]
+        assert _link_table.get_complex_ids(2).tolist() == [1, 4]
+        assert _link_table.to_dicts() == (
+            {1: [2, 3], 2: [1, 4]},
+            {1: 2, 2: 1, 3: 1, 4: 2},
+        )
@@ -0,0 +1,102 @@
+import shutil
+from pathlib import Path
+
+import pytest
+from geopandas import GeoDataFrame
+from shapely import Point
+
+from ra2ce.analysis.analysis_collection import AnalysisCollection
+from ra2ce.analysis.analysis_config_data.analysis_config_data import (
+    AnalysisSectionBase,
+    ProjectSection,
+)
+from ra2ce.analysis.analysis_protocol import AnalysisProtocol
+from ra2ce.analysis.analysis_result.analysis_result_wrapper import (
+    AnalysisResult,
+    AnalysisResultWrapper,
+)
+from ra2ce.runners.simple_analysis_runner_base import SimpleAnalysisRunnerBase
+
+
+class MockedAnalysis(AnalysisProtocol):
+    def __init__(self, name: str, output_path: Path) -> None:
+        self.analysis = AnalysisSectionBase(name=name, save_csv=True)
+        self.output_path = output_path
+
+    def execute(self) -> AnalysisResultWrapper:
+        return AnalysisResultWrapper(
+            results_collection=[
+                AnalysisResult(
+                    analysis_result=GeoDataFrame(
+                        {"dummy_column": ["left"], "geometry": [Point(4.2, 2.4)]}
+                    ),
+                    analysis_config=self.analysis,
+                    output_path=self.output_path,
+                )
+            ]
+        )
+
+
+class FailingMockedAnalysis(MockedAnalysis):
+    def execute(self) -> AnalysisResultWrapper:
+        raise ValueError(f"Analysis {self.analysis.name} failed.")
+
+
+class MockedAnalysisRunner(SimpleAnalysisRunnerBase):
+    def __str__(self) -> str:
+        return "Mocked Analysis Runner"
+
+    @staticmethod
+    def filter_supported_analyses(
+        analysis_collection: AnalysisCollection,
+    ) -> list[AnalysisProtocol]:
+        return analysis_collection.losses_analyses
+
+
+class TestSimpleAnalysisRunnerBase:
+    def test_run_exports_results_with_project_settings(
+        self, test_result_param_case: Path
+    ):
+        # 1. Define test data.
+        if test_result_param_case.exists():
+            shutil.rmtree(test_result_param_case)
+        _analysis_collection = AnalysisCollection(
+            losses_analyses=[
+                MockedAnalysis("First", test_result_param_case),
+                MockedAnalysis("Second", test_result_param_case),
+            ],
+            project=ProjectSection(export_max_workers=1, export_max_in_flight_bytes=0),
+        )
+
+        # 2. Run test.
+        _results = MockedAnalysisRunner().run(_analysis_collection)
+
+        # 3. Verify expectations.
+        assert len(_results) == 2
+        assert all(
+            _result.results_collection[0].base_export_path.with_suffix(".csv").is_file()
+            for _result in _results
+        )
+
+    def test_given_failing_analysis_exports_previous_results(
+        self, test_result_param_case: Path
+    ):
+        # 1. Define test data.
+        if test_result_param_case.exists():
+            shutil.rmtree(test_result_param_case)
+        _analysis = MockedAnalysis("First", test_result_param_case)
+        _analysis_collection = AnalysisCollection(
+            losses_analyses=[
+                _analysis,
+                FailingMockedAnalysis("Failing", test_result_param_case),
+            ],
+        )
+
+        # 2. Run test.
+        with pytest.raises(ValueError) as exc_err:
+            MockedAnalysisRunner().run(_analysis_collection)
+
+        # 3. Verify expectations.
+        assert str(exc_err.value) == "Analysis Failing failed."
+        _base_export_path = _analysis.execute().results_collection[0].base_export_path
+        assert _base_export_path.with_suffix(".csv").is_file()